@@ -61,7 +61,9 @@ class Algorithm( OTObject ):
             f.close()
 
             f      = open(fileTmap, 'wb')
-            (X, T) = self.stateN.convergingStaggeredField().interpolation().Tmap(self.config.fineResolution)
+            (X, T) = self.stateN.convergingStaggeredField().interpolation().Tmap(self.config.fineResolution,
+                                                                                 self.config.TmapNSubsteps,
+                                                                                 self.config.TmapOrder)
             np.save(f, X)
             np.save(f, T)
             f.close()
@@ -0,0 +1,116 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_______________
+# anamorphose.py
+#_______________
+#
+# Vectorized anamorphose : closed form solution of the 1D OT problem
+#
+# f0 and f1 are either two densities on the (N+1) grid of [0,1] or two stacks
+# of such densities, the last axis being the spatial axis. All the problems
+# of the stack and all the time levels are solved at once.
+#
+
+import numpy as np
+
+from quantile import cumulativeDistribution
+from quantile import interpolateStack
+
+#__________________________________________________
+
+def timeLevels(P):
+    # time levels of the staggered grid
+    TS       = np.zeros(P+2)
+    TS[1:-1] = np.linspace(0.5/P, 1.-0.5/P, P)
+    TS[-1]   = 1.
+    return TS
+
+#__________________________________________________
+
+def anamorphose(f0, f1, P, fineResolution, PDFError):
+    #
+    # returns (fu, mu, J, X_fine, T_fine) where
+    #   * fu     -> density on the staggered grid, shape (..., N+1, P+2)
+    #   * mu     -> momentum on the staggered grid, shape (..., N+2, P+1)
+    #   * J      -> theoretical value of the functional J, shape (...)
+    #   * X_fine -> fine grid of [0,1]
+    #   * T_fine -> optimal transport map from f1 to f0 on the fine grid, shape (..., fineResolution)
+    #
+    N         = f0.shape[-1] - 1
+
+    # apply a non-zero filter to boundary conditions
+    minValue  = f0.mean(axis=-1)[...,np.newaxis] * PDFError
+    f0        = np.maximum(f0, minValue)
+    f1        = np.maximum(f1, minValue)
+
+    # interpolates boundary conditions
+    X         = np.linspace(0.0, 1.0, N+1)
+    X_fine    = np.linspace(0.0, 1.0, fineResolution)
+    f0_fine   = interpolateStack(X_fine, X, f0)
+    f1_fine   = interpolateStack(X_fine, X, f1)
+
+    # Computing CDF by integration
+    CDF0      = cumulativeDistribution(X_fine, f0_fine)
+    CDF1      = cumulativeDistribution(X_fine, f1_fine)
+
+    # Rescale CDF1 since
+    # mass default could have been produced by the non-zero filter
+    CDF1     *= CDF0[...,-1:] / CDF1[...,-1:]
+
+    # Optimal transport map from f0 to f1 on the fine grid, i.e. iCDF1(CDF0(x))
+    iT_fine   = interpolateStack(CDF0, CDF1, X_fine)
+
+    # Interpolates solution on a staggered grid : all time levels are
+    # stored along a new axis, just before the spatial axis
+    TS        = timeLevels(P)
+    t         = TS[:,np.newaxis]
+    XS        = np.linspace(0.0, 1.0, N+1)
+
+    T_t_fine  = ( 1.0 - t ) * X_fine + t * iT_fine[...,np.newaxis,:]
+    iT_t_XS   = interpolateStack(XS, T_t_fine, X_fine)
+    CDF0_XS   = interpolateStack(iT_t_XS, X_fine, CDF0[...,np.newaxis,:])
+    iT_iT_t   = interpolateStack(CDF0_XS, CDF1[...,np.newaxis,:], X_fine)
+
+    f0_t      = interpolateStack(iT_t_XS, X, f0[...,np.newaxis,:])
+    f1_t      = interpolateStack(iT_iT_t, X, f1[...,np.newaxis,:])
+
+    fu        = f0_t / ( ( 1.0 - t ) + t * ( f0_t / f1_t ) )
+    fu        = np.swapaxes(fu, -1, -2)
+
+    # Now computes m to complete the solution of the optimal transport
+    # We have df/dt + dm/dx = 0
+    dfu_dt    = P * ( fu[...,1:] - fu[...,:-1] )
+
+    # Corrects boundary condition
+    # this produce non zero divergence to the results
+    # it could be appropriate to apply proxCdivb after this algorithm
+    divError  = dfu_dt.sum(axis=-2)
+    dfu_dt   -= divError[...,np.newaxis,:] / ( N + 1.0 )
+
+    # Computes mu = - int( partialTfu , x )
+    mu           = np.zeros(shape=f0.shape[:-1]+(N+2, P+1))
+    mu[...,1:,:] = - dfu_dt / N
+    mu           = mu.cumsum(axis=-2)
+
+    # Theoretical J
+    iCDF0_fine = interpolateStack(X_fine, CDF0, X_fine)
+    iCDF1_fine = interpolateStack(X_fine, CDF1, X_fine)
+    J          = np.trapz(np.power(iCDF0_fine-iCDF1_fine, 2), X_fine, axis=-1) * P * N
+
+    # Optimal transport map from f1 to f0, i.e. iCDF0(CDF1(x))
+    T_fine     = interpolateStack(CDF1, CDF0, X_fine)
+
+    return (fu, mu, J, X_fine, T_fine)
+
+#__________________________________________________
@@ -0,0 +1,96 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#__________________
+# distanceMatrix.py
+#__________________
+#
+# Exact W2^2 distance matrix between 1D profiles
+#
+# In 1D, W2^2 is the L2 distance between the quantile functions. The quantile
+# function of each profile is computed once on nLevels levels, and the matrix
+# of the distances is then obtained with the Gram matrix of the quantile
+# functions :
+#   |Qi - Qj|^2 = |Qi|^2 + |Qj|^2 - 2 Qi.Qj
+#
+# Rows are processed by chunks of chunkSize profiles to bound the memory.
+#
+
+import numpy as np
+
+from quantile import interpolateStack
+from quantile import normalizedCDF
+from quantile import quantileFunction
+from quantile import quantileLevels
+
+#__________________________________________________
+
+def quantileFunctions(fs, fineResolution, PDFError=0.):
+    #
+    # fs is a stack of profiles on the (N+1) grid of [0,1], shape (nProfiles, N+1)
+    # returns the quantile functions of fs / int(fs), shape (nProfiles, fineResolution)
+    # the profiles are first floored to PDFError times their mean, as in anamorphose
+    #
+    fs     = np.atleast_2d(fs)
+    X      = np.linspace(0.0, 1.0, fs.shape[-1])
+    X_fine = np.linspace(0.0, 1.0, fineResolution)
+    fs     = np.maximum( fs , PDFError * fs.mean(axis=-1)[...,np.newaxis] )
+
+    f_fine = interpolateStack(X_fine, X, fs)
+    return quantileFunction(X_fine, normalizedCDF(X_fine, f_fine), quantileLevels(fineResolution))
+
+#__________________________________________________
+
+def quantileDistanceMatrix(Q0, Q1=None, chunkSize=1024):
+    #
+    # returns the matrix D of shape (n0, n1) such that
+    #   D[i,j] = mean( ( Q0[i] - Q1[j] )^2 )
+    # if Q1 is None, Q1 = Q0 and D is symmetric with a zero diagonal
+    #
+    symmetric = Q1 is None
+    if symmetric:
+        Q1    = Q0
+
+    nLevels   = Q0.shape[-1]
+    norm0     = np.power(Q0, 2).sum(axis=-1)
+    norm1     = np.power(Q1, 2).sum(axis=-1)
+
+    D         = np.zeros(shape=(Q0.shape[0], Q1.shape[0]))
+    for start in xrange(0, Q0.shape[0], chunkSize):
+        end          = min(start+chunkSize, Q0.shape[0])
+        D[start:end] = ( norm0[start:end,np.newaxis] + norm1[np.newaxis,:]
+                         - 2. * np.dot(Q0[start:end], Q1.T) ) / nLevels
+
+    # round-off errors
+    D         = np.maximum(D, 0.)
+    if symmetric:
+        D     = 0.5 * ( D + D.T )
+        np.fill_diagonal(D, 0.)
+
+    return D
+
+#__________________________________________________
+
+def distanceMatrix(fs0, fs1=None, fineResolution=1000, PDFError=0., chunkSize=1024):
+    #
+    # W2^2 between every profile of fs0 and every profile of fs1
+    # (or every pair of profiles of fs0 if fs1 is None)
+    #
+    Q0     = quantileFunctions(fs0, fineResolution, PDFError)
+    if fs1 is None:
+        return quantileDistanceMatrix(Q0, None, chunkSize)
+
+    Q1     = quantileFunctions(fs1, fineResolution, PDFError)
+    return quantileDistanceMatrix(Q0, Q1, chunkSize)
+
+#__________________________________________________
@@ -0,0 +1,96 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#____________
+# quantile.py
+#____________
+#
+# CDF and quantile functions of 1D densities
+#
+# All functions work on stacks of densities : the last axis of f is the
+# spatial axis, sampled at the increasing points X, and all the other axes
+# are treated as independent problems.
+#
+
+import numpy as np
+
+#__________________________________________________
+
+def cumulativeDistribution(X, f):
+    # integrates f along the last axis with the trapezoidal rule
+    CDF          = np.zeros(shape=f.shape)
+    CDF[...,1:]  = np.cumsum( 0.5 * ( f[...,1:] + f[...,:-1] ) * np.diff(X) , axis=-1 )
+    return CDF
+
+#__________________________________________________
+
+def normalizedCDF(X, f, floor=0.):
+    # CDF of f / int(f), f being first floored to floor times its mean
+    f   = np.maximum( f , floor * f.mean(axis=-1)[...,np.newaxis] )
+    CDF = cumulativeDistribution(X, f)
+    return CDF / CDF[...,-1:]
+
+#__________________________________________________
+
+def interpolateStack(x, xp, fp):
+    #
+    # linear interpolation along the last axis, with constant extrapolation
+    #   * fp are the values at the increasing points xp
+    #   * x  are the points where to interpolate
+    # the leading axes of x, xp and fp are broadcast against each other
+    #
+    # rows are shifted so that a single call to np.interp handles the whole stack
+    #
+    x      = np.asarray(x)
+    xp     = np.asarray(xp)
+    fp     = np.asarray(fp)
+    lead   = np.broadcast(x[...,0], xp[...,0], fp[...,0]).shape
+
+    fp2D   = np.broadcast_to(fp, lead + fp.shape[-1:]).reshape((-1, fp.shape[-1]))
+    xp2D   = np.broadcast_to(xp, lead + xp.shape[-1:]).reshape((-1, xp.shape[-1]))
+    x2D    = np.broadcast_to(x,  lead + x.shape[-1:] ).reshape((-1, x.shape[-1]))
+    nRows  = fp2D.shape[0]
+
+    xMin   = xp2D[:,:1]
+    xMax   = xp2D[:,-1:]
+    span   = ( xMax - xMin ).max() + 1.
+    offset = span * np.arange(nRows)[:,np.newaxis] - xMin
+
+    y      = np.interp( ( np.clip(x2D, xMin, xMax) + offset ).ravel() ,
+                        ( xp2D + offset ).ravel() ,
+                        fp2D.ravel() )
+
+    return y.reshape(lead + x.shape[-1:])
+
+#__________________________________________________
+
+def quantileFunction(X, CDF, levels):
+    # inverts each row of CDF, normalized CDF sampled at X, at the given levels
+    return interpolateStack(levels, CDF, X)
+
+#__________________________________________________
+
+def quantileLevels(nLevels):
+    # midpoint rule on [0,1]
+    return ( np.arange(nLevels) + 0.5 ) / nLevels
+
+#__________________________________________________
+
+def squaredDistance(X, f0, f1, nLevels, floor=0.):
+    # W2^2 between f0 / int(f0) and f1 / int(f1), for each problem of the stack
+    levels = quantileLevels(nLevels)
+    Q0     = quantileFunction(X, normalizedCDF(X, f0, floor), levels)
+    Q1     = quantileFunction(X, normalizedCDF(X, f1, floor), levels)
+    return np.power(Q0 - Q1, 2).mean(axis=-1)
+
+#__________________________________________________
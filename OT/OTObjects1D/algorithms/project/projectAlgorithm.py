@@ -80,7 +80,9 @@ class ProjectAlgorithm( OTObject ):
             f.close()
 
             f          = open(fileTmap, 'wb')
-            (X, T)     = self.state.interpolation().Tmap(self.config.fineResolution)
+            (X, T)     = self.state.interpolation().Tmap(self.config.fineResolution,
+                                                         self.config.TmapNSubsteps,
+                                                         self.config.TmapOrder)
             np.save(f, X)
             np.save(f, T)
             f.close()
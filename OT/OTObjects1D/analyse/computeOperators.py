@@ -21,6 +21,8 @@
 import numpy as np
 import cPickle as pck
 
+from ...utils.io                import files
+from ...utils.io.extractAnalyse import writeAnalyse
 from operators1 import listOfOperators1 as defineListOfOperators1
 from operators2 import listOfOperators2 as defineListOfOperators2
 
@@ -100,16 +102,9 @@ def applyOperators(listOfOperators1, listOfOperators2, outputDir):
 
     iterationTimes = np.cumsum(iterationTimes)
 
-    fileAnalyse = outputDir + 'analyse.bin'
-    f = open(fileAnalyse, 'wb')
-    p = pck.Pickler(f,protocol=-1)
-    p.dump(iterationNumbers)
-    p.dump(iterationTimes)
-    p.dump(operatorNames)
-    p.dump(values)
-    f.close()
+    writeAnalyse(outputDir, iterationNumbers, iterationTimes, operatorNames, values)
 
-    print ('Results written in '+fileAnalyse+' ...')
+    print ('Results written in '+files.fileAnalyse(outputDir)+' and '+files.fileAnalyseValues(outputDir)+' ...')
     return ( iterationNumbers, iterationTimes, values )
     
 def applyAllOperators(outputDir):
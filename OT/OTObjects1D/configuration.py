@@ -153,6 +153,14 @@ class Configuration(DefaultConfiguration):
                           defaultVal=1000,
                           attrType='int')
 
+        self.addAttribute('TmapNSubsteps',
+                          defaultVal=0,
+                          attrType='int')
+
+        self.addAttribute('TmapOrder',
+                          defaultVal=4,
+                          attrType='int')
+
         self.addAttribute('dynamics',
                           defaultVal=0,
                           attrType='int')
@@ -259,4 +267,9 @@ class Configuration(DefaultConfiguration):
                           isSubAttr=[('algoName','anamorph')],
                           attrType='float')
 
+        self.addAttribute('anamorphDebugPlots',
+                          defaultVal=False,
+                          isSubAttr=[('algoName','anamorph')],
+                          attrType='bool')
+
 #__________________________________________________
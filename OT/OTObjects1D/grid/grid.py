@@ -20,8 +20,6 @@
 
 import numpy as np
 
-from scipy.interpolate                import interp1d
-
 from ..OTObject                       import OTObject
 from ...utils                         import cardan
 from ...utils.interpolate.interpolate import makeInterpolatorPP
@@ -356,25 +354,46 @@ class CenteredField( Field ):
 
         return StaggeredCenteredField( self.N , self.P , staggeredField , self )
 
-    def Tmap(self, fineResolution=None):
+    def Tmap(self, fineResolution=None, nSubsteps=None, order=4):
+        #
+        # the characteristics starting from the fineResolution points of [0,1]
+        # are integrated with nSubsteps time steps (default P) of an explicit
+        # Runge-Kutta scheme of order 1, 2 or 4, all particles at once
+        #
         if fineResolution is None:
             fineResolution = self.N + 1
+        if nSubsteps is None or nSubsteps <= 0:
+            nSubsteps = self.P
 
         f       = self.f * ( self.f > 0 ) + 1.0 * ( self.f <= 0 )
         v       = self.m * ( self.f > 0 ) / f
-
         xV      = np.linspace(0.0, 1.0, self.N+1)
-        tV      = np.linspace(0.0, 1.0, self.P+1)
+
+        def velocity(x, t):
+            # linear in time between the slices of v and 0 outside of [0,1]
+            jj = t * self.P
+            j  = min(int(np.floor(jj)), self.P-1)
+            return ( np.interp(x, xV, v[:,j],   left=0.0, right=0.0) * (j+1.0-jj) +
+                     np.interp(x, xV, v[:,j+1], left=0.0, right=0.0) * (jj-j) )
 
         # First compute iT_map
-        T       = np.linspace(0.5/fineResolution, 1.0-0.5/fineResolution, fineResolution)
+        dt      = 1.0 / nSubsteps
         iTarray = np.linspace(0.0, 1.0, fineResolution)
 
-        for t in T:
-            jj       = t * self.P
-            j        = int(np.floor(jj))
-            vmap     = interp1d(xV, v[:,j] * (j+1.0-jj) + v[:,j+1] * (jj-j), copy=False, bounds_error=False, fill_value=0.0)
-            iTarray += vmap(iTarray) / fineResolution
+        for n in xrange(nSubsteps):
+            t = n * dt
+            if order == 1:
+                iTarray += dt * velocity(iTarray, t)
+            elif order == 2:
+                k1       = velocity(iTarray, t)
+                k2       = velocity(iTarray + 0.5*dt*k1, t + 0.5*dt)
+                iTarray += dt * k2
+            else:
+                k1       = velocity(iTarray, t)
+                k2       = velocity(iTarray + 0.5*dt*k1, t + 0.5*dt)
+                k3       = velocity(iTarray + 0.5*dt*k2, t + 0.5*dt)
+                k4       = velocity(iTarray + dt*k3, t + dt)
+                iTarray += dt * ( k1 + 2.0*k2 + 2.0*k3 + k4 ) / 6.0
 
         # Then inverse iT_map to get T_map
         Tmap   = makeInterpolatorPP(iTarray, np.linspace(0.0, 1.0, fineResolution), copy=False)
@@ -18,10 +18,61 @@
 # Default class for all objects 
 # Stores the grid discretization
 #
+# Every object stores the physical extents of the domain [0,Lx]x[0,Ly] and
+# of the time interval [0,T], and the floating point type of the arrays it
+# creates, see PhysicalDomain. The objects created by an object share its
+# physical domain.
+#
+
+class PhysicalDomain:
+
+    def __init__(self, Lx=1., Ly=1., T=1., dtype='float64'):
+        self.Lx    = float(Lx)
+        self.Ly    = float(Ly)
+        self.T     = float(T)
+        # 'float64' or 'float32'
+        self.dtype = dtype
+
+    def __repr__(self):
+        return 'Physical domain [0,'+str(self.Lx)+']x[0,'+str(self.Ly)+'] on [0,'+str(self.T)+'] in '+self.dtype
+
+    def withPrecision(self, dtype):
+        return PhysicalDomain(self.Lx, self.Ly, self.T, dtype)
+
+#__________________________________________________
+
+def physicalDomainForConfig(config):
+    # configurations saved without physical extents use the unit domain
+    return PhysicalDomain(getattr(config, 'Lx', 1.),
+                          getattr(config, 'Ly', 1.),
+                          getattr(config, 'T',  1.))
+
+#__________________________________________________
 
 class OTObject:
+
+    # objects saved without physical domain use the unit domain in float64
+    Lx     = 1.
+    Ly     = 1.
+    T      = 1.
+    dtype  = 'float64'
+    domain = PhysicalDomain()
     
-    def __init__(self, M, N, P):
+    def __init__(self, M, N, P, domain=None):
         self.M = M
         self.N = N
         self.P = P
+        self.setDomain(domain)
+
+    def setDomain(self, domain):
+        if domain is None:
+            domain = PhysicalDomain()
+        self.domain = domain
+        self.Lx     = domain.Lx
+        self.Ly     = domain.Ly
+        self.T      = domain.T
+        self.dtype  = domain.dtype
+
+    def scalings(self):
+        # inverse of the grid spacings
+        return ( self.M / self.Lx , self.N / self.Ly , self.P / self.T )
@@ -56,11 +56,11 @@ class AdrAlgorithm( Algorithm ):
 
             centField   = stagField.interpolation()
             z           = grid.StaggeredCenteredField( self.M , self.N , self.P ,
-                                                       stagField, centField )
+                                                       stagField, centField, domain=self.domain )
             w           = z.copy()
-            self.stateN = AdrState( self.M , self.N , self.P , z , w )
+            self.stateN = AdrState( self.M , self.N , self.P , z , w , domain=self.domain )
 
-        self.stateNP1 = self.stateN.copy()
+        self.stateNP1 = self.nextState()
 
     def initialize(self):
         Algorithm.initialize(self)
@@ -68,5 +68,5 @@ class AdrAlgorithm( Algorithm ):
         if self.stateN is None:
             z = initialStaggeredCenteredField(self.config)
             w = z.copy()
-            self.stateN   = AdrState( self.M , self.N , self.P , z , w )
-            self.stateNP1 = self.stateN.copy()
+            self.stateN   = AdrState( self.M , self.N , self.P , z , w , domain=self.domain )
+            self.stateNP1 = self.nextState()
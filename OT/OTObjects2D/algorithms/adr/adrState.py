@@ -28,15 +28,15 @@ class AdrState( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  z=None , w=None ):
+                  z=None , w=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if z is None:
-            self.z = grid.StaggeredCenteredField(M,N,P)
+            self.z = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.z = z
         if w is None:
-            self.w = grid.StaggeredCenteredField(M,N,P)
+            self.w = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.w = w
 
@@ -56,50 +56,50 @@ class AdrState( OTObject ):
     def __add__(self, other):
         if isinstance(other,AdrState):
             return AdrState( self.M , self.N , self.P ,
-                             self.z + other.z , self.w + other.w )
+                             self.z + other.z , self.w + other.w , domain=self.domain )
         else:
             return AdrState( self.M , self.N , self.P ,
-                             self.z + other , self.w + other )
+                             self.z + other , self.w + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,AdrState):
             return AdrState( self.M , self.N , self.P ,
-                             self.z - other.z , self.w - other.w )
+                             self.z - other.z , self.w - other.w , domain=self.domain )
         else:
             return AdrState( self.M , self.N , self.P ,
-                             self.z - other , self.w - other )
+                             self.z - other , self.w - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,AdrState):
             return AdrState( self.M , self.N , self.P ,
-                             self.z * other.z , self.w * other.w )
+                             self.z * other.z , self.w * other.w , domain=self.domain )
         else:
             return AdrState( self.M , self.N , self.P ,
-                             self.z * other , self.w * other )
+                             self.z * other , self.w * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,AdrState):
             return AdrState( self.M , self.N , self.P ,
-                             self.z / other.z , self.w / other.w )
+                             self.z / other.z , self.w / other.w , domain=self.domain )
         else:
             return AdrState( self.M , self.N , self.P ,
-                             self.z / other , self.w / other )
+                             self.z / other , self.w / other , domain=self.domain )
 
     def __radd__(self, other):
         return AdrState( self.M , self.N , self.P ,
-                         other + self.z , other + self.w )
+                         other + self.z , other + self.w , domain=self.domain )
 
     def __rsub__(self, other):
         return AdrState( self.M , self.N , self.P ,
-                         other - self.z , other - self.w )
+                         other - self.z , other - self.w , domain=self.domain )
 
     def __rmul__(self, other):
         return AdrState( self.M , self.N , self.P ,
-                         other * self.z , other * self.w )
+                         other * self.z , other * self.w , domain=self.domain )
 
     def __rdiv__(self, other):
         return AdrState( self.M , self.N , self.P ,
-                         other / self.z , other / self.w )
+                         other / self.z , other / self.w , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,AdrState):
@@ -143,16 +143,16 @@ class AdrState( OTObject ):
 
     def __neg__(self):
         return AdrState( self.M , self.N , self.P ,
-                         - self.z , - self.w )
+                         - self.z , - self.w , domain=self.domain )
 
     def __pos__(self):
         return AdrState( self.M , self.N , self.P ,
-                         + self.z , + self.w )
+                         + self.z , + self.w , domain=self.domain )
 
     def __abs__(self):
         return AdrState( self.M , self.N , self.P ,
-                         abs ( self.z ) , abs ( self.w ) )
+                         abs ( self.z ) , abs ( self.w ) , domain=self.domain )
     def copy(self):
         return AdrState( self.M , self.N , self.P ,
-                         self.z.copy() , self.w.copy() )
+                         self.z.copy() , self.w.copy() , domain=self.domain )
 
@@ -19,6 +19,7 @@
 #
 
 from ...OTObject import OTObject
+from ...OTObject import physicalDomainForConfig
 from ...grid import grid
 
 class Prox1Adr( OTObject ):
@@ -30,7 +31,8 @@ class Prox1Adr( OTObject ):
                  config , 
                  proxCdiv, proxJ):
         OTObject.__init__( self ,
-                           config.M , config.N , config.P )
+                           config.M , config.N , config.P ,
+                           physicalDomainForConfig(config) )
         self.proxCdiv = proxCdiv
         self.proxJ    = proxJ
 
@@ -41,4 +43,4 @@ class Prox1Adr( OTObject ):
         stagField = self.proxCdiv(stagCentField.staggeredField)
         centField = self.proxJ(stagCentField.centeredField, gamma)
         return grid.StaggeredCenteredField( self.M, self.N, self.P, 
-                                            stagField, centField)
+                                            stagField, centField, domain=self.domain)
@@ -60,16 +60,16 @@ class Adr3Algorithm( Algorithm ):
 
             centField   = stagField.interpolation()
             u1          = grid.StaggeredCenteredField( self.M , self.N , self.P ,
-                                                        stagField, centField )
+                                                        stagField, centField, domain=self.domain )
         
-            self.stateN = Adr3State( self.M , self.N , self.P , u1 , u1.copy() , u1.copy() , u1.copy() )
+            self.stateN = Adr3State( self.M , self.N , self.P , u1 , u1.copy() , u1.copy() , u1.copy() , domain=self.domain )
 
-        self.stateNP1 = self.stateN.copy()
+        self.stateNP1 = self.nextState()
 
     def initialize(self):
         Algorithm.initialize(self)
 
         if self.stateN is None:
             u1 = initialStaggeredCenteredField(self.config)
-            self.stateN   = Adr3State( self.M , self.N , self.P , u1 , u1.copy() , u1.copy() , u1.copy() )
-            self.stateNP1 = self.stateN.copy()
+            self.stateN   = Adr3State( self.M , self.N , self.P , u1 , u1.copy() , u1.copy() , u1.copy() , domain=self.domain )
+            self.stateNP1 = self.nextState()
@@ -28,26 +28,26 @@ class Adr3State( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  u1=None , u2=None , u3=None , x=None ):
+                  u1=None , u2=None , u3=None , x=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if u1 is None:
-            self.u1 = grid.StaggeredCenteredField(M,N,P)
+            self.u1 = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.u1 = u1
 
         if u2 is None:
-            self.u2 = grid.StaggeredCenteredField(M,N,P)
+            self.u2 = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.u2 = u2
 
         if u3 is None:
-            self.u3 = grid.StaggeredCenteredField(M,N,P)
+            self.u3 = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.u3 = u3
 
         if x is None:
-            self.x = grid.StaggeredCenteredField(M,N,P)
+            self.x = grid.StaggeredCenteredField(M,N,P, domain=domain)
         else:
             self.x = x
 
@@ -69,50 +69,50 @@ class Adr3State( OTObject ):
     def __add__(self, other):
         if isinstance(other,Adr3State):
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 + other.u1 , self.u2 + other.u2 , self.u3 + other.u3 , self.x + other.x )
+                              self.u1 + other.u1 , self.u2 + other.u2 , self.u3 + other.u3 , self.x + other.x , domain=self.domain )
         else:
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 + other , self.u2 + other , self.u3 + other , self.x + other )
+                              self.u1 + other , self.u2 + other , self.u3 + other , self.x + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,Adr3State):
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 - other.u1 , self.u2 - other.u2 , self.u3 - other.u3 , self.x - other.x )
+                              self.u1 - other.u1 , self.u2 - other.u2 , self.u3 - other.u3 , self.x - other.x , domain=self.domain )
         else:
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 - other , self.u2 - other , self.u3 - other , self.x - other )
+                              self.u1 - other , self.u2 - other , self.u3 - other , self.x - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,Adr3State):
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 * other.u1 , self.u2 * other.u2 , self.u3 * other.u3 , self.x * other.x )
+                              self.u1 * other.u1 , self.u2 * other.u2 , self.u3 * other.u3 , self.x * other.x , domain=self.domain )
         else:
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 * other , self.u2 * other , self.u3 * other , self.x * other )
+                              self.u1 * other , self.u2 * other , self.u3 * other , self.x * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,Adr3State):
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 / other.u1 , self.u2 / other.u2 , self.u3 / other.u3 , self.x / other.x )
+                              self.u1 / other.u1 , self.u2 / other.u2 , self.u3 / other.u3 , self.x / other.x , domain=self.domain )
         else:
             return Adr3State( self.M , self.N , self.P ,
-                              self.u1 / other , self.u2 / other , self.u3 / other , self.x / other )
+                              self.u1 / other , self.u2 / other , self.u3 / other , self.x / other , domain=self.domain )
 
     def __radd__(self, other):
         return Adr3State( self.M , self.N , self.P ,
-                          other + self.u1 , other + self.u2 , other + self.u3 , other + self.x )
+                          other + self.u1 , other + self.u2 , other + self.u3 , other + self.x , domain=self.domain )
 
     def __rsub__(self, other):
         return Adr3State( self.M , self.N , self.P ,
-                          other - self.u1 , other - self.u2 , other - self.u3 , other - self.x )
+                          other - self.u1 , other - self.u2 , other - self.u3 , other - self.x , domain=self.domain )
 
     def __rmul__(self, other):
         return Adr3State( self.M , self.N , self.P ,
-                          other * self.u1 , other * self.u2 , other * self.u3 , other * self.x )
+                          other * self.u1 , other * self.u2 , other * self.u3 , other * self.x , domain=self.domain )
 
     def __rdiv__(self, other):
         return Adr3State( self.M , self.N , self.P ,
-                          other / self.u1 , other / self.u2 , other / self.u3 , other / self.x )
+                          other / self.u1 , other / self.u2 , other / self.u3 , other / self.x , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,Adr3State):
@@ -172,16 +172,16 @@ class Adr3State( OTObject ):
 
     def __neg__(self):
         return Adr3State( self.M , self.N , self.P ,
-                          - self.u1 , - self.u2 , - self.u3 , - self.x )
+                          - self.u1 , - self.u2 , - self.u3 , - self.x , domain=self.domain )
 
     def __pos__(self):
         return Adr3State( self.M , self.N , self.P ,
-                          + self.u1 , + self.u2 , + self.u3 , + self.x )
+                          + self.u1 , + self.u2 , + self.u3 , + self.x , domain=self.domain )
 
     def __abs__(self):
         return Adr3State( self.M , self.N , self.P ,
-                          abs ( self.u1 ) , abs ( self.u2 ) , abs ( self.u3 ) , abs ( self.x ) )
+                          abs ( self.u1 ) , abs ( self.u2 ) , abs ( self.u3 ) , abs ( self.x ) , domain=self.domain )
     def copy(self):
         return Adr3State( self.M , self.N , self.P ,
-                          self.u1.copy() , self.u2.copy() , self.u3.copy() , self.x.copy() )
+                          self.u1.copy() , self.u2.copy() , self.u3.copy() , self.x.copy() , domain=self.domain )
 
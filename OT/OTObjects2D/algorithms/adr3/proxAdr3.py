@@ -19,6 +19,7 @@
 #
 
 from ...OTObject import OTObject
+from ...OTObject import physicalDomainForConfig
 from ...grid import grid
 
 class Prox1Adr3( OTObject ):
@@ -30,7 +31,8 @@ class Prox1Adr3( OTObject ):
                  config , 
                  proxCdiv, proxJ):
         OTObject.__init__( self ,
-                           config.M , config.N , config.P )
+                           config.M , config.N , config.P ,
+                           physicalDomainForConfig(config) )
         self.proxCdiv = proxCdiv
         self.proxJ    = proxJ
 
@@ -41,7 +43,7 @@ class Prox1Adr3( OTObject ):
         stagField = self.proxCdiv(stagCentField.staggeredField)
         centField = self.proxJ(stagCentField.centeredField, gamma)
         return grid.StaggeredCenteredField( self.M, self.N, self.P, 
-                                            stagField, centField)
+                                            stagField, centField, domain=self.domain)
 
 class Prox2Adr3:
     '''
@@ -67,7 +69,8 @@ class Prox3Adr3( OTObject ):
                  config,
                  proxCb):
         OTObject.__init__( self ,
-                           config.M , config.N , config.P )
+                           config.M , config.N , config.P ,
+                           physicalDomainForConfig(config) )
         self.proxCb = proxCb
 
     def __repr__(self):
@@ -77,5 +80,5 @@ class Prox3Adr3( OTObject ):
         stagField = self.proxCb(stagCentField.staggeredField)
         centField = stagCentField.centeredField.copy()
         return grid.StaggeredCenteredField( self.M , self.N, self.P,
-                                            stagField, centField)
+                                            stagField, centField, domain=self.domain)
 
@@ -22,12 +22,29 @@
 #   * setState     [method]
 #   * initialize   [method]
 #
+# in low-memory mode, stateNP1 is the same object as stateN (see nextState),
+# the step functions reading every field of stateN before overwriting it
+#
+# in single or mixed precision, the states and the step function are cast
+# to float32 during the iterations (see precision.py and switchPrecision)
+#
 
+import os
 import cPickle as pck
 import time    as tm
 import numpy   as np
 
-from ..OTObject import OTObject
+from ..OTObject           import OTObject
+from ..OTObject           import physicalDomainForConfig
+from ...utils.io          import files
+from ...utils.sys.metrics import currentRSS
+from ...utils.sys.metrics import MetricsLog
+from ...utils.sys.metrics import MetricsServer
+from profiling            import profilerForAlgorithm
+from memory               import memoryReportForConfig
+from memory               import printMemoryReport
+from precision            import castArrays
+from precision            import precisionForIteration
 
 class Algorithm( OTObject ):
     '''
@@ -36,17 +53,26 @@ class Algorithm( OTObject ):
 
     def __init__(self, config):
         self.config = config
-        OTObject.__init__(self, config.M , config.N , config.P)
+        OTObject.__init__(self, config.M , config.N , config.P , physicalDomainForConfig(config))
         self.stateN = None
         self.stateNP1 = None
         
     def __repr__(self):
         return ( 'Algorithm' )
 
+    def fileState(self):
+        return files.fileFinalState(self.config.outputDir)
+
+    def staleFiles(self):
+        # output files of a previous run of a static solver
+        return [ files.fileSolution(self.config.outputDir) ,
+                 files.fileDisplacementField(self.config.outputDir) ]
+
     def saveState(self):
-        fileConfig   = self.config.outputDir + 'config.bin'
-        fileState    = self.config.outputDir + 'finalState.bin'
-        fileRunCount = self.config.outputDir + 'runCount.bin'
+        fileConfig   = files.fileConfig(self.config.outputDir)
+        fileState    = self.fileState()
+        fileRunCount = files.fileRunCount(self.config.outputDir)
+        fileStates   = files.fileStates(self.config.outputDir)
 
         try:
             f = open(fileConfig, 'ab')
@@ -73,6 +99,10 @@ class Algorithm( OTObject ):
             p.dump(runCount)
             f.close()
 
+            for fileName in self.staleFiles():
+                if os.path.isfile(fileName):
+                    os.remove(fileName)
+
             self.config.iterCount = 0
             self.config.iterTarget = 0
 
@@ -81,7 +111,8 @@ class Algorithm( OTObject ):
             print(fileConfig)
             print(fileState)
             print(fileRunCount)
-            print(self.config.outputDir+'states.bin')
+            if os.path.isfile(fileStates):
+                print(fileStates)
             print('__________________________________________________')
 
         except:
@@ -89,6 +120,11 @@ class Algorithm( OTObject ):
             print('WARNING : could not write output files')
             print('__________________________________________________')
 
+    def nextState(self):
+        if getattr(self.config, 'lowMemory', False):
+            return self.stateN
+        return self.stateN.copy()
+
     def initialize(self):
         self.stateN = None
 
@@ -148,6 +184,7 @@ class Algorithm( OTObject ):
         print('__________________________________________________')
         print('Initialising algorithm...')
         print('__________________________________________________')
+        printMemoryReport(memoryReportForConfig(self.config))
         self.initialize()
 
         fileCurrentState = self.config.outputDir + 'states.bin'
@@ -160,30 +197,70 @@ class Algorithm( OTObject ):
         print('__________________________________________________')
         self.config.printConfig()
         print('__________________________________________________')
+        self.initializePrecision()
+
+        # in mixed precision, the step function is only profiled until the first switch
+        profiler = None
+        if getattr(self.config, 'profiling', False):
+            profiler = profilerForAlgorithm(self)
+
+        metricsLog    = MetricsLog(self.config.outputDir + 'metrics.jsonl')
+        metricsServer = None
+        if getattr(self.config, 'metricsEndpoint', ''):
+            try:
+                metricsServer = MetricsServer(self.config.metricsEndpoint)
+            except:
+                print('WARNING : could not serve metrics on '+self.config.metricsEndpoint)
+
         timeStart = tm.time()
         timeCheck = timeStart
+        self.lastMetrics = (0, timeStart, None)
 
-        while self.config.iterCount < self.config.iterTarget:
-            self.stepFunction(self.stateN,self.stateNP1)
-            self.stepFunction(self.stateNP1,self.stateN)
-
-            if np.mod(self.config.iterCount, self.config.nModPrint) == 0:
-                print('___________________________________')
-                print('iteration   : '+str(self.config.iterCount)+'/'+str(self.config.iterTarget))
-                print('elpsed time : '+str(tm.time()-timeStart))
-                print('J           = '+str(self.stateN.functionalJ()))
+        # the proximal classes are instrumented at class level, they
+        # must be restored even if the iterations fail
+        try:
+            while self.config.iterCount < self.config.iterTarget:
+                self.switchPrecision(precisionForIteration(self.config, self.config.iterCount))
+                self.stepFunction(self.stateN,self.stateNP1)
+                self.stepFunction(self.stateNP1,self.stateN)
+
+                if np.mod(self.config.iterCount, self.config.nModPrint) == 0:
+                    metrics = self.metrics(self.config.iterCount+2, timeStart, 'running')
+                    print('___________________________________')
+                    print('iteration   : '+str(self.config.iterCount)+'/'+str(self.config.iterTarget))
+                    print('elpsed time : '+str(metrics['wallTime']))
+                    print('J           = '+str(metrics['J']))
+                    metricsLog.write(metrics)
+                    if metricsServer is not None:
+                        metricsServer.update(metrics)
+                    if profiler is not None:
+                        self.writeProfile(profiler, self.config.iterCount+2)
+
+                if np.mod(self.config.iterCount, self.config.nModWrite) == 0:
+                    p.clear_memo()
+                    p.dump(self.stateN.convergingStaggeredField())
+                    p.dump(tm.time()-timeCheck)
+                    timeCheck = tm.time()
+
+                self.config.iterCount += 2
+
+            timeAlgo = tm.time() - timeStart
+            if profiler is not None:
+                self.writeProfile(profiler, self.config.iterCount)
+
+        finally:
+            f.close()
+            if profiler is not None:
+                profiler.restore()
+            if metricsServer is not None:
+                metricsServer.close()
 
-            if np.mod(self.config.iterCount, self.config.nModWrite) == 0:
-                p.clear_memo()
-                p.dump(self.stateN.convergingStaggeredField())
-                p.dump(tm.time()-timeCheck)
-                timeCheck = tm.time()
+        self.switchPrecision('float64')
 
-            self.config.iterCount += 2
+        metrics = self.metrics(self.config.iterCount, timeStart, 'finished')
+        metricsLog.write(metrics)
 
-        timeAlgo = tm.time() - timeStart
-        f.close()
-        finalJ = self.stateN.functionalJ()
+        finalJ = metrics['J']
 
         print('__________________________________________________')
         print('Algorithm finished')
@@ -196,6 +273,74 @@ class Algorithm( OTObject ):
         self.saveState()
         return finalJ
 
+    def initializePrecision(self):
+        # the states and the step function are built in float64
+        self.stepFunctions = { 'float64' : self.stepFunction }
+        self.precision     = 'float64'
+        self.switchPrecision(precisionForIteration(self.config, self.config.iterCount))
+
+    def switchPrecision(self, dtype):
+        #
+        # casts the states and the step function to dtype, the step
+        # functions being cast from the float64 one only once
+        #
+        if dtype == self.precision:
+            return
+
+        if not dtype in self.stepFunctions:
+            self.stepFunctions[dtype] = castArrays(self.stepFunctions['float64'], dtype)
+
+        (self.stateN, self.stateNP1) = castArrays((self.stateN, self.stateNP1), dtype)
+        self.stepFunction            = self.stepFunctions[dtype]
+        self.precision               = dtype
+        self.setDomain(self.domain.withPrecision(dtype))
+
+    def metrics(self, nIterations, timeStart, status):
+        #
+        # metrics of the current state, the throughput and the change of the
+        # converging field being measured since the previous call
+        #
+        # the converging field is the output of a projection (e.g. on the divergence
+        # constrain for PD), hence its own residuals are always at round-off level
+        #
+        timeNow            = tm.time()
+        (iterLast, tLast, fieldLast) = self.lastMetrics
+        field                        = self.stateN.convergingStaggeredField().copy()
+        self.lastMetrics             = (nIterations, timeNow, field)
+
+        if timeNow > tLast and nIterations > iterLast:
+            rate = ( nIterations - iterLast ) / ( timeNow - tLast )
+            eta  = max(0, self.config.iterTarget - nIterations) / rate
+        else:
+            rate = None
+            eta  = None
+
+        if fieldLast is not None and nIterations > iterLast:
+            # relative change per iteration
+            change = float( ( field - fieldLast ).LInftyNorm() /
+                            max( field.LInftyNorm(), 1.e-300 ) / ( nIterations - iterLast ) )
+        else:
+            change = None
+
+        return { 'status'              : status ,
+                 'iteration'           : nIterations ,
+                 'iterTarget'          : self.config.iterTarget ,
+                 'wallTime'            : timeNow - timeStart ,
+                 'iterationsPerSecond' : rate ,
+                 'eta'                 : eta ,
+                 'J'                   : float(self.stateN.functionalJ()) ,
+                 'iterateChange'       : change ,
+                 'rss'                 : currentRSS() }
+
+    def writeProfile(self, profiler, nIterations):
+        fileJSON = self.config.outputDir + 'profile.json'
+        fileCSV  = self.config.outputDir + 'profile.csv'
+        try:
+            profiler.writeJSON(fileJSON, nIterations)
+            profiler.appendCSV(fileCSV, nIterations, not os.path.exists(fileCSV))
+        except:
+            print('WARNING : could not write profiling report')
+
     def rerun(self, newIterTarget):
         self.config.iterTarget = newIterTarget
         return self.run()
@@ -0,0 +1,115 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#______________
+# closedForm.py
+#______________
+#
+# Closed form of the W2 distance between two Gaussian densities
+#
+#   W2^2 = |m0 - m1|^2 + tr( S0 + S1 - 2 ( S0^1/2 S1 S0^1/2 )^1/2 )
+#
+# and of the optimal transport map T(x) = m1 + A ( x - m0 ) with
+#
+#   A = S0^-1/2 ( S0^1/2 S1 S0^1/2 )^1/2 S0^-1/2
+#
+# The affine map is also optimal when f1 is a translate of f0, which is
+# the case of boundaryType = 2.
+#
+
+import numpy as np
+
+from ...grid.displacement import nodes
+
+#__________________________________________________
+
+def sqrtm(S):
+    # square root of a symmetric positive 2x2 matrix
+    (w, V) = np.linalg.eigh(S)
+    return np.dot(V * np.sqrt(np.maximum(w, 0.)), V.T)
+
+#__________________________________________________
+
+def moments(f):
+    # mean and covariance of f/sum(f) on the (M+1)x(N+1) grid of [0,1]^2
+    X,Y  = nodes(f.shape[0]-1, f.shape[1]-1)
+    w    = f / f.sum()
+    mean = np.array([ ( w * X ).sum() , ( w * Y ).sum() ])
+    dX   = X - mean[0]
+    dY   = Y - mean[1]
+    cov  = np.array([ [ ( w * dX * dX ).sum() , ( w * dX * dY ).sum() ] ,
+                      [ ( w * dX * dY ).sum() , ( w * dY * dY ).sum() ] ])
+    return (mean, cov)
+
+#__________________________________________________
+
+def gaussianOnGrid(M, N, mean, cov, mass):
+    # Gaussian density with given moments, sampled on the grid and rescaled to mass
+    X,Y  = nodes(M, N)
+    dX   = X - mean[0]
+    dY   = Y - mean[1]
+    iCov = np.linalg.inv(cov)
+    g    = np.exp( -0.5 * ( iCov[0,0] * dX * dX + 2. * iCov[0,1] * dX * dY + iCov[1,1] * dY * dY ) )
+    return mass * g / g.sum()
+
+#__________________________________________________
+
+def gaussianFitError(f):
+    # relative L1 distance between f and the Gaussian with the same moments
+    (mean, cov) = moments(f)
+    g           = gaussianOnGrid(f.shape[0]-1, f.shape[1]-1, mean, cov, f.sum())
+    return np.abs(f - g).sum() / np.abs(f).sum()
+
+#__________________________________________________
+
+def gaussianTransport(f0, f1):
+    #
+    # returns (W2^2, m0, m1, A) for the Gaussians fitted on f0 and f1
+    #
+    (m0, S0)  = moments(f0)
+    (m1, S1)  = moments(f1)
+
+    S0h       = sqrtm(S0)
+    iS0h      = np.linalg.inv(S0h)
+    C         = sqrtm(np.dot(S0h, np.dot(S1, S0h)))
+
+    A         = np.dot(iS0h, np.dot(C, iS0h))
+    W2        = ( np.power(m1 - m0, 2).sum() +
+                  np.trace(S0) + np.trace(S1) - 2. * np.trace(C) )
+
+    return (max(W2, 0.), m0, m1, A)
+
+#__________________________________________________
+
+def gaussianDisplacement(M, N, m0, m1, A):
+    # T(x) - x on the grid
+    X,Y = nodes(M, N)
+    dX  = m1[0] + A[0,0] * ( X - m0[0] ) + A[0,1] * ( Y - m0[1] ) - X
+    dY  = m1[1] + A[1,0] * ( X - m0[0] ) + A[1,1] * ( Y - m0[1] ) - Y
+    return (dX, dY)
+
+#__________________________________________________
+
+def isGaussianProblem(config):
+    # the grid has been extended for the reservoir
+    if config.dynamics > 2:
+        return False
+
+    # known closed forms
+    if config.boundaryType in [1, 2]:
+        return True
+
+    return ( gaussianFitError(config.boundaries.temporalBoundaries.bt0) < config.gaussianFitTolerance and
+             gaussianFitError(config.boundaries.temporalBoundaries.bt1) < config.gaussianFitTolerance )
+
+#__________________________________________________
@@ -0,0 +1,93 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#________________________
+# Class GaussianAlgorithm
+#________________________
+#
+# defines the algorithm to compute the W2 distance between the temporal boundaries
+# of the configuration using the closed form for Gaussian densities
+#
+# Only the static problem is solved (see StaticAlgorithm).
+#
+
+import time    as tm
+import numpy   as np
+
+from ..staticAlgorithm import StaticState
+from ..staticAlgorithm import StaticAlgorithm
+from closedForm        import gaussianTransport
+from closedForm        import gaussianDisplacement
+
+#__________________________________________________
+
+class GaussianState( StaticState ):
+    '''
+    class to store the solution of a Gaussian Algorithm
+    '''
+
+    def __init__(self, M, N, P, m0, m1, A, nIterations, time, domain=None):
+        StaticState.__init__(self, M, N, P, nIterations, time, domain)
+        self.m0 = m0
+        self.m1 = m1
+        self.A  = A
+
+#__________________________________________________
+
+class GaussianAlgorithm( StaticAlgorithm ):
+    '''
+    class to handle a Gaussian Algorithm
+    '''
+
+    def __repr__(self):
+        return ( 'Gaussian Algorithm' )
+
+    #_________________________
+
+    def displacement(self):
+        # T(x) - x for the affine map between the fitted Gaussians
+        return gaussianDisplacement(self.M, self.N, self.stateN.m0, self.stateN.m1, self.stateN.A)
+
+    #_________________________
+
+    def run(self):
+        print('__________________________________________________')
+        print('Starting algorithm...')
+        print('__________________________________________________')
+        self.config.printConfig()
+        print('__________________________________________________')
+        timeStart = tm.time()
+
+        # catch boundary conditions
+        f0        = self.config.boundaries.temporalBoundaries.bt0
+        f1        = self.config.boundaries.temporalBoundaries.bt1
+
+        (W2, m0, m1, A) = gaussianTransport(f0, f1)
+
+        # Scales W2^2 as functionalJ, i.e. sum(m**2/f) on the (M+1)x(N+1)x(P+1) grid
+        finalJ    = self.P * f0.sum() * W2
+
+        timeAlgo    = tm.time() - timeStart
+        self.stateN = GaussianState(self.M, self.N, self.P, m0, m1, A, 0, timeAlgo, self.domain)
+
+        print('__________________________________________________')
+        print('Algorithm finished')
+        print('W2                       = '+str(np.sqrt(W2)))
+        print('J                        = '+str(finalJ))
+        print('Time taken               : '+str(timeAlgo))
+        print('__________________________________________________')
+
+        self.saveState()
+        return finalJ
+
+#__________________________________________________
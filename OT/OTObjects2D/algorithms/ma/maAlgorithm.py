@@ -0,0 +1,169 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#__________________
+# Class MaAlgorithm
+#__________________
+#
+# defines the algorithm to compute the W2 distance between the temporal boundaries
+# of the configuration by solving the Monge-Ampere equation
+#
+# Only valid for smooth positive densities : the densities are floored to
+# maDensityFloor times their mean before solving.
+#
+# If the Newton iterations do not converge, W2 and J are nan and the state
+# is marked as not converged.
+#
+# Only the static problem is solved (see StaticAlgorithm).
+#
+
+import time    as tm
+import numpy   as np
+
+from ..staticAlgorithm          import StaticState
+from ..staticAlgorithm          import StaticAlgorithm
+from ...proximals.div.proxCdivb import ProxCdivb
+from mongeAmpere                import MongeAmpereSolver
+from mongeAmpere                import derivativeMatrices
+
+#__________________________________________________
+
+class MaState( StaticState ):
+    '''
+    class to store the solution of a Monge-Ampere Algorithm
+    '''
+
+    def __init__(self, M, N, P, potential, nIterations, time, converged, continuation, domain=None):
+        StaticState.__init__(self, M, N, P, nIterations, time, domain)
+        self.potential    = potential
+        self.converged    = converged
+        self.continuation = continuation
+
+#__________________________________________________
+
+class MaAlgorithm( StaticAlgorithm ):
+    '''
+    class to handle a Monge-Ampere Algorithm
+    '''
+
+    def __repr__(self):
+        return ( 'Monge-Ampere Algorithm' )
+
+    #_________________________
+
+    def displacement(self):
+        # T(x) - x = grad(phi), only if the Newton iterations converged
+        if not self.stateN.converged:
+            return None
+
+        (Dx, Dy, Dxx, Dyy, Dxy) = derivativeMatrices(self.M, self.N)
+        phi = self.stateN.potential.ravel()
+        return ( ( Dx * phi ).reshape(self.stateN.potential.shape) ,
+                 ( Dy * phi ).reshape(self.stateN.potential.shape) )
+
+    #_________________________
+
+    def run(self):
+        print('__________________________________________________')
+        print('Starting algorithm...')
+        print('__________________________________________________')
+        self.config.printConfig()
+        print('__________________________________________________')
+        timeStart = tm.time()
+
+        # catch boundary conditions
+        f0        = self.config.boundaries.temporalBoundaries.bt0
+        f1        = self.config.boundaries.temporalBoundaries.bt1
+
+        # positive densities with mean 1
+        a         = np.maximum(f0, self.config.maDensityFloor * f0.mean())
+        b         = np.maximum(f1, self.config.maDensityFloor * f1.mean())
+        a         = a / a.mean()
+        b         = b / b.mean()
+
+        solver    = MongeAmpereSolver(a, b,
+                                      ProxCdivb(self.M, self.N, 0, domain=self.domain),
+                                      self.config.maLinearTolerance,
+                                      self.config.maLinearMaxIter,
+                                      self.config.maMinStep)
+
+        #
+        # continuation from the uniform densities : the Newton iterations solve the
+        # equation between (1-s)+s*a and (1-s)+s*b, starting from the solution of the
+        # last value of s that converged. The increment of s is doubled after a success
+        # and halved after a failure, down to maMinContinuationStep.
+        #
+        phi       = np.zeros(shape=a.shape)
+        s         = 0.
+        ds        = 1.
+        error     = 0.
+        nIter     = 0
+
+        while s < 1. and ds >= self.config.maMinContinuationStep and nIter < self.config.iterTarget:
+            sTrial = min(1., s + ds)
+            solver.setDensities(( 1. - sTrial ) + sTrial * a, ( 1. - sTrial ) + sTrial * b)
+
+            phiTrial = phi
+            (residual, convex, coefficients) = solver.linearization(phiTrial)
+            error    = np.abs(residual).max()
+            theta    = 1.
+
+            while nIter < self.config.iterTarget and error > self.config.maTolerance and theta > 0.:
+                (phiTrial, residual, coefficients, theta) = solver.step(phiTrial, residual, coefficients)
+                error  = np.abs(residual).max()
+                nIter += 1
+
+                if np.mod(nIter, self.config.nModPrint) == 0:
+                    print('___________________________________')
+                    print('iteration   : '+str(nIter)+'/'+str(self.config.iterTarget))
+                    print('elpsed time : '+str(tm.time()-timeStart))
+                    print('continuation: '+str(sTrial))
+                    print('residual    = '+str(error))
+                    print('step        = '+str(theta))
+
+            if error <= self.config.maTolerance:
+                phi = phiTrial
+                s   = sTrial
+                ds *= 2.
+            else:
+                ds *= 0.5
+
+        converged = ( s == 1. )
+
+        if converged:
+            W2     = solver.transportCost(phi)
+            # Scales W2^2 as functionalJ, i.e. sum(m**2/f) on the (M+1)x(N+1)x(P+1) grid
+            finalJ = self.P * f0.sum() * W2
+        else:
+            print('WARNING : the Newton iterations did not converge beyond the continuation parameter '+str(s))
+            print('          the densities may be too irregular for this grid')
+            W2     = np.nan
+            finalJ = np.nan
+
+        timeAlgo    = tm.time() - timeStart
+        self.stateN = MaState(self.M, self.N, self.P, phi, nIter, timeAlgo, converged, s, self.domain)
+
+        print('__________________________________________________')
+        print('Algorithm finished')
+        print('Number of iterations     : '+str(nIter))
+        print('Converged                : '+str(converged))
+        print('Residual                 = '+str(error))
+        print('W2                       = '+str(np.sqrt(W2)))
+        print('J                        = '+str(finalJ))
+        print('Time taken               : '+str(timeAlgo))
+        print('__________________________________________________')
+
+        self.saveState()
+        return finalJ
+
+#__________________________________________________
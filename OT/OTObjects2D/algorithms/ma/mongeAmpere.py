@@ -0,0 +1,254 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_______________
+# mongeAmpere.py
+#_______________
+#
+# Damped Newton solver for the Monge-Ampere equation, written in logarithmic form
+#
+#   log( a ) - log( b( x + grad(phi) ) ) - log( det( I + D2(phi) ) ) = 0
+#
+# on the (M+1)x(N+1) grid of [0,1]^2, with homogeneous Neumann boundary conditions
+# on the displacement potential phi. The transport map is T(x) = x + grad(phi).
+#
+# The derivatives are centered differences, stored as sparse matrices. log(b) is
+# evaluated at T(x) with a cubic spline. The residual is defined up to a constant,
+# hence its mean is removed and phi is sought with zero mean.
+#
+# Each Newton step solves the linearized equation with GMRES, preconditioned
+# by the inverse of the Laplacian computed with the DCT of ProxCdivb. If GMRES
+# does not reach the tolerance, or if its direction does not decrease the
+# residual, the linearized equation is solved with a sparse direct solver.
+#
+# The densities a and b are assumed to be positive, with mean 1.
+#
+
+import numpy               as np
+import scipy.sparse        as sps
+import scipy.sparse.linalg as spla
+
+from scipy.ndimage         import map_coordinates
+
+from ...grid.displacement  import nodes
+
+#__________________________________________________
+
+def differenceMatrices(n, h):
+    # first and second order centered differences on n nodes with reflected ends,
+    # i.e. the first order difference vanishes on the boundary nodes
+    D1 = sps.lil_matrix((n,n))
+    D2 = sps.lil_matrix((n,n))
+
+    for i in xrange(1,n-1):
+        D1[i,i+1] = 0.5 / h
+        D1[i,i-1] = - 0.5 / h
+        D2[i,i+1] = 1. / ( h * h )
+        D2[i,i-1] = 1. / ( h * h )
+        D2[i,i]   = - 2. / ( h * h )
+
+    D2[0,0]     = - 2. / ( h * h )
+    D2[0,1]     = 2. / ( h * h )
+    D2[n-1,n-1] = - 2. / ( h * h )
+    D2[n-1,n-2] = 2. / ( h * h )
+
+    return (D1.tocsr(), D2.tocsr())
+
+#__________________________________________________
+
+def derivativeMatrices(M, N):
+    # (Dx, Dy, Dxx, Dyy, Dxy) acting on the raveled (M+1)x(N+1) arrays
+    (D1x, D2x) = differenceMatrices(M+1, 1./M)
+    (D1y, D2y) = differenceMatrices(N+1, 1./N)
+    Ix         = sps.identity(M+1)
+    Iy         = sps.identity(N+1)
+
+    return ( sps.kron(D1x, Iy).tocsr() ,
+             sps.kron(Ix, D1y).tocsr() ,
+             sps.kron(D2x, Iy).tocsr() ,
+             sps.kron(Ix, D2y).tocsr() ,
+             sps.kron(D1x, D1y).tocsr() )
+
+#__________________________________________________
+
+def splineInterpolation(field, X, Y):
+    # interpolates field, given on the nodes of [0,1]^2, at the points (X,Y)
+    M = field.shape[0] - 1
+    N = field.shape[1] - 1
+    return map_coordinates(field, [X*M, Y*N], order=3, mode='nearest')
+
+#__________________________________________________
+
+class MongeAmpereSolver:
+    '''
+    Damped Newton solver for the Monge-Ampere equation
+    '''
+
+    def __init__(self, a, b, poisson, linearTolerance, linearMaxIter, minStep):
+        self.M       = a.shape[0] - 1
+        self.N       = a.shape[1] - 1
+        self.shape   = a.shape
+        self.poisson = poisson
+        self.setDensities(a, b)
+
+        (self.Dx, self.Dy, self.Dxx, self.Dyy, self.Dxy) = derivativeMatrices(self.M, self.N)
+
+        (X, Y)  = nodes(self.M, self.N)
+        self.X  = X.ravel()
+        self.Y  = Y.ravel()
+
+        # step used to differentiate the spline of log(b)
+        self.dT = 1.e-5
+
+        self.linearTolerance = linearTolerance
+        self.linearMaxIter   = linearMaxIter
+        self.minStep         = minStep
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Damped Newton solver for the Monge-Ampere equation'
+
+    #_________________________
+
+    def setDensities(self, a, b):
+        self.a    = a
+        self.b    = b
+        self.logA = np.log(a).ravel()
+        self.logB = np.log(b)
+
+    #_________________________
+
+    def linearization(self, phi):
+        # returns (residual, convex, coefficients), the residual is None if phi is not convex
+        phi = phi.ravel()
+        uxx = 1. + self.Dxx * phi
+        uyy = 1. + self.Dyy * phi
+        uxy = self.Dxy * phi
+        det = uxx * uyy - uxy * uxy
+
+        convex = ( uxx.min() > 0. and uyy.min() > 0. and det.min() > 0. )
+        if not convex:
+            return (None, False, None)
+
+        TX     = self.X + self.Dx * phi
+        TY     = self.Y + self.Dy * phi
+        logBT  = splineInterpolation(self.logB, TX, TY)
+        logBxT = ( splineInterpolation(self.logB, TX + self.dT, TY) -
+                   splineInterpolation(self.logB, TX - self.dT, TY) ) / ( 2. * self.dT )
+        logByT = ( splineInterpolation(self.logB, TX, TY + self.dT) -
+                   splineInterpolation(self.logB, TX, TY - self.dT) ) / ( 2. * self.dT )
+
+        residual  = self.logA - logBT - np.log(det)
+        residual -= residual.mean()
+
+        return (residual.reshape(self.shape), convex, (logBxT, logByT, uxx, uyy, uxy, det))
+
+    #_________________________
+
+    def jacobian(self, coefficients):
+        #
+        # returns - [ cof(D2u) : D2(psi) / det(D2u) + grad(log(b))(T) . grad(psi) ]
+        # i.e. the derivative of the residual in the direction psi, up to its mean
+        #
+        (logBxT, logByT, uxx, uyy, uxy, det) = coefficients
+        return - ( sps.diags(uyy/det) * self.Dxx +
+                   sps.diags(uxx/det) * self.Dyy -
+                   sps.diags(2.*uxy/det) * self.Dxy +
+                   sps.diags(logBxT) * self.Dx +
+                   sps.diags(logByT) * self.Dy )
+
+    #_________________________
+
+    def applyPreconditioner(self, r):
+        r = r.reshape((self.M+1,self.N+1,1))
+        return - self.poisson.inverseLaplacian(r - r.mean()).ravel()
+
+    #_________________________
+
+    def newtonDirection(self, residual, coefficients, direct=False):
+        J     = self.jacobian(coefficients)
+        shape = J.shape
+        size  = shape[0]
+        info  = 1
+
+        if not direct:
+            # the residual has zero mean, and so must the linearized residual
+            A = spla.LinearOperator(shape,
+                                    matvec=lambda v: J * v - ( J * v ).mean(),
+                                    dtype=float)
+            P = spla.LinearOperator(shape,
+                                    matvec=self.applyPreconditioner,
+                                    dtype=float)
+
+            (psi, info) = spla.gmres(A, -residual.ravel(),
+                                     tol=self.linearTolerance,
+                                     maxiter=self.linearMaxIter,
+                                     M=P)
+
+        if not info == 0:
+            # bordered system, the multiplier of the zero mean constraint absorbs the mean of J.psi
+            ones = sps.csr_matrix(np.ones(shape=(size,1)))
+            K    = sps.bmat([[J, ones], [ones.T, None]]).tocsc()
+            psi  = spla.spsolve(K, np.append(-residual.ravel(), 0.))[:size]
+
+        psi = psi.reshape(self.shape)
+        return psi - psi.mean()
+
+    #_________________________
+
+    def lineSearch(self, phi, psi, norm):
+        theta = 1.
+
+        while theta >= self.minStep:
+            phiTrial = phi + theta * psi
+            (residualTrial, convex, coefficientsTrial) = self.linearization(phiTrial)
+            if convex and np.sqrt(( residualTrial * residualTrial ).mean()) < ( 1. - 1.e-4 * theta ) * norm:
+                return (phiTrial, residualTrial, coefficientsTrial, theta)
+            theta *= 0.5
+
+        return (None, None, None, 0.)
+
+    #_________________________
+
+    def step(self, phi, residual, coefficients):
+        #
+        # damped Newton step, the L2 norm of the residual must decrease and phi stay convex
+        # if the GMRES direction fails, the step is tried again with the exact Newton direction
+        #
+        norm = np.sqrt(( residual * residual ).mean())
+
+        for direct in [False, True]:
+            psi = self.newtonDirection(residual, coefficients, direct)
+            (phiTrial, residualTrial, coefficientsTrial, theta) = self.lineSearch(phi, psi, norm)
+            if theta > 0.:
+                return (phiTrial, residualTrial, coefficientsTrial, theta)
+
+        return (phi, residual, coefficients, 0.)
+
+    #_________________________
+
+    def displacement(self, phi):
+        # T(x) - x = grad(phi)
+        phi = phi.ravel()
+        return ( ( self.Dx * phi ).reshape(self.shape) ,
+                 ( self.Dy * phi ).reshape(self.shape) )
+
+    #_________________________
+
+    def transportCost(self, phi):
+        # W2^2 between the probability densities a and b
+        (dX, dY) = self.displacement(phi)
+        return ( self.a * ( dX * dX + dY * dY ) ).sum() / self.a.sum()
+
+#__________________________________________________
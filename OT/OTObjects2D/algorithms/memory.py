@@ -0,0 +1,147 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+###########
+# memory.py
+###########
+#
+# Predicts the memory footprint of an algorithm from (M, N, P, algoName, dynamics)
+# without allocating anything :
+#   * states     -> the fields of stateN and stateNP1 (only one state in low-memory mode,
+#                   stateNP1 being then the same object as stateN)
+#   * transient  -> the temporaries alive at the same time during one step
+#   * proximals  -> the precomputed eigenvalues, inverse matrices and kernels
+#   * boundaries -> the boundary conditions
+#   * process    -> the resident memory of the process before the allocation
+#
+# In single precision, the states and the temporaries are in float32 and the
+# proximals are kept in float64 next to their float32 copy. When switching
+# precision, the states are alive in both precisions at the same time. In mixed
+# precision, the peak is reached during the float64 refinements.
+#
+# The transient part is an upper estimate obtained by counting the temporaries
+# of the step functions, the temporaries inside a proximal operator being
+# counted as one field.
+#
+
+from ...utils.sys.metrics import currentRSS
+
+# fields of one state
+stateFields     = { 'adr'  : [ 'staggeredCentered' ] * 2 ,
+                    'wfr'  : [ 'staggeredCenteredSource' ] * 2 ,
+                    'adr3' : [ 'staggeredCentered' ] * 4 ,
+                    'pd'   : [ 'staggered' , 'staggered' , 'centered' ] }
+
+# (number, type) of the fields allocated at the same time during one step
+#   * adr, wfr -> 2*z-w, the result of prox1 and one temporary inside prox1
+#   * adr3     -> p1, p2, p3, p and two temporaries of the updates
+#   * pd       -> the argument and the result of a proximal, one temporary inside it
+transientFields = { 'adr'  : ( 3 , 'staggeredCentered' ) ,
+                    'wfr'  : ( 3 , 'staggeredCenteredSource' ) ,
+                    'adr3' : ( 6 , 'staggeredCentered' ) ,
+                    'pd'   : ( 3 , 'staggered' ) }
+
+def fieldSizes(M, N, P):
+    # number of elements of each type of field
+    n         = (M+1)*(N+1)*(P+1)
+    staggered = (M+2)*(N+1)*(P+1) + (M+1)*(N+2)*(P+1) + (M+1)*(N+1)*(P+2)
+    centered  = 3*n
+
+    return { 'cell'                    : n ,
+             'staggered'               : staggered ,
+             'centered'                : centered ,
+             'staggeredCentered'       : staggered + centered ,
+             'staggeredCenteredSource' : staggered + centered + 2*n }
+
+def predictMemory(M, N, P, algoName, dynamics, lowMemory=False, masked=False, precision='double'):
+    #
+    # returns the number of bytes of each part and the predicted peak
+    # the static solvers (sinkhorn, ma, gaussian) only store potentials and
+    # temporaries on the spatial grid, and the separable kernels of sinkhorn
+    #
+    sizes = fieldSizes(M, N, P)
+    n     = sizes['cell']
+
+    if algoName in stateFields:
+        nStates   = 1 if lowMemory else 2
+        states    = nStates * sum( [ sizes[field] for field in stateFields[algoName] ] )
+        (nTransient, transientType) = transientFields[algoName]
+        transient = nTransient * sizes[transientType]
+
+        # eigenvalues of the divergence projector, divergence and centered kernels,
+        # tridiagonal inverse matrices of the interpolation projector
+        proximals = 5*n + (M+1)**2 + (N+1)**2 + (P+1)**2
+        if masked:
+            # first guess (persistent) and vectors (transient) of the conjugate gradient
+            proximals += n
+            transient += 5*n
+    else:
+        states    = 2*(M+1)*(N+1)
+        transient = 4*(M+1)*(N+1)
+        proximals = (M+1)**2 + (N+1)**2
+        precision = 'double'
+
+    boundaries = 2*(M+1)*(N+1)
+    if not dynamics in [2, 5]:
+        boundaries += 2*(N+1)*(P+1) + 2*(M+1)*(P+1)
+
+    if precision == 'single':
+        # float32 iterations, or float64 copy of the states when switching precision
+        transient = max( 4 * transient , 8 * states )
+        states    = 4 * states
+        proximals = 12 * proximals
+    elif precision == 'mixed':
+        transient = max( 8 * transient , 4 * states )
+        states    = 8 * states
+        proximals = 12 * proximals
+    else:
+        states    = 8 * states
+        transient = 8 * transient
+        proximals = 8 * proximals
+
+    report = { 'states'     : states ,
+               'transient'  : transient ,
+               'proximals'  : proximals ,
+               'boundaries' : 8 * boundaries ,
+               'process'    : currentRSS() }
+    report['peak'] = sum(report.values())
+    return report
+
+def memoryReportForConfig(config):
+    return predictMemory(config.M, config.N, config.P, config.algoName, config.dynamics,
+                         getattr(config, 'lowMemory', False),
+                         getattr(config, 'mask', None) is not None,
+                         getattr(config, 'precision', 'double'))
+
+def availableMemory():
+    # in bytes, None if /proc/meminfo is not available
+    try:
+        f = open('/proc/meminfo', 'r')
+        for line in f:
+            if line.startswith('MemAvailable:'):
+                f.close()
+                return 1024 * int(line.split()[1])
+        f.close()
+    except:
+        pass
+    return None
+
+def printMemoryReport(report):
+    print('Predicted memory (MB)')
+    for part in ['states', 'transient', 'proximals', 'boundaries', 'process', 'peak']:
+        print('    '+part.ljust(11)+': '+'%.1f' % ( report[part] / 1024.**2 ))
+
+    available = availableMemory()
+    if available is not None and report['peak'] > available:
+        print('WARNING : predicted peak memory above the available memory ('+'%.1f' % ( available / 1024.**2 )+' MB)')
+        print('          consider lowMemory = True, precision = single or a smaller grid')
@@ -57,9 +57,9 @@ class PdAlgorithm( Algorithm ):
                 stagField = newState.convergingStaggeredField()
 
             centField   = stagField.interpolation()
-            self.stateN = PdState( self.M , self.N , self.P , stagField , stagField.copy() , centField )
+            self.stateN = PdState( self.M , self.N , self.P , stagField , stagField.copy() , centField , domain=self.domain )
 
-        self.stateNP1 = self.stateN.copy()
+        self.stateNP1 = self.nextState()
 
     def initialize(self):
         Algorithm.initialize(self)
@@ -69,6 +69,6 @@ class PdAlgorithm( Algorithm ):
             y = u.copy()
             v = u.interpolation()
 
-            self.stateN = PdState( self.M , self.N , self.P , u , y , v )
-            self.stateNP1 = self.stateN.copy()
+            self.stateN = PdState( self.M , self.N , self.P , u , y , v , domain=self.domain )
+            self.stateNP1 = self.nextState()
     
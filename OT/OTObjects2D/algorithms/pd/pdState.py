@@ -28,19 +28,19 @@ class PdState( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  u=None , y=None , v=None ):
+                  u=None , y=None , v=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if u is None:
-            self.u = grid.StaggeredField(M,N,P)
+            self.u = grid.StaggeredField(M,N,P, domain=domain)
         else:
             self.u = u
         if y is None:
-            self.y = grid.StaggeredField(M,N,P)
+            self.y = grid.StaggeredField(M,N,P, domain=domain)
         else:
             self.y = y
         if v is None:
-            self.v = grid.CenteredField(M,N,P)
+            self.v = grid.CenteredField(M,N,P, domain=domain)
         else:
             self.v = v
 
@@ -61,50 +61,50 @@ class PdState( OTObject ):
     def __add__(self, other):
         if isinstance(other,PdState):
             return PdState( self.M , self.N , self.P ,
-                            self.u + other.u , self.y + other.y , self.v + other.v )
+                            self.u + other.u , self.y + other.y , self.v + other.v , domain=self.domain )
         else:
             return PdState( self.M , self.N , self.P ,
-                            self.u + other , self.y + other , self.v + other )
+                            self.u + other , self.y + other , self.v + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,PdState):
             return PdState( self.M , self.N , self.P ,
-                            self.u - other.u , self.y - other.y , self.v - other.v )
+                            self.u - other.u , self.y - other.y , self.v - other.v , domain=self.domain )
         else:
             return PdState( self.M , self.N , self.P ,
-                            self.u - other , self.y - other , self.v - other )
+                            self.u - other , self.y - other , self.v - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,PdState):
             return PdState( self.M , self.N , self.P ,
-                            self.u * other.u , self.y * other.y , self.v * other.v )
+                            self.u * other.u , self.y * other.y , self.v * other.v , domain=self.domain )
         else:
             return PdState( self.M , self.N , self.P ,
-                            self.u * other , self.y * other , self.v * other )
+                            self.u * other , self.y * other , self.v * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,PdState):
             return PdState( self.M , self.N , self.P ,
-                            self.u / other.u , self.y / other.y , self.v / other.v )
+                            self.u / other.u , self.y / other.y , self.v / other.v , domain=self.domain )
         else:
             return PdState( self.M , self.N , self.P ,
-                            self.u / other , self.y / other , self.v / other )
+                            self.u / other , self.y / other , self.v / other , domain=self.domain )
 
     def __radd__(self, other):
         return PdState( self.M , self.N , self.P ,
-                        other + self.u , other + self.y , other + self.v )
+                        other + self.u , other + self.y , other + self.v , domain=self.domain )
 
     def __rsub__(self, other):
         return PdState( self.M , self.N , self.P ,
-                        other - self.u , other - self.y , other - self.v )
+                        other - self.u , other - self.y , other - self.v , domain=self.domain )
 
     def __rmul__(self, other):
         return PdState( self.M , self.N , self.P ,
-                        other * self.u , other * self.y , other * self.v )
+                        other * self.u , other * self.y , other * self.v , domain=self.domain )
 
     def __rdiv__(self, other):
         return PdState( self.N , self.P ,
-                        other / self.u , other / self.y , other / self.v )
+                        other / self.u , other / self.y , other / self.v , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,PdState):
@@ -156,16 +156,16 @@ class PdState( OTObject ):
 
     def __neg__(self):
         return PdState( self.M , self.N , self.P ,
-                        - self.u , - self.y , - self.v )
+                        - self.u , - self.y , - self.v , domain=self.domain )
 
     def __pos__(self):
         return PdState( self.M , self.N , self.P ,
-                        + self.u , + self.y , + self.v )
+                        + self.u , + self.y , + self.v , domain=self.domain )
 
     def __abs__(self):
         return PdState( self.M , self.N , self.P ,
-                        abs ( self.u ) , abs ( self.y ) , abs ( self.v ) )
+                        abs ( self.u ) , abs ( self.y ) , abs ( self.v ) , domain=self.domain )
     def copy(self):
         return PdState( self.M , self.N , self.P ,
-                        self.u.copy() , self.y.copy() , self.v.copy() )
+                        self.u.copy() , self.y.copy() , self.v.copy() , domain=self.domain )
 
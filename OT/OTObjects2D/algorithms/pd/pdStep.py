@@ -36,9 +36,11 @@ class PdStep:
         return ( 'Step function for a PD algorithm' )
 
     def __call__(self, stateN, stateNP1):
+        # stateNP1 may be stateN (low-memory mode)
+        uN = stateN.u
         stateNP1.v = self.prox1( stateN.v + ( self.sigma * stateN.y.interpolation() ) )
-        stateNP1.u = self.prox2( stateN.u - ( self.tau * stateNP1.v.Tinterpolation() ) ) 
+        stateNP1.u = self.prox2( uN - ( self.tau * stateNP1.v.Tinterpolation() ) ) 
         stateNP1.y = ( ( ( 1. + self.theta ) * stateNP1.u ) - 
-                       ( self.theta * stateN.u ) )
+                       ( self.theta * uN ) )
 
 
@@ -0,0 +1,106 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+##############
+# precision.py
+##############
+#
+# Floating point precision of the iterations (config.precision) :
+#   * double -> every iteration in float64
+#   * single -> every iteration in float32
+#   * mixed  -> iterations in float32, except the last mixedRefineIterations
+#               iterations of every block of mixedRefinePeriod iterations and
+#               the last mixedRefineIterations iterations of the run, in float64
+#
+# The states and the step function are switched from one precision to the
+# other by castArrays, the step function in float64 being kept so that the
+# precomputed arrays of the proximals never lose their precision. The objects
+# of the copy create their arrays in the new precision as well, see the dtype
+# of their physical domain.
+#
+
+import types
+import copy
+import numpy as np
+
+from ..OTObject import OTObject
+from ..OTObject import PhysicalDomain
+
+def castArrays(obj, dtype, memo=None):
+    #
+    # returns a copy of obj in which the floating point arrays are of type dtype
+    # the objects shared inside obj are still shared in the copy
+    #
+    if memo is None:
+        memo = {}
+    if id(obj) in memo:
+        return memo[id(obj)]
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'f':
+            result = obj.astype(dtype)
+        elif obj.dtype.kind == 'c':
+            result = obj.astype(np.promote_types(dtype, np.complex64))
+        else:
+            result = obj
+
+    elif isinstance(obj, PhysicalDomain):
+        result = obj.withPrecision(dtype)
+
+    elif isinstance(obj, list):
+        result = []
+        memo[id(obj)] = result
+        result.extend( [ castArrays(o, dtype, memo) for o in obj ] )
+
+    elif isinstance(obj, tuple):
+        result = tuple( [ castArrays(o, dtype, memo) for o in obj ] )
+
+    elif isinstance(obj, dict):
+        result = {}
+        memo[id(obj)] = result
+        for (key, value) in obj.items():
+            result[key] = castArrays(value, dtype, memo)
+
+    elif ( hasattr(obj, '__dict__') and
+           not isinstance(obj, (type, types.ClassType, types.ModuleType,
+                                types.FunctionType, types.MethodType)) ):
+        result = copy.copy(obj)
+        memo[id(obj)] = result
+        for (name, value) in obj.__dict__.items():
+            result.__dict__[name] = castArrays(value, dtype, memo)
+        if isinstance(obj, OTObject):
+            # objects saved without physical domain use the default one
+            result.setDomain(castArrays(result.domain, dtype, memo))
+
+    else:
+        result = obj
+
+    memo[id(obj)] = result
+    return result
+
+def precisionForIteration(config, iterCount):
+    # dtype of the iterations iterCount and iterCount+1
+    precision = getattr(config, 'precision', 'double')
+
+    if precision == 'single':
+        return 'float32'
+
+    if precision == 'mixed':
+        period = config.mixedRefinePeriod
+        refine = config.mixedRefineIterations
+        if config.iterTarget - iterCount <= refine:
+            return 'float64'
+        if period <= 0 or np.mod(iterCount, period) < period - refine:
+            return 'float32'
+
+    return 'float64'
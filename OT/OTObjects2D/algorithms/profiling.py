@@ -0,0 +1,52 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+##############
+# profiling.py
+##############
+#
+# Instruments the proximal operators, the grid operators and the step
+# function of an algorithm (see utils/sys/profiler.py)
+#
+# The self time of the step function is the time spent in the step
+# arithmetic, i.e. outside of the proximal and grid operators
+#
+
+from ...utils.sys.profiler             import Profiler
+from ..grid                            import grid
+from ..proximals.projector             import Projector
+from ..proximals.proximalJ             import ProxJ
+from ..proximals.proximalJ             import ProxJMasked
+from ..proximals.div.proxCdivp         import ProxCdivp
+from ..proximals.div.proxCdivMasked    import ProxCdivMasked
+from ..proximals.div.proxCdivSource    import ProxCdivbSource
+from ..proximals.div.proxCdivSource    import ProxCdivtbSource
+from ..proximals.sc.proxCscp           import ProxCscp
+from ..proximals.bound.proxCb          import ProxCb
+from ..proximals.bound.proxCtb         import ProxCtb
+from ..proximals.bound.proxCrb         import ProxCrb
+
+def profilerForAlgorithm(algorithm):
+    profiler = Profiler()
+
+    # the proximals are labelled with the name of their class
+    for cls in [ Projector , ProxCdivp , ProxCdivMasked , ProxCdivbSource , ProxCdivtbSource ,
+                 ProxCscp , ProxCb , ProxCtb , ProxCrb , ProxJ , ProxJMasked ]:
+        profiler.patchClass(cls, '__call__')
+
+    profiler.patchClass(grid.StaggeredField, 'interpolation', 'StaggeredField.interpolation')
+    profiler.patchClass(grid.StaggeredField, 'divergence', 'StaggeredField.divergence')
+    profiler.patchClass(grid.CenteredField, 'Tinterpolation', 'CenteredField.Tinterpolation')
+
+    profiler.patchObject(algorithm, 'stepFunction', 'step')
+    return profiler
@@ -0,0 +1,150 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#____________
+# sinkhorn.py
+#____________
+#
+# Entropy-regularized OT between two densities on the (M+1)x(N+1) grid of [0,1]^2
+#
+# The iterations are written in the log domain on the dual potentials (f,g).
+# Since the squared euclidian cost is separable, the Gaussian kernel is applied
+# as two 1D log-convolutions, first along y then along x.
+#
+# The regularization parameter eps is decreased geometrically (epsilon scaling)
+# from eps = 1 to the target value.
+#
+
+import numpy as np
+
+#__________________________________________________
+
+def squaredDistances(n):
+    x = np.linspace(0.0, 1.0, n)
+    return np.power(x[:,np.newaxis] - x[np.newaxis,:], 2)
+
+#__________________________________________________
+
+def logSumExp(A, axis):
+    Amax = A.max(axis=axis)
+    Amax = np.where(np.isfinite(Amax), Amax, 0.0)
+    with np.errstate(divide='ignore'):
+        return Amax + np.log(np.exp(A - np.expand_dims(Amax, axis)).sum(axis=axis))
+
+#__________________________________________________
+
+def softMin(h, Cx, Cy, eps):
+    #
+    # returns -eps * log( sum_kl exp( h_kl - ( Cx_ik + Cy_jl ) / eps ) )
+    #
+    A = logSumExp(h[:,np.newaxis,:] - Cy[np.newaxis,:,:] / eps, axis=2)
+    B = logSumExp(A[np.newaxis,:,:] - Cx[:,:,np.newaxis] / eps, axis=1)
+    return -eps * B
+
+#__________________________________________________
+
+def logDensity(a):
+    with np.errstate(divide='ignore'):
+        return np.log(np.maximum(a, 0.0) / np.maximum(a, 0.0).sum())
+
+#__________________________________________________
+
+def epsilonScaling(epsTarget, scaling, eps0=1.0):
+    epsList = [max(eps0, epsTarget)]
+    while epsList[-1] * scaling > epsTarget:
+        epsList.append(epsList[-1] * scaling)
+    if epsList[-1] > epsTarget:
+        epsList.append(epsTarget)
+    return epsList
+
+#__________________________________________________
+
+def sinkhornPotentials(loga, logb, Cx, Cy, epsList, nIterScaling, iterMax, tolerance):
+    a = np.exp(loga)
+    f = np.zeros(shape=loga.shape)
+    g = np.zeros(shape=logb.shape)
+
+    for eps in epsList[:-1]:
+        for n in xrange(nIterScaling):
+            f = softMin(logb + g / eps, Cx, Cy, eps)
+            g = softMin(loga + f / eps, Cx, Cy, eps)
+
+    eps   = epsList[-1]
+    f     = softMin(logb + g / eps, Cx, Cy, eps)
+    nIter = 0
+    error = np.inf
+
+    while nIter < iterMax and error > tolerance:
+        g     = softMin(loga + f / eps, Cx, Cy, eps)
+        fNew  = softMin(logb + g / eps, Cx, Cy, eps)
+
+        # error on the first marginal of the plan defined by (f,g)
+        with np.errstate(over='ignore', invalid='ignore'):
+            error = np.nansum( a * np.abs( 1.0 - np.exp( ( f - fNew ) / eps ) ) )
+
+        f      = fNew
+        nIter += 1
+
+    return (f, g, nIter, error)
+
+#__________________________________________________
+
+def sinkhornSymmetricPotential(loga, Cx, Cy, epsList, nIterScaling, iterMax, tolerance):
+    a = np.exp(loga)
+    p = np.zeros(shape=loga.shape)
+
+    for eps in epsList[:-1]:
+        for n in xrange(nIterScaling):
+            p = 0.5 * ( p + softMin(loga + p / eps, Cx, Cy, eps) )
+
+    eps   = epsList[-1]
+    nIter = 0
+    error = np.inf
+
+    while nIter < iterMax and error > tolerance:
+        pNew   = 0.5 * ( p + softMin(loga + p / eps, Cx, Cy, eps) )
+        error  = ( a * np.abs( pNew - p ) ).sum() / eps
+        p      = pNew
+        nIter += 1
+
+    return p
+
+#__________________________________________________
+
+def sinkhorn(f0, f1, epsTarget, scaling, nIterScaling, iterMax, tolerance, debiased):
+    #
+    # returns an approximation of W2^2 between f0/sum(f0) and f1/sum(f1)
+    # as well as the dual potentials and the convergence information
+    #
+    loga    = logDensity(f0)
+    logb    = logDensity(f1)
+    a       = np.exp(loga)
+    b       = np.exp(logb)
+
+    Cx      = squaredDistances(f0.shape[0])
+    Cy      = squaredDistances(f0.shape[1])
+    epsList = epsilonScaling(epsTarget, scaling)
+
+    (f, g, nIter, error) = sinkhornPotentials(loga, logb, Cx, Cy, epsList, nIterScaling, iterMax, tolerance)
+
+    # a * f vanishes outside the support of a
+    cost    = np.nansum(a * f) + np.nansum(b * g)
+
+    if debiased:
+        p     = sinkhornSymmetricPotential(loga, Cx, Cy, epsList, nIterScaling, iterMax, tolerance)
+        q     = sinkhornSymmetricPotential(logb, Cx, Cy, epsList, nIterScaling, iterMax, tolerance)
+        cost -= np.nansum(a * p) + np.nansum(b * q)
+
+    return (max(cost, 0.0), f, g, nIter, error)
+
+#__________________________________________________
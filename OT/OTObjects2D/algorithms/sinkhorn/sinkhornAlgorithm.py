@@ -0,0 +1,94 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#________________________
+# Class SinkhornAlgorithm
+#________________________
+#
+# defines the algorithm to compute the entropy-regularized W2 distance
+# between the temporal boundaries of the configuration
+#
+# Only the static problem is solved (see StaticAlgorithm).
+#
+
+import time    as tm
+import numpy   as np
+
+from ..staticAlgorithm import StaticState
+from ..staticAlgorithm import StaticAlgorithm
+from sinkhorn          import sinkhorn
+
+#__________________________________________________
+
+class SinkhornState( StaticState ):
+    '''
+    class to store the solution of a Sinkhorn Algorithm
+    '''
+
+    def __init__(self, M, N, P, potential0, potential1, nIterations, time, domain=None):
+        StaticState.__init__(self, M, N, P, nIterations, time, domain)
+        self.potential0 = potential0
+        self.potential1 = potential1
+
+#__________________________________________________
+
+class SinkhornAlgorithm( StaticAlgorithm ):
+    '''
+    class to handle a Sinkhorn Algorithm
+    '''
+
+    def __repr__(self):
+        return ( 'Sinkhorn Algorithm' )
+
+    #_________________________
+
+    def run(self):
+        print('__________________________________________________')
+        print('Starting algorithm...')
+        print('__________________________________________________')
+        self.config.printConfig()
+        print('__________________________________________________')
+        timeStart = tm.time()
+
+        # catch boundary conditions
+        f0        = self.config.boundaries.temporalBoundaries.bt0
+        f1        = self.config.boundaries.temporalBoundaries.bt1
+
+        (W2eps, potential0, potential1,
+         nIter, error) = sinkhorn(f0, f1,
+                                  self.config.sinkhornEpsilon,
+                                  self.config.sinkhornScaling,
+                                  self.config.sinkhornNIterScaling,
+                                  self.config.iterTarget,
+                                  self.config.sinkhornTolerance,
+                                  self.config.sinkhornDebiased)
+
+        # Scales W2^2 as functionalJ, i.e. sum(m**2/f) on the (M+1)x(N+1)x(P+1) grid
+        finalJ    = self.P * f0.sum() * W2eps
+
+        timeAlgo    = tm.time() - timeStart
+        self.stateN = SinkhornState(self.M, self.N, self.P, potential0, potential1, nIter, timeAlgo, self.domain)
+
+        print('__________________________________________________')
+        print('Algorithm finished')
+        print('Number of iterations     : '+str(nIter))
+        print('Marginal error           = '+str(error))
+        print('W2 (eps)                 = '+str(np.sqrt(W2eps)))
+        print('J (eps)                  = '+str(finalJ))
+        print('Time taken               : '+str(timeAlgo))
+        print('__________________________________________________')
+
+        self.saveState()
+        return finalJ
+
+#__________________________________________________
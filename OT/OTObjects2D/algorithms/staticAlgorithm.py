@@ -0,0 +1,114 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+
+#______________________
+# Class StaticAlgorithm
+#______________________
+#
+# defines the default class for a static solver (sinkhorn, ma, gaussian)
+#
+# a static solver computes W2 between the temporal boundaries without any
+# space-time field, hence it writes neither states.bin nor finalState.bin :
+# its solution (potentials, number of iterations and time) is written in
+# solution.bin and J in result.bin, which are read by the analyse tools
+#
+# a static solver that computes the transport map may define displacement :
+# with exportDisplacement, f0 is then moved along this map and the resulting
+# space-time field is written in displacementField.bin, which the analyse and
+# plot tools read in place of finalState.bin
+#
+# a real static solver must also define :
+#   * run [method] that sets stateN to a StaticState
+#
+
+import cPickle as pck
+
+from algorithm                import Algorithm
+from ..OTObject               import OTObject
+from ..grid.displacement      import displacementInterpolation
+from ...utils.io              import files
+
+#__________________________________________________
+
+class StaticState( OTObject ):
+    '''
+    class to store the solution of a static solver
+    '''
+
+    def __init__(self, M, N, P, nIterations, time, domain=None):
+        OTObject.__init__(self, M, N, P, domain)
+        self.nIterations = nIterations
+        self.time        = time
+
+#__________________________________________________
+
+class StaticAlgorithm( Algorithm ):
+    '''
+    class to handle a static solver
+    '''
+
+    def __repr__(self):
+        return ( 'Static Algorithm' )
+
+    #_________________________
+
+    def fileState(self):
+        return files.fileSolution(self.config.outputDir)
+
+    #_________________________
+
+    def staleFiles(self):
+        # output files of a previous run of an iterative algorithm or of a static solver
+        return [ files.fileFinalState(self.config.outputDir) ,
+                 files.fileStates(self.config.outputDir) ,
+                 files.fileDisplacementField(self.config.outputDir) ]
+
+    #_________________________
+
+    def displacement(self):
+        # T(x) - x on the grid, None if the transport map is not known
+        return None
+
+    #_________________________
+
+    def saveDisplacementField(self):
+        fileName = files.fileDisplacementField(self.config.outputDir)
+        d        = self.displacement()
+
+        if d is None:
+            print('WARNING : no transport map, '+fileName+' is not written')
+            return
+
+        (dX, dY) = d
+        field    = displacementInterpolation(self.config.boundaries.temporalBoundaries.bt0,
+                                             dX, dY, self.P, self.domain)
+
+        f = open(fileName, 'wb')
+        p = pck.Pickler(f, protocol=-1)
+        p.dump(field)
+        f.close()
+
+        print('Displacement interpolation written in '+fileName)
+
+    #_________________________
+
+    def saveState(self):
+        # no state is written in states.bin (see extractIterations)
+        self.config.iterTarget = 0
+        Algorithm.saveState(self)
+
+        if getattr(self.config, 'exportDisplacement', False):
+            self.saveDisplacementField()
+
+#__________________________________________________
@@ -0,0 +1,80 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+############
+# proxWfr.py
+############
+#
+# Proximal operators for a WFR Algorithm
+#   * Prox1Wfr -> projection on the divergence constrain (staggered field and source)
+#                 and proximal operator of J (centered field and source)
+#   * Prox2Wfr -> projection on the interpolation constrain, the staggered and
+#                 centered sources being equal
+#
+
+from ...OTObject         import OTObject
+from ...OTObject         import physicalDomainForConfig
+from ...grid             import grid
+from ...grid.sourceGrid  import StaggeredCenteredFieldSource
+from ...grid.sourceGrid  import proximalJSource
+
+#__________________________________________________
+
+class Prox1Wfr( OTObject ):
+    '''
+    First proximal operator for a WFR algorithm
+    '''
+
+    def __init__(self,
+                 config ,
+                 proxCdiv):
+        OTObject.__init__( self ,
+                           config.M , config.N , config.P ,
+                           physicalDomainForConfig(config) )
+        self.proxCdiv = proxCdiv
+
+    def __repr__(self):
+        return ( 'First proximal operator for a WFR algorithm' )
+
+    def __call__(self, z, gamma):
+        (stagField, stagSource) = self.proxCdiv(z.staggeredField(), z.staggeredSource)
+        (centField, centSource) = proximalJSource(z.centeredField(), z.centeredSource, gamma)
+        return StaggeredCenteredFieldSource( self.M, self.N, self.P,
+                                             grid.StaggeredCenteredField( self.M, self.N, self.P,
+                                                                          stagField, centField, domain=self.domain ),
+                                             stagSource, centSource, domain=self.domain )
+
+#__________________________________________________
+
+class Prox2Wfr( OTObject ):
+    '''
+    Second proximal operator for a WFR algorithm
+    '''
+
+    def __init__(self,
+                 config ,
+                 proxCsc):
+        OTObject.__init__( self ,
+                           config.M , config.N , config.P ,
+                           physicalDomainForConfig(config) )
+        self.proxCsc = proxCsc
+
+    def __repr__(self):
+        return ( 'Second proximal operator for a WFR algorithm' )
+
+    def __call__(self, z):
+        source = 0.5 * ( z.staggeredSource + z.centeredSource )
+        return StaggeredCenteredFieldSource( self.M, self.N, self.P,
+                                             self.proxCsc(z.staggeredCenteredField),
+                                             source, source.copy(), domain=self.domain )
+
+#__________________________________________________
@@ -0,0 +1,81 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+####################
+# Class WfrAlgorithm
+####################
+#
+# defines a WFR algorithm for a given configuration
+#
+# unbalanced transport : the continuity equation admits a source term,
+# penalized in J with the length scale wfrDelta (see grid/sourceGrid.py),
+# hence f0 and f1 may have different masses without adding a reservoir
+#
+
+from ..algorithm                  import Algorithm
+from ...grid                      import grid
+from ...grid.sourceGrid           import StaggeredCenteredFieldSource
+from ...init.initialFields        import initialStaggeredCenteredField
+from ...proximals.defineProximals import sourceProximalForConfig
+
+from wfrState import WfrState
+from wfrStep  import WfrStep
+from proxWfr  import Prox1Wfr
+from proxWfr  import Prox2Wfr
+
+class WfrAlgorithm( Algorithm ):
+    '''
+    class to handle a WFR Algorithm
+    '''
+
+    def __init__(self, config):
+        Algorithm.__init__(self, config)
+
+        proxCdiv,proxCsc  = sourceProximalForConfig(config)
+        prox1 = Prox1Wfr(config, proxCdiv)
+        prox2 = Prox2Wfr(config, proxCsc)
+        self.stepFunction = WfrStep(config, prox1, prox2)
+
+    def __repr__(self):
+        return ( 'WFR algorithm' )
+
+    def setState(self, newState, copy=True):
+        if isinstance(newState, WfrState):
+            if copy:
+                self.stateN = newState.copy()
+            else:
+                self.stateN = newState
+        else:
+            if copy:
+                stagField = newState.convergingStaggeredField().copy()
+            else:
+                stagField = newState.convergingStaggeredField()
+
+            centField   = stagField.interpolation()
+            z           = StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                        grid.StaggeredCenteredField( self.M , self.N , self.P ,
+                                                                                     stagField, centField, domain=self.domain ),
+                                                        domain=self.domain )
+            w           = z.copy()
+            self.stateN = WfrState( self.M , self.N , self.P , z , w , domain=self.domain )
+
+        self.stateNP1 = self.nextState()
+
+    def initialize(self):
+        Algorithm.initialize(self)
+
+        if self.stateN is None:
+            z = StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                              initialStaggeredCenteredField(self.config) , domain=self.domain )
+            w = z.copy()
+            self.stateN   = WfrState( self.M , self.N , self.P , z , w , domain=self.domain )
+            self.stateNP1 = self.nextState()
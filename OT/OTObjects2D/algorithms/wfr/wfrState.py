@@ -0,0 +1,61 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+################
+# Class WfrState
+################
+#
+# defines the state for a WFR algorithm
+#
+
+from ...OTObject         import OTObject
+from ...grid.sourceGrid  import StaggeredCenteredFieldSource
+
+class WfrState( OTObject ):
+    '''
+    class to handle the state for a WFR algorithm
+    '''
+
+    def __init__( self ,
+                  M , N , P ,
+                  z=None , w=None , domain=None ):
+        OTObject.__init__( self ,
+                           M , N , P , domain=domain )
+        if z is None:
+            self.z = StaggeredCenteredFieldSource(M,N,P, domain=domain)
+        else:
+            self.z = z
+        if w is None:
+            self.w = StaggeredCenteredFieldSource(M,N,P, domain=domain)
+        else:
+            self.w = w
+
+    def LInftyNorm(self):
+        return max( self.z.LInftyNorm() ,
+                    self.w.LInftyNorm() )
+
+    def convergingStaggeredField(self):
+        return self.z.staggeredField()
+
+    def convergingSource(self, delta):
+        # unscaled source zeta = s / delta
+        return self.z.staggeredSource / delta
+
+    def functionalJ(self):
+        return self.z.functionalJ()
+
+    def __repr__(self):
+        return 'Object representing the state of a WFR algorithm'
+
+    def copy(self):
+        return WfrState( self.M , self.N , self.P ,
+                         self.z.copy() , self.w.copy() , domain=self.domain )
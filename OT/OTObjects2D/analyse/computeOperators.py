@@ -17,11 +17,19 @@
 #
 # applies the operators defined in operators*.py on the result of a simulation
 #
+# static solvers (see StaticAlgorithm) do not write any state : their analyse
+# has a single line, with J read from result.bin (normalized as in functionalJ)
+# and the other operators set to nan
+#
 
+import os
 import numpy as np
 import cPickle as pck
 
+from ...utils.io                import files
+from ...utils.io.extractAnalyse import writeAnalyse
 from operators1 import listOfOperators1 as defineListOfOperators1
+from operators1 import functionalJ
 from operators2 import listOfOperators2 as defineListOfOperators2
 
 def extractIterations(outputDir):
@@ -57,13 +65,10 @@ def extractIterations(outputDir):
 
     return iterationNumbers
 
-def applyOperators(listOfOperators1, listOfOperators2, outputDir, printDetails=False):
+def operatorsOfStates(listOfOperators1, listOfOperators2, outputDir, printDetails=False):
     '''
     Apply operators to all states of a simulation
     '''
-
-    print('Starting analyse in '+outputDir+' ...')
-
     if printDetails:
         print('Extracting number of iterations ...')
     iterationNumbers = extractIterations(outputDir)
@@ -98,6 +103,50 @@ def applyOperators(listOfOperators1, listOfOperators2, outputDir, printDetails=F
         i += 1
     f.close()
 
+    return ( iterationNumbers, np.cumsum(iterationTimes), values )
+
+def operatorsOfSolution(listOfOperators1, listOfOperators2, outputDir, printDetails=False):
+    '''
+    Apply operators to the solution of a static solver
+    '''
+    if printDetails:
+        print('Catching solution and result ...')
+    f = open(files.fileSolution(outputDir), 'rb')
+    p = pck.Unpickler(f)
+    solution = p.load()
+    f.close()
+
+    f = open(files.fileResult(outputDir), 'rb')
+    p = pck.Unpickler(f)
+    result = p.load()
+    f.close()
+
+    iterationNumbers = np.array([ float(solution.nIterations) ])
+    iterationTimes = np.array([ solution.time ])
+    values = np.nan * np.ones(shape=(1,len(listOfOperators1)+len(listOfOperators2)))
+
+    # same normalization as functionalJ : the result is sum |m|^2 / f on the grid
+    for j in xrange(len(listOfOperators1)):
+        if listOfOperators1[j][0] is functionalJ:
+            values[0,j] = ( result * solution.Lx * solution.Ly * solution.T /
+                            ( solution.M * solution.N * solution.P ) )
+
+    return ( iterationNumbers, iterationTimes, values )
+
+def applyOperators(listOfOperators1, listOfOperators2, outputDir, printDetails=False):
+    '''
+    Apply operators to the result of a simulation
+    '''
+
+    print('Starting analyse in '+outputDir+' ...')
+
+    if os.path.isfile(files.fileSolution(outputDir)):
+        ( iterationNumbers, iterationTimes,
+          values ) = operatorsOfSolution(listOfOperators1, listOfOperators2, outputDir, printDetails)
+    else:
+        ( iterationNumbers, iterationTimes,
+          values ) = operatorsOfStates(listOfOperators1, listOfOperators2, outputDir, printDetails)
+
     if printDetails:
         print('Preparing results ...')
     operatorNames = []
@@ -106,18 +155,9 @@ def applyOperators(listOfOperators1, listOfOperators2, outputDir, printDetails=F
     for op in listOfOperators2:
         operatorNames.append(op[1])
 
-    iterationTimes = np.cumsum(iterationTimes)
-
-    fileAnalyse = outputDir + 'analyse.bin'
-    f = open(fileAnalyse, 'wb')
-    p = pck.Pickler(f,protocol=-1)
-    p.dump(iterationNumbers)
-    p.dump(iterationTimes)
-    p.dump(operatorNames)
-    p.dump(values)
-    f.close()
+    writeAnalyse(outputDir, iterationNumbers, iterationTimes, operatorNames, values)
 
-    print ('Results written in '+fileAnalyse+' ...')
+    print ('Results written in '+files.fileAnalyse(outputDir)+' and '+files.fileAnalyseValues(outputDir)+' ...')
     return ( iterationNumbers, iterationTimes, values )
     
 def applyAllOperators(outputDir, printDetails=False):
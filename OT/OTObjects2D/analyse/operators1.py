@@ -41,14 +41,16 @@ def absMin(state):
     return abs( state.f.min() )
 
 def functionalJ(state):
-    return ( state.interpolation().functionalJ() / ( state.M * state.N * state.P ) )
+    # J = int int |m|^2 / f dx dt, each cell being of volume Lx*Ly*T / ( M*N*P )
+    return ( state.interpolation().functionalJ() * state.Lx * state.Ly * state.T /
+             ( state.M * state.N * state.P ) )
 
 def make_functionalJeps(eps):
     def funcJeps(state):
         centField = state.interpolation()
         return ( ( ( np.power( centField.mx , 2. ) + 
                      np.power( centField.my , 2. ) ) / 
-                   ( np.maximum( centField.f , eps ) ) ).sum() / 
+                   ( np.maximum( centField.f , eps ) ) ).sum() * state.Lx * state.Ly * state.T / 
                  ( state.M * state.N * state.P ) ) 
     return funcJeps
  
@@ -17,6 +17,10 @@
 #
 # util to plot the final state for multiple simulations 
 #
+# The artists are created once : each frame only swaps the image data and
+# changes the transparency of the (static) init/final contours, so that the
+# animation can be blitted
+#
 
 import numpy                as np
 import matplotlib.pyplot    as plt
@@ -30,10 +34,13 @@ from ....utils.plotting.positions   import xylims2d
 from ....utils.plotting.plotting    import makeAxesGrid
 from ....utils.plotting.plotting    import adaptAxesExtent
 from ....utils.plotting.plot        import addTitleLabelsGrid
-from ....utils.plotting.plot        import addTimeTextPBar
-from ....utils.plotting.plot        import plotTimeTextPBar
+from ....utils.plotting.plot        import addAnimatedTimeTextPBar
+from ....utils.plotting.plot        import updateTimeTextPBar
 from ....utils.plotting.plotMatrix  import addColorBar
 from ....utils.plotting.plotMatrix  import plotMatrix
+from ....utils.plotting.plotMatrix  import updateMatrix
+from ....utils.plotting.plotMatrix  import matrixArtists
+from ....utils.plotting.plotMatrix  import setMatrixAlpha
 from ....utils.plotting.plotMatrix  import filterKwargsMiniMaxiCmapName
 
 #__________________________________________________ 
@@ -63,9 +70,10 @@ def makeAnimFinalStateMultiSim(kwargsFuncAnim,
                                cticksDecimals,
                                order,
                                extendDirection,
-                               EPSILON):
+                               EPSILON,
+                               timeResampling='linear'):
 
-    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList)
+    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, timeResampling)
     (xmin, xmax, ymin, ymax)                = xylims2d()
     (miniC, maxiC, cmapNameC, kwargs)       = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargs)
     (miniI, maxiI, cmapNameI, kwargsInit)   = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargsInit)
@@ -76,8 +84,9 @@ def makeAnimFinalStateMultiSim(kwargsFuncAnim,
 
     (gs, axes) = makeAxesGrid(plt, len(outputDirList), order=order, extendDirection=extendDirection)
 
-    alphaInit  = transparencyFunction(1.-float(0)/(Pmax+1.))
-    alphaFinal = transparencyFunction(float(0)/(Pmax+1.))
+    imsC = []
+    imsI = []
+    imsF = []
 
     for (f, finit, ffinal, label, ax) in zip(fs, finits, ffinals, labelList, axes):
         imC = plotMatrix(ax,
@@ -112,6 +121,10 @@ def makeAnimFinalStateMultiSim(kwargsFuncAnim,
                          vmax=maxiF,
                          **kwargsFinal)
 
+        imsC.append(imC)
+        imsI.append(imI)
+        imsF.append(imF)
+
         adaptAxesExtent(ax, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
         addTitleLabelsGrid(ax, title=label, xLabel=xLabel, yLabel=yLabel, grid=False)
 
@@ -120,60 +133,44 @@ def makeAnimFinalStateMultiSim(kwargsFuncAnim,
         (cax, cbar)   = addColorBar(plt, timeTextPBar, cmapNameC, miniC, maxiC, nbrCTicks, cticksDecimals, cLabel)
 
     if timeTextPBar:
-        (TTPBax, ret) = addTimeTextPBar(plt, 0, Pmax+1)
+        (TTPBax, TTPB) = addAnimatedTimeTextPBar(plt, Pmax+1)
 
     def animate(t):
-        ret = []
-        kwargsInit['alpha']  = transparencyFunction(1.-float(t)/(Pmax+1.))
-        kwargsFinal['alpha'] = transparencyFunction(float(t)/(Pmax+1.))
-
-        for (f, finit, ffinal, label, ax) in zip(fs, finits, ffinals, labelList, axes):
-            ax.cla()
-            imC = plotMatrix(ax,
-                             f[:,:,t],
-                             plotter=plotter,
-                             xmin=xmin,
-                             xmax=xmax,
-                             ymin=ymin,
-                             ymax=ymax,
-                             cmapName=cmapNameC,
-                             vmin=miniC,
-                             vmax=maxiC,
-                             **kwargs)
-            imI = plotMatrix(ax,
-                             finit,
-                             plotter='contour',
-                             xmin=xmin,
-                             xmax=xmax,
-                             ymin=ymin,
-                             ymax=ymax,
-                             vmin=miniI,
-                             vmax=maxiI,
-                             **kwargsInit)
-            imF = plotMatrix(ax,
-                             ffinal,
-                             plotter='contour',
-                             xmin=xmin,
-                             xmax=xmax,
-                             ymin=ymin,
-                             ymax=ymax,
-                             vmin=miniF,
-                             vmax=maxiF,
-                             **kwargsFinal)
-            ret.extend([imC,imI,imF])
-
-            adaptAxesExtent(ax, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
-            addTitleLabelsGrid(ax, title=label, xLabel=xLabel, yLabel=yLabel, grid=False)
+        ret        = []
+        alphaInit  = transparencyFunction(1.-float(t)/(Pmax+1.))
+        alphaFinal = transparencyFunction(float(t)/(Pmax+1.))
+
+        for (i, (f, ax)) in enumerate(zip(fs, axes)):
+            imsC[i] = updateMatrix(ax,
+                                   imsC[i],
+                                   f[:,:,t],
+                                   plotter=plotter,
+                                   xmin=xmin,
+                                   xmax=xmax,
+                                   ymin=ymin,
+                                   ymax=ymax,
+                                   cmapName=cmapNameC,
+                                   vmin=miniC,
+                                   vmax=maxiC,
+                                   **kwargs)
+            setMatrixAlpha(imsI[i], alphaInit)
+            setMatrixAlpha(imsF[i], alphaFinal)
+
+            ret.extend(matrixArtists(imsC[i]))
+            ret.extend(matrixArtists(imsI[i]))
+            ret.extend(matrixArtists(imsF[i]))
 
         if timeTextPBar:
-            TTPBax.cla()
-            ret.extend(plotTimeTextPBar(TTPBax, t, Pmax+1))
+            ret.extend(updateTimeTextPBar(TTPB, t, Pmax+1))
 
         return tuple(ret)
 
     def init():
         return animate(0)
 
+    kwargsFuncAnim = dict(kwargsFuncAnim)
+    kwargsFuncAnim.setdefault('blit', True)
+
     frames = np.arange(Pmax+2)
     print('Making animation ...')
     return FuncAnimation(figure, animate, frames, init_func=init, **kwargsFuncAnim)
@@ -20,6 +20,7 @@ from ....utils.plotting.plotting            import makeOutputDirLabelPrefixFigNa
 from ....utils.animating.saveAnimation      import makeMovieWriter
 from ....utils.animating.saveAnimation      import saveAnimation
 from animFinalStateMultiSim                 import makeAnimFinalStateMultiSim
+from rawAnimFinalStateMultiSim              import rawAnimFinalStateMultiSim
 
 #__________________________________________________
 
@@ -54,7 +55,27 @@ class FinalStateAnimator:
              prefixFigName) in zip(outputDirListList,
                                    labelListList,
                                    prefixFigNameList):
-        
+
+            if self.config.animFinalState_rawFrames:
+                rawAnimFinalStateMultiSim(outputDirList,
+                                          self.config.figDir,
+                                          prefixFigName,
+                                          transparencyFunction,
+                                          self.config.animFinalState_args,
+                                          self.config.animFinalState_argsInit,
+                                          self.config.animFinalState_argsFinal,
+                                          self.config.animFinalState_cmapName,
+                                          self.config.animFinalState_rawFramesNbrContours,
+                                          self.config.animFinalState_rawFramesScale,
+                                          self.config.extensions,
+                                          self.config.writerName,
+                                          self.config.writerFPS,
+                                          self.config.writerCodec,
+                                          self.config.writerBitrate,
+                                          self.config.writerExtraArgs,
+                                          self.config.timeResampling)
+                continue
+
             animation = makeAnimFinalStateMultiSim(self.config.funcAnimArgs,
                                                    outputDirList,
                                                    self.config.figDir,
@@ -80,7 +101,8 @@ class FinalStateAnimator:
                                                    self.config.animFinalState_cTicksDecimals,
                                                    self.config.animFinalState_order,
                                                    self.config.animFinalState_extendDirection,
-                                                   self.config.EPSILON)
+                                                   self.config.EPSILON,
+                                                   self.config.timeResampling)
 
             saveAnimation(animation, 
                           self.config.figDir, 
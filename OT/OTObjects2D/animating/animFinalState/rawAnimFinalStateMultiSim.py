@@ -0,0 +1,105 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________________
+# rawAnimFinalStateMultiSim.py
+#_____________________________
+#
+# util to animate the final state for multiple simulations without matplotlib
+# figures : the frames are rendered as RGB arrays (see utils/animating/rawFrames.py)
+# and all the extensions are encoded from a single rendering pass
+#
+# Axes, titles, color bar and time text are not drawn
+#
+
+from matplotlib.colors                  import colorConverter
+
+from ....utils.io.extractFinalState     import extractFinalStateMultiSim
+from ....utils.plotting.cmap            import colormapLUT
+from ....utils.plotting.cmap            import colormapMatrix
+from ....utils.plotting.plotMatrix      import filterKwargsMiniMaxiCmapName
+from ....utils.animating.rawFrames      import contourLevels
+from ....utils.animating.rawFrames      import contourMask
+from ....utils.animating.rawFrames      import overlay
+from ....utils.animating.rawFrames      import upscale
+from ....utils.animating.rawFrames      import tileFrames
+from ....utils.animating.rawFrames      import makeRawFrameWriter
+
+#__________________________________________________
+
+def rawAnimFinalStateMultiSim(outputDirList,
+                              figDir,
+                              prefixFigName,
+                              transparencyFunction,
+                              kwargs,
+                              kwargsInit,
+                              kwargsFinal,
+                              cmapName,
+                              nbrContours,
+                              scale,
+                              extensionsList,
+                              writerName,
+                              writerFPS,
+                              writerCodec,
+                              writerBitrate,
+                              writerExtraArgs,
+                              timeResampling='linear'):
+
+    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, timeResampling)
+    (miniC, maxiC, cmapNameC, kwargs)       = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargs)
+    (miniI, maxiI, cmapNameI, kwargsInit)   = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargsInit)
+    (miniF, maxiF, cmapNameF, kwargsFinal)  = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargsFinal)
+
+    lut        = colormapLUT(cmapNameC)
+    colorInit  = colorConverter.to_rgb(kwargsInit.get('colors', 'k'))
+    colorFinal = colorConverter.to_rgb(kwargsFinal.get('colors', 'k'))
+    levelsInit = contourLevels(miniI, maxiI, kwargsInit.get('levels', nbrContours))
+    levelsFin  = contourLevels(miniF, maxiF, kwargsFinal.get('levels', nbrContours))
+
+    # the contours of the initial and final states are computed once
+    masksInit  = [ contourMask(finit, levelsInit) for finit in finits ]
+    masksFinal = [ contourMask(ffinal, levelsFin) for ffinal in ffinals ]
+
+    def frame(t):
+        alphaInit  = transparencyFunction(1.-float(t)/(Pmax+1.))
+        alphaFinal = transparencyFunction(float(t)/(Pmax+1.))
+        images     = []
+        for (f, maskInit, maskFinal) in zip(fs, masksInit, masksFinal):
+            image = colormapMatrix(f[:,:,t], lut, miniC, maxiC)
+            image = overlay(image, maskInit, alphaInit, colorInit)
+            image = overlay(image, maskFinal, alphaFinal, colorFinal)
+            images.append(upscale(image, scale))
+        return tileFrames(images)
+
+    image0 = frame(0)
+    writer = makeRawFrameWriter(writerName,
+                                figDir,
+                                prefixFigName,
+                                extensionsList,
+                                image0.shape[1],
+                                image0.shape[0],
+                                Pmax+2,
+                                writerFPS,
+                                writerCodec,
+                                writerBitrate,
+                                writerExtraArgs)
+
+    print('Making animation ...')
+    writer.write(image0)
+    for t in xrange(1, Pmax+2):
+        writer.write(frame(t))
+
+    if not writer.close() == 0:
+        print('Could not write '+figDir+prefixFigName+' ...')
+
+#__________________________________________________
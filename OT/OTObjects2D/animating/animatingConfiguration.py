@@ -74,6 +74,9 @@ class AnimatingConfiguration(DefaultConfiguration):
                           defaultVal=['sim0'],
                           attrType='list')
 
+        self.addAttribute('timeResampling',
+                          defaultVal='linear')
+
         #_______________
 
         self.addAttribute('writerName',
@@ -252,6 +255,24 @@ class AnimatingConfiguration(DefaultConfiguration):
                           'str',
                           True)
 
+        self.addAttribute('animFinalState_rawFrames',
+                          False,
+                          [('animFinalState',True)],
+                          'bool',
+                          True)
+
+        self.addAttribute('animFinalState_rawFramesScale',
+                          1,
+                          [('animFinalState',True),('animFinalState_rawFrames',True)],
+                          'int',
+                          True)
+
+        self.addAttribute('animFinalState_rawFramesNbrContours',
+                          7,
+                          [('animFinalState',True),('animFinalState_rawFrames',True)],
+                          'int',
+                          True)
+
         #_______________
 
         self.addAttribute('trianimFinalState',
@@ -75,7 +75,8 @@ class FinalStateTrianimator:
                                                       self.config.trianimFinalState_order,
                                                       self.config.trianimFinalState_extendDirection,
                                                       self.config.trianimFinalState_extendDirectionTrianim,
-                                                      self.config.EPSILON)
+                                                      self.config.EPSILON,
+                                                      self.config.timeResampling)
 
             saveAnimation(animation, 
                           self.config.figDir, 
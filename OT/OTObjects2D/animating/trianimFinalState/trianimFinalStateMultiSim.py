@@ -61,9 +61,10 @@ def makeTrianimFinalStateMultiSim(kwargsFuncAnim,
                                   order,
                                   extendDirection,
                                   extendDirectionTriplot,
-                                  EPSILON):
+                                  EPSILON,
+                                  timeResampling='linear'):
 
-    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList)
+    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, timeResampling)
     (xmin, xmax, ymin, ymax)                = xylims2d()
     (miniC, maxiC, cmapNameC, kwargs)       = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargs)
 
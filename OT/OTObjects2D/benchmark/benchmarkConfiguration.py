@@ -0,0 +1,162 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________________
+# Class BenchmarkConfiguration
+#_____________________________
+#
+# Defines everything necessary for running the benchmark
+# of the OT algorithms from a config file
+#   * gaussian    -> error vs time on Gaussian boundaries
+#   * performance -> timings and peak memory, compared with a baseline
+#
+
+from gaussianBenchmark                           import GaussianBenchmark
+from performanceBenchmark                        import PerformanceBenchmark
+from ...utils.configuration.defaultConfiguration import DefaultConfiguration
+
+#__________________________________________________
+
+class BenchmarkConfiguration(DefaultConfiguration):
+
+    def __init__(self, benchmarkConfigFile=None):
+        DefaultConfiguration.__init__(self, benchmarkConfigFile)
+
+    #_________________________
+
+    def __repr__(self):
+        return 'BenchmarkConfiguration for the 2D OT algoritms'
+
+    #_________________________
+
+    def benchmark(self):
+        if self.benchmarkType == 'performance':
+            return PerformanceBenchmark(self)
+        return GaussianBenchmark(self)
+
+    #_________________________
+
+    def checkAttributes(self):
+        DefaultConfiguration.checkAttributes(self)
+
+        if not self.benchmarkType in ['gaussian', 'performance']:
+            print ( 'Value ' + str(self.benchmarkType) +
+                    ' is not valid for parameter benchmarkType ' )
+            self.benchmarkType = self.defaultValues['benchmarkType']
+            print ( 'Replacing by default value : ' + str ( self.benchmarkType ) )
+
+        if self.benchmarkType == 'gaussian' and not self.boundaryType in [1, 2]:
+            print ( 'Value ' + str(self.boundaryType) +
+                    ' is not valid for parameter boundaryType ' )
+            self.boundaryType = self.defaultValues['boundaryType']
+            print ( 'Replacing by default value : ' + str ( self.boundaryType ) )
+
+        sizes = []
+        for size in self.sizes:
+            if size > 0:
+                sizes.append(size)
+            else:
+                print ( 'Removing invalid size ' + str(size) )
+        self.sizes = sizes
+
+        if self.benchmarkType == 'performance':
+            self.boundaryTypes = [ boundaryType for boundaryType in self.boundaryTypes if boundaryType in range(1, 7) ]
+            self.dynamicsList  = [ dynamics for dynamics in self.dynamicsList if dynamics in range(0, 6) ]
+
+            if not self.precisionTolerance > 0.:
+                print ( 'Value ' + str(self.precisionTolerance) +
+                        ' is not valid for parameter precisionTolerance ' )
+                self.precisionTolerance = self.defaultValues['precisionTolerance']
+                print ( 'Replacing by default value : ' + str ( self.precisionTolerance ) )
+
+    #_________________________
+
+    def defaultAttributes(self):
+        DefaultConfiguration.defaultAttributes(self)
+
+        self.addAttribute('EPSILON',
+                          defaultVal=1.e-8,
+                          attrType='float')
+
+        self.addAttribute('configFile',
+                          defaultVal='./OT2D.cfg')
+
+        self.addAttribute('outputDir',
+                          defaultVal='./output/')
+
+        self.addAttribute('benchmarkType',
+                          defaultVal='gaussian')
+
+        self.addAttribute('boundaryType',
+                          defaultVal=1,
+                          attrType='int')
+
+        self.addAttribute('sizes',
+                          defaultVal=[16, 32, 64],
+                          attrType='list')
+
+        self.addAttribute('algoNames',
+                          defaultVal=['adr', 'pd'],
+                          attrType='list')
+
+        self.addAttribute('dynamicsList',
+                          defaultVal=[0],
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='list')
+
+        self.addAttribute('boundaryTypes',
+                          defaultVal=[1],
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='list')
+
+        self.addAttribute('precisions',
+                          defaultVal=['double'],
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='list')
+
+        self.addAttribute('precisionTolerance',
+                          defaultVal=1.e-3,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='float')
+
+        self.addAttribute('nTiming',
+                          defaultVal=10,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='int')
+
+        self.addAttribute('iterTarget',
+                          defaultVal=1000,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='int')
+
+        self.addAttribute('tolerance',
+                          defaultVal=1.e-4,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='float')
+
+        self.addAttribute('baselineFile',
+                          defaultVal='',
+                          isSubAttr=[('benchmarkType','performance')],
+                          printWarning=False)
+
+        self.addAttribute('regressionThreshold',
+                          defaultVal=0.2,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='float')
+
+        self.addAttribute('updateBaseline',
+                          defaultVal=False,
+                          isSubAttr=[('benchmarkType','performance')],
+                          attrType='bool')
+
+#__________________________________________________
@@ -0,0 +1,169 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________
+# gaussianBenchmark.py
+#_____________________
+#
+# Measures the error vs time curve of the algorithms on Gaussian boundaries
+# (boundaryType = 1 or 2), for which W2 is known in closed form
+#
+# For each size and each iterative algorithm, the states written every nModWrite
+# iterations are read back from states.bin and W2^2 is estimated from their
+# functional J, with the same scaling as the one used for the closed form.
+#
+# The static solvers (see StaticAlgorithm) write no state : their curve has a
+# single point, W2^2 being estimated from the J they return.
+#
+
+import os
+import time    as tm
+import cPickle as pck
+import numpy   as np
+
+from ..configuration                      import Configuration
+from ..algorithms.gaussian.closedForm     import gaussianTransport
+from ...utils.io                          import files
+from ...utils.io.extractBenchmark         import extractBenchmark
+
+#__________________________________________________
+
+def caseOutputDir(outputDir, algoName, size):
+    return outputDir + algoName + '_' + str(size) + '/'
+
+#__________________________________________________
+
+def cleanOutputDir(outputDir):
+    if not os.path.isdir(outputDir):
+        os.makedirs(outputDir)
+
+    for fileName in [ files.fileConfig(outputDir) ,
+                      files.fileFinalState(outputDir) ,
+                      files.fileSolution(outputDir) ,
+                      files.fileDisplacementField(outputDir) ,
+                      files.fileRunCount(outputDir) ,
+                      files.fileStates(outputDir) ]:
+        if os.path.isfile(fileName):
+            os.remove(fileName)
+
+#__________________________________________________
+
+def errorCurve(outputDir, W2ref, mass, P, result):
+    times  = []
+    errors = []
+
+    if os.path.isfile(files.fileSolution(outputDir)):
+        f        = open(files.fileSolution(outputDir), 'rb')
+        p        = pck.Unpickler(f)
+        solution = p.load()
+        f.close()
+
+        W2       = result / ( P * mass )
+        return (np.array([solution.time]), np.array([abs(W2 - W2ref) / W2ref]))
+
+    f = open(files.fileStates(outputDir), 'rb')
+    p = pck.Unpickler(f)
+    try:
+        while True:
+            state = p.load()
+            times.append(p.load())
+            W2    = state.interpolation().functionalJ() / ( state.P * mass )
+            errors.append(abs(W2 - W2ref) / W2ref)
+    except EOFError:
+        f.close()
+
+    return (np.cumsum(times), np.array(errors))
+
+#__________________________________________________
+
+def runCase(configFile, outputDir, boundaryType, algoName, size):
+    caseDir   = caseOutputDir(outputDir, algoName, size)
+    cleanOutputDir(caseDir)
+
+    config    = Configuration(configFile, { 'M'                : size ,
+                                            'N'                : size ,
+                                            'P'                : size ,
+                                            'boundaryType'     : boundaryType ,
+                                            'algoName'         : algoName ,
+                                            'initial'          : 0 ,
+                                            'gaussianFastPath' : False ,
+                                            'cropSupport'      : False ,
+                                            'outputDir'        : caseDir } )
+
+    f0        = config.boundaries.temporalBoundaries.bt0
+    f1        = config.boundaries.temporalBoundaries.bt1
+    W2ref     = gaussianTransport(f0, f1)[0]
+
+    print('__________________________________________________')
+    print('Benchmark : '+algoName+' with M = N = P = '+str(size))
+    print('__________________________________________________')
+
+    timeStart = tm.time()
+    algorithm = config.algorithm()
+    result    = algorithm.run()
+    timeAlgo  = tm.time() - timeStart
+
+    (times, errors) = errorCurve(caseDir, W2ref, f0.sum(), config.P, result)
+
+    return ( algoName , size , W2ref , times , errors , timeAlgo )
+
+#__________________________________________________
+
+class GaussianBenchmark:
+
+    def __init__(self, config):
+        self.config = config
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Benchmark of the 2D OT algorithms on Gaussian boundaries'
+
+    #_________________________
+
+    def run(self):
+        fileBenchmark = files.fileBenchmark(self.config.outputDir)
+        if os.path.isfile(fileBenchmark):
+            os.remove(fileBenchmark)
+
+        for size in self.config.sizes:
+            for algoName in self.config.algoNames:
+                record = runCase(self.config.configFile,
+                                 self.config.outputDir,
+                                 self.config.boundaryType,
+                                 algoName,
+                                 size)
+
+                f = open(fileBenchmark, 'ab')
+                p = pck.Pickler(f, protocol=-1)
+                p.dump(record)
+                f.close()
+
+        (algoNames, sizes, W2refs, times, errors, timesAlgo) = extractBenchmark(self.config.outputDir)
+
+        print('__________________________________________________')
+        print('Benchmark finished')
+        print('algoName     size         final error  time')
+        for i in xrange(len(algoNames)):
+            if errors[i].size > 0:
+                error = errors[i][-1]
+            else:
+                error = np.nan
+            print(algoNames[i].ljust(13) + str(sizes[i]).ljust(13) +
+                  ( '%.3e' % error ).ljust(13) + ( '%.3e' % timesAlgo[i] ))
+        print('Results written in '+fileBenchmark)
+        print('__________________________________________________')
+
+        return (algoNames, sizes, W2refs, times, errors, timesAlgo)
+
+#__________________________________________________
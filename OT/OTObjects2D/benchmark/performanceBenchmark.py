@@ -0,0 +1,401 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#________________________
+# performanceBenchmark.py
+#________________________
+#
+# Measures the performance of the solver for every combination of size,
+# dynamics, boundaryType, algoName and precision :
+#   * mean time of each proximal operator (on random fields)
+#   * mean time of one call to the step function of the algorithm
+#   * time and number of iterations to tolerance, i.e. until the relative
+#     variation of J between two states written in states.bin is below tolerance
+#   * peak memory (maximum resident set size), and the predicted one (see algorithms/memory.py)
+#   * final J, and for the single and mixed precisions its relative difference
+#     with the final J in double precision, flagged when above precisionTolerance
+#
+# testPrecision checks that the final J of a small problem in single and mixed
+# precision agrees with the one in double precision.
+#
+# Each case runs in its own process, so that the peak memory is the one of
+# the case. The results are written in outputDir/performance.json and compared
+# with a baseline JSON file (same format) to flag the regressions.
+#
+
+import os
+import json
+import resource
+import time            as tm
+import cPickle         as pck
+import multiprocessing as mp
+
+from ..configuration                      import Configuration
+from ..algorithms.memory                  import memoryReportForConfig
+from ..proximals.defineProximals          import proximalForConfig
+from ..proximals.defineProximals          import sourceProximalForConfig
+from ...utils.io                          import files
+from gaussianBenchmark                    import cleanOutputDir
+
+#__________________________________________________
+
+def caseKey(size, dynamics, boundaryType, algoName, precision='double'):
+    # the precision is omitted in double precision, to match the older baselines
+    key = ( 'size=' + str(size) + '/dynamics=' + str(dynamics) +
+            '/boundaryType=' + str(boundaryType) + '/algoName=' + algoName )
+    if not precision == 'double':
+        key += '/precision=' + precision
+    return key
+
+#__________________________________________________
+
+def caseOutputDir(outputDir, size, dynamics, boundaryType, algoName, precision):
+    return ( outputDir + algoName + '_' + str(size) + '_d' + str(dynamics) +
+             '_b' + str(boundaryType) + '_' + precision + '/' )
+
+#__________________________________________________
+
+def peakMemory():
+    # in bytes, ru_maxrss being in kilobytes on Linux
+    return 1024 * resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+#__________________________________________________
+
+def timeProximals(config, nTiming):
+    if config.algoName == 'wfr':
+        proximals = sourceProximalForConfig(config)
+    else:
+        proximals = proximalForConfig(config)
+
+    times = {}
+    for prox in proximals:
+        if prox is None or not hasattr(prox, 'timing'):
+            continue
+        times[prox.__class__.__name__] = prox.timing(nTiming) / nTiming
+    return times
+
+#__________________________________________________
+
+def timeStepFunction(algorithm, nTiming):
+    stepFunction = getattr(algorithm, 'stepFunction', None)
+    if stepFunction is None:
+        return None
+
+    algorithm.initialize()
+    algorithm.initializePrecision()
+    stepFunction = algorithm.stepFunction
+
+    timeStart = tm.time()
+    for i in xrange(nTiming):
+        stepFunction(algorithm.stateN, algorithm.stateNP1)
+        stepFunction(algorithm.stateNP1, algorithm.stateN)
+    stepTime  = ( tm.time() - timeStart ) / ( 2 * nTiming )
+
+    algorithm.switchPrecision('float64')
+    return stepTime
+
+#__________________________________________________
+
+def timeToTolerance(outputDir, nModWrite, tolerance):
+    #
+    # returns (time, iterations) to reach the tolerance, (None, None) if not reached
+    #
+    if not os.path.isfile(files.fileStates(outputDir)):
+        return (None, None)
+
+    time  = 0.
+    JPrev = None
+
+    f = open(files.fileStates(outputDir), 'rb')
+    p = pck.Unpickler(f)
+    i = 0
+    try:
+        while True:
+            state = p.load()
+            time += p.load()
+            J     = state.interpolation().functionalJ()
+            if JPrev is not None and abs(J - JPrev) <= tolerance * abs(J):
+                f.close()
+                return (time, i * nModWrite)
+            JPrev = J
+            i    += 1
+    except EOFError:
+        f.close()
+
+    return (None, None)
+
+#__________________________________________________
+
+def runPerformanceCase(configFile, outputDir, size, dynamics, boundaryType, algoName, precision, nTiming, iterTarget, tolerance):
+    caseDir = caseOutputDir(outputDir, size, dynamics, boundaryType, algoName, precision)
+    cleanOutputDir(caseDir)
+
+    config  = Configuration(configFile, { 'M'                : size ,
+                                          'N'                : size ,
+                                          'P'                : size ,
+                                          'dynamics'         : dynamics ,
+                                          'boundaryType'     : boundaryType ,
+                                          'algoName'         : algoName ,
+                                          'iterTarget'       : iterTarget ,
+                                          'initial'          : 0 ,
+                                          'gaussianFastPath' : False ,
+                                          'cropSupport'      : False ,
+                                          'masked'           : False ,
+                                          'profiling'        : False ,
+                                          'precision'        : precision ,
+                                          'outputDir'        : caseDir } )
+
+    record  = { 'key'          : caseKey(size, dynamics, boundaryType, algoName, precision) ,
+                'size'         : size ,
+                'dynamics'     : config.dynamics ,
+                'boundaryType' : boundaryType ,
+                'algoName'     : algoName ,
+                'precision'    : precision }
+
+    record['predictedPeakMemory'] = memoryReportForConfig(config)['peak']
+
+    record['proximals'] = timeProximals(config, nTiming)
+    record['stepTime']  = timeStepFunction(config.algorithm(), nTiming)
+
+    # the algorithm is run from scratch for the time to tolerance
+    algorithm         = config.algorithm()
+    record['finalJ']  = float(algorithm.run())
+
+    (record['timeToTolerance'],
+     record['iterationsToTolerance']) = timeToTolerance(caseDir, config.nModWrite, tolerance)
+    record['peakMemory']              = peakMemory()
+
+    return record
+
+#__________________________________________________
+
+def timeMetrics(record):
+    # metrics compared with the baseline, the lower the better
+    metrics = {}
+    for (name, time) in record['proximals'].items():
+        metrics['proximals/'+name] = time
+    for name in ['stepTime', 'timeToTolerance', 'peakMemory', 'relativeJError']:
+        metrics[name] = record.get(name, None)
+    return metrics
+
+#__________________________________________________
+
+def compareWithBaseline(records, baseline, threshold):
+    #
+    # returns the list of (key, metric, value, baselineValue) for which
+    # value > ( 1 + threshold ) * baselineValue
+    #
+    baselineRecords = dict( [ ( record['key'] , record ) for record in baseline['records'] ] )
+    regressions     = []
+
+    for record in records:
+        if not record['key'] in baselineRecords:
+            continue
+        metrics         = timeMetrics(record)
+        baselineMetrics = timeMetrics(baselineRecords[record['key']])
+        for name in sorted(metrics.keys()):
+            value         = metrics[name]
+            baselineValue = baselineMetrics.get(name, None)
+            if value is None or baselineValue is None or baselineValue <= 0.:
+                continue
+            if value > ( 1. + threshold ) * baselineValue:
+                regressions.append((record['key'], name, value, baselineValue))
+
+    return regressions
+
+#__________________________________________________
+
+def addPrecisionErrors(records):
+    # relative difference of final J with the one of the same case in double precision
+    doubleJ = dict( [ ( caseKey(record['size'], record['dynamics'], record['boundaryType'], record['algoName']) ,
+                        record['finalJ'] ) for record in records if record['precision'] == 'double' ] )
+
+    for record in records:
+        key = caseKey(record['size'], record['dynamics'], record['boundaryType'], record['algoName'])
+        if record['precision'] == 'double' or not key in doubleJ or doubleJ[key] == 0.:
+            continue
+        record['relativeJError'] = abs( record['finalJ'] - doubleJ[key] ) / abs( doubleJ[key] )
+
+#__________________________________________________
+
+def precisionFailures(records, tolerance):
+    # records for which the relative difference of final J with double precision is above tolerance
+    return [ record for record in records if record.get('relativeJError', 0.) > tolerance ]
+
+#__________________________________________________
+
+def testPrecision(configFile, outputDir, size=16, iterTarget=1000, tolerance=1.e-3):
+    #
+    # runs pd on the Gaussian boundaries (boundaryType = 1, dynamics = 0) of size
+    # M = N = P = size in double, single and mixed precision, and raises an
+    # AssertionError if the relative difference of final J with double precision
+    # is above tolerance
+    #
+    # with the default values, the relative difference is about 3e-5, while
+    # after 200 iterations only it is about 4e-4 since J still varies. adr is
+    # not used because it converges too slowly : its final J varies by 10% between
+    # 1000 and 3000 iterations, so that the difference is the one of the path and
+    # not the one of the precision
+    #
+    print('__________________________________________________')
+    print('Testing precisions...')
+    print('size       = '+str(size))
+    print('iterTarget = '+str(iterTarget))
+    print('tolerance  = '+str(tolerance))
+
+    finalJ = {}
+    for precision in ['double', 'single', 'mixed']:
+        caseDir = caseOutputDir(outputDir, size, 0, 1, 'pd', precision)
+        cleanOutputDir(caseDir)
+        config  = Configuration(configFile, { 'M'                : size ,
+                                              'N'                : size ,
+                                              'P'                : size ,
+                                              'dynamics'         : 0 ,
+                                              'boundaryType'     : 1 ,
+                                              'algoName'         : 'pd' ,
+                                              'iterTarget'       : iterTarget ,
+                                              'initial'          : 0 ,
+                                              'gaussianFastPath' : False ,
+                                              'cropSupport'      : False ,
+                                              'masked'           : False ,
+                                              'profiling'        : False ,
+                                              'precision'        : precision ,
+                                              'outputDir'        : caseDir } )
+        finalJ[precision] = float(config.algorithm().run())
+
+    maxError = 0.
+    print('__________________________________________________')
+    print('final J (double) = '+str(finalJ['double']))
+    for precision in ['single', 'mixed']:
+        error    = abs( finalJ[precision] - finalJ['double'] ) / abs( finalJ['double'] )
+        maxError = max( maxError , error )
+        print('final J ('+precision+') = '+str(finalJ[precision])+' , relative difference = '+str(error))
+
+    print('max relative difference : '+str(maxError))
+    print('__________________________________________________')
+
+    if not maxError <= tolerance:
+        raise AssertionError('The final J in single or mixed precision differs from the one in double precision by ' +
+                             str(maxError) + ' > ' + str(tolerance))
+
+    return maxError
+
+#__________________________________________________
+
+def formatValue(value):
+    if value is None:
+        return '-'
+    return '%.3e' % value
+
+#__________________________________________________
+
+class PerformanceBenchmark:
+
+    def __init__(self, config):
+        self.config = config
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Performance benchmark of the 2D OT algorithms'
+
+    #_________________________
+
+    def run(self):
+        records = []
+
+        for size in self.config.sizes:
+            for dynamics in self.config.dynamicsList:
+                for boundaryType in self.config.boundaryTypes:
+                    for algoName in self.config.algoNames:
+                        for precision in self.config.precisions:
+                            print('__________________________________________________')
+                            print('Benchmark : '+caseKey(size, dynamics, boundaryType, algoName, precision))
+                            print('__________________________________________________')
+
+                            # one process per case, for the peak memory
+                            pool   = mp.Pool(1, maxtasksperchild=1)
+                            record = pool.apply(runPerformanceCase, (self.config.configFile,
+                                                                     self.config.outputDir,
+                                                                     size,
+                                                                     dynamics,
+                                                                     boundaryType,
+                                                                     algoName,
+                                                                     precision,
+                                                                     self.config.nTiming,
+                                                                     self.config.iterTarget,
+                                                                     self.config.tolerance))
+                            pool.close()
+                            pool.join()
+                            records.append(record)
+
+        addPrecisionErrors(records)
+        failures    = precisionFailures(records, self.config.precisionTolerance)
+        report      = { 'records'            : records ,
+                        'precisionTolerance' : self.config.precisionTolerance ,
+                        'precisionFailures'  : [ record['key'] for record in failures ] }
+        regressions = []
+
+        if self.config.baselineFile and os.path.isfile(self.config.baselineFile):
+            f           = open(self.config.baselineFile, 'r')
+            baseline    = json.load(f)
+            f.close()
+            regressions = compareWithBaseline(records, baseline, self.config.regressionThreshold)
+            report['baselineFile'] = self.config.baselineFile
+            report['regressions']  = [ { 'key' : key , 'metric' : name , 'value' : value , 'baseline' : baselineValue }
+                                       for (key, name, value, baselineValue) in regressions ]
+
+        filePerformance = self.config.outputDir + 'performance.json'
+        f = open(filePerformance, 'w')
+        json.dump(report, f, indent=1, sort_keys=True)
+        f.close()
+
+        if self.config.baselineFile and self.config.updateBaseline:
+            f = open(self.config.baselineFile, 'w')
+            json.dump({ 'records' : records }, f, indent=1, sort_keys=True)
+            f.close()
+            print('Baseline written in '+self.config.baselineFile)
+
+        print('__________________________________________________')
+        print('Benchmark finished')
+        print('case'.ljust(70) + 'step time'.ljust(13) + 'tol. time'.ljust(13) + 'peak memory'.ljust(13) +
+              'predicted'.ljust(13) + 'J error')
+        for record in records:
+            print(record['key'].ljust(70) +
+                  formatValue(record['stepTime']).ljust(13) +
+                  formatValue(record['timeToTolerance']).ljust(13) +
+                  formatValue(record['peakMemory']).ljust(13) +
+                  formatValue(record.get('predictedPeakMemory', None)).ljust(13) +
+                  formatValue(record.get('relativeJError', None)))
+
+        if failures:
+            print('__________________________________________________')
+            print('WARNING : final J differs from double precision by more than '+str(self.config.precisionTolerance))
+            for record in failures:
+                print(record['key'] + ' : ' + formatValue(record['relativeJError']))
+
+        if 'regressions' in report:
+            if regressions:
+                print('__________________________________________________')
+                print('Regressions with respect to '+self.config.baselineFile)
+                for (key, name, value, baselineValue) in regressions:
+                    print(key + ' ' + name + ' : ' + formatValue(value) + ' vs ' + formatValue(baselineValue))
+            else:
+                print('No regression with respect to '+self.config.baselineFile)
+
+        print('Results written in '+filePerformance)
+        print('__________________________________________________')
+
+        return (records, regressions)
+
+#__________________________________________________
@@ -0,0 +1,160 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_______________
+# cropSupport.py
+#_______________
+#
+# Crops the temporal boundaries to a padded bounding box of the joint support
+# of f0 and f1, and embeds the results back into the original grid
+#
+# Each axis is cropped independently : the cropped box [i0,i0+Mc]x[j0,j0+Nc]
+# is the physical domain [0,Lx*Mc/M]x[0,Ly*Nc/N], hence the grid spacings
+# are unchanged and the cropped problem is the restriction of the original
+# one : the momentum and J need no scaling when embedding the results.
+#
+# sinkhorn, ma and gaussian only handle the unit domain, hence their
+# boundaries are not cropped.
+#
+# If a reservoir is added around the cropped grid (dynamics = 3 or 4), it is
+# dropped when embedding the results.
+#
+
+import os
+import cPickle as pck
+import numpy   as np
+
+from ..grid          import grid
+from ..OTObject      import PhysicalDomain
+from ..OTObject      import physicalDomainForConfig
+from ...utils.io     import files
+
+#__________________________________________________
+
+def supportBox(bt0, bt1, threshold, padding):
+    #
+    # returns (i0, j0, Mc, Nc), the smallest box which contains the support
+    # of f0 and f1, extended by padding nodes, with at least 2 cells per axis
+    #
+    M       = bt0.shape[0] - 1
+    N       = bt0.shape[1] - 1
+
+    f       = np.maximum(np.abs(bt0), np.abs(bt1))
+    support = ( f > threshold * f.max() )
+    I       = np.nonzero(support.any(axis=1))[0]
+    J       = np.nonzero(support.any(axis=0))[0]
+
+    iMin    = max(I[0]-padding, 0)
+    iMax    = min(I[-1]+padding, M)
+    jMin    = max(J[0]-padding, 0)
+    jMax    = min(J[-1]+padding, N)
+
+    Mc      = min(max(iMax-iMin, 2), M)
+    Nc      = min(max(jMax-jMin, 2), N)
+
+    # centers the box on the support
+    i0      = min(max(iMin-(Mc-iMax+iMin)/2, 0), M-Mc)
+    j0      = min(max(jMin-(Nc-jMax+jMin)/2, 0), N-Nc)
+
+    return (i0, j0, Mc, Nc)
+
+#__________________________________________________
+
+def cropBoundaries(config):
+    config.cropBox     = None
+
+    if config.algoName in ['sinkhorn', 'ma', 'gaussian']:
+        print('Support not cropped since algorithm '+config.algoName+' only handles the unit domain')
+        return
+
+    if config.dynamics == 0:
+        print('Support not cropped since spatial boundary conditions are required (dynamics=0)')
+        return
+
+    if config.dynamics == 5:
+        print('Support not cropped since the domain is periodic (dynamics=5)')
+        return
+
+    bt0              = config.boundaries.temporalBoundaries.bt0
+    bt1              = config.boundaries.temporalBoundaries.bt1
+    (i0, j0, Mc, Nc) = supportBox(bt0, bt1, config.cropThreshold, config.cropPadding)
+
+    if Mc == config.M and Nc == config.N:
+        print('Support not cropped since it fills the domain')
+        return
+
+    print('Cropping support : '+str(config.M)+'x'+str(config.N)+' -> '+str(Mc)+'x'+str(Nc))
+
+    config.cropBox     = (i0, j0, Mc, Nc, config.M, config.N)
+    config.Lx          = config.Lx * Mc / config.M
+    config.Ly          = config.Ly * Nc / config.N
+    config.M           = Mc
+    config.N           = Nc
+    domain             = physicalDomainForConfig(config)
+
+    temporalBoundaries = grid.TemporalBoundaries( Mc , Nc , config.P ,
+                                                  bt0[i0:i0+Mc+1,j0:j0+Nc+1].copy() ,
+                                                  bt1[i0:i0+Mc+1,j0:j0+Nc+1].copy() ,
+                                                  domain=domain )
+
+    config.boundaries  = grid.Boundaries( Mc , Nc , config.P , temporalBoundaries , domain=domain )
+
+#__________________________________________________
+
+def embedStaggeredField(field, cropBox):
+    # embeds field, defined on the cropped grid, into the original grid
+    (i0, j0, Mc, Nc, M, N) = cropBox
+    P                      = field.P
+
+    # size of the reservoir
+    r  = ( field.M - Mc ) / 2
+
+    mx = np.zeros(shape=(M+2,N+1,P+1))
+    my = np.zeros(shape=(M+1,N+2,P+1))
+    f  = np.zeros(shape=(M+1,N+1,P+2))
+
+    mx[i0:i0+Mc+2,j0:j0+Nc+1,:] = field.mx[r:r+Mc+2,r:r+Nc+1,:]
+    my[i0:i0+Mc+1,j0:j0+Nc+2,:] = field.my[r:r+Mc+1,r:r+Nc+2,:]
+    f[i0:i0+Mc+1,j0:j0+Nc+1,:]  = field.f[r:r+Mc+1,r:r+Nc+1,:]
+
+    # the cropped box is [0,Lx*Mc/M]x[0,Ly*Nc/N]
+    domain = PhysicalDomain(field.Lx * M / Mc, field.Ly * N / Nc, field.T)
+
+    return grid.StaggeredField(M, N, P, mx, my, f, domain=domain)
+
+#__________________________________________________
+
+def embedOutput(config, result):
+    #
+    # writes the final state embedded into the original grid and
+    # returns the result, which is the same on both grids
+    #
+    if config.cropBox is None or not os.path.isfile(files.fileFinalState(config.outputDir)):
+        return result
+
+    f           = open(files.fileFinalState(config.outputDir), 'rb')
+    p           = pck.Unpickler(f)
+    finalState  = p.load().convergingStaggeredField()
+    f.close()
+
+    fileName    = files.fileEmbeddedFinalState(config.outputDir)
+    f           = open(fileName, 'wb')
+    p           = pck.Pickler(f, protocol=-1)
+    p.dump(embedStaggeredField(finalState, config.cropBox))
+    f.close()
+
+    print('Final state embedded into the original grid written in '+fileName)
+
+    return result
+
+#__________________________________________________
@@ -24,6 +24,7 @@ from scipy.interpolate import interp1d
 from ...utils.io.io import extensionOfFile
 from ...utils.io.io import arrayFromFile
 from ..grid         import grid
+from ..OTObject     import physicalDomainForConfig
 
 from gaussian       import defaultBoundaryGaussian
 from gaussian       import defaultBoundaryGaussian2
@@ -31,39 +32,53 @@ from gaussianSplit  import defaultBoundaryGaussianSplit1
 from gaussianSplit  import defaultBoundaryGaussianSplit2
 from gaussianSine   import defaultBoundaryGaussianSine
 from gaussianSine   import defaultBoundaryGaussianCosine
+from cropSupport    import cropBoundaries
+from mask           import maskTemporalBoundaries
+from mask           import maskSpatialBoundaries
 
 def boundariesForConfig(config):
+    domain = physicalDomainForConfig(config)
+
     # default configurations
     if config.boundaryType == 1:
-        config.boundaries = defaultBoundaryGaussian( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussian( config.M , config.N , config.P , domain )
     elif config.boundaryType == 2:
-        config.boundaries = defaultBoundaryGaussian2( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussian2( config.M , config.N , config.P , domain )
     elif config.boundaryType == 3:
-        config.boundaries = defaultBoundaryGaussianSplit1( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussianSplit1( config.M , config.N , config.P , domain )
     elif config.boundaryType == 4:
-        config.boundaries = defaultBoundaryGaussianSplit2( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussianSplit2( config.M , config.N , config.P , domain )
     elif config.boundaryType == 5:
-        config.boundaries = defaultBoundaryGaussianSine( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussianSine( config.M , config.N , config.P , domain )
     elif config.boundaryType == 6:
-        config.boundaries = defaultBoundaryGaussianCosine( config.M , config.N , config.P )
+        config.boundaries = defaultBoundaryGaussianCosine( config.M , config.N , config.P , domain )
 
     # from file
     elif config.boundaryType == 0:
         config.boundaries = boundariesFromFile( config )
 
+    # inactive cells
+    maskTemporalBoundaries(config)
+
     # normalize boundaries
     config.boundaries.normalize(config.normType)
+
+    # crop boundaries to their support
+    if config.cropSupport:
+        cropBoundaries(config)
+        domain = config.boundaries.domain
     
     # adapt boundaries to dynamics
     if config.dynamics == 1:
-        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P )
+        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , domain=domain )
 
-    if config.dynamics == 0 or config.dynamics == 1:
+    # the source term of wfr handles the mass default
+    if ( config.dynamics == 0 or config.dynamics == 1 ) and not config.algoName == 'wfr':
         delta = config.boundaries.relativeMassDefault()
         if delta > config.EPSILON:
             print ('Changing dynamics because mass default is not compatible with dynamics='+str(config.dynamics))
 
-            if config.algoName == 'pd':
+            if config.algoName in ['pd', 'sinkhorn', 'ma', 'gaussian']:
                 config.dynamics = 2
             else:
                 M = config.M
@@ -72,9 +87,9 @@ def boundariesForConfig(config):
                 bt1 = np.zeros(shape=(M+1+2,N+1+2))
                 bt0[1:M+2,1:N+2] = config.boundaries.temporalBoundaries.bt0[:,:]
                 bt1[1:M+2,1:N+2] = config.boundaries.temporalBoundaries.bt1[:,:]
-                temporalBoundaries = TemporalBoundaries( M+2, N+2, config.P, bt0, bt1 )
+                temporalBoundaries = grid.TemporalBoundaries( M+2, N+2, config.P, bt0, bt1, domain=domain )
 
-                config.boundaries = Boundaries( M+2, N+2 , config.P , temporalBoundaries )
+                config.boundaries = grid.Boundaries( M+2, N+2 , config.P , temporalBoundaries , domain=domain )
                 config.M = M+2
                 config.N = N+2
                 
@@ -83,67 +98,65 @@ def boundariesForConfig(config):
                 elif config.algoName == 'adr3':
                     config.dynamics = 4
 
-    if config.dynamics == 2:
-        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P )
+    if config.dynamics == 2 or config.dynamics == 5:
+        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , domain=domain )
     elif config.dynamics == 3 or config.dynamics == 4:
-        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P )
+        config.boundaries.spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , domain=domain )
         config.boundaries.placeReservoir(config)
 
-def boundariesFromFile(config):
-    # Catching bt from files
-    bt0 = arrayFromFile( config.filef0 )
-    bt1 = arrayFromFile( config.filef1 )
+    # periodic dynamics : mass must be conserved
+    if config.dynamics == 5 and abs(config.boundaries.relativeMassDefault()) > config.EPSILON:
+        print ('Correcting mass default by rescaling f1 since it is not compatible with dynamics=5')
+        config.boundaries.normalize(0)
 
-    if bt0 is None or bt1 is None:
+    # inactive faces
+    maskSpatialBoundaries(config)
+
+def temporalBoundaryFromFile(fileName, M, N, name='bt'):
+    # Catching one temporal boundary from file, in OT resolution
+    bt = arrayFromFile( fileName )
+
+    if bt is None:
         raise IOError('Could not load temporal boundaries')
 
     try:
-        bt0 = np.array(bt0)
-        bt1 = np.array(bt1)
+        bt = np.array(bt)
     except:
         raise IOError('Could not cast temporal boundaries into arrays')
 
-    if len(bt0.shape) == 1:
-        bt0 = bt0.reshape((config.M+1,config.N+1))
-
-    if len(bt1.shape) == 1:
-        bt1 = bt1.reshape((config.M+1,config.N+1))
+    if len(bt.shape) == 1:
+        bt = bt.reshape((M+1,N+1))
 
-    if ( not len(bt0.shape) == 2 or
-         not len(bt1.shape) == 2 ):
+    if not len(bt.shape) == 2:
         raise IOError('Temporal boundaries must be 2-dimensional arrays')
 
-    if not bt0.shape == (config.M+1,config.N+1):
-        print( 'Interpolating bt0 into OT resolution ...')
+    if not bt.shape == (M+1,N+1):
+        print( 'Interpolating '+name+' into OT resolution ...')
 
-        if not bt0.shape[0] == config.M + 1:
-            bt0temp = bt0.copy()
-            interpBt0 = interp1d( np.linspace( 0.0 , 1.0 , bt0.shape[0] ) , bt0temp , axis = 0 )
-            bt0 = interpBt0( np.linspace( 0.0 , 1.0 , config.M + 1 ) )
+        if not bt.shape[0] == M + 1:
+            bttemp = bt.copy()
+            interpBt = interp1d( np.linspace( 0.0 , 1.0 , bt.shape[0] ) , bttemp , axis = 0 )
+            bt = interpBt( np.linspace( 0.0 , 1.0 , M + 1 ) )
 
-        if not bt0.shape[1] == config.N + 1:
-            bt0temp = bt0.copy()
-            interpBt0 = interp1d( np.linspace( 0.0 , 1.0 , bt0.shape[1] ) , bt0temp , axis = 1 )
-            bt0 = interpBt0( np.linspace( 0.0 , 1.0 , config.N + 1 ) )
+        if not bt.shape[1] == N + 1:
+            bttemp = bt.copy()
+            interpBt = interp1d( np.linspace( 0.0 , 1.0 , bt.shape[1] ) , bttemp , axis = 1 )
+            bt = interpBt( np.linspace( 0.0 , 1.0 , N + 1 ) )
 
-    if not bt1.shape == (config.M+1,config.N+1):
-        print( 'Interpolating bt1 into OT resolution ...')
+    return bt
 
-        if not bt1.shape[0] == config.M + 1:
-            bt1temp = bt1.copy()
-            interpBt1 = interp1d( np.linspace( 0.0 , 1.0 , bt1.shape[0] ) , bt1temp , axis = 0 )
-            bt1 = interpBt1( np.linspace( 0.0 , 1.0 , config.M + 1 ) )
+def boundariesFromFile(config):
+    domain = physicalDomainForConfig(config)
 
-        if not bt1.shape[1] == config.N + 1:
-            bt1temp = bt1.copy()
-            interpBt1 = interp1d( np.linspace( 0.0 , 1.0 , bt1.shape[1] ) , bt1temp , axis = 1 )
-            bt1 = interpBt1( np.linspace( 0.0 , 1.0 , config.N + 1 ) )
+    # Catching bt from files
+    bt0 = temporalBoundaryFromFile( config.filef0 , config.M , config.N , 'bt0' )
+    bt1 = temporalBoundaryFromFile( config.filef1 , config.M , config.N , 'bt1' )
 
-    temporalBoundaries = grid.TemporalBoundaries( config.M , config.N , config.P , bt0 , bt1 )
+    temporalBoundaries = grid.TemporalBoundaries( config.M , config.N , config.P , bt0 , bt1 , domain=domain )
 
     if not config.dynamics == 0:
-        spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P )
-        return grid.Boundaries( config.M , config.N , config.P , temporalBoundaries , spatialBoundaries )
+        spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , domain=domain )
+        return grid.Boundaries( config.M , config.N , config.P , temporalBoundaries , spatialBoundaries , domain=domain )
 
     # catching bx from files
     bx0 = arrayFromFile( config.filemx0 )
@@ -243,6 +256,6 @@ def boundariesFromFile(config):
             interpBy1 = interp1d( np.linspace( 0.0 , 1.0 , by1.shape[1] ) , by1temp , axis = 1 )
             by1 = interpBy1( np.linspace( 0.0 , 1.0 , config.P + 1 ) )
 
-    spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , bx0 , bx1 , by0 , by1 )
+    spatialBoundaries = grid.SpatialBoundaries( config.M , config.N , config.P , bx0 , bx1 , by0 , by1 , domain=domain )
     
-    return grid.Boundaries( config.M , config.N , config.P , temporalBoundaries , spatialBoundaries )
+    return grid.Boundaries( config.M , config.N , config.P , temporalBoundaries , spatialBoundaries , domain=domain )
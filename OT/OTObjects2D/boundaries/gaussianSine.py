@@ -23,7 +23,7 @@ from ..grid import grid
 
 def boundaryGaussianSine(M,N,P,
                          A0,alphaX0,betaX0,alphaY0,betaY0,x00,x01,y00,y01,
-                         A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11):
+                         A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11, domain=None):
     #
     # f0 = A0exp(-alphaX0(x-x00)^2)exp(-alphaY0(y-y00)^2)sin^2(betaX0(x-x01))sin^2(betaY0(y-y01))
     # f1 = A1exp(-alphaX1(x-x10)^2)exp(-alphaY1(y-y10)^2)sin^2(betaX1(x-x11))sin^2(betaY1(y-y11))
@@ -54,15 +54,15 @@ def boundaryGaussianSine(M,N,P,
                    np.power( np.sin( betaX1 * ( X - x11 ) ) , 2 ) *
                    np.power( np.sin( betaY1 * ( Y - y11 ) ) , 2 ) ) )
 
-    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 )
-    spatialBoundaries  = grid.SpatialBoundaries( M , N , P )
+    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 , domain=domain )
+    spatialBoundaries  = grid.SpatialBoundaries( M , N , P , domain=domain )
 
     return grid.Boundaries( M , N , P ,
-                            temporalBoundaries, spatialBoundaries )
+                            temporalBoundaries, spatialBoundaries, domain=domain )
 
 def boundaryGaussianCosine(M,N,P,
                            A0,alphaX0,betaX0,alphaY0,betaY0,x00,x01,y00,y01,
-                           A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11):
+                           A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11, domain=None):
     #
     # f0 = A0exp(-alphaX0(x-x00)^2)exp(-alphaY0(y-y00)^2)cos^2(betaX0(x-x01))cos^2(betaY0(y-y01))
     # f1 = A1exp(-alphaX1(x-x10)^2)exp(-alphaY1(y-y10)^2)cos^2(betaX1(x-x11))cos^2(betaY1(y-y11))
@@ -93,13 +93,13 @@ def boundaryGaussianCosine(M,N,P,
                    np.power( np.cos( betaX1 * ( X - x11 ) ) , 2 ) *
                    np.power( np.cos( betaY1 * ( Y - y11 ) ) , 2 ) ) )
 
-    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 )
-    spatialBoundaries  = grid.SpatialBoundaries( M , N , P )
+    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 , domain=domain )
+    spatialBoundaries  = grid.SpatialBoundaries( M , N , P , domain=domain )
 
     return grid.Boundaries( M , N , P ,
-                            temporalBoundaries, spatialBoundaries )
+                            temporalBoundaries, spatialBoundaries, domain=domain )
 
-def defaultBoundaryGaussianSine(M, N, P):
+def defaultBoundaryGaussianSine(M, N, P, domain=None):
     A0      = 1.
     alphaX0 = 60.
     betaX0  = 16*np.pi
@@ -121,9 +121,9 @@ def defaultBoundaryGaussianSine(M, N, P):
     y11     = 0.
     return boundaryGaussianSine(M,N,P,
                                 A0,alphaX0,betaX0,alphaY0,betaY0,x00,x01,y00,y01,
-                                A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11)
+                                A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11, domain=domain)
 
-def defaultBoundaryGaussianCosine(M, N, P):
+def defaultBoundaryGaussianCosine(M, N, P, domain=None):
     A0      = 1.
     alphaX0 = 60.
     betaX0  = 16*np.pi
@@ -145,4 +145,4 @@ def defaultBoundaryGaussianCosine(M, N, P):
     y11     = 0.
     return boundaryGaussianCosine(M,N,P,
                                   A0,alphaX0,betaX0,alphaY0,betaY0,x00,x01,y00,y01,
-                                  A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11)
+                                  A1,alphaX1,betaX1,alphaY1,betaY1,x10,x11,y10,y11, domain=domain)
@@ -23,7 +23,7 @@ from ..grid import grid
 
 def boundaryGaussianSplit1(M,N,P,
                            A00,A01,alphaX00,alphaX01,x00,x01,alphaY00,alphaY01,y00,y01,
-                           A1,alphaX1,x1,alphaY1,y1):
+                           A1,alphaX1,x1,alphaY1,y1, domain=None):
     #
     # f0(x) = A00exp(-alphaX00(x-x00)^2)exp(-alphaY00(y-y00)^2) + A01exp(-alphaX01(x-x01)^2)exp(-alphaY01(y-y01)^2)
     # f1(x) = A1exp(-alphaX1(x-x1)^2)exp(-alphaY1(y-y1)^2)
@@ -47,15 +47,15 @@ def boundaryGaussianSplit1(M,N,P,
 
     f1  = ( A1  * np.exp( -alphaX1  * np.power( X - x1  , 2 ) ) * np.exp( -alphaY1  * np.power( Y - y1  , 2 ) ) )
 
-    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 )
-    spatialBoundaries  = grid.SpatialBoundaries( M , N , P )
+    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 , domain=domain )
+    spatialBoundaries  = grid.SpatialBoundaries( M , N , P , domain=domain )
 
     return grid.Boundaries( M , N , P ,
-                            temporalBoundaries, spatialBoundaries )
+                            temporalBoundaries, spatialBoundaries, domain=domain )
 
 def boundaryGaussianSplit2(M,N,P,
                            A0,alphaX0,x0,alphaY0,y0,
-                           A10,A11,alphaX10,alphaX11,x10,x11,alphaY10,alphaY11,y10,y11):
+                           A10,A11,alphaX10,alphaX11,x10,x11,alphaY10,alphaY11,y10,y11, domain=None):
     #
     # f0(x) = A0exp(-alphaX0(x-x0)^2)exp(-alphaY0(y-y0)^2)
     # f1(x) = A10exp(-alphaX10(x-x10)^2)exp(-alphaY10(y-y10)^2) + A11exp(-alphaX11(x-x11)^2)exp(-alphaY11(y-y11)^2)
@@ -78,13 +78,13 @@ def boundaryGaussianSplit2(M,N,P,
     f1  = ( A10 * np.exp( -alphaX10 * np.power( X - x10 , 2 ) ) * np.exp( -alphaY10 * np.power( Y - y10 , 2 ) ) +
             A11 * np.exp( -alphaX11 * np.power( X - x11 , 2 ) ) * np.exp( -alphaY11 * np.power( Y - y11 , 2 ) ) )
 
-    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 )
-    spatialBoundaries  = grid.SpatialBoundaries( M , N , P )
+    temporalBoundaries = grid.TemporalBoundaries( M , N , P , f0 , f1 , domain=domain )
+    spatialBoundaries  = grid.SpatialBoundaries( M , N , P , domain=domain )
 
     return grid.Boundaries( M , N , P ,
-                            temporalBoundaries, spatialBoundaries )
+                            temporalBoundaries, spatialBoundaries, domain=domain )
 
-def defaultBoundaryGaussianSplit1(M, N, P):
+def defaultBoundaryGaussianSplit1(M, N, P, domain=None):
     A00      = 1.
     A01      = 1.
     alphaX00 = 110.
@@ -103,9 +103,9 @@ def defaultBoundaryGaussianSplit1(M, N, P):
     y1       = 0.5    
     return boundaryGaussianSplit1(M, N, P,
                                   A00,A01,alphaX00,alphaX01,x00,x01,alphaY00,alphaY01,y00,y01,
-                                  A1,alphaX1,x1,alphaY1,y1)
+                                  A1,alphaX1,x1,alphaY1,y1, domain=domain)
 
-def defaultBoundaryGaussianSplit2(M, N, P):
+def defaultBoundaryGaussianSplit2(M, N, P, domain=None):
     A0       = 1.
     alphaX0  = 60.
     x0       = 0.5
@@ -136,4 +136,4 @@ def defaultBoundaryGaussianSplit2(M, N, P):
     y11      = 0.75
     return boundaryGaussianSplit2(M, N, P,
                                   A0,alphaX0,x0,alphaY0,y0,
-                                  A10,A11,alphaX10,alphaX11,x10,x11,alphaY10,alphaY11,y10,y11)
+                                  A10,A11,alphaX10,alphaX11,x10,x11,alphaY10,alphaY11,y10,y11, domain=domain)
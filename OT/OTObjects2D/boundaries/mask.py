@@ -0,0 +1,121 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#________
+# mask.py
+#________
+#
+# Mask of the active cells (e.g. sea cells of a land/sea mask)
+#
+# The mask is a boolean array of shape (M+1,N+1) defined on the nodes of f.
+# Mass may only be transported between active nodes :
+#   * f0 and f1 are set to 0 on the inactive nodes
+#   * the momentum is set to 0 on every face adjacent to an inactive node
+#
+# Mass has to be conserved in each connected component of the active nodes.
+#
+
+import numpy as np
+
+from scipy.ndimage  import zoom
+
+from ...utils.io.io import arrayFromFile
+
+#__________________________________________________
+
+def maskFromFile(fileName, M, N):
+    mask = arrayFromFile(fileName)
+
+    if mask is None:
+        raise IOError('Could not load mask')
+
+    mask = np.array(mask)
+    if len(mask.shape) == 1:
+        mask = mask.reshape((M+1,N+1))
+
+    if not len(mask.shape) == 2:
+        raise IOError('Mask must be a 2-dimensional array')
+
+    if not mask.shape == (M+1,N+1):
+        print( 'Interpolating mask into OT resolution ...')
+        mask = zoom( 1. * mask ,
+                     ( ( M + 1. ) / mask.shape[0] , ( N + 1. ) / mask.shape[1] ) ,
+                     order=0 )
+
+    return ( mask > 0.5 )
+
+#__________________________________________________
+
+def faceMasks(mask):
+    #
+    # returns (maskX, maskY), the active faces of mx (M+2,N+1) and my (M+1,N+2)
+    # a face is active if all its adjacent nodes are active
+    #
+    maskX          = np.zeros(shape=(mask.shape[0]+1,mask.shape[1]), dtype=bool)
+    maskX[:-1,:]   = mask
+    maskX[1:,:]   &= mask
+    maskX[0,:]     = mask[0,:]
+    maskX[-1,:]    = mask[-1,:]
+
+    maskY          = np.zeros(shape=(mask.shape[0],mask.shape[1]+1), dtype=bool)
+    maskY[:,:-1]   = mask
+    maskY[:,1:]   &= mask
+    maskY[:,0]     = mask[:,0]
+    maskY[:,-1]    = mask[:,-1]
+
+    return (maskX, maskY)
+
+#__________________________________________________
+
+def maskTemporalBoundaries(config):
+    # loads the mask and sets f0 and f1 to 0 on the inactive nodes
+    config.mask = None
+    if not config.masked:
+        return
+
+    config.mask = maskFromFile(config.fileMask, config.M, config.N)
+    print('Masked domain : '+str(config.mask.sum())+' active nodes out of '+str(config.mask.size))
+
+    temporalBoundaries      = config.boundaries.temporalBoundaries
+    temporalBoundaries.bt0 *= config.mask
+    temporalBoundaries.bt1 *= config.mask
+
+#__________________________________________________
+
+def maskSpatialBoundaries(config):
+    #
+    # adapts the mask to the final grid (cropped or with a reservoir)
+    # and sets the spatial boundaries to 0 on the inactive faces
+    #
+    if config.mask is None:
+        return
+
+    if getattr(config, 'cropBox', None) is not None:
+        (i0, j0, Mc, Nc, M, N) = config.cropBox
+        config.mask            = config.mask[i0:i0+Mc+1,j0:j0+Nc+1]
+
+    # the reservoir surrounding the domain is active
+    r = ( config.M + 1 - config.mask.shape[0] ) / 2
+    if r > 0:
+        mask                   = np.ones(shape=(config.M+1,config.N+1), dtype=bool)
+        mask[r:-r,r:-r]        = config.mask
+        config.mask            = mask
+
+    (maskX, maskY)             = faceMasks(config.mask)
+    spatialBoundaries          = config.boundaries.spatialBoundaries
+    spatialBoundaries.bx0     *= maskX[0,:,np.newaxis]
+    spatialBoundaries.bx1     *= maskX[-1,:,np.newaxis]
+    spatialBoundaries.by0     *= maskY[:,0,np.newaxis]
+    spatialBoundaries.by1     *= maskY[:,-1,np.newaxis]
+
+#__________________________________________________
@@ -22,6 +22,11 @@ from boundaries.defineBoundaries                import boundariesForConfig
 from algorithms.adr.adrAlgorithm                import AdrAlgorithm
 from algorithms.pd.pdAlgorithm                  import PdAlgorithm
 from algorithms.adr3.adr3Algorithm              import Adr3Algorithm
+from algorithms.sinkhorn.sinkhornAlgorithm      import SinkhornAlgorithm
+from algorithms.ma.maAlgorithm                  import MaAlgorithm
+from algorithms.gaussian.gaussianAlgorithm      import GaussianAlgorithm
+from algorithms.wfr.wfrAlgorithm                import WfrAlgorithm
+from algorithms.gaussian.closedForm             import isGaussianProblem
 
 from ..utils.configuration.defaultConfiguration import DefaultConfiguration
 
@@ -32,11 +37,19 @@ class Configuration(DefaultConfiguration):
     Stores the configuraion for an OT algorithm
     '''
 
-    def __init__(self, configFile=None):
+    def __init__(self, configFile=None, overrides=None, withBoundaries=True):
         DefaultConfiguration.__init__(self, configFile)
+        if overrides is not None:
+            for attr in overrides:
+                self.__setattr__(attr, overrides[attr])
+            # sub attributes of the overriden values
+            self.checkAttributes()
         self.swappedInitFinal = False
         self.iterCount = 0
-        boundariesForConfig(self)
+        # withBoundaries = False only reads the attributes, e.g. to check them
+        # before building one configuration per pair of fields
+        if withBoundaries:
+            boundariesForConfig(self)
 
     #_________________________
 
@@ -45,13 +58,36 @@ class Configuration(DefaultConfiguration):
 
     #_________________________
 
+    def isUnitDomain(self):
+        # configurations saved without physical extents use the unit domain
+        return ( getattr(self, 'Lx', 1.) == 1. and
+                 getattr(self, 'Ly', 1.) == 1. and
+                 getattr(self, 'T',  1.) == 1. )
+
+    #_________________________
+
     def algorithm(self):
+        if ( self.gaussianFastPath and not self.algoName in ['gaussian', 'wfr'] and
+             self.isUnitDomain() and not getattr(self, 'masked', False) and
+             not self.dynamics == 5 and
+             isGaussianProblem(self) ):
+            print('Gaussian problem detected, using closed form')
+            return GaussianAlgorithm(self)
+
         if self.algoName == 'adr':
             return AdrAlgorithm(self)
         elif self.algoName == 'pd':
             return PdAlgorithm(self)
         elif self.algoName == 'adr3':
             return Adr3Algorithm(self)
+        elif self.algoName == 'sinkhorn':
+            return SinkhornAlgorithm(self)
+        elif self.algoName == 'ma':
+            return MaAlgorithm(self)
+        elif self.algoName == 'gaussian':
+            return GaussianAlgorithm(self)
+        elif self.algoName == 'wfr':
+            return WfrAlgorithm(self)
         else:
             return
 
@@ -59,6 +95,40 @@ class Configuration(DefaultConfiguration):
 
     def checkAttributes(self):
         DefaultConfiguration.checkAttributes(self)
+
+        if not ( self.Lx > self.EPSILON and self.Ly > self.EPSILON and self.T > self.EPSILON ):
+            print ( 'Values ' + str(self.Lx) + ', ' + str(self.Ly) + ' and ' + str(self.T) +
+                    ' are not valid for parameters Lx, Ly and T ' )
+            self.Lx = self.defaultValues['Lx']
+            self.Ly = self.defaultValues['Ly']
+            self.T  = self.defaultValues['T']
+            print ( 'Replacing by default values : ' + str(self.Lx) + ', ' + str(self.Ly) + ' and ' + str(self.T) )
+
+        if self.algoName in ['sinkhorn', 'ma', 'gaussian'] and not self.isUnitDomain():
+            print ( 'Algorithm ' + self.algoName + ' only handles the unit domain, ' +
+                    'ignoring parameters Lx, Ly and T' )
+            self.Lx = self.defaultValues['Lx']
+            self.Ly = self.defaultValues['Ly']
+            self.T  = self.defaultValues['T']
+
+        if self.algoName in ['sinkhorn', 'ma', 'gaussian', 'wfr'] and self.dynamics == 5:
+            print ( 'Algorithm ' + self.algoName + ' does not handle periodic dynamics, ' +
+                    'replacing dynamics by 2' )
+            self.dynamics = 2
+
+        if not self.precision in ['double', 'single', 'mixed']:
+            print ( 'Value ' + self.precision + ' is not valid for parameter precision' )
+            self.precision = self.defaultValues['precision']
+            print ( 'Replacing by default value : ' + self.precision )
+
+        if self.dynamics == 5 and self.masked:
+            print ( 'Masked domains are not handled with periodic dynamics, ignoring parameter masked' )
+            self.masked = False
+
+        if self.algoName in ['sinkhorn', 'ma', 'gaussian', 'wfr'] and self.masked:
+            print ( 'Algorithm ' + self.algoName + ' does not handle masked domains, ' +
+                    'ignoring parameter masked' )
+            self.masked = False
         
         if self.algoName == 'adr':
             if not self.gamma > self.EPSILON:
@@ -124,6 +194,55 @@ class Configuration(DefaultConfiguration):
                 self.omega3 = self.defaultValues['omega3']
                 print ( 'Replacing by default values : ' + str(self.omega1) + ', ' + str(self.omega2) + ' and ' +str(self.omega3) )
 
+        elif self.algoName == 'sinkhorn':
+            if not self.sinkhornEpsilon > self.EPSILON:
+                print ( 'Value ' + str(self.sinkhornEpsilon) +
+                        ' is not valid for parameter sinkhornEpsilon ' )
+                self.sinkhornEpsilon = self.defaultValues['sinkhornEpsilon']
+                print ( 'Replacing by default value : ' + str ( self.sinkhornEpsilon ) )
+            if not ( self.sinkhornScaling > self.EPSILON and self.sinkhornScaling < 1. - self.EPSILON ):
+                print ( 'Value ' + str(self.sinkhornScaling) +
+                        ' is not valid for parameter sinkhornScaling ' )
+                self.sinkhornScaling = self.defaultValues['sinkhornScaling']
+                print ( 'Replacing by default value : ' + str ( self.sinkhornScaling ) )
+
+        elif self.algoName == 'wfr':
+            if not self.wfrGamma > self.EPSILON:
+                print ( 'Value ' + str(self.wfrGamma) +
+                        ' is not valid for parameter wfrGamma ' )
+                self.wfrGamma = self.defaultValues['wfrGamma']
+                print ( 'Replacing by default value : ' + str ( self.wfrGamma ) )
+            if not ( self.wfrAlpha > self.EPSILON and self.wfrAlpha < 2. - self.EPSILON ):
+                print ( 'Value ' + str(self.wfrAlpha) +
+                        ' is not valid for parameter wfrAlpha ' )
+                self.wfrAlpha = self.defaultValues['wfrAlpha']
+                print ( 'Replacing by default value : ' + str ( self.wfrAlpha ) )
+            if not self.wfrDelta > self.EPSILON:
+                print ( 'Value ' + str(self.wfrDelta) +
+                        ' is not valid for parameter wfrDelta ' )
+                self.wfrDelta = self.defaultValues['wfrDelta']
+                print ( 'Replacing by default value : ' + str ( self.wfrDelta ) )
+            if self.dynamics in [3, 4]:
+                print ( 'Algorithm wfr does not need a reservoir, replacing dynamics by 1' )
+                self.dynamics = 1
+
+        elif self.algoName == 'ma':
+            if not ( self.maDensityFloor > self.EPSILON and self.maDensityFloor < 1. ):
+                print ( 'Value ' + str(self.maDensityFloor) +
+                        ' is not valid for parameter maDensityFloor ' )
+                self.maDensityFloor = self.defaultValues['maDensityFloor']
+                print ( 'Replacing by default value : ' + str ( self.maDensityFloor ) )
+            if not ( self.maMinStep > 0. and self.maMinStep <= 1. ):
+                print ( 'Value ' + str(self.maMinStep) +
+                        ' is not valid for parameter maMinStep ' )
+                self.maMinStep = self.defaultValues['maMinStep']
+                print ( 'Replacing by default value : ' + str ( self.maMinStep ) )
+            if not ( self.maMinContinuationStep > 0. and self.maMinContinuationStep <= 1. ):
+                print ( 'Value ' + str(self.maMinContinuationStep) +
+                        ' is not valid for parameter maMinContinuationStep ' )
+                self.maMinContinuationStep = self.defaultValues['maMinContinuationStep']
+                print ( 'Replacing by default value : ' + str ( self.maMinContinuationStep ) )
+
     #_________________________
 
     def defaultAttributes(self):
@@ -148,6 +267,18 @@ class Configuration(DefaultConfiguration):
                           defaultVal=32,
                           attrType='int')
 
+        self.addAttribute('Lx',
+                          defaultVal=1.,
+                          attrType='float')
+
+        self.addAttribute('Ly',
+                          defaultVal=1.,
+                          attrType='float')
+
+        self.addAttribute('T',
+                          defaultVal=1.,
+                          attrType='float')
+
         self.addAttribute('dynamics',
                           defaultVal=0,
                           attrType='int')
@@ -160,6 +291,38 @@ class Configuration(DefaultConfiguration):
                           defaultVal=0,
                           attrType='int')
 
+        self.addAttribute('cropSupport',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('cropThreshold',
+                          defaultVal=1.e-6,
+                          isSubAttr=[('cropSupport',True)],
+                          attrType='float')
+
+        self.addAttribute('cropPadding',
+                          defaultVal=2,
+                          isSubAttr=[('cropSupport',True)],
+                          attrType='int')
+
+        self.addAttribute('masked',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('fileMask',
+                          defaultVal='mask.bin',
+                          isSubAttr=[('masked',True)])
+
+        self.addAttribute('maskCGTolerance',
+                          defaultVal=1.e-8,
+                          isSubAttr=[('masked',True)],
+                          attrType='float')
+
+        self.addAttribute('maskCGMaxIter',
+                          defaultVal=100,
+                          isSubAttr=[('masked',True)],
+                          attrType='int')
+
         self.addAttribute('filef0',
                           defaultVal='f0.bin',
                           isSubAttr=[('boundaryType',0)])
@@ -187,6 +350,19 @@ class Configuration(DefaultConfiguration):
         self.addAttribute('algoName',
                           defaultVal='adr')
 
+        self.addAttribute('gaussianFastPath',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('gaussianFitTolerance',
+                          defaultVal=1.e-2,
+                          isSubAttr=[('gaussianFastPath',True)],
+                          attrType='float')
+
+        self.addAttribute('exportDisplacement',
+                          defaultVal=False,
+                          attrType='bool')
+
         self.addAttribute('iterTarget',
                           defaultVal=1000,
                           attrType='int')
@@ -199,6 +375,31 @@ class Configuration(DefaultConfiguration):
                           defaultVal=100,
                           attrType='int')
 
+        self.addAttribute('profiling',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('metricsEndpoint',
+                          defaultVal='',
+                          printWarning=False)
+
+        self.addAttribute('lowMemory',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('precision',
+                          defaultVal='double')
+
+        self.addAttribute('mixedRefinePeriod',
+                          defaultVal=1000,
+                          isSubAttr=[('precision','mixed')],
+                          attrType='int')
+
+        self.addAttribute('mixedRefineIterations',
+                          defaultVal=100,
+                          isSubAttr=[('precision','mixed')],
+                          attrType='int')
+
         self.addAttribute('initial',
                           defaultVal=0,
                           attrType='int')
@@ -257,4 +458,74 @@ class Configuration(DefaultConfiguration):
                           isSubAttr=[('algoName','adr3')],
                           attrType='float')
 
+        self.addAttribute('sinkhornEpsilon',
+                          defaultVal=1.e-3,
+                          isSubAttr=[('algoName','sinkhorn')],
+                          attrType='float')
+
+        self.addAttribute('sinkhornScaling',
+                          defaultVal=0.5,
+                          isSubAttr=[('algoName','sinkhorn')],
+                          attrType='float')
+
+        self.addAttribute('sinkhornNIterScaling',
+                          defaultVal=2,
+                          isSubAttr=[('algoName','sinkhorn')],
+                          attrType='int')
+
+        self.addAttribute('sinkhornTolerance',
+                          defaultVal=1.e-6,
+                          isSubAttr=[('algoName','sinkhorn')],
+                          attrType='float')
+
+        self.addAttribute('sinkhornDebiased',
+                          defaultVal=True,
+                          isSubAttr=[('algoName','sinkhorn')],
+                          attrType='bool')
+
+        self.addAttribute('wfrGamma',
+                          defaultVal=1./75.,
+                          isSubAttr=[('algoName','wfr')],
+                          attrType='float')
+
+        self.addAttribute('wfrAlpha',
+                          defaultVal=1.998,
+                          isSubAttr=[('algoName','wfr')],
+                          attrType='float')
+
+        self.addAttribute('wfrDelta',
+                          defaultVal=0.5,
+                          isSubAttr=[('algoName','wfr')],
+                          attrType='float')
+
+        self.addAttribute('maDensityFloor',
+                          defaultVal=1.e-2,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='float')
+
+        self.addAttribute('maTolerance',
+                          defaultVal=1.e-6,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='float')
+
+        self.addAttribute('maLinearTolerance',
+                          defaultVal=1.e-3,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='float')
+
+        self.addAttribute('maLinearMaxIter',
+                          defaultVal=50,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='int')
+
+        self.addAttribute('maMinStep',
+                          defaultVal=1./64.,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='float')
+
+        self.addAttribute('maMinContinuationStep',
+                          defaultVal=1./1024.,
+                          isSubAttr=[('algoName','ma')],
+                          attrType='float')
+
 #__________________________________________________
@@ -0,0 +1,105 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#________________
+# displacement.py
+#________________
+#
+# Displacement interpolation of a density on the (M+1)x(N+1) grid of [0,1]^2
+#
+# Given a displacement d(x) = T(x) - x, the mass located at x moves along
+# x -> x + t d(x). The density and momentum are deposited on the nodes with
+# bilinear weights and returned as a StaggeredField.
+#
+
+import numpy as np
+from grid import StaggeredField
+
+#__________________________________________________
+
+def nodes(M, N):
+    x = np.linspace(0., 1., M+1)
+    y = np.linspace(0., 1., N+1)
+    return np.meshgrid(x, y, indexing='ij')
+
+#__________________________________________________
+
+def bilinearInterpolation(field, X, Y):
+    # interpolates field, given on the nodes of [0,1]^2, at the points (X,Y)
+    M  = field.shape[0] - 1
+    N  = field.shape[1] - 1
+
+    x  = np.clip(X, 0., 1.) * M
+    y  = np.clip(Y, 0., 1.) * N
+    i  = np.minimum(np.floor(x).astype(int), M-1)
+    j  = np.minimum(np.floor(y).astype(int), N-1)
+    wx = x - i
+    wy = y - j
+
+    return ( ( 1. - wx ) * ( 1. - wy ) * field[i,j]   +
+             wx          * ( 1. - wy ) * field[i+1,j] +
+             ( 1. - wx ) * wy          * field[i,j+1] +
+             wx          * wy          * field[i+1,j+1] )
+
+#__________________________________________________
+
+def bilinearDeposit(weights, X, Y, M, N):
+    # adjoint of bilinearInterpolation : spreads weights located at (X,Y) on the nodes
+    x  = np.clip(X, 0., 1.) * M
+    y  = np.clip(Y, 0., 1.) * N
+    i  = np.minimum(np.floor(x).astype(int), M-1)
+    j  = np.minimum(np.floor(y).astype(int), N-1)
+    wx = x - i
+    wy = y - j
+
+    field = np.zeros(shape=(M+1,N+1))
+    np.add.at(field, (i,j),     ( 1. - wx ) * ( 1. - wy ) * weights)
+    np.add.at(field, (i+1,j),   wx          * ( 1. - wy ) * weights)
+    np.add.at(field, (i,j+1),   ( 1. - wx ) * wy          * weights)
+    np.add.at(field, (i+1,j+1), wx          * wy          * weights)
+    return field
+
+#__________________________________________________
+
+def displacementInterpolation(mass, dX, dY, P, domain=None):
+    #
+    # returns the StaggeredField where
+    #   * f[:,:,k]  is the density at time k/(P+1),        k = 0 ... P+1
+    #   * mx[:,:,k] is the momentum at time (k+0.5)/(P+1), k = 0 ... P
+    # the spatial boundary values of the momentum are set to 0
+    #
+    M   = mass.shape[0] - 1
+    N   = mass.shape[1] - 1
+    X,Y = nodes(M, N)
+
+    f   = np.zeros(shape=(M+1,N+1,P+2))
+    mxc = np.zeros(shape=(M+1,N+1,P+1))
+    myc = np.zeros(shape=(M+1,N+1,P+1))
+
+    for k in xrange(P+2):
+        t        = float(k) / ( P + 1. )
+        f[:,:,k] = bilinearDeposit(mass, X + t * dX, Y + t * dY, M, N)
+
+    for k in xrange(P+1):
+        t          = ( k + 0.5 ) / ( P + 1. )
+        mxc[:,:,k] = bilinearDeposit(mass * dX, X + t * dX, Y + t * dY, M, N)
+        myc[:,:,k] = bilinearDeposit(mass * dY, X + t * dX, Y + t * dY, M, N)
+
+    mx = np.zeros(shape=(M+2,N+1,P+1))
+    my = np.zeros(shape=(M+1,N+2,P+1))
+    mx[1:M+1,:,:] = 0.5 * ( mxc[0:M,:,:] + mxc[1:M+1,:,:] )
+    my[:,1:N+1,:] = 0.5 * ( myc[:,0:N,:] + myc[:,1:N+1,:] )
+
+    return StaggeredField(M, N, P, mx, my, f, domain=domain)
+
+#__________________________________________________
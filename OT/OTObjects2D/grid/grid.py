@@ -31,9 +31,9 @@ class Field( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  mx , my , f ):
+                  mx , my , f , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         self.mx = mx
         self.my = my
         self.f = f
@@ -49,50 +49,50 @@ class Field( OTObject ):
     def __add__(self, other):
         if isinstance(other,Field):
             return Field( self.M , self.N , self.P ,
-                          self.mx + other.mx , self.my + other.my , self.f + other.f )
+                          self.mx + other.mx , self.my + other.my , self.f + other.f , domain=self.domain )
         else:
             return Field( self.M , self.N , self.P ,
-                          self.mx + other , self.my + other , self.f + other )
+                          self.mx + other , self.my + other , self.f + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,Field):
             return Field( self.M , self.N , self.P ,
-                          self.mx - other.mx , self.my - other.my , self.f - other.f )
+                          self.mx - other.mx , self.my - other.my , self.f - other.f , domain=self.domain )
         else:
             return Field( self.M , self.N , self.P ,
-                          self.mx - other , self.my - other , self.f - other )
+                          self.mx - other , self.my - other , self.f - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,Field):
             return Field( self.M , self.N , self.P ,
-                          self.mx * other.mx , self.my * other.my , self.f * other.f )
+                          self.mx * other.mx , self.my * other.my , self.f * other.f , domain=self.domain )
         else:
             return Field( self.M , self.N , self.P ,
-                          self.mx * other , self.my * other , self.f * other )
+                          self.mx * other , self.my * other , self.f * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,Field):
             return Field( self.M , self.N , self.P ,
-                          self.mx / other.mx , self.my / other.my , self.f / other.f )
+                          self.mx / other.mx , self.my / other.my , self.f / other.f , domain=self.domain )
         else:
             return Field( self.M , self.N , self.P ,
-                          self.mx / other , self.my / other , self.f / other )
+                          self.mx / other , self.my / other , self.f / other , domain=self.domain )
 
     def __radd__(self, other):
         return Field( self.M , self.N , self.P ,
-                      other + self.mx , other + self.my , other + self.f )
+                      other + self.mx , other + self.my , other + self.f , domain=self.domain )
 
     def __rsub__(self, other):
         return Field( self.M , self.N , self.P ,
-                      other - self.mx , other - self.my , other - self.f )
+                      other - self.mx , other - self.my , other - self.f , domain=self.domain )
 
     def __rmul__(self, other):
         return Field( self.M , self.N , self.P ,
-                      other * self.mx , other * self.my , other * self.f )
+                      other * self.mx , other * self.my , other * self.f , domain=self.domain )
 
     def __rdiv__(self, other):
         return Field( self.M , self.N , self.P ,
-                      other / self.mx , other / self.my , other / self.f )
+                      other / self.mx , other / self.my , other / self.f , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,Field):
@@ -144,18 +144,18 @@ class Field( OTObject ):
 
     def __neg__(self):
         return Field( self.M , self.N , self.P ,
-                      - self.mx , - self.my , - self.f )
+                      - self.mx , - self.my , - self.f , domain=self.domain )
 
     def __pos__(self):
         return Field( self.M , self.N , self.P ,
-                      + self.mx , + self.my , + self.f )
+                      + self.mx , + self.my , + self.f , domain=self.domain )
 
     def __abs__(self):
         return Field( self.M , self.N , self.P ,
-                      abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) )
+                      abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) , domain=self.domain )
     def copy(self):
         return Field( self.M , self.N , self.P ,
-                      self.mx.copy() , self.my.copy() , self.f.copy() )
+                      self.mx.copy() , self.my.copy() , self.f.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -166,54 +166,57 @@ class StaggeredField( Field ):
 
     def __init__( self ,
                   M , N , P ,
-                  mx=None , my=None , f=None ):
+                  mx=None , my=None , f=None , domain=None ):
+        OTObject.__init__( self ,
+                           M , N , P , domain=domain )
 
         if mx is None:
-            mx = np.zeros(shape=(M+2,N+1,P+1))
+            mx = np.zeros(shape=(M+2,N+1,P+1), dtype=self.dtype)
         if my is None:
-            my = np.zeros(shape=(M+1,N+2,P+1))
+            my = np.zeros(shape=(M+1,N+2,P+1), dtype=self.dtype)
         if f is None:
-            f  = np.zeros(shape=(M+1,N+1,P+2))
+            f  = np.zeros(shape=(M+1,N+1,P+2), dtype=self.dtype)
         
         Field.__init__( self ,
                         M , N , P ,
-                        mx , my , f )
+                        mx , my , f , domain=domain )
 
     def __repr__(self):
         return 'Object representing a field (mx,my,f) on a staggered grid'
 
-    def random(M, N, P):
+    def random(M, N, P, domain=None):
         return StaggeredField( M , N , P ,
                                np.random.rand(M+2,N+1,P+1) , 
                                np.random.rand(M+1,N+2,P+1) ,
-                               np.random.rand(M+1,N+1,P+2) )
+                               np.random.rand(M+1,N+1,P+2), domain=domain )
     random = staticmethod(random)
 
     def interpolation(self):
-        mx = np.zeros(shape=(self.M+1,self.N+1,self.P+1))
+        mx = np.zeros(shape=(self.M+1,self.N+1,self.P+1), dtype=self.dtype)
         mx[:,:,:]           = 0.5*self.mx[0:self.M+1,:,:]
         mx[0:self.M+1,:,:] += 0.5*self.mx[1:self.M+2,:,:]
 
-        my = np.zeros(shape=(self.M+1,self.N+1,self.P+1))
+        my = np.zeros(shape=(self.M+1,self.N+1,self.P+1), dtype=self.dtype)
         my[:,:,:]           = 0.5*self.my[:,0:self.N+1,:]
         my[:,0:self.N+1,:] += 0.5*self.my[:,1:self.N+2,:]
 
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+1))
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+1), dtype=self.dtype)
         f[:,:,:]            = 0.5*self.f[:,:,0:self.P+1]
         f[:,:,0:self.P+1]  += 0.5*self.f[:,:,1:self.P+2]
 
         return CenteredField( self.M, self.N, self.P,
-                              mx, my, f )
+                              mx, my, f, domain=self.domain )
 
     def divergence(self):
-        div = ( self.M*( self.mx[1:self.M+2,:,:] - self.mx[0:self.M+1,:,:] ) +
-                self.N*( self.my[:,1:self.N+2,:] - self.my[:,0:self.N+1,:] ) +
-                self.P*( self.f[:,:,1:self.P+2]  - self.f[:,:,0:self.P+1]  ) )
-        return Divergence( self.M , self.N , self.P , div )
+        (sx, sy, st) = self.scalings()
+        div = ( sx*( self.mx[1:self.M+2,:,:] - self.mx[0:self.M+1,:,:] ) +
+                sy*( self.my[:,1:self.N+2,:] - self.my[:,0:self.N+1,:] ) +
+                st*( self.f[:,:,1:self.P+2]  - self.f[:,:,0:self.P+1]  ) )
+        return Divergence( self.M , self.N , self.P , div , domain=self.domain )
 
     def temporalBoundaries(self):
         return TemporalBoundaries( self.M , self.N, self.P,
-                                   self.f[:,:,0].copy(), self.f[:,:,self.P+1].copy() )
+                                   self.f[:,:,0].copy(), self.f[:,:,self.P+1].copy(), domain=self.domain )
 
     def temporalReservoirBoundaries(self):
         trb = self.temporalBoundaries()
@@ -226,71 +229,71 @@ class StaggeredField( Field ):
     def spatialBoundaries(self):
         return SpatialBoundaries( self.M, self.N, self.P,
                                   self.mx[0,:,:].copy(), self.mx[self.M+1,:,:].copy(),
-                                  self.my[:,0,:].copy(), self.my[:,self.N+1,:].copy() )
+                                  self.my[:,0,:].copy(), self.my[:,self.N+1,:].copy(), domain=self.domain )
 
     def boundaries(self):
         return Boundaries( self.M, self.N, self.P,
-                           self.temporalBoundaries(), self.spatialBoundaries() )
+                           self.temporalBoundaries(), self.spatialBoundaries(), domain=self.domain )
 
     def reservoirBoundaries(self):
         return Boundaries( self.M, self.N, self.P,
-                           self.temporalReservoirBoundaries(), self.spatialBoundaries() )
+                           self.temporalReservoirBoundaries(), self.spatialBoundaries(), domain=self.domain )
 
     def divergenceBoundaries(self):
         return DivergenceBoundaries( self.M, self.N, self.P,
-                                     self.divergence(), self.boundaries() )
+                                     self.divergence(), self.boundaries(), domain=self.domain )
 
     def divergenceTemporalBoundaries(self):
         return DivergenceTemporalBoundaries( self.M, self.N, self.P,
-                                             self.divergence(), self.temporalBoundaries() )
+                                             self.divergence(), self.temporalBoundaries(), domain=self.domain )
 
     def __add__(self, other):
         if isinstance(other,StaggeredField):
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx + other.mx , self.my + other.my , self.f + other.f )
+                                   self.mx + other.mx , self.my + other.my , self.f + other.f , domain=self.domain )
         else:
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx + other , self.my + other , self.f + other )
+                                   self.mx + other , self.my + other , self.f + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,StaggeredField):
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx - other.mx , self.my - other.my , self.f - other.f )
+                                   self.mx - other.mx , self.my - other.my , self.f - other.f , domain=self.domain )
         else:
             return Field( self.M , self.N , self.P ,
-                          self.mx - other , self.my - other , self.f - other )
+                          self.mx - other , self.my - other , self.f - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,StaggeredField):
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx * other.mx , self.my * other.my , self.f * other.f )
+                                   self.mx * other.mx , self.my * other.my , self.f * other.f , domain=self.domain )
         else:
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx * other , self.my * other , self.f * other )
+                                   self.mx * other , self.my * other , self.f * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,StaggeredField):
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx / other.mx , self.my / other.my , self.f / other.f )
+                                   self.mx / other.mx , self.my / other.my , self.f / other.f , domain=self.domain )
         else:
             return StaggeredField( self.M , self.N , self.P ,
-                                   self.mx / other , self.my / other , self.f / other )
+                                   self.mx / other , self.my / other , self.f / other , domain=self.domain )
 
     def __radd__(self, other):
         return StaggeredField( self.M , self.N , self.P ,
-                               other + self.mx , other + self.my , other + self.f )
+                               other + self.mx , other + self.my , other + self.f , domain=self.domain )
 
     def __rsub__(self, other):
         return StaggeredField( self.M , self.N , self.P ,
-                               other - self.mx , other - self.my , other - self.f )
+                               other - self.mx , other - self.my , other - self.f , domain=self.domain )
 
     def __rmul__(self, other):
         return StaggeredField( self.M , self.N , self.P ,
-                               other * self.mx , other * self.my , other * self.f )
+                               other * self.mx , other * self.my , other * self.f , domain=self.domain )
 
     def __rdiv__(self, other):
         return StaggeredField( self.M , self.N , self.P ,
-                               other / self.mx , other / self.my , other / self.f )
+                               other / self.mx , other / self.my , other / self.f , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,StaggeredField):
@@ -342,18 +345,18 @@ class StaggeredField( Field ):
 
     def __neg__(self):
         return StaggeredField( self.M , self.N , self.P ,
-                               - self.mx , - self.my , - self.f )
+                               - self.mx , - self.my , - self.f , domain=self.domain )
 
     def __pos__(self):
         return StaggeredField( self.M , self.N , self.P ,
-                               + self.mx , + self.my , + self.f )
+                               + self.mx , + self.my , + self.f , domain=self.domain )
 
     def __abs__(self):
         return StaggeredField( self.M , self.N , self.P ,
-                               abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) )
+                               abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) , domain=self.domain )
     def copy(self):
         return StaggeredField( self.M , self.N , self.P ,
-                               self.mx.copy() , self.my.copy() , self.f.copy() )
+                               self.mx.copy() , self.my.copy() , self.f.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -364,29 +367,29 @@ class CenteredField( Field ):
 
     def __init__( self ,
                   M , N , P ,
-                  mx=None , my=None , f=None ):
+                  mx=None , my=None , f=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         
         if mx is None:
-            mx = np.zeros(shape=(M+1,N+1,P+1))
+            mx = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
         if my is None:
-            my = np.zeros(shape=(M+1,N+1,P+1))
+            my = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
         if f is None:
-            f  = np.zeros(shape=(M+1,N+1,P+1))
+            f  = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
 
         Field.__init__( self ,
                         M , N , P ,
-                        mx , my , f )
+                        mx , my , f , domain=domain )
 
     def __repr__(self):
         return 'Object representing a field (m,f) on a centered grid'
 
-    def random(M, N, P):
+    def random(M, N, P, domain=None):
         return CenteredField( M , N , P ,
                               np.random.rand(M+1,N+1,P+1) ,
                               np.random.rand(M+1,N+1,P+1) ,
-                              np.random.rand(M+1,N+1,P+1) )
+                              np.random.rand(M+1,N+1,P+1), domain=domain )
     random = staticmethod(random)
 
     def functionalJ(self):
@@ -396,7 +399,7 @@ class CenteredField( Field ):
                  ( self.f * ( self.f > 0 ) + 1. * ( 1. - ( self.f > 0 ) ) ) ).sum()
 
     def proximalJ(self, gamma):
-        unity = np.ones(shape=self.f.shape)
+        unity = np.ones(shape=self.f.shape, dtype=self.f.dtype)
         fstar = cardan.maxRoot( unity,
                                 2*gamma-self.f,
                                 gamma**2-2*gamma*self.f,
@@ -405,28 +408,28 @@ class CenteredField( Field ):
         fstar = np.maximum( fstar, 0. )
         mx = ( fstar * self.mx ) / ( fstar + gamma )
         my = ( fstar * self.my ) / ( fstar + gamma )
-        return CenteredField(self.M, self.N, self.P, mx, my, fstar)
+        return CenteredField(self.M, self.N, self.P, mx, my, fstar, domain=self.domain)
 
     def Tinterpolation(self):
-        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
+        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
         mx[0:self.M+1,:,:]  = 0.5*self.mx[:,:,:]
         mx[1:self.M+2,:,:] += 0.5*self.mx[:,:,:]
 
-        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
+        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
         my[:,0:self.N+1,:]  = 0.5*self.my[:,:,:]
         my[:,1:self.N+2,:] += 0.5*self.my[:,:,:]
 
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
         f[:,:,0:self.P+1]   = 0.5*self.f[:,:,:]
         f[:,:,1:self.P+2]  += 0.5*self.f[:,:,:]
 
         return StaggeredField( self.M, self.N, self.P,
-                               mx, my, f )
+                               mx, my, f, domain=self.domain )
 
     def TinterpolationError(self):
-        mxu = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
-        myu = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
-        fu  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
+        mxu = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
+        myu = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
+        fu  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
 
         mxu[0:self.M+1,:,:] = -0.5*self.mx[:,:,:]
         mxu[1:self.M+2,:,:] -= 0.5*self.mx[:,:,:]
@@ -437,57 +440,137 @@ class CenteredField( Field ):
         fu[:,:,0:self.P+1]  = -0.5*self.f[:,:,:]
         fu[:,:,1:self.P+2]  -= 0.5*self.f[:,:,:]
 
-        staggeredField = StaggeredField( self.M , self.N , self.P , mxu , myu , fu )
-
-        return StaggeredCenteredField( self.M, self.N , self.P , staggeredField , self )
+        staggeredField = StaggeredField( self.M , self.N , self.P , mxu , myu , fu , domain=self.domain )
+
+        return StaggeredCenteredField( self.M, self.N , self.P , staggeredField , self , domain=self.domain )
+
+    def velocity(self, densityFloor=0.):
+        #
+        # returns the velocity (vx, vy) = m / f, where f is floored to
+        # densityFloor * max(f), the velocity being 0 where f vanishes
+        #
+        f  = np.maximum( self.f , densityFloor * self.f.max() )
+        f  = f * ( f > 0 ) + 1. * ( f <= 0 )
+        vx = self.mx * ( self.f > 0 ) / f
+        vy = self.my * ( self.f > 0 ) / f
+        return (vx, vy)
+
+    def Tmap(self, X0=None, Y0=None, nSubsteps=None, order=4, densityFloor=1.e-3, trajectories=False):
+        #
+        # advects the particles (X0, Y0), by default all the nodes of the grid,
+        # with nSubsteps time steps (default P) of an explicit Runge-Kutta scheme
+        # of order 1, 2 or 4, all particles at once
+        #
+        # returns (X0, Y0, TX, TY), the positions at time 1 being (TX, TY), and
+        # if trajectories is True the positions at every time step as well,
+        # with shape (nSubsteps+1,) + X0.shape
+        #
+        from displacement import nodes
+        from displacement import bilinearInterpolation
+
+        if X0 is None or Y0 is None:
+            (X0, Y0) = nodes(self.M, self.N)
+        if nSubsteps is None or nSubsteps <= 0:
+            nSubsteps = self.P
+
+        # velocity in units of the unit square per unit of time
+        (vx, vy) = self.velocity(densityFloor)
+        vx       = vx * self.T / self.Lx
+        vy       = vy * self.T / self.Ly
+
+        def velocity(X, Y, t):
+            # bilinear in space and linear in time between the slices
+            tt = t * self.P
+            k  = min(int(np.floor(tt)), self.P-1)
+            w  = tt - k
+            return ( ( 1. - w ) * bilinearInterpolation(vx[:,:,k],   X, Y) +
+                     w          * bilinearInterpolation(vx[:,:,k+1], X, Y) ,
+                     ( 1. - w ) * bilinearInterpolation(vy[:,:,k],   X, Y) +
+                     w          * bilinearInterpolation(vy[:,:,k+1], X, Y) )
+
+        dt = 1. / nSubsteps
+        X  = np.array(X0, dtype=float)
+        Y  = np.array(Y0, dtype=float)
+
+        if trajectories:
+            trajX    = np.zeros(shape=(nSubsteps+1,)+X.shape)
+            trajY    = np.zeros(shape=(nSubsteps+1,)+Y.shape)
+            trajX[0] = X
+            trajY[0] = Y
+
+        for n in xrange(nSubsteps):
+            t = n * dt
+            if order == 1:
+                (kx, ky)   = velocity(X, Y, t)
+            elif order == 2:
+                (k1x, k1y) = velocity(X, Y, t)
+                (kx, ky)   = velocity(X+0.5*dt*k1x, Y+0.5*dt*k1y, t+0.5*dt)
+            else:
+                (k1x, k1y) = velocity(X, Y, t)
+                (k2x, k2y) = velocity(X+0.5*dt*k1x, Y+0.5*dt*k1y, t+0.5*dt)
+                (k3x, k3y) = velocity(X+0.5*dt*k2x, Y+0.5*dt*k2y, t+0.5*dt)
+                (k4x, k4y) = velocity(X+dt*k3x, Y+dt*k3y, t+dt)
+                kx         = ( k1x + 2.*k2x + 2.*k3x + k4x ) / 6.
+                ky         = ( k1y + 2.*k2y + 2.*k3y + k4y ) / 6.
+
+            X = np.clip(X + dt * kx, 0., 1.)
+            Y = np.clip(Y + dt * ky, 0., 1.)
+
+            if trajectories:
+                trajX[n+1] = X
+                trajY[n+1] = Y
+
+        if trajectories:
+            return (X0, Y0, X, Y, trajX, trajY)
+        return (X0, Y0, X, Y)
 
     def __add__(self, other):
         if isinstance(other,CenteredField):
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx + other.mx , self.my + other.my , self.f + other.f )
+                                  self.mx + other.mx , self.my + other.my , self.f + other.f , domain=self.domain )
         else:
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx + other , self.my + other , self.f + other )
+                                  self.mx + other , self.my + other , self.f + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,CenteredField):
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx - other.mx , self.my - other.my , self.f - other.f )
+                                  self.mx - other.mx , self.my - other.my , self.f - other.f , domain=self.domain )
         else:
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx - other , self.my - other , self.f - other )
+                                  self.mx - other , self.my - other , self.f - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,CenteredField):
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx * other.mx , self.my * other.my , self.f * other.f )
+                                  self.mx * other.mx , self.my * other.my , self.f * other.f , domain=self.domain )
         else:
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx * other , self.my * other , self.f * other )
+                                  self.mx * other , self.my * other , self.f * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,CenteredField):
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx / other.mx , self.my / other.my , self.f / other.f )
+                                  self.mx / other.mx , self.my / other.my , self.f / other.f , domain=self.domain )
         else:
             return CenteredField( self.M , self.N , self.P ,
-                                  self.mx / other , self.my / other , self.f / other )
+                                  self.mx / other , self.my / other , self.f / other , domain=self.domain )
 
     def __radd__(self, other):
         return CenteredField( self.M , self.N , self.P ,
-                              other + self.mx , other + self.my , other + self.f )
+                              other + self.mx , other + self.my , other + self.f , domain=self.domain )
 
     def __rsub__(self, other):
         return CenteredField( self.M , self.N , self.P ,
-                              other - self.mx , other - self.my , other - self.f )
+                              other - self.mx , other - self.my , other - self.f , domain=self.domain )
 
     def __rmul__(self, other):
         return CenteredField( self.M , self.N , self.P ,
-                              other * self.mx , other * self.my , other * self.f )
+                              other * self.mx , other * self.my , other * self.f , domain=self.domain )
 
     def __rdiv__(self, other):
         return CenteredField( self.M , self.N , self.P ,
-                              other / self.mx , other / self.my , other / self.f )
+                              other / self.mx , other / self.my , other / self.f , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,CenteredField):
@@ -539,18 +622,18 @@ class CenteredField( Field ):
 
     def __neg__(self):
         return CenteredField( self.M , self.N , self.P ,
-                              - self.mx , - self.my , - self.f )
+                              - self.mx , - self.my , - self.f , domain=self.domain )
 
     def __pos__(self):
         return CenteredField( self.M , self.N , self.P ,
-                              + self.mx , + self.my , + self.f )
+                              + self.mx , + self.my , + self.f , domain=self.domain )
 
     def __abs__(self):
         return CenteredField( self.M , self.N , self.P ,
-                              abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) )
+                              abs ( self.mx ) , abs ( self.my ) , abs ( self.f ) , domain=self.domain )
     def copy(self):
         return CenteredField( self.M , self.N , self.P ,
-                              self.mx.copy() , self.my.copy() , self.f.copy() )
+                              self.mx.copy() , self.my.copy() , self.f.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -561,37 +644,39 @@ class Divergence( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  div=None ):
+                  div=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if div is None:
-            self.div = np.zeros(shape=(M+1,N+1,P+1))
+            self.div = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
         else:
             self.div = div
 
     def __repr__(self):
         return 'Object representing the divergence of a field'
 
-    def random(M, N, P):
+    def random(M, N, P, domain=None):
         return Divergence( M, N , P ,
-                           np.random.rand(M+1,N+1,P+1) )
+                           np.random.rand(M+1,N+1,P+1), domain=domain )
     random = staticmethod(random)
 
     def Tdivergence(self):
-        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
-        mx[0:self.M+1,:,:] = -self.M*self.div[0:self.M+1,:,:]
-        mx[1:self.M+2,:,:] += self.M*self.div[0:self.M+1,:,:]
+        (sx, sy, st) = self.scalings()
+
+        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
+        mx[0:self.M+1,:,:] = -sx*self.div[0:self.M+1,:,:]
+        mx[1:self.M+2,:,:] += sx*self.div[0:self.M+1,:,:]
 
-        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
-        my[:,0:self.N+1,:] = -self.N*self.div[:,0:self.N+1,:]
-        my[:,1:self.N+2,:] += self.N*self.div[:,0:self.N+1,:]
+        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
+        my[:,0:self.N+1,:] = -sy*self.div[:,0:self.N+1,:]
+        my[:,1:self.N+2,:] += sy*self.div[:,0:self.N+1,:]
 
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
-        f[:,:,0:self.P+1]  = -self.P*self.div[:,:,0:self.P+1]
-        f[:,:,1:self.P+2]  += self.P*self.div[:,:,0:self.P+1]
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
+        f[:,:,0:self.P+1]  = -st*self.div[:,:,0:self.P+1]
+        f[:,:,1:self.P+2]  += st*self.div[:,:,0:self.P+1]
 
         return StaggeredField( self.M, self.N, self.P,
-                               mx, my, f )
+                               mx, my, f, domain=self.domain )
 
     def sum(self):
         return self.div.sum()
@@ -602,50 +687,50 @@ class Divergence( OTObject ):
     def __add__(self, other):
         if isinstance(other,Divergence):
             return Divergence( self.M , self.N , self.P ,
-                               self.div + other.div )
+                               self.div + other.div , domain=self.domain )
         else:
             return Divergence( self.M , self.N , self.P ,
-                               self.div + other )
+                               self.div + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,Divergence):
             return Divergence( self.M , self.N , self.P ,
-                               self.div - other.div )
+                               self.div - other.div , domain=self.domain )
         else:
             return Divergence( self.M , self.N , self.P ,
-                               self.div - other )
+                               self.div - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,Divergence):
             return Divergence( self.M , self.N , self.P ,
-                               self.div * other.div )
+                               self.div * other.div , domain=self.domain )
         else:
             return Divergence( self.M , self.N , self.P ,
-                               self.div * other )
+                               self.div * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,Divergence):
             return Divergence( self.M , self.N , self.P ,
-                               self.div / other.div )
+                               self.div / other.div , domain=self.domain )
         else:
             return Divergence( self.M , self.N , self.P ,
-                               self.div / other )
+                               self.div / other , domain=self.domain )
 
     def __radd__(self, other):
         return Divergence( self.M , self.N , self.P ,
-                           other + self.div )
+                           other + self.div , domain=self.domain )
 
     def __rsub__(self, other):
         return Divergence( self.M , self.N , self.P ,
-                           other - self.div )
+                           other - self.div , domain=self.domain )
 
     def __rmul__(self, other):
         return Divergence( self.M , self.N , self.P ,
-                           other * self.div )
+                           other * self.div , domain=self.domain )
 
     def __rdiv__(self, other):
         return Divergence( self.M , self.N , self.P ,
-                           other / self.div )
+                           other / self.div , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,Divergence):
@@ -681,18 +766,18 @@ class Divergence( OTObject ):
 
     def __neg__(self):
         return Divergence( self.M , self.N , self.P ,
-                           - self.div )
+                           - self.div , domain=self.domain )
 
     def __pos__(self):
         return Divergence( self.M , self.N , self.P ,
-                           + self.div )
+                           + self.div , domain=self.domain )
 
     def __abs__(self):
         return Divergence( self.M , self.N , self.P ,
-                           abs ( self.div ) )
+                           abs ( self.div ) , domain=self.domain )
     def copy(self):
         return Divergence( self.M , self.N , self.P ,
-                           self.div.copy() )
+                           self.div.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -703,15 +788,15 @@ class TemporalBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  bt0=None , bt1=None ):
+                  bt0=None , bt1=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if bt0 is None:
-            self.bt0 = np.zeros(shape=(M+1,N+1))
+            self.bt0 = np.zeros(shape=(M+1,N+1), dtype=self.dtype)
         else:
             self.bt0 = bt0
         if bt1 is None:
-            self.bt1 = np.zeros(shape=(M+1,N+1))
+            self.bt1 = np.zeros(shape=(M+1,N+1), dtype=self.dtype)
         else:
             self.bt1 = bt1
 
@@ -719,40 +804,40 @@ class TemporalBoundaries( OTObject ):
     def __repr__(self):
         return 'Object representing the temporal boundaries of a field'
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         bt0 = np.random.rand(M+1,N+1)
         bt1 = np.random.rand(M+1,N+1)
         return TemporalBoundaries( M , N , P ,
-                                   bt0 , bt1 )
+                                   bt0 , bt1 , domain=domain )
     random = staticmethod(random)
 
     def TtemporalBoundaries(self):
-        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
-        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
+        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
+        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
 
         f[:,:,0]        = self.bt0[:,:]
         f[:,:,self.P+1] = self.bt1[:,:]
 
         return StaggeredField( self.M, self.N, self.P,
-                               mx, my, f )
+                               mx, my, f, domain=self.domain )
 
     def TtemporalReservoirBoundaries(self):
-        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
-        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
+        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
+        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
 
         f[:,:,0] = self.bt0[:,:]
         f[1:self.M,1:self.N,self.P+1] = self.bt1[1:self.M,1:self.N]
 
         return StaggeredField( self.M, self.N, self.P,
-                               mx, my, f )
+                               mx, my, f, domain=self.domain )
 
     def massDefault(self):
-        return ( self.P * ( self.bt0.sum() - self.bt1.sum() ) )
+        return ( self.scalings()[2] * ( self.bt0.sum() - self.bt1.sum() ) )
 
     def scalingMassDefault(self):
-        return ( self.P * ( self.bt0.sum() + self.bt1.sum() ) )
+        return ( self.scalings()[2] * ( self.bt0.sum() + self.bt1.sum() ) )
 
     def LInftyNorm(self):
         return np.max( [ abs(self.bt0).max() , abs(self.bt1).max() ] )
@@ -766,50 +851,50 @@ class TemporalBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,TemporalBoundaries):
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 + other.bt0 , self.bt1 + other.bt1 )
+                                       self.bt0 + other.bt0 , self.bt1 + other.bt1 , domain=self.domain )
         else:
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 + other , self.bt1 + other )
+                                       self.bt0 + other , self.bt1 + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,TemporalBoundaries):
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 - other.bt0 , self.bt1 - other.bt1 )
+                                       self.bt0 - other.bt0 , self.bt1 - other.bt1 , domain=self.domain )
         else:
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 - other , self.bt1 - other )
+                                       self.bt0 - other , self.bt1 - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,TemporalBoundaries):
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 * other.bt0 , self.bt1 * other.bt1 )
+                                       self.bt0 * other.bt0 , self.bt1 * other.bt1 , domain=self.domain )
         else:
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 * other , self.bt1 * other )
+                                       self.bt0 * other , self.bt1 * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,TemporalBoundaries):
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 / other.bt0 , self.bt1 / other.bt1 )
+                                       self.bt0 / other.bt0 , self.bt1 / other.bt1 , domain=self.domain )
         else:
             return TemporalBoundaries( self.M , self.N , self.P ,
-                                       self.bt0 / other , self.bt1 / other )
+                                       self.bt0 / other , self.bt1 / other , domain=self.domain )
 
     def __radd__(self, other):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   other + self.bt0 , other + self.bt1 )
+                                   other + self.bt0 , other + self.bt1 , domain=self.domain )
 
     def __rsub__(self, other):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   other - self.bt0 , other - self.bt1 )
+                                   other - self.bt0 , other - self.bt1 , domain=self.domain )
 
     def __rmul__(self, other):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   other * self.bt0 , other * self.bt1 )
+                                   other * self.bt0 , other * self.bt1 , domain=self.domain )
 
     def __rdiv__(self, other):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   other / self.bt0 , other / self.bt1 )
+                                   other / self.bt0 , other / self.bt1 , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,TemporalBoundaries):
@@ -853,18 +938,18 @@ class TemporalBoundaries( OTObject ):
 
     def __neg__(self):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   - self.bt0 , - self.bt1 )
+                                   - self.bt0 , - self.bt1 , domain=self.domain )
 
     def __pos__(self):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   + self.bt0 , + self.bt1 )
+                                   + self.bt0 , + self.bt1 , domain=self.domain )
 
     def __abs__(self):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   abs ( self.bt0 ) , abs ( self.bt1 ) )
+                                   abs ( self.bt0 ) , abs ( self.bt1 ) , domain=self.domain )
     def copy(self):
         return TemporalBoundaries( self.M , self.N , self.P ,
-                                   self.bt0.copy() , self.bt1.copy() )
+                                   self.bt0.copy() , self.bt1.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -875,45 +960,45 @@ class SpatialBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  bx0=None , bx1=None , by0=None , by1=None ):
+                  bx0=None , bx1=None , by0=None , by1=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
 
         if bx0 is None:
-            self.bx0 = np.zeros(shape=(N+1,P+1))
+            self.bx0 = np.zeros(shape=(N+1,P+1), dtype=self.dtype)
         else:
             self.bx0 = bx0
         if bx1 is None:
-            self.bx1 = np.zeros(shape=(N+1,P+1))
+            self.bx1 = np.zeros(shape=(N+1,P+1), dtype=self.dtype)
         else:
             self.bx1 = bx1
 
         if by0 is None:
-            self.by0 = np.zeros(shape=(M+1,P+1))
+            self.by0 = np.zeros(shape=(M+1,P+1), dtype=self.dtype)
         else:
             self.by0 = by0
         if by1 is None:
-            self.by1 = np.zeros(shape=(M+1,P+1))
+            self.by1 = np.zeros(shape=(M+1,P+1), dtype=self.dtype)
         else:
             self.by1 = by1
 
     def __repr__(self):
         return 'Object representing the spatial boundaries of a field'
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         bx0 = np.random.rand(N+1,P+1)
         bx1 = np.random.rand(N+1,P+1)
         
         by0 = np.random.rand(M+1,P+1)
         by1 = np.random.rand(M+1,P+1)
         return SpatialBoundaries( M , N , P ,
-                                  bx0 , bx1 , by0 , by1 )
+                                  bx0 , bx1 , by0 , by1 , domain=domain )
     random = staticmethod(random)
 
     def TspatialBoundaries(self):
-        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1))
-        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1))
-        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2))
+        mx = np.zeros(shape=(self.M+2,self.N+1,self.P+1), dtype=self.dtype)
+        my = np.zeros(shape=(self.M+1,self.N+2,self.P+1), dtype=self.dtype)
+        f  = np.zeros(shape=(self.M+1,self.N+1,self.P+2), dtype=self.dtype)
 
         mx[0,:,:]        = self.bx0[:,:]
         mx[self.M+1,:,:] = self.bx1[:,:]
@@ -922,15 +1007,17 @@ class SpatialBoundaries( OTObject ):
         my[:,self.N+1,:] = self.by1[:,:]
 
         return StaggeredField( self.M, self.N, self.P,
-                               mx, my, f )
+                               mx, my, f, domain=self.domain )
 
     def massDefault(self):
-        return ( self.M * ( self.bx0.sum() - self.bx1.sum() ) +
-                 self.N * ( self.by0.sum() - self.by1.sum() ) )
+        (sx, sy, st) = self.scalings()
+        return ( sx * ( self.bx0.sum() - self.bx1.sum() ) +
+                 sy * ( self.by0.sum() - self.by1.sum() ) )
 
     def scalingMassDefault(self):
-        return ( self.M * ( abs(self.bx0.sum()) + abs(self.bx1.sum()) ) +
-                 self.N * ( abs(self.by0.sum()) + abs(self.by1.sum()) ) )        
+        (sx, sy, st) = self.scalings()
+        return ( sx * ( abs(self.bx0.sum()) + abs(self.bx1.sum()) ) +
+                 sy * ( abs(self.by0.sum()) + abs(self.by1.sum()) ) )        
 
     def LInftyNorm(self):
         return np.max( [ abs(self.bx0).max() , abs(self.bx1).max() ,
@@ -939,50 +1026,50 @@ class SpatialBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,SpatialBoundaries):
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 + other.bx0 , self.bx1 + other.bx1 , self.by0 + other.by0 , self.by1 + other.by1 )
+                                      self.bx0 + other.bx0 , self.bx1 + other.bx1 , self.by0 + other.by0 , self.by1 + other.by1 , domain=self.domain )
         else:
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 + other , self.bx1 + other , self.by0 + other , self.by1 + other )
+                                      self.bx0 + other , self.bx1 + other , self.by0 + other , self.by1 + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,SpatialBoundaries):
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 - other.bx0 , self.bx1 - other.bx1 , self.by0 - other.by0 , self.by1 - other.by1 )
+                                      self.bx0 - other.bx0 , self.bx1 - other.bx1 , self.by0 - other.by0 , self.by1 - other.by1 , domain=self.domain )
         else:
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 - other , self.bx1 - other , self.by0 - other , self.by1 - other )
+                                      self.bx0 - other , self.bx1 - other , self.by0 - other , self.by1 - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,SpatialBoundaries):
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 * other.bx0 , self.bx1 * other.bx1 , self.by0 * other.by0 , self.by1 * other.by1 )
+                                      self.bx0 * other.bx0 , self.bx1 * other.bx1 , self.by0 * other.by0 , self.by1 * other.by1 , domain=self.domain )
         else:
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 * other , self.bx1 * other , self.by0 * other , self.by1 * other )
+                                      self.bx0 * other , self.bx1 * other , self.by0 * other , self.by1 * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,SpatialBoundaries):
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 / other.bx0 , self.bx1 / other.bx1 , self.by0 / other.by0 , self.by1 / other.by1 )
+                                      self.bx0 / other.bx0 , self.bx1 / other.bx1 , self.by0 / other.by0 , self.by1 / other.by1 , domain=self.domain )
         else:
             return SpatialBoundaries( self.M , self.N , self.P ,
-                                      self.bx0 / other , self.bx1 / other , self.by0 / other , self.by1 / other )
+                                      self.bx0 / other , self.bx1 / other , self.by0 / other , self.by1 / other , domain=self.domain )
 
     def __radd__(self, other):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  other + self.bx0 , other + self.bx1 , other + self.by0 , other + self.by1 )
+                                  other + self.bx0 , other + self.bx1 , other + self.by0 , other + self.by1 , domain=self.domain )
 
     def __rsub__(self, other):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  other - self.bx0 , other - self.bx1 , other - self.by0 , other - self.by1 )
+                                  other - self.bx0 , other - self.bx1 , other - self.by0 , other - self.by1 , domain=self.domain )
 
     def __rmul__(self, other):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  other * self.bx0 , other * self.bx1 , other * self.by0 , other * self.by1 )
+                                  other * self.bx0 , other * self.bx1 , other * self.by0 , other * self.by1 , domain=self.domain )
 
     def __rdiv__(self, other):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  other / self.bx0 , other / self.bx1 , other / self.by0 , other / self.by1 )
+                                  other / self.bx0 , other / self.bx1 , other / self.by0 , other / self.by1 , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,SpatialBoundaries):
@@ -1042,18 +1129,18 @@ class SpatialBoundaries( OTObject ):
 
     def __neg__(self):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  - self.bx0 , - self.bx1 , - self.by0 , - self.by1 )
+                                  - self.bx0 , - self.bx1 , - self.by0 , - self.by1 , domain=self.domain )
 
     def __pos__(self):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  + self.bx0 , + self.bx1 , + self.by0 , + self.by1 )
+                                  + self.bx0 , + self.bx1 , + self.by0 , + self.by1 , domain=self.domain )
 
     def __abs__(self):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  abs ( self.bx0 ) , abs ( self.bx1 ) , abs ( self.by0 ) , abs ( self.by1 ) )
+                                  abs ( self.bx0 ) , abs ( self.bx1 ) , abs ( self.by0 ) , abs ( self.by1 ) , domain=self.domain )
     def copy(self):
         return SpatialBoundaries( self.M , self.N , self.P ,
-                                  self.bx0.copy() , self.bx1.copy() , self.by0.copy() , self.by1.copy() )
+                                  self.bx0.copy() , self.bx1.copy() , self.by0.copy() , self.by1.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1064,15 +1151,15 @@ class Boundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  temporalBoundaries=None , spatialBoundaries=None ):
+                  temporalBoundaries=None , spatialBoundaries=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if temporalBoundaries is None:
-            self.temporalBoundaries = TemporalBoundaries( M , N , P )
+            self.temporalBoundaries = TemporalBoundaries( M , N , P , domain=domain )
         else:
             self.temporalBoundaries = temporalBoundaries
         if spatialBoundaries is None:
-            self.spatialBoundaries = SpatialBoundaries( M , N , P )
+            self.spatialBoundaries = SpatialBoundaries( M , N , P , domain=domain )
         else:
             self.spatialBoundaries = spatialBoundaries
 
@@ -1090,9 +1177,9 @@ class Boundaries( OTObject ):
         gridS = self.spatialBoundaries.TspatialBoundaries()
         return ( gridT + gridS )
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return Boundaries( M , N , P ,
-                           TemporalBoundaries.random(M,N,P) , SpatialBoundaries.random(M,N,P) )
+                           TemporalBoundaries.random(M,N,P, domain=domain) , SpatialBoundaries.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
     def massDefault(self):
@@ -1112,7 +1199,7 @@ class Boundaries( OTObject ):
         return np.max( [ self.temporalBoundaries.LInftyNorm() , self.spatialBoundaries.LInftyNorm() ] )
 
     def placeReservoir(self, config=None):
-        self.spatialBoundaries = SpatialBoundaries(self.M,self.N,self.P)
+        self.spatialBoundaries = SpatialBoundaries(self.M,self.N,self.P, domain=self.domain)
 
         self.temporalBoundaries.bt0[0,:]      = 0.
         self.temporalBoundaries.bt0[self.M,:] = 0.
@@ -1132,11 +1219,13 @@ class Boundaries( OTObject ):
                 config.swappedInitFinal = True
 
     def normalize(self, normType):
-        mInit = ( self.P * self.temporalBoundaries.bt0.sum() +
-                  self.M * ( self.spatialBoundaries.bx0.sum() - self.spatialBoundaries.bx1.sum() ) +
-                  self.N * ( self.spatialBoundaries.by0.sum() - self.spatialBoundaries.by1.sum() ) )
+        (sx, sy, st) = self.scalings()
 
-        mFinal = self.P * self.temporalBoundaries.bt1.sum()
+        mInit = ( st * self.temporalBoundaries.bt0.sum() +
+                  sx * ( self.spatialBoundaries.bx0.sum() - self.spatialBoundaries.bx1.sum() ) +
+                  sy * ( self.spatialBoundaries.by0.sum() - self.spatialBoundaries.by1.sum() ) )
+
+        mFinal = st * self.temporalBoundaries.bt1.sum()
 
         if normType == 0:
             # correct mass default by rescaling f1
@@ -1148,11 +1237,11 @@ class Boundaries( OTObject ):
 
         elif normType == 2:
             # mass exits on the boundaries
-            self.spatialBoundaries.bx0 += 0.25 * ( mFinal - mInit ) / ( self.M * ( self.N + 1 ) * ( self.P + 1 ) )
-            self.spatialBoundaries.bx1 -= 0.25 * ( mFinal - mInit ) / ( self.M * ( self.N + 1 ) * ( self.P + 1 ) )
+            self.spatialBoundaries.bx0 += 0.25 * ( mFinal - mInit ) / ( sx * ( self.N + 1 ) * ( self.P + 1 ) )
+            self.spatialBoundaries.bx1 -= 0.25 * ( mFinal - mInit ) / ( sx * ( self.N + 1 ) * ( self.P + 1 ) )
 
-            self.spatialBoundaries.by0 += 0.25 * ( mFinal - mInit ) / ( self.N * ( self.M + 1 ) * ( self.P + 1 ) )
-            self.spatialBoundaries.by1 -= 0.25 * ( mFinal - mInit ) / ( self.N * ( self.M + 1 ) * ( self.P + 1 ) )
+            self.spatialBoundaries.by0 += 0.25 * ( mFinal - mInit ) / ( sy * ( self.M + 1 ) * ( self.P + 1 ) )
+            self.spatialBoundaries.by1 -= 0.25 * ( mFinal - mInit ) / ( sy * ( self.M + 1 ) * ( self.P + 1 ) )
 
         elif normType == 3:
             # only use this with zero spatial boundary conditions
@@ -1162,50 +1251,50 @@ class Boundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,Boundaries):
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries + other.temporalBoundaries , self.spatialBoundaries + other.spatialBoundaries )
+                               self.temporalBoundaries + other.temporalBoundaries , self.spatialBoundaries + other.spatialBoundaries , domain=self.domain )
         else:
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries + other , self.spatialBoundaries + other )
+                               self.temporalBoundaries + other , self.spatialBoundaries + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,Boundaries):
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries - other.temporalBoundaries , self.spatialBoundaries - other.spatialBoundaries )
+                               self.temporalBoundaries - other.temporalBoundaries , self.spatialBoundaries - other.spatialBoundaries , domain=self.domain )
         else:
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries - other , self.spatialBoundaries - other )
+                               self.temporalBoundaries - other , self.spatialBoundaries - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,Boundaries):
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries * other.temporalBoundaries , self.spatialBoundaries * other.spatialBoundaries )
+                               self.temporalBoundaries * other.temporalBoundaries , self.spatialBoundaries * other.spatialBoundaries , domain=self.domain )
         else:
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries * other , self.spatialBoundaries * other )
+                               self.temporalBoundaries * other , self.spatialBoundaries * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,Boundaries):
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries / other.temporalBoundaries , self.spatialBoundaries / other.spatialBoundaries )
+                               self.temporalBoundaries / other.temporalBoundaries , self.spatialBoundaries / other.spatialBoundaries , domain=self.domain )
         else:
             return Boundaries( self.M , self.N , self.P ,
-                               self.temporalBoundaries / other , self.spatialBoundaries / other )
+                               self.temporalBoundaries / other , self.spatialBoundaries / other , domain=self.domain )
 
     def __radd__(self, other):
         return Boundaries( self.M , self.N , self.P ,
-                           other + self.temporalBoundaries , other + self.spatialBoundaries )
+                           other + self.temporalBoundaries , other + self.spatialBoundaries , domain=self.domain )
 
     def __rsub__(self, other):
         return Boundaries( self.M , self.N , self.P ,
-                           other - self.temporalBoundaries , other - self.spatialBoundaries )
+                           other - self.temporalBoundaries , other - self.spatialBoundaries , domain=self.domain )
 
     def __rmul__(self, other):
         return Boundaries( self.M , self.N , self.P ,
-                           other * self.temporalBoundaries , other * self.spatialBoundaries )
+                           other * self.temporalBoundaries , other * self.spatialBoundaries , domain=self.domain )
 
     def __rdiv__(self, other):
         return Boundaries( self.M , self.N , self.P ,
-                           other / self.temporalBoundaries , other / self.spatialBoundaries )
+                           other / self.temporalBoundaries , other / self.spatialBoundaries , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,Boundaries):
@@ -1249,18 +1338,18 @@ class Boundaries( OTObject ):
 
     def __neg__(self):
         return Boundaries( self.M , self.N , self.P ,
-                           - self.temporalBoundaries , - self.spatialBoundaries )
+                           - self.temporalBoundaries , - self.spatialBoundaries , domain=self.domain )
 
     def __pos__(self):
         return Boundaries( self.M , self.N , self.P ,
-                           + self.temporalBoundaries , + self.spatialBoundaries )
+                           + self.temporalBoundaries , + self.spatialBoundaries , domain=self.domain )
 
     def __abs__(self):
         return Boundaries( self.M , self.N , self.P ,
-                           abs ( self.temporalBoundaries ) , abs ( self.spatialBoundaries ) )
+                           abs ( self.temporalBoundaries ) , abs ( self.spatialBoundaries ) , domain=self.domain )
     def copy(self):
         return Boundaries( self.M , self.N , self.P ,
-                           self.temporalBoundaries.copy() , self.spatialBoundaries.copy() )
+                           self.temporalBoundaries.copy() , self.spatialBoundaries.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1271,16 +1360,16 @@ class DivergenceBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  divergence=None , boundaries=None ):
+                  divergence=None , boundaries=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
 
         if divergence is None:
-            self.divergence = Divergence( M , N , P )
+            self.divergence = Divergence( M , N , P , domain=domain )
         else:
             self.divergence = divergence
         if boundaries is None:
-            self.boundaries = Boundaries( M , N , P )
+            self.boundaries = Boundaries( M , N , P , domain=domain )
         else:
             self.boundaries = boundaries
 
@@ -1293,20 +1382,22 @@ class DivergenceBoundaries( OTObject ):
         return ( gridDiv + gridB )
 
     def applyGaussForward(self):
-        self.divergence.div[0,:,:]      += self.M*self.boundaries.spatialBoundaries.bx0[:,:]
-        self.divergence.div[self.M,:,:] -= self.M*self.boundaries.spatialBoundaries.bx1[:,:]
-        self.divergence.div[:,0,:]      += self.N*self.boundaries.spatialBoundaries.by0[:,:]
-        self.divergence.div[:,self.N,:] -= self.N*self.boundaries.spatialBoundaries.by1[:,:]
-        self.divergence.div[:,:,0]      += self.P*self.boundaries.temporalBoundaries.bt0[:,:]
-        self.divergence.div[:,:,self.P] -= self.P*self.boundaries.temporalBoundaries.bt1[:,:]
+        (sx, sy, st) = self.scalings()
+        self.divergence.div[0,:,:]      += sx*self.boundaries.spatialBoundaries.bx0[:,:]
+        self.divergence.div[self.M,:,:] -= sx*self.boundaries.spatialBoundaries.bx1[:,:]
+        self.divergence.div[:,0,:]      += sy*self.boundaries.spatialBoundaries.by0[:,:]
+        self.divergence.div[:,self.N,:] -= sy*self.boundaries.spatialBoundaries.by1[:,:]
+        self.divergence.div[:,:,0]      += st*self.boundaries.temporalBoundaries.bt0[:,:]
+        self.divergence.div[:,:,self.P] -= st*self.boundaries.temporalBoundaries.bt1[:,:]
 
     def applyGaussBackward(self):
-        self.boundaries.spatialBoundaries.bx0  += self.M*self.divergence.div[0,:,:]
-        self.boundaries.spatialBoundaries.bx1  -= self.M*self.divergence.div[self.M,:,:]
-        self.boundaries.spatialBoundaries.by0  += self.N*self.divergence.div[:,0,:]
-        self.boundaries.spatialBoundaries.by1  -= self.N*self.divergence.div[:,self.N,:]
-        self.boundaries.temporalBoundaries.bt0 += self.P*self.divergence.div[:,:,0]
-        self.boundaries.temporalBoundaries.bt1 -= self.P*self.divergence.div[:,:,self.P]
+        (sx, sy, st) = self.scalings()
+        self.boundaries.spatialBoundaries.bx0  += sx*self.divergence.div[0,:,:]
+        self.boundaries.spatialBoundaries.bx1  -= sx*self.divergence.div[self.M,:,:]
+        self.boundaries.spatialBoundaries.by0  += sy*self.divergence.div[:,0,:]
+        self.boundaries.spatialBoundaries.by1  -= sy*self.divergence.div[:,self.N,:]
+        self.boundaries.temporalBoundaries.bt0 += st*self.divergence.div[:,:,0]
+        self.boundaries.temporalBoundaries.bt1 -= st*self.divergence.div[:,:,self.P]
 
     def massDefault(self):
         return ( self.divergence.sum() +
@@ -1328,24 +1419,26 @@ class DivergenceBoundaries( OTObject ):
                        2.*(self.M+1.)*(self.P+1.) +
                        2.*(self.M+1.)*(self.N+1.) )
 
+            (sx, sy, st) = self.scalings()
+
             dm = self.massDefault()
             self.divergence -= dm / nbrPts
-            self.boundaries.spatialBoundaries.bx0  -= dm / ( self.M * nbrPts )
-            self.boundaries.spatialBoundaries.bx1  += dm / ( self.M * nbrPts )
-            self.boundaries.spatialBoundaries.by0  -= dm / ( self.N * nbrPts )
-            self.boundaries.spatialBoundaries.by1  += dm / ( self.N * nbrPts )
-            self.boundaries.temporalBoundaries.bt0 -= dm / ( self.P * nbrPts )
-            self.boundaries.temporalBoundaries.bt1 += dm / ( self.P * nbrPts )
+            self.boundaries.spatialBoundaries.bx0  -= dm / ( sx * nbrPts )
+            self.boundaries.spatialBoundaries.bx1  += dm / ( sx * nbrPts )
+            self.boundaries.spatialBoundaries.by0  -= dm / ( sy * nbrPts )
+            self.boundaries.spatialBoundaries.by1  += dm / ( sy * nbrPts )
+            self.boundaries.temporalBoundaries.bt0 -= dm / ( st * nbrPts )
+            self.boundaries.temporalBoundaries.bt1 += dm / ( st * nbrPts )
 
             deltaM = self.relativeMassDefault()
         return deltaM
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return DivergenceBoundaries( M , N , P ,
-                                     Divergence.random(M,N,P) , Boundaries.random(M,N,P) )
+                                     Divergence.random(M,N,P, domain=domain) , Boundaries.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
-    def ones( M , N , P ):
+    def ones( M , N , P , domain=None ):
         div =  np.ones(shape=(M+1,N+1,P+1))
         bx0 =  M*np.ones(shape=(N+1,P+1))
         bx1 = -M*np.ones(shape=(N+1,P+1))
@@ -1355,12 +1448,12 @@ class DivergenceBoundaries( OTObject ):
         bt1 = -P*np.ones(shape=(M+1,N+1))
         return DivergenceBoundaries( M , N , P ,
                                      Divergence( M , N , P ,
-                                                 div ) ,
+                                                 div , domain=domain ) ,
                                      Boundaries( M , N , P ,
                                                  TemporalBoundaries( M , N , P ,
-                                                                     bt0 , bt1 ) ,
+                                                                     bt0 , bt1 , domain=domain ) ,
                                                  SpatialBoundaries( M , N , P ,
-                                                                    bx0 , bx1 , by0 , by1 ) ) )
+                                                                    bx0 , bx1 , by0 , by1 , domain=domain ) , domain=domain ) , domain=domain )
     ones = staticmethod(ones)
 
     def LInftyNorm(self):
@@ -1369,50 +1462,50 @@ class DivergenceBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,DivergenceBoundaries):
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence + other.divergence , self.boundaries + other.boundaries )
+                                         self.divergence + other.divergence , self.boundaries + other.boundaries , domain=self.domain )
         else:
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence + other , self.boundaries + other )
+                                         self.divergence + other , self.boundaries + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,DivergenceBoundaries):
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence - other.divergence , self.boundaries - other.boundaries )
+                                         self.divergence - other.divergence , self.boundaries - other.boundaries , domain=self.domain )
         else:
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence - other , self.boundaries - other )
+                                         self.divergence - other , self.boundaries - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,DivergenceBoundaries):
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence * other.divergence , self.boundaries * other.boundaries )
+                                         self.divergence * other.divergence , self.boundaries * other.boundaries , domain=self.domain )
         else:
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence * other , self.boundaries * other )
+                                         self.divergence * other , self.boundaries * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,DivergenceBoundaries):
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence / other.divergence , self.boundaries / other.boundaries )
+                                         self.divergence / other.divergence , self.boundaries / other.boundaries , domain=self.domain )
         else:
             return DivergenceBoundaries( self.M , self.N , self.P ,
-                                         self.divergence / other , self.boundaries / other )
+                                         self.divergence / other , self.boundaries / other , domain=self.domain )
 
     def __radd__(self, other):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     other + self.divergence , other + self.boundaries )
+                                     other + self.divergence , other + self.boundaries , domain=self.domain )
 
     def __rsub__(self, other):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     other - self.divergence , other - self.boundaries )
+                                     other - self.divergence , other - self.boundaries , domain=self.domain )
 
     def __rmul__(self, other):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     other * self.divergence , other * self.boundaries )
+                                     other * self.divergence , other * self.boundaries , domain=self.domain )
 
     def __rdiv__(self, other):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     other / self.divergence , other / self.boundaries )
+                                     other / self.divergence , other / self.boundaries , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,DivergenceBoundaries):
@@ -1456,18 +1549,18 @@ class DivergenceBoundaries( OTObject ):
 
     def __neg__(self):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     - self.divergence , - self.boundaries )
+                                     - self.divergence , - self.boundaries , domain=self.domain )
 
     def __pos__(self):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     + self.divergence , + self.boundaries )
+                                     + self.divergence , + self.boundaries , domain=self.domain )
 
     def __abs__(self):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     abs ( self.divergence ) , abs ( self.boundaries ) )
+                                     abs ( self.divergence ) , abs ( self.boundaries ) , domain=self.domain )
     def copy(self):
         return DivergenceBoundaries( self.M , self.N , self.P ,
-                                     self.divergence.copy() , self.boundaries.copy() )
+                                     self.divergence.copy() , self.boundaries.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1478,15 +1571,15 @@ class DivergenceTemporalBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  divergence=None , temporalBoundaries=None ):
+                  divergence=None , temporalBoundaries=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if divergence is None:
-            self.divergence = Divergence( M , N , P )
+            self.divergence = Divergence( M , N , P , domain=domain )
         else:
             self.divergence = divergence
         if temporalBoundaries is None:
-            self.temporalBoundaries = TemporalBoundaries( M , N , P )
+            self.temporalBoundaries = TemporalBoundaries( M , N , P , domain=domain )
         else:
             self.temporalBoundaries = temporalBoundaries
 
@@ -1499,16 +1592,18 @@ class DivergenceTemporalBoundaries( OTObject ):
         return ( gridDiv + gridB )
 
     def applyGaussForward(self):
-        self.divergence.div[:,:,0]      += self.P*self.temporalBoundaries.bt0[:,:]
-        self.divergence.div[:,:,self.P] -= self.P*self.temporalBoundaries.bt1[:,:]
+        st = self.scalings()[2]
+        self.divergence.div[:,:,0]      += st*self.temporalBoundaries.bt0[:,:]
+        self.divergence.div[:,:,self.P] -= st*self.temporalBoundaries.bt1[:,:]
 
     def applyGaussBackward(self):
-        self.temporalBoundaries.bt0 += self.P*self.divergence.div[:,:,0]
-        self.temporalBoundaries.bt1 -= self.P*self.divergence.div[:,:,self.P]
+        st = self.scalings()[2]
+        self.temporalBoundaries.bt0 += st*self.divergence.div[:,:,0]
+        self.temporalBoundaries.bt1 -= st*self.divergence.div[:,:,self.P]
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return DivergenceTemporalBoundaries( M , N , P ,
-                                             Divergence.random(M,N,P) , TemporalBoundaries.random(M,N,P) )
+                                             Divergence.random(M,N,P, domain=domain) , TemporalBoundaries.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
     def LInftyNorm(self):
@@ -1517,50 +1612,50 @@ class DivergenceTemporalBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,DivergenceTemporalBoundaries):
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence + other.divergence , self.temporalBoundaries + other.temporalBoundaries )
+                                                 self.divergence + other.divergence , self.temporalBoundaries + other.temporalBoundaries , domain=self.domain )
         else:
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence + other , self.temporalBoundaries + other )
+                                                 self.divergence + other , self.temporalBoundaries + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,DivergenceTemporalBoundaries):
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence - other.divergence , self.temporalBoundaries - other.temporalBoundaries )
+                                                 self.divergence - other.divergence , self.temporalBoundaries - other.temporalBoundaries , domain=self.domain )
         else:
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence - other , self.temporalBoundaries - other )
+                                                 self.divergence - other , self.temporalBoundaries - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,DivergenceTemporalBoundaries):
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence * other.divergence , self.temporalBoundaries * other.temporalBoundaries )
+                                                 self.divergence * other.divergence , self.temporalBoundaries * other.temporalBoundaries , domain=self.domain )
         else:
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence * other , self.temporalBoundaries * other )
+                                                 self.divergence * other , self.temporalBoundaries * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,DivergenceTemporalBoundaries):
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence / other.divergence , self.temporalBoundaries / other.temporalBoundaries )
+                                                 self.divergence / other.divergence , self.temporalBoundaries / other.temporalBoundaries , domain=self.domain )
         else:
             return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                                 self.divergence / other , self.temporalBoundaries / other )
+                                                 self.divergence / other , self.temporalBoundaries / other , domain=self.domain )
 
     def __radd__(self, other):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             other + self.divergence , other + self.temporalBoundaries )
+                                             other + self.divergence , other + self.temporalBoundaries , domain=self.domain )
 
     def __rsub__(self, other):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             other - self.divergence , other - self.temporalBoundaries )
+                                             other - self.divergence , other - self.temporalBoundaries , domain=self.domain )
 
     def __rmul__(self, other):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             other * self.divergence , other * self.temporalBoundaries )
+                                             other * self.divergence , other * self.temporalBoundaries , domain=self.domain )
 
     def __rdiv__(self, other):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             other / self.divergence , other / self.temporalBoundaries )
+                                             other / self.divergence , other / self.temporalBoundaries , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,DivergenceTemporalBoundaries):
@@ -1604,18 +1699,18 @@ class DivergenceTemporalBoundaries( OTObject ):
 
     def __neg__(self):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             - self.divergence , - self.temporalBoundaries )
+                                             - self.divergence , - self.temporalBoundaries , domain=self.domain )
 
     def __pos__(self):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             + self.divergence , + self.temporalBoundaries )
+                                             + self.divergence , + self.temporalBoundaries , domain=self.domain )
 
     def __abs__(self):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             abs ( self.divergence ) , abs ( self.temporalBoundaries ) )
+                                             abs ( self.divergence ) , abs ( self.temporalBoundaries ) , domain=self.domain )
     def copy(self):
         return DivergenceTemporalBoundaries( self.M , self.N , self.P ,
-                                             self.divergence.copy() , self.temporalBoundaries.copy() )
+                                             self.divergence.copy() , self.temporalBoundaries.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1626,16 +1721,16 @@ class StaggeredCenteredField( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  staggeredField=None , centeredField=None ):
+                  staggeredField=None , centeredField=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if staggeredField is None:
-            self.staggeredField = StaggeredField( M , N , P )
+            self.staggeredField = StaggeredField( M , N , P , domain=domain )
         else:
             self.staggeredField = staggeredField
             
         if centeredField is None:
-            self.centeredField = CenteredField( M , N , P )
+            self.centeredField = CenteredField( M , N , P , domain=domain )
         else:
             self.centeredField = centeredField
 
@@ -1649,23 +1744,23 @@ class StaggeredCenteredField( OTObject ):
         centeredField = self.centeredField - self.staggeredField.interpolation()
         boundaries    = self.staggeredField.boundaries()
         return CenteredFieldBoundaries(self.M, self.N, self.P,
-                                       centeredField, boundaries)
+                                       centeredField, boundaries, domain=self.domain)
 
     def interpolationErrorReservoirBoundaries(self):
         centeredField = self.centeredField - self.staggeredField.interpolation()
         boundaries    = self.staggeredField.reservoirBoundaries()
         return CenteredFieldBoundaries(self.M, self.N, self.P,
-                                       centeredField, boundaries)
+                                       centeredField, boundaries, domain=self.domain)
 
     def interpolationErrorTemporalBoundaries(self):
         centeredField      = self.centeredField - self.staggeredField.interpolation()
         temporalBoundaries = self.staggeredField.temporalBoundaries()
         return CenteredFieldTemporalBoundaries(self.M, self.N, self.P,
-                                               centeredField, temporalBoundaries)
+                                               centeredField, temporalBoundaries, domain=self.domain)
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return StaggeredCenteredField( M , N , P ,
-                                       StaggeredField.random(M,N,P) , CenteredField.random(M,N,P) )
+                                       StaggeredField.random(M,N,P, domain=domain) , CenteredField.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
     def LInftyNorm(self):
@@ -1674,50 +1769,50 @@ class StaggeredCenteredField( OTObject ):
     def __add__(self, other):
         if isinstance(other,StaggeredCenteredField):
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField + other.staggeredField , self.centeredField + other.centeredField )
+                                           self.staggeredField + other.staggeredField , self.centeredField + other.centeredField , domain=self.domain )
         else:
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField + other , self.centeredField + other )
+                                           self.staggeredField + other , self.centeredField + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,StaggeredCenteredField):
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField - other.staggeredField , self.centeredField - other.centeredField )
+                                           self.staggeredField - other.staggeredField , self.centeredField - other.centeredField , domain=self.domain )
         else:
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField - other , self.centeredField - other )
+                                           self.staggeredField - other , self.centeredField - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,StaggeredCenteredField):
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField * other.staggeredField , self.centeredField * other.centeredField )
+                                           self.staggeredField * other.staggeredField , self.centeredField * other.centeredField , domain=self.domain )
         else:
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField * other , self.centeredField * other )
+                                           self.staggeredField * other , self.centeredField * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,StaggeredCenteredField):
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField / other.staggeredField , self.centeredField / other.centeredField )
+                                           self.staggeredField / other.staggeredField , self.centeredField / other.centeredField , domain=self.domain )
         else:
             return StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.staggeredField / other , self.centeredField / other )
+                                           self.staggeredField / other , self.centeredField / other , domain=self.domain )
 
     def __radd__(self, other):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       other + self.staggeredField , other + self.centeredField )
+                                       other + self.staggeredField , other + self.centeredField , domain=self.domain )
 
     def __rsub__(self, other):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       other - self.staggeredField , other - self.centeredField )
+                                       other - self.staggeredField , other - self.centeredField , domain=self.domain )
 
     def __rmul__(self, other):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       other * self.staggeredField , other * self.centeredField )
+                                       other * self.staggeredField , other * self.centeredField , domain=self.domain )
 
     def __rdiv__(self, other):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       other / self.staggeredField , other / self.centeredField )
+                                       other / self.staggeredField , other / self.centeredField , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,StaggeredCenteredField):
@@ -1761,18 +1856,18 @@ class StaggeredCenteredField( OTObject ):
 
     def __neg__(self):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       - self.staggeredField , - self.centeredField )
+                                       - self.staggeredField , - self.centeredField , domain=self.domain )
 
     def __pos__(self):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       + self.staggeredField , + self.centeredField )
+                                       + self.staggeredField , + self.centeredField , domain=self.domain )
 
     def __abs__(self):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       abs ( self.staggeredField ) , abs ( self.centeredField ) )
+                                       abs ( self.staggeredField ) , abs ( self.centeredField ) , domain=self.domain )
     def copy(self):
         return StaggeredCenteredField( self.M , self.N , self.P ,
-                                       self.staggeredField.copy() , self.centeredField.copy() )
+                                       self.staggeredField.copy() , self.centeredField.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1783,17 +1878,17 @@ class CenteredFieldBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  centeredField=None , boundaries=None ):
+                  centeredField=None , boundaries=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
 
         if centeredField is None:
-            self.centeredField = CenteredField(M,N,P)
+            self.centeredField = CenteredField(M,N,P, domain=domain)
         else:
             self.centeredField = centeredField
 
         if boundaries is None:
-            self.boundaries = Boundaries(M,N,P)
+            self.boundaries = Boundaries(M,N,P, domain=domain)
         else:
             self.boundaries = boundaries
 
@@ -1803,18 +1898,18 @@ class CenteredFieldBoundaries( OTObject ):
     def TinterpolationErrorBoundaries(self):
         scField  = self.centeredField.TinterpolationError()
         scField += StaggeredCenteredField( self.M, self.N , self.P ,
-                                           self.boundaries.Tboundaries() )
+                                           self.boundaries.Tboundaries() , domain=self.domain )
         return scField
 
     def TinterpolationErrorReservoirBoundaries(self):
         scField  = self.centeredField.TinterpolationError()
         scField += StaggeredCenteredField( self.M, self.N , self.P ,
-                                           self.boundaries.TreservoirBoundaries() )
+                                           self.boundaries.TreservoirBoundaries() , domain=self.domain )
         return scField
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return CenteredFieldBoundaries( M , N , P ,
-                                        CenteredField.random(M,N,P) , Boundaries.random(M,N,P) )
+                                        CenteredField.random(M,N,P, domain=domain) , Boundaries.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
     def LInftyNorm(self):
@@ -1823,50 +1918,50 @@ class CenteredFieldBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,CenteredFieldBoundaries):
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField + other.centeredField , self.boundaries + other.boundaries )
+                                            self.centeredField + other.centeredField , self.boundaries + other.boundaries , domain=self.domain )
         else:
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField + other , self.boundaries + other )
+                                            self.centeredField + other , self.boundaries + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,CenteredFieldBoundaries):
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField - other.centeredField , self.boundaries - other.boundaries )
+                                            self.centeredField - other.centeredField , self.boundaries - other.boundaries , domain=self.domain )
         else:
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField - other , self.boundaries - other )
+                                            self.centeredField - other , self.boundaries - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,CenteredFieldBoundaries):
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField * other.centeredField , self.boundaries * other.boundaries )
+                                            self.centeredField * other.centeredField , self.boundaries * other.boundaries , domain=self.domain )
         else:
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField * other , self.boundaries * other )
+                                            self.centeredField * other , self.boundaries * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,CenteredFieldBoundaries):
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField / other.centeredField , self.boundaries / other.boundaries )
+                                            self.centeredField / other.centeredField , self.boundaries / other.boundaries , domain=self.domain )
         else:
             return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                            self.centeredField / other , self.boundaries / other )
+                                            self.centeredField / other , self.boundaries / other , domain=self.domain )
 
     def __radd__(self, other):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        other + self.centeredField , other + self.boundaries )
+                                        other + self.centeredField , other + self.boundaries , domain=self.domain )
 
     def __rsub__(self, other):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        other - self.centeredField , other - self.boundaries )
+                                        other - self.centeredField , other - self.boundaries , domain=self.domain )
 
     def __rmul__(self, other):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        other * self.centeredField , other * self.boundaries )
+                                        other * self.centeredField , other * self.boundaries , domain=self.domain )
 
     def __rdiv__(self, other):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        other / self.centeredField , other / self.boundaries )
+                                        other / self.centeredField , other / self.boundaries , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,CenteredFieldBoundaries):
@@ -1910,18 +2005,18 @@ class CenteredFieldBoundaries( OTObject ):
 
     def __neg__(self):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        - self.centeredField , - self.boundaries )
+                                        - self.centeredField , - self.boundaries , domain=self.domain )
 
     def __pos__(self):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        + self.centeredField , + self.boundaries )
+                                        + self.centeredField , + self.boundaries , domain=self.domain )
 
     def __abs__(self):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        abs ( self.centeredField ) , abs ( self.boundaries ) )
+                                        abs ( self.centeredField ) , abs ( self.boundaries ) , domain=self.domain )
     def copy(self):
         return CenteredFieldBoundaries( self.M , self.N , self.P ,
-                                        self.centeredField.copy() , self.boundaries.copy() )
+                                        self.centeredField.copy() , self.boundaries.copy() , domain=self.domain )
 
 #__________________________________________________
 
@@ -1932,16 +2027,16 @@ class CenteredFieldTemporalBoundaries( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  centeredField=None , temporalBoundaries=None ):
+                  centeredField=None , temporalBoundaries=None , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         if centeredField is None:
-            self.centeredField = CenteredField( M , N , P )
+            self.centeredField = CenteredField( M , N , P , domain=domain )
         else:
             self.centeredField = centeredField
 
         if temporalBoundaries is None:
-            self.temporalBoundaries = TemporalBoundaries( M , N , P )
+            self.temporalBoundaries = TemporalBoundaries( M , N , P , domain=domain )
         else:
             self.temporalBoundaries = temporalBoundaries
 
@@ -1951,12 +2046,12 @@ class CenteredFieldTemporalBoundaries( OTObject ):
     def TinterpolationErrorTemporalBoundaries(self):
         scField  = self.centeredField.TinterpolationError()
         scField += StaggeredCenteredField( self.M , self.N , self.P ,
-                                           self.temporalBoundaries.TtemporalBoundaries() )
+                                           self.temporalBoundaries.TtemporalBoundaries() , domain=self.domain )
         return scField
 
-    def random( M , N , P ):
+    def random( M , N , P , domain=None ):
         return CenteredFieldTemporalBoundaries( M , N , P ,
-                                                CenteredField.random(M,N,P) , TemporalBoundaries.random(M,N,P) )
+                                                CenteredField.random(M,N,P, domain=domain) , TemporalBoundaries.random(M,N,P, domain=domain), domain=domain )
     random = staticmethod(random)
 
     def LInftyNorm(self):
@@ -1965,50 +2060,50 @@ class CenteredFieldTemporalBoundaries( OTObject ):
     def __add__(self, other):
         if isinstance(other,CenteredFieldTemporalBoundaries):
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField + other.centeredField , self.temporalBoundaries + other.temporalBoundaries )
+                                                    self.centeredField + other.centeredField , self.temporalBoundaries + other.temporalBoundaries , domain=self.domain )
         else:
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField + other , self.temporalBoundaries + other )
+                                                    self.centeredField + other , self.temporalBoundaries + other , domain=self.domain )
 
     def __sub__(self, other):
         if isinstance(other,CenteredFieldTemporalBoundaries):
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField - other.centeredField , self.temporalBoundaries - other.temporalBoundaries )
+                                                    self.centeredField - other.centeredField , self.temporalBoundaries - other.temporalBoundaries , domain=self.domain )
         else:
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField - other , self.temporalBoundaries - other )
+                                                    self.centeredField - other , self.temporalBoundaries - other , domain=self.domain )
 
     def __mul__(self, other):
         if isinstance(other,CenteredFieldTemporalBoundaries):
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField * other.centeredField , self.temporalBoundaries * other.temporalBoundaries )
+                                                    self.centeredField * other.centeredField , self.temporalBoundaries * other.temporalBoundaries , domain=self.domain )
         else:
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField * other , self.temporalBoundaries * other )
+                                                    self.centeredField * other , self.temporalBoundaries * other , domain=self.domain )
 
     def __div__(self, other):
         if isinstance(other,CenteredFieldTemporalBoundaries):
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField / other.centeredField , self.temporalBoundaries / other.temporalBoundaries )
+                                                    self.centeredField / other.centeredField , self.temporalBoundaries / other.temporalBoundaries , domain=self.domain )
         else:
             return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                    self.centeredField / other , self.temporalBoundaries / other )
+                                                    self.centeredField / other , self.temporalBoundaries / other , domain=self.domain )
 
     def __radd__(self, other):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                other + self.centeredField , other + self.temporalBoundaries )
+                                                other + self.centeredField , other + self.temporalBoundaries , domain=self.domain )
 
     def __rsub__(self, other):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                other - self.centeredField , other - self.temporalBoundaries )
+                                                other - self.centeredField , other - self.temporalBoundaries , domain=self.domain )
 
     def __rmul__(self, other):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                other * self.centeredField , other * self.temporalBoundaries )
+                                                other * self.centeredField , other * self.temporalBoundaries , domain=self.domain )
 
     def __rdiv__(self, other):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                other / self.centeredField , other / self.temporalBoundaries )
+                                                other / self.centeredField , other / self.temporalBoundaries , domain=self.domain )
 
     def __iadd__(self, other):
         if isinstance(other,CenteredFieldTemporalBoundaries):
@@ -2052,16 +2147,16 @@ class CenteredFieldTemporalBoundaries( OTObject ):
 
     def __neg__(self):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                - self.centeredField , - self.temporalBoundaries )
+                                                - self.centeredField , - self.temporalBoundaries , domain=self.domain )
 
     def __pos__(self):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                + self.centeredField , + self.temporalBoundaries )
+                                                + self.centeredField , + self.temporalBoundaries , domain=self.domain )
 
     def __abs__(self):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                abs ( self.centeredField ) , abs ( self.temporalBoundaries ) )
+                                                abs ( self.centeredField ) , abs ( self.temporalBoundaries ) , domain=self.domain )
     def copy(self):
         return CenteredFieldTemporalBoundaries( self.M , self.N , self.P ,
-                                                self.centeredField.copy() , self.temporalBoundaries.copy() )
+                                                self.centeredField.copy() , self.temporalBoundaries.copy() , domain=self.domain )
 
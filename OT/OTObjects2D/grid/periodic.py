@@ -0,0 +1,45 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+#____________
+# periodic.py
+#____________
+#
+# Staggered fields for the dynamics periodic in space (dynamics = 5)
+#
+# The domain is periodic in x and y with M+1 and N+1 nodes. The faces
+# mx[1:M+2] and my[:,1:N+2] are the actual unknowns, mx[M+1] (resp. my[:,N+1])
+# being the face between node M (resp. N) and node 0. mx[0] and my[:,0] are
+# ghost copies of these faces, so that the usual divergence and interpolation
+# operators are periodic.
+#
+
+#__________________________________________________
+
+def wrapStaggeredField(field):
+    # sets the ghost faces
+    field.mx[0,:,:] = field.mx[field.M+1,:,:]
+    field.my[:,0,:] = field.my[:,field.N+1,:]
+    return field
+
+#__________________________________________________
+
+def foldStaggeredField(field):
+    #
+    # adjoint of wrapStaggeredField : adds the contribution of
+    # the ghost faces to the faces they are copied from
+    #
+    field.mx[field.M+1,:,:] += field.mx[0,:,:]
+    field.my[:,field.N+1,:] += field.my[:,0,:]
+    return wrapStaggeredField(field)
+
+#__________________________________________________
@@ -0,0 +1,265 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+###############
+# sourceGrid.py
+###############
+#
+# Fields for the unbalanced (Wasserstein-Fisher-Rao) dynamic formulation
+#
+#   d_t f + div(m) = zeta
+#   J = sum( ( |m|^2 + delta^2 zeta^2 ) / f )
+#
+# The source is stored scaled, i.e. s = delta * zeta, so that J is
+# isotropic in (m, s) : J = sum( ( |m|^2 + s^2 ) / f ), and the continuity
+# equation reads d_t f + div(m) - s / delta = 0
+#
+# The source is defined on the centered grid, shape (M+1,N+1,P+1), both for
+# the staggered and for the centered field
+#
+
+import numpy as np
+
+from ..OTObject import OTObject
+from ...utils   import cardan
+from grid       import CenteredField
+from grid       import StaggeredCenteredField
+
+#__________________________________________________
+
+def functionalJSource(centeredField, source):
+    positive = ( centeredField.f > 0 )
+    return ( ( centeredField.mx * centeredField.mx +
+               centeredField.my * centeredField.my +
+               source * source ) *
+             positive /
+             ( centeredField.f * positive + 1. * ( 1. - positive ) ) ).sum()
+
+#__________________________________________________
+
+def proximalJSource(centeredField, source, gamma):
+    #
+    # same cubic as CenteredField.proximalJ, the source being
+    # an additional component of the momentum
+    #
+    f     = centeredField.f
+    unity = np.ones(shape=f.shape, dtype=f.dtype)
+    fstar = cardan.maxRoot( unity,
+                            2*gamma-f,
+                            gamma**2-2*gamma*f,
+                            -(gamma**2*f+0.5*gamma*( centeredField.mx*centeredField.mx +
+                                                     centeredField.my*centeredField.my +
+                                                     source*source )) )
+
+    fstar = np.maximum( fstar, 0. )
+    mx = ( fstar * centeredField.mx ) / ( fstar + gamma )
+    my = ( fstar * centeredField.my ) / ( fstar + gamma )
+    s  = ( fstar * source ) / ( fstar + gamma )
+    return ( CenteredField(centeredField.M, centeredField.N, centeredField.P, mx, my, fstar,
+                            domain=centeredField.domain) , s )
+
+#__________________________________________________
+
+class StaggeredCenteredFieldSource( OTObject ):
+    '''
+    class to store a staggered and a centered field with their (scaled) sources
+    '''
+
+    def __init__( self ,
+                  M , N , P ,
+                  staggeredCenteredField=None , staggeredSource=None , centeredSource=None , domain=None ):
+        OTObject.__init__( self ,
+                           M , N , P , domain=domain )
+        if staggeredCenteredField is None:
+            self.staggeredCenteredField = StaggeredCenteredField( M , N , P , domain=domain )
+        else:
+            self.staggeredCenteredField = staggeredCenteredField
+
+        if staggeredSource is None:
+            self.staggeredSource = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
+        else:
+            self.staggeredSource = staggeredSource
+
+        if centeredSource is None:
+            self.centeredSource = np.zeros(shape=(M+1,N+1,P+1), dtype=self.dtype)
+        else:
+            self.centeredSource = centeredSource
+
+    def __repr__(self):
+        return 'Object representing a staggered and a centered field with their sources'
+
+    def staggeredField(self):
+        return self.staggeredCenteredField.staggeredField
+
+    def centeredField(self):
+        return self.staggeredCenteredField.centeredField
+
+    def functionalJ(self):
+        return functionalJSource( self.centeredField() , self.centeredSource )
+
+    def random( M , N , P , domain=None ):
+        return StaggeredCenteredFieldSource( M , N , P ,
+                                             StaggeredCenteredField.random(M,N,P, domain=domain) ,
+                                             np.random.rand(M+1,N+1,P+1) ,
+                                             np.random.rand(M+1,N+1,P+1), domain=domain )
+    random = staticmethod(random)
+
+    def LInftyNorm(self):
+        return np.max( [ self.staggeredCenteredField.LInftyNorm() ,
+                         np.abs(self.staggeredSource).max() ,
+                         np.abs(self.centeredSource).max() ] )
+
+    def __add__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField + other.staggeredCenteredField ,
+                                                 self.staggeredSource + other.staggeredSource ,
+                                                 self.centeredSource + other.centeredSource , domain=self.domain )
+        else:
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField + other ,
+                                                 self.staggeredSource + other ,
+                                                 self.centeredSource + other , domain=self.domain )
+
+    def __sub__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField - other.staggeredCenteredField ,
+                                                 self.staggeredSource - other.staggeredSource ,
+                                                 self.centeredSource - other.centeredSource , domain=self.domain )
+        else:
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField - other ,
+                                                 self.staggeredSource - other ,
+                                                 self.centeredSource - other , domain=self.domain )
+
+    def __mul__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField * other.staggeredCenteredField ,
+                                                 self.staggeredSource * other.staggeredSource ,
+                                                 self.centeredSource * other.centeredSource , domain=self.domain )
+        else:
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField * other ,
+                                                 self.staggeredSource * other ,
+                                                 self.centeredSource * other , domain=self.domain )
+
+    def __div__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField / other.staggeredCenteredField ,
+                                                 self.staggeredSource / other.staggeredSource ,
+                                                 self.centeredSource / other.centeredSource , domain=self.domain )
+        else:
+            return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                                 self.staggeredCenteredField / other ,
+                                                 self.staggeredSource / other ,
+                                                 self.centeredSource / other , domain=self.domain )
+
+    def __radd__(self, other):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             other + self.staggeredCenteredField ,
+                                             other + self.staggeredSource ,
+                                             other + self.centeredSource , domain=self.domain )
+
+    def __rsub__(self, other):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             other - self.staggeredCenteredField ,
+                                             other - self.staggeredSource ,
+                                             other - self.centeredSource , domain=self.domain )
+
+    def __rmul__(self, other):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             other * self.staggeredCenteredField ,
+                                             other * self.staggeredSource ,
+                                             other * self.centeredSource , domain=self.domain )
+
+    def __rdiv__(self, other):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             other / self.staggeredCenteredField ,
+                                             other / self.staggeredSource ,
+                                             other / self.centeredSource , domain=self.domain )
+
+    def __iadd__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            self.staggeredCenteredField += other.staggeredCenteredField
+            self.staggeredSource        += other.staggeredSource
+            self.centeredSource         += other.centeredSource
+            return self
+        else:
+            self.staggeredCenteredField += other
+            self.staggeredSource        += other
+            self.centeredSource         += other
+            return self
+
+    def __isub__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            self.staggeredCenteredField -= other.staggeredCenteredField
+            self.staggeredSource        -= other.staggeredSource
+            self.centeredSource         -= other.centeredSource
+            return self
+        else:
+            self.staggeredCenteredField -= other
+            self.staggeredSource        -= other
+            self.centeredSource         -= other
+            return self
+
+    def __imul__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            self.staggeredCenteredField *= other.staggeredCenteredField
+            self.staggeredSource        *= other.staggeredSource
+            self.centeredSource         *= other.centeredSource
+            return self
+        else:
+            self.staggeredCenteredField *= other
+            self.staggeredSource        *= other
+            self.centeredSource         *= other
+            return self
+
+    def __idiv__(self, other):
+        if isinstance(other,StaggeredCenteredFieldSource):
+            self.staggeredCenteredField /= other.staggeredCenteredField
+            self.staggeredSource        /= other.staggeredSource
+            self.centeredSource         /= other.centeredSource
+            return self
+        else:
+            self.staggeredCenteredField /= other
+            self.staggeredSource        /= other
+            self.centeredSource         /= other
+            return self
+
+    def __neg__(self):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             - self.staggeredCenteredField ,
+                                             - self.staggeredSource ,
+                                             - self.centeredSource , domain=self.domain )
+
+    def __pos__(self):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             + self.staggeredCenteredField ,
+                                             + self.staggeredSource ,
+                                             + self.centeredSource , domain=self.domain )
+
+    def __abs__(self):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             abs ( self.staggeredCenteredField ) ,
+                                             abs ( self.staggeredSource ) ,
+                                             abs ( self.centeredSource ) , domain=self.domain )
+    def copy(self):
+        return StaggeredCenteredFieldSource( self.M , self.N , self.P ,
+                                             self.staggeredCenteredField.copy() ,
+                                             self.staggeredSource.copy() ,
+                                             self.centeredSource.copy() , domain=self.domain )
+
+#__________________________________________________
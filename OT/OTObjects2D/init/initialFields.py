@@ -20,6 +20,7 @@
 
 import numpy as np
 from ..grid import grid
+from ..OTObject import physicalDomainForConfig
 
 def initialStaggeredField(config):
     mx = np.zeros(shape=(config.M+2,config.N+1,config.P+1))
@@ -57,7 +58,7 @@ def initialStaggeredField(config):
                          config.boundaries.temporalBoundaries.bt1[:,:] * t )
             
     return grid.StaggeredField( config.M , config.N , config.P ,
-                                mx , my, f )
+                                mx , my, f , domain=physicalDomainForConfig(config) )
 
 def initialCenteredField(config):
     return initialStaggeredField(config).interpolation()
@@ -65,4 +66,5 @@ def initialCenteredField(config):
 def initialStaggeredCenteredField(config):
     staggeredField = initialStaggeredField(config)
     return grid.StaggeredCenteredField( config.M , config.N , config.P ,
-                                        staggeredField , staggeredField.interpolation() )
+                                        staggeredField , staggeredField.interpolation() ,
+                                        domain=staggeredField.domain )
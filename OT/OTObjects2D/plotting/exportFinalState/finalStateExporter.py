@@ -0,0 +1,71 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#______________________
+# finalStateExporter.py
+#______________________
+#
+# Exports every time level of the final state as a PNG image, without
+# matplotlib figures (see utils/plotting/exportPNG.py)
+#
+
+from ....utils.io.extractFinalState         import extractFinalStateMultiSim
+from ....utils.plotting.plotting            import makeOutputDirLabelPrefixFigNameList
+from ....utils.plotting.plotMatrix          import filterKwargsMiniMaxiCmapName
+from ....utils.plotting.exportPNG           import exportFramesPNG
+
+#__________________________________________________
+
+class FinalStateExporter:
+
+    def __init__(self, config):
+        self.config = config
+
+    #_________________________
+
+    def export(self):
+        if not self.config.exportFinalState:
+            return
+
+        ( outputDirListList,
+          labelListList,
+          prefixFigNameList) = makeOutputDirLabelPrefixFigNameList(self.config.singleOrMulti,
+                                                                   self.config.outputDirList,
+                                                                   self.config.labelList,
+                                                                   self.config.exportFinalState_prefixFigName)
+
+        for (outputDirList,
+             labelList,
+             prefixFigName) in zip(outputDirListList,
+                                   labelListList,
+                                   prefixFigNameList):
+
+            (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, self.config.timeResampling)
+            (mini, maxi, cmapName, kwargs)          = filterKwargsMiniMaxiCmapName(mini, maxi, self.config.exportFinalState_cmapName,
+                                                                                   **self.config.exportFinalState_args)
+
+            # the simulations of a group share the same color scale
+            if len(outputDirList) > 1:
+                prefixFileNames = [ self.config.figDir + prefixFigName + label + '_' for label in labelList ]
+            else:
+                prefixFileNames = [ self.config.figDir + prefixFigName ]
+
+            exportFramesPNG(fs,
+                            prefixFileNames,
+                            cmapName,
+                            mini,
+                            maxi,
+                            self.config.exportFinalState_scale,
+                            self.config.nProcesses)
+
+#__________________________________________________
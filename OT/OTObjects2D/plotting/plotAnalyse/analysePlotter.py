@@ -58,6 +58,8 @@ class AnalysePlotter:
                                 prefixFigName, 
                                 labelList,
                                 plotSubplots,
-                                self.config.extensions)
+                                self.config.extensions,
+                                self.config.plotAnalyse_nbrPointsMax,
+                                self.config.plotAnalyse_downsampling)
 
 #__________________________________________________
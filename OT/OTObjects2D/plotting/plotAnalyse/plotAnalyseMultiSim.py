@@ -17,23 +17,32 @@
 #
 # plots the result of multiple analyses
 #
+# Only the plotted columns are read, and the curves longer than
+# nbrPointsMax are downsampled (see utils/plotting/downsample.py)
+#
 
 import numpy             as np
 import matplotlib.pyplot as plt
 
-from ....utils.plotting.plot     import plot
-from ....utils.plotting.plotting import plottingOptionsMultiSim
-from ....utils.plotting.plot     import tryAddCustomLegend
-from ....utils.plotting.plotting import makeAxesGrid
-from ....utils.plotting.plot     import addTitleLabelsGrid
-from ....utils.plotting.plot     import trySetScale
-from ....utils.plotting.saveFig  import saveFig
-from ....utils.io.extractAnalyse import extractAnalyseMultiSim
+from ....utils.plotting.plot       import plot
+from ....utils.plotting.plotting   import plottingOptionsMultiSim
+from ....utils.plotting.plot       import tryAddCustomLegend
+from ....utils.plotting.plotting   import makeAxesGrid
+from ....utils.plotting.plot       import addTitleLabelsGrid
+from ....utils.plotting.plot       import trySetScale
+from ....utils.plotting.saveFig    import saveFig
+from ....utils.plotting.downsample import downsample
+from ....utils.io.extractAnalyse   import extractAnalyseColumnsMultiSim
+
+def plotAnalyseMultiSim(outputDirList, figDir, prefixFigName, labelList, figSubFig, extensionsList, nbrPointsMax=0, downsampling='lttb'):
 
-def plotAnalyseMultiSim(outputDirList, figDir, prefixFigName, labelList, figSubFig, extensionsList):
+    columnsNeeded = []
+    for subFig in figSubFig:
+        for columns in subFig[0]:
+            columnsNeeded.extend(columns)
 
     (options, mModOptions, nModOptions)     = plottingOptionsMultiSim()
-    (iterNumbers, iterTimes, names, values) = extractAnalyseMultiSim(outputDirList)
+    (iterNumbers, iterTimes, names, values) = extractAnalyseColumnsMultiSim(outputDirList, columnsNeeded)
 
     for (columnsList, xAxisList, xScaleList, yScaleList, xLabelList, yLabelList, titleList, gridList, fileNameSuffix) in figSubFig:
 
@@ -61,8 +70,8 @@ def plotAnalyseMultiSim(outputDirList, figDir, prefixFigName, labelList, figSubF
                 for column in columns:
                     nOptions = np.mod(nOptions+1, nModOptions)
                     column   = min(N-1, column)
-                    Y        = value[:, column]
-                    plot(ax, Y, X, options[mOptions, nOptions], label=label+', '+name[column])
+                    (XD, Y)  = downsample(X, value[column], nbrPointsMax, downsampling, xScale, yScale)
+                    plot(ax, Y, XD, options[mOptions, nOptions], label=label+', '+name[column])
 
             trySetScale(ax, xScale, yScale)
             tryAddCustomLegend(ax, True)
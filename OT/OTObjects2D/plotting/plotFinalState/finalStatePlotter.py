@@ -73,6 +73,8 @@ class FinalStatePlotter:
                                    self.config.plotFinalState_order,
                                    self.config.plotFinalState_extendDirection,
                                    self.config.extensions,
-                                   self.config.EPSILON)
+                                   self.config.EPSILON,
+                                   self.config.timeResampling,
+                                   self.config.nProcesses)
 
 #__________________________________________________
@@ -18,20 +18,98 @@
 # util to plot the final state for multiple simulations 
 #
 
-import matplotlib.pyplot as plt
-
-from ....utils.io.io                import fileNameSuffix
-from ....utils.io.extractFinalState import extractFinalStateMultiSim
-from ....utils.plotting.positions   import figureRect
-from ....utils.plotting.positions   import xylims2d
-from ....utils.plotting.plotting    import makeAxesGrid
-from ....utils.plotting.plotting    import adaptAxesExtent
-from ....utils.plotting.plot        import addTitleLabelsGrid
-from ....utils.plotting.plot        import addTimeTextPBar
-from ....utils.plotting.plotMatrix  import addColorBar
-from ....utils.plotting.plotMatrix  import plotMatrix
-from ....utils.plotting.plotMatrix  import filterKwargsMiniMaxiCmapName
-from ....utils.plotting.saveFig     import saveFig
+from ....utils.io.io                    import fileNameSuffix
+from ....utils.io.extractFinalState     import extractFinalStateMultiSim
+from ....utils.plotting.positions       import figureRect
+from ....utils.plotting.positions       import xylims2d
+from ....utils.plotting.plotting        import makeAxesGrid
+from ....utils.plotting.plotting        import adaptAxesExtent
+from ....utils.plotting.plot            import addTitleLabelsGrid
+from ....utils.plotting.plot            import addTimeTextPBar
+from ....utils.plotting.plotMatrix      import addColorBar
+from ....utils.plotting.plotMatrix      import plotMatrix
+from ....utils.plotting.plotMatrix      import filterKwargsMiniMaxiCmapName
+from ....utils.plotting.saveFig         import saveFig
+from ....utils.plotting.parallelFrames  import FrameRenderer
+from ....utils.plotting.parallelFrames  import renderFrames
+
+#__________________________________________________
+
+class FinalStateFrameRenderer( FrameRenderer ):
+    '''
+    renders the frame t of plotFinalStateMultiSim
+    '''
+
+    def __init__(self, fileNames, nbrOfSims, Pmax, params):
+        FrameRenderer.__init__(self, fileNames)
+        self.nbrOfSims = nbrOfSims
+        self.Pmax      = Pmax
+        self.params    = params
+
+    #_________________________
+
+    def render(self, plt, arrays, t):
+        p       = self.params
+        n       = self.nbrOfSims
+        fs      = arrays[0:n]
+        finits  = arrays[n:2*n]
+        ffinals = arrays[2*n:3*n]
+
+        kwargsInit          = p['kwargsInit'].copy()
+        kwargsFinal         = p['kwargsFinal'].copy()
+        kwargsInit['alpha']  = p['alphasInit'][t]
+        kwargsFinal['alpha'] = p['alphasFinal'][t]
+
+        (gs, axes) = makeAxesGrid(plt, n, order=p['order'], extendDirection=p['extendDirection'])
+
+        for (f, finit, ffinal, label, ax) in zip(fs, finits, ffinals, p['labelList'], axes):
+
+            plotMatrix(ax,
+                       f[:,:,t],
+                       plotter=p['plotter'],
+                       xmin=p['xmin'],
+                       xmax=p['xmax'],
+                       ymin=p['ymin'],
+                       ymax=p['ymax'],
+                       cmapName=p['cmapNameC'],
+                       vmin=p['miniC'],
+                       vmax=p['maxiC'],
+                       **p['kwargs'])
+            plotMatrix(ax,
+                       finit,
+                       plotter='contour',
+                       xmin=p['xmin'],
+                       xmax=p['xmax'],
+                       ymin=p['ymin'],
+                       ymax=p['ymax'],
+                       vmin=p['miniI'],
+                       vmax=p['maxiI'],
+                       **kwargsInit)
+            plotMatrix(ax,
+                       ffinal,
+                       plotter='contour',
+                       xmin=p['xmin'],
+                       xmax=p['xmax'],
+                       ymin=p['ymin'],
+                       ymax=p['ymax'],
+                       vmin=p['miniF'],
+                       vmax=p['maxiF'],
+                       **kwargsFinal)
+
+            adaptAxesExtent(ax, p['xmin'], p['xmax'], p['ymin'], p['ymax'], p['extendX'], p['extendY'],
+                            p['nbrXTicks'], p['nbrYTicks'], p['xTicksDecimals'], p['yTicksDecimals'], p['EPSILON'])
+            addTitleLabelsGrid(ax, title=label, xLabel=p['xLabel'], yLabel=p['yLabel'], grid=False)
+
+        gs.tight_layout(plt.gcf(), rect=figureRect(p['colorBar'], p['timeTextPBar']))
+
+        if p['colorBar']:
+            addColorBar(plt, p['timeTextPBar'], p['cmapNameC'], p['miniC'], p['maxiC'], p['nbrCTicks'], p['cticksDecimals'], p['cLabel'])
+
+        if p['timeTextPBar']:
+            addTimeTextPBar(plt, t, self.Pmax+1)
+
+        figName = p['figDir'] + p['prefixFigName'] + fileNameSuffix(t,self.Pmax+2)
+        saveFig(plt, figName, p['extensionsList'])
 
 #__________________________________________________
 
@@ -61,70 +139,58 @@ def plotFinalStateMultiSim(outputDirList,
                            order,
                            extendDirection,
                            extensionsList,
-                           EPSILON):
+                           EPSILON,
+                           timeResampling='linear',
+                           nProcesses=1):
 
-    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList)
+    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, timeResampling)
     (xmin, xmax, ymin, ymax)                = xylims2d()
     (miniC, maxiC, cmapNameC, kwargs)       = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargs)
     (miniI, maxiI, cmapNameI, kwargsInit)   = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargsInit)
     (miniF, maxiF, cmapNameF, kwargsFinal)  = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargsFinal)
 
-    for t in xrange(Pmax+2):
-        kwargsInit['alpha']  = transparencyFunction(1.-float(t)/(Pmax+1.))
-        kwargsFinal['alpha'] = transparencyFunction(float(t)/(Pmax+1.))
-
-        figure     = plt.figure()
-        plt.clf()
-
-        (gs, axes) = makeAxesGrid(plt, len(outputDirList), order=order, extendDirection=extendDirection)
-
-        for (f, finit, ffinal, label, ax) in zip(fs, finits, ffinals, labelList, axes):
-
-            plotMatrix(ax,
-                       f[:,:,t],
-                       plotter=plotter,
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       cmapName=cmapNameC,
-                       vmin=miniC,
-                       vmax=maxiC,
-                       **kwargs)
-            plotMatrix(ax,
-                       finit,
-                       plotter='contour',
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       vmin=miniI,
-                       vmax=maxiI,
-                       **kwargsInit)
-            plotMatrix(ax,
-                       ffinal,
-                       plotter='contour',
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       vmin=miniF,
-                       vmax=maxiF,
-                       **kwargsFinal)
-
-            adaptAxesExtent(ax, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
-            addTitleLabelsGrid(ax, title=label, xLabel=xLabel, yLabel=yLabel, grid=False)
-
-        gs.tight_layout(figure, rect=figureRect(colorBar, timeTextPBar))
-
-        if colorBar:
-            addColorBar(plt, timeTextPBar, cmapNameC, miniC, maxiC, nbrCTicks, cticksDecimals, cLabel)
-
-        if timeTextPBar:
-            addTimeTextPBar(plt, t, Pmax+1)
-
-        figName = figDir + prefixFigName + fileNameSuffix(t,Pmax+2)
-        saveFig(plt, figName, extensionsList)
-        plt.close()
+    # transparencies are computed here since transparencyFunction may not be pickled
+    params = { 'figDir'         : figDir,
+               'prefixFigName'  : prefixFigName,
+               'labelList'      : labelList,
+               'alphasInit'     : [ transparencyFunction(1.-float(t)/(Pmax+1.)) for t in xrange(Pmax+2) ],
+               'alphasFinal'    : [ transparencyFunction(float(t)/(Pmax+1.)) for t in xrange(Pmax+2) ],
+               'plotter'        : plotter,
+               'kwargs'         : kwargs,
+               'kwargsInit'     : kwargsInit,
+               'kwargsFinal'    : kwargsFinal,
+               'colorBar'       : colorBar,
+               'cmapNameC'      : cmapNameC,
+               'miniC'          : miniC,
+               'maxiC'          : maxiC,
+               'miniI'          : miniI,
+               'maxiI'          : maxiI,
+               'miniF'          : miniF,
+               'maxiF'          : maxiF,
+               'timeTextPBar'   : timeTextPBar,
+               'xLabel'         : xLabel,
+               'yLabel'         : yLabel,
+               'cLabel'         : cLabel,
+               'xmin'           : xmin,
+               'xmax'           : xmax,
+               'ymin'           : ymin,
+               'ymax'           : ymax,
+               'extendX'        : extendX,
+               'extendY'        : extendY,
+               'nbrXTicks'      : nbrXTicks,
+               'nbrYTicks'      : nbrYTicks,
+               'nbrCTicks'      : nbrCTicks,
+               'xTicksDecimals' : xTicksDecimals,
+               'yTicksDecimals' : yTicksDecimals,
+               'cticksDecimals' : cticksDecimals,
+               'order'          : order,
+               'extendDirection': extendDirection,
+               'extensionsList' : extensionsList,
+               'EPSILON'        : EPSILON }
+
+    def makeRenderer(fileNames):
+        return FinalStateFrameRenderer(fileNames, len(outputDirList), Pmax, params)
+
+    renderFrames(makeRenderer, fs+finits+ffinals, Pmax+2, nProcesses)
 
 #__________________________________________________
@@ -18,6 +18,7 @@
 from plotAnalyse.analysePlotter             import AnalysePlotter
 from plotFinalState.finalStatePlotter       import FinalStatePlotter
 from triplotFinalState.finalStateTriplotter import FinalStateTriplotter
+from exportFinalState.finalStateExporter    import FinalStateExporter
 
 #__________________________________________________
 
@@ -27,6 +28,7 @@ class Plotter:
         self.analysePlotter       = AnalysePlotter(config)
         self.finalStatePlotter    = FinalStatePlotter(config)
         self.finalStateTriplotter = FinalStateTriplotter(config)
+        self.finalStateExporter   = FinalStateExporter(config)
 
     #_________________________
 
@@ -34,5 +36,6 @@ class Plotter:
         self.analysePlotter.plot()
         self.finalStatePlotter.plot()
         self.finalStateTriplotter.plot()
+        self.finalStateExporter.export()
 
 #__________________________________________________
@@ -74,6 +74,13 @@ class PlottingConfiguration(DefaultConfiguration):
                           defaultVal=['sim0'],
                           attrType='list')
 
+        self.addAttribute('timeResampling',
+                          defaultVal='linear')
+
+        self.addAttribute('nProcesses',
+                          defaultVal=1,
+                          attrType='int')
+
         #_______________
 
         self.addAttribute('plotAnalyse',
@@ -105,6 +112,15 @@ class PlottingConfiguration(DefaultConfiguration):
                           isSubAttr=[('plotAnalyse', True)],
                           attrType='bool')
 
+        self.addAttribute('plotAnalyse_nbrPointsMax',
+                          defaultVal=0,
+                          isSubAttr=[('plotAnalyse', True)],
+                          attrType='int')
+
+        self.addAttribute('plotAnalyse_downsampling',
+                          defaultVal='lttb',
+                          isSubAttr=[('plotAnalyse', True)])
+
         #_______________
 
         self.addAttribute('plotFinalState',
@@ -309,4 +325,28 @@ class PlottingConfiguration(DefaultConfiguration):
                           defaultVal='horizontal',
                           isSubAttr=[('triplotFinalState',True)])
 
+        #_______________
+
+        self.addAttribute('exportFinalState',
+                          defaultVal=False,
+                          attrType='bool')
+
+        self.addAttribute('exportFinalState_prefixFigName',
+                          defaultVal='finalState_png_',
+                          isSubAttr=[('exportFinalState',True)])
+
+        self.addAttribute('exportFinalState_args',
+                          defaultVal={},
+                          isSubAttr=[('exportFinalState',True)],
+                          attrType='dict')
+
+        self.addAttribute('exportFinalState_cmapName',
+                          defaultVal='jet',
+                          isSubAttr=[('exportFinalState',True)])
+
+        self.addAttribute('exportFinalState_scale',
+                          defaultVal=1,
+                          isSubAttr=[('exportFinalState',True)],
+                          attrType='int')
+
 #__________________________________________________
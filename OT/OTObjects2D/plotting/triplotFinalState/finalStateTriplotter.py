@@ -68,6 +68,8 @@ class FinalStateTriplotter:
                                       self.config.triplotFinalState_extendDirection,
                                       self.config.triplotFinalState_extendDirectionTriplot,
                                       self.config.extensions,
-                                      self.config.EPSILON)
+                                      self.config.EPSILON,
+                                      self.config.timeResampling,
+                                      self.config.nProcesses)
 
 #__________________________________________________
@@ -18,20 +18,76 @@
 # util to plot the final state for multiple simulations 
 #
 
-import matplotlib.pyplot as plt
-
-from ....utils.io.io                import fileNameSuffix
-from ....utils.io.extractFinalState import extractFinalStateMultiSim
-from ....utils.plotting.positions   import figureRect
-from ....utils.plotting.positions   import xylims2d
-from ....utils.plotting.plotting    import makeAxesGridTriplot
-from ....utils.plotting.plotting    import adaptAxesExtent
-from ....utils.plotting.plot        import addTitleLabelsGrid
-from ....utils.plotting.plot        import addTimeTextPBar
-from ....utils.plotting.plotMatrix  import addColorBar
-from ....utils.plotting.plotMatrix  import plotMatrix
-from ....utils.plotting.plotMatrix  import filterKwargsMiniMaxiCmapName
-from ....utils.plotting.saveFig     import saveFig
+from ....utils.io.io                    import fileNameSuffix
+from ....utils.io.extractFinalState     import extractFinalStateMultiSim
+from ....utils.plotting.positions       import figureRect
+from ....utils.plotting.positions       import xylims2d
+from ....utils.plotting.plotting        import makeAxesGridTriplot
+from ....utils.plotting.plotting        import adaptAxesExtent
+from ....utils.plotting.plot            import addTitleLabelsGrid
+from ....utils.plotting.plot            import addTimeTextPBar
+from ....utils.plotting.plotMatrix      import addColorBar
+from ....utils.plotting.plotMatrix      import plotMatrix
+from ....utils.plotting.plotMatrix      import filterKwargsMiniMaxiCmapName
+from ....utils.plotting.saveFig         import saveFig
+from ....utils.plotting.parallelFrames  import FrameRenderer
+from ....utils.plotting.parallelFrames  import renderFrames
+
+#__________________________________________________
+
+class FinalStateFrameTriplotter( FrameRenderer ):
+    '''
+    renders the frame t of triplotFinalStateMultiSim
+    '''
+
+    def __init__(self, fileNames, nbrOfSims, Pmax, params):
+        FrameRenderer.__init__(self, fileNames)
+        self.nbrOfSims = nbrOfSims
+        self.Pmax      = Pmax
+        self.params    = params
+
+    #_________________________
+
+    def render(self, plt, arrays, t):
+        p       = self.params
+        n       = self.nbrOfSims
+        fs      = arrays[0:n]
+        finits  = arrays[n:2*n]
+        ffinals = arrays[2*n:3*n]
+
+        (gs, axes, axesInit, axesFinal) = makeAxesGridTriplot(plt, n, p['order'], p['extendDirection'], p['extendDirectionTriplot'])
+
+        for (f, finit, ffinal, label, ax, axInit, axFinal) in zip(fs, finits, ffinals, p['labelList'], axes, axesInit, axesFinal):
+
+            for (axis, matrix, title) in [ ( ax      , f[:,:,t] , label            ) ,
+                                           ( axInit  , finit    , label+', init'   ) ,
+                                           ( axFinal , ffinal   , label+', final'  ) ]:
+                plotMatrix(axis,
+                           matrix,
+                           plotter=p['plotter'],
+                           xmin=p['xmin'],
+                           xmax=p['xmax'],
+                           ymin=p['ymin'],
+                           ymax=p['ymax'],
+                           cmapName=p['cmapNameC'],
+                           vmin=p['miniC'],
+                           vmax=p['maxiC'],
+                           **p['kwargs'])
+
+                adaptAxesExtent(axis, p['xmin'], p['xmax'], p['ymin'], p['ymax'], p['extendX'], p['extendY'],
+                                p['nbrXTicks'], p['nbrYTicks'], p['xTicksDecimals'], p['yTicksDecimals'], p['EPSILON'])
+                addTitleLabelsGrid(axis, title=title, xLabel=p['xLabel'], yLabel=p['yLabel'], grid=False)
+
+        gs.tight_layout(plt.gcf(), rect=figureRect(p['colorBar'], p['timeTextPBar']))
+
+        if p['colorBar']:
+            addColorBar(plt, p['timeTextPBar'], p['cmapNameC'], p['miniC'], p['maxiC'], p['nbrCTicks'], p['cticksDecimals'], p['cLabel'])
+
+        if p['timeTextPBar']:
+            addTimeTextPBar(plt, t, self.Pmax+1)
+
+        figName = p['figDir'] + p['prefixFigName'] + fileNameSuffix(t,self.Pmax+2)
+        saveFig(plt, figName, p['extensionsList'])
 
 #__________________________________________________
 
@@ -59,75 +115,48 @@ def triplotFinalStateMultiSim(outputDirList,
                               extendDirection,
                               extendDirectionTriplot,
                               extensionsList,
-                              EPSILON):
+                              EPSILON,
+                              timeResampling='linear',
+                              nProcesses=1):
 
-    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList)
+    (fs, finits, ffinals, mini, maxi, Pmax) = extractFinalStateMultiSim(outputDirList, timeResampling)
     (xmin, xmax, ymin, ymax)                = xylims2d()
     (miniC, maxiC, cmapNameC, kwargs)       = filterKwargsMiniMaxiCmapName(mini, maxi, cmapName, **kwargs)
 
-
-    for t in xrange(Pmax+2):
-
-        figure     = plt.figure()
-        plt.clf()
-
-        (gs, axes, axesInit, axesFinal) = makeAxesGridTriplot(plt, len(outputDirList), order, extendDirection, extendDirectionTriplot)
-
-        for (f, finit, ffinal, label, ax, axInit, axFinal) in zip(fs, finits, ffinals, labelList, axes, axesInit, axesFinal):
-
-            plotMatrix(ax,
-                       f[:,:,t],
-                       plotter=plotter,
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       cmapName=cmapNameC,
-                       vmin=miniC,
-                       vmax=maxiC,
-                       **kwargs)
-            plotMatrix(axInit,
-                       finit,
-                       plotter=plotter,
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       cmapName=cmapNameC,
-                       vmin=miniC,
-                       vmax=maxiC,
-                       **kwargs)
-            plotMatrix(axFinal,
-                       ffinal,
-                       plotter=plotter,
-                       xmin=xmin,
-                       xmax=xmax,
-                       ymin=ymin,
-                       ymax=ymax,
-                       cmapName=cmapNameC,
-                       vmin=miniC,
-                       vmax=maxiC,
-                       **kwargs)
-
-            adaptAxesExtent(ax, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
-            addTitleLabelsGrid(ax, title=label, xLabel=xLabel, yLabel=yLabel, grid=False)
-
-            adaptAxesExtent(axInit, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
-            addTitleLabelsGrid(axInit, title=label+', init', xLabel=xLabel, yLabel=yLabel, grid=False)
-
-            adaptAxesExtent(axFinal, xmin, xmax, ymin, ymax, extendX, extendY, nbrXTicks, nbrYTicks, xTicksDecimals, yTicksDecimals, EPSILON)
-            addTitleLabelsGrid(axFinal, title=label+', final', xLabel=xLabel, yLabel=yLabel, grid=False)
-
-        gs.tight_layout(figure, rect=figureRect(colorBar, timeTextPBar))
-
-        if colorBar:
-            addColorBar(plt, timeTextPBar, cmapNameC, miniC, maxiC, nbrCTicks, cticksDecimals, cLabel)
-
-        if timeTextPBar:
-            addTimeTextPBar(plt, t, Pmax+1)
-
-        figName = figDir + prefixFigName + fileNameSuffix(t,Pmax+2)
-        saveFig(plt, figName, extensionsList)
-        plt.close()
+    params = { 'figDir'                 : figDir,
+               'prefixFigName'          : prefixFigName,
+               'labelList'              : labelList,
+               'plotter'                : plotter,
+               'kwargs'                 : kwargs,
+               'colorBar'               : colorBar,
+               'cmapNameC'              : cmapNameC,
+               'miniC'                  : miniC,
+               'maxiC'                  : maxiC,
+               'timeTextPBar'           : timeTextPBar,
+               'xLabel'                 : xLabel,
+               'yLabel'                 : yLabel,
+               'cLabel'                 : cLabel,
+               'xmin'                   : xmin,
+               'xmax'                   : xmax,
+               'ymin'                   : ymin,
+               'ymax'                   : ymax,
+               'extendX'                : extendX,
+               'extendY'                : extendY,
+               'nbrXTicks'              : nbrXTicks,
+               'nbrYTicks'              : nbrYTicks,
+               'nbrCTicks'              : nbrCTicks,
+               'xTicksDecimals'         : xTicksDecimals,
+               'yTicksDecimals'         : yTicksDecimals,
+               'cticksDecimals'         : cticksDecimals,
+               'order'                  : order,
+               'extendDirection'        : extendDirection,
+               'extendDirectionTriplot' : extendDirectionTriplot,
+               'extensionsList'         : extensionsList,
+               'EPSILON'                : EPSILON }
+
+    def makeRenderer(fileNames):
+        return FinalStateFrameTriplotter(fileNames, len(outputDirList), Pmax, params)
+
+    renderFrames(makeRenderer, fs+finits+ffinals, Pmax+2, nProcesses)
 
 #__________________________________________________
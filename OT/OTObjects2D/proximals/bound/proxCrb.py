@@ -29,14 +29,14 @@ class ProxCrb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.Boundaries(M,N,P)
+            kernel = grid.Boundaries(M,N,P, domain=domain)
 
         self.massDefault = kernel.massDefault()
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
     def __repr__(self):
         return ( 'Projector on the boundary contion constrain space with reservoir.' )
@@ -74,7 +74,7 @@ class ProxCrb( Projector ):
     def test(self,nTest,overwrite=True):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field,overwrite)
 
             diff = field.boundaries() - self.kernel
@@ -95,7 +95,7 @@ class ProxCrb( Projector ):
     def timing(self,nTiming,overwrite=True):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field,overwrite)
             t += tm.time() - time_start
@@ -22,20 +22,30 @@
 #   * P
 #   * dynamics
 #   * boundaries
+#   * mask
 #
 
+import numpy as np
+
 from ..grid import grid
+from ..OTObject import physicalDomainForConfig
 
 from proximalJ import ProxJ
+from proximalJ import ProxJMasked
 
 from div.proxCdiv import ProxCdiv
 from div.proxCdivb import ProxCdivb
 from div.proxCdivtb import ProxCdivtb
+from div.proxCdivp import ProxCdivp
+from div.proxCdivMasked import ProxCdivMasked
+from div.proxCdivSource import ProxCdivbSource
+from div.proxCdivSource import ProxCdivtbSource
 
 from sc.proxCsc import ProxCsc
 from sc.proxCscb import ProxCscb
 from sc.proxCsctb import ProxCsctb
 from sc.proxCscrb import ProxCscrb
+from sc.proxCscp import ProxCscp
 
 from bound.proxCb import ProxCb
 from bound.proxCtb import ProxCtb
@@ -43,61 +53,111 @@ from bound.proxCrb import ProxCrb
 
 def proximalForConfig(config):
 
+    domain = physicalDomainForConfig(config)
+
     if config.dynamics == 0 or config.dynamics == 1:
         # normal dynamics
         proxCdiv = ProxCdivb( config.M , config.N , config.P ,
-                              grid.DivergenceBoundaries( config.M , config.N , config.P , boundaries=config.boundaries) )
+                              grid.DivergenceBoundaries( config.M , config.N , config.P , boundaries=config.boundaries , domain=domain) , domain=domain )
 
         proxCsc  = ProxCscb( config.M , config.N , config.P ,
-                             grid.CenteredFieldBoundaries( config.M , config.N , config.P , boundaries=config.boundaries) )
+                             grid.CenteredFieldBoundaries( config.M , config.N , config.P , boundaries=config.boundaries , domain=domain) , domain=domain )
 
-        proxJ    = ProxJ( config.M , config.N , config.P )
+        proxJ    = ProxJ( config.M , config.N , config.P , domain=domain )
 
-        proxCb   = ProxCb( config.M , config.N, config.P, config.boundaries )
+        proxCb   = ProxCb( config.M , config.N, config.P, config.boundaries, domain=domain )
 
     elif config.dynamics == 2:
         # no contrain for m
         proxCdiv = ProxCdivtb( config.M , config.N , config.P ,
                                grid.DivergenceTemporalBoundaries( config.M , config.N , config.P , 
-                                                                  temporalBoundaries=config.boundaries.temporalBoundaries ) )
+                                                                  temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) , domain=domain )
         
         proxCsc  = ProxCsctb( config.M , config.N , config.P ,
                               grid.CenteredFieldTemporalBoundaries( config.M , config.N , config.P , 
-                                                                    temporalBoundaries=config.boundaries.temporalBoundaries ) )
+                                                                    temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) , domain=domain )
 
-        proxJ    = ProxJ( config.M , config.N , config.P )
+        proxJ    = ProxJ( config.M , config.N , config.P , domain=domain )
 
         proxCb   = ProxCtb( config.M , config.N , config.P ,
-                            config.boundaries.temporalBoundaries )
+                            config.boundaries.temporalBoundaries , domain=domain )
 
     elif config.dynamics == 3:
         # reservoir
         # for Adr
-        proxCdiv = ProxCdiv( config.M , config.N , config.P )
+        proxCdiv = ProxCdiv( config.M , config.N , config.P , domain=domain )
 
         proxCsc  = ProxCscrb( config.M , config.N , config.P ,
-                              grid.CenteredFieldBoundaries( config.M , config.N ,config.P , boundaries=config.boundaries ) )
+                              grid.CenteredFieldBoundaries( config.M , config.N ,config.P , boundaries=config.boundaries , domain=domain ) , domain=domain )
 
-        proxJ    = ProxJ( config.M , config.N , config.P )
+        proxJ    = ProxJ( config.M , config.N , config.P , domain=domain )
 
         proxCb   = ProxCrb( config.M , config.N , config.P ,
-                            config.boundaries )
+                            config.boundaries , domain=domain )
 
     elif config.dynamics == 4:
         # reservoir
         # for Adr 3
 
-        proxCdiv = ProxCdiv( config.M , config.N , config.P )
+        proxCdiv = ProxCdiv( config.M , config.N , config.P , domain=domain )
 
-        proxCsc  = ProxCsc( config.M , config.N, config.P )
+        proxCsc  = ProxCsc( config.M , config.N, config.P, domain=domain )
 
-        proxJ    = ProxJ( config.M , config.N , config.P )
+        proxJ    = ProxJ( config.M , config.N , config.P , domain=domain )
 
         proxCb   = ProxCrb( config.M , config.N , config.P ,
-                            config.boundaries )
+                            config.boundaries , domain=domain )
+
+    elif config.dynamics == 5:
+        # periodic in space
+        proxCdiv = ProxCdivp( config.M , config.N , config.P ,
+                              grid.DivergenceTemporalBoundaries( config.M , config.N , config.P ,
+                                                                 temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) , domain=domain )
+
+        proxCsc  = ProxCscp( config.M , config.N , config.P ,
+                             grid.CenteredFieldTemporalBoundaries( config.M , config.N , config.P ,
+                                                                   temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) , domain=domain )
+
+        proxJ    = ProxJ( config.M , config.N , config.P , domain=domain )
+
+        proxCb   = ProxCtb( config.M , config.N , config.P ,
+                            config.boundaries.temporalBoundaries , domain=domain )
+
+    if getattr(config, 'mask', None) is not None:
+        # inactive cells
+        proxCdiv = ProxCdivMasked( config.M , config.N , config.P ,
+                                   proxCdiv , config.mask ,
+                                   config.maskCGTolerance , config.maskCGMaxIter , domain=domain )
+
+        proxJ    = ProxJMasked( config.M , config.N , config.P , config.mask , domain=domain )
 
     return proxCdiv,proxCsc,proxJ,proxCb
 
+def sourceProximalForConfig(config):
+    # projectors for the unbalanced (wfr) dynamics, i.e. with a source term
+
+    domain = physicalDomainForConfig(config)
+
+    if config.dynamics == 0 or config.dynamics == 1:
+        proxCdiv = ProxCdivbSource( config.M , config.N , config.P ,
+                                    grid.DivergenceBoundaries( config.M , config.N , config.P , boundaries=config.boundaries , domain=domain) ,
+                                    config.wfrDelta , domain=domain )
+
+        proxCsc  = ProxCscb( config.M , config.N , config.P ,
+                             grid.CenteredFieldBoundaries( config.M , config.N , config.P , boundaries=config.boundaries , domain=domain) , domain=domain )
+
+    else:
+        proxCdiv = ProxCdivtbSource( config.M , config.N , config.P ,
+                                     grid.DivergenceTemporalBoundaries( config.M , config.N , config.P ,
+                                                                        temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) ,
+                                     config.wfrDelta , domain=domain )
+
+        proxCsc  = ProxCsctb( config.M , config.N , config.P ,
+                              grid.CenteredFieldTemporalBoundaries( config.M , config.N , config.P ,
+                                                                    temporalBoundaries=config.boundaries.temporalBoundaries , domain=domain ) , domain=domain )
+
+    return proxCdiv,proxCsc
+
 def testProximals(M, N, P, nTest):
 
     maxError = 0.
@@ -176,6 +236,63 @@ def testProximals(M, N, P, nTest):
 
     maxError = max( max( maxError , e1 ) , e2 )
 
+    print('__________________________________________________')
+    print('Testing ProxCdivp...')
+    kernel = grid.DivergenceTemporalBoundaries.random(M,N,P)
+    # removes the mass default, which is not in the range of A
+    kernel.divergence.div -= ( kernel.divergence.sum() -
+                               kernel.scalings()[2] * ( kernel.temporalBoundaries.bt1.sum() -
+                                                        kernel.temporalBoundaries.bt0.sum() ) ) / kernel.divergence.div.size
+    prox   = ProxCdivp(M,N,P,kernel)
+    e1 = prox.testInverse(nTest)
+    e2 = prox.test(nTest)
+    print('mean error (inverse) = '+str(e1))
+    print('mean error (kernel)  = '+str(e2))
+    print('timing               : '+str(prox.timing(nTest)))
+
+    maxError = max( max( maxError , e1 ) , e2 )
+
+    print('__________________________________________________')
+    print('Testing ProxCdivMasked...')
+    mask   = np.ones(shape=(M+1,N+1), dtype=bool)
+    mask[M/4:M/2+1,N/4:N/2+1] = False
+    # no mass under the mask and no mass default, i.e. a kernel in the range of A.S
+    kernel = grid.DivergenceBoundaries.random(M,N,P)
+    kernel.divergence.div                    *= 0.
+    kernel.boundaries.spatialBoundaries      *= 0.
+    kernel.boundaries.temporalBoundaries.bt0 *= mask
+    kernel.boundaries.temporalBoundaries.bt1 *= mask * ( kernel.boundaries.temporalBoundaries.bt0.sum() /
+                                                         ( kernel.boundaries.temporalBoundaries.bt1 * mask ).sum() )
+    # random fields give no useful first guess, hence more iterations are allowed than in the algorithms
+    prox   = ProxCdivMasked(M,N,P,ProxCdivb(M,N,P,kernel),mask,maxIter=1000)
+    e1 = prox.testInverse(nTest)
+    e2 = prox.test(nTest)
+    print('mean error (inverse) = '+str(e1))
+    print('mean error (kernel)  = '+str(e2))
+    print('timing               : '+str(prox.timing(nTest)))
+
+    maxError = max( max( maxError , e1 ) , e2 )
+
+    print('__________________________________________________')
+    print('Testing ProxCdivbSource...')
+    kernel = grid.DivergenceBoundaries.random(M,N,P)
+    prox   = ProxCdivbSource(M,N,P,kernel,0.5)
+    e = prox.test(nTest)
+    print('mean error = '+str(e))
+    print('timing     : '+str(prox.timing(nTest)))
+
+    maxError = max( maxError , e )
+
+    print('__________________________________________________')
+    print('Testing ProxCdivtbSource...')
+    kernel = grid.DivergenceTemporalBoundaries.random(M,N,P)
+    prox   = ProxCdivtbSource(M,N,P,kernel,0.5)
+    e = prox.test(nTest)
+    print('mean error = '+str(e))
+    print('timing     : '+str(prox.timing(nTest)))
+
+    maxError = max( maxError , e )
+
     print('__________________________________________________')
     print('Testing ProxCsc...')
     kernel = grid.CenteredField.random(M,N,P)
@@ -228,6 +345,18 @@ def testProximals(M, N, P, nTest):
 
     maxError = max( max( maxError , e1 ) , e2 )
 
+    print('__________________________________________________')
+    print('Testing ProxCscp...')
+    kernel = grid.CenteredFieldTemporalBoundaries.random(M,N,P)
+    prox   = ProxCscp(M,N,P,kernel)
+    e1 = prox.testInverse(nTest)
+    e2 = prox.test(nTest)
+    print('mean error (inverse) = '+str(e1))
+    print('mean error (kernel)  = '+str(e2))
+    print('timing               : '+str(prox.timing(nTest)))
+
+    maxError = max( max( maxError , e1 ) , e2 )
+
     print('__________________________________________________')
     print('Finished testing proximal operators')
     print('max error : '+str(maxError))
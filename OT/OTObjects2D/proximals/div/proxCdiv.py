@@ -31,22 +31,23 @@ class ProxCdiv( Projector ):
     
     def __init__( self ,
                   M, N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.Divergence(M,N,P)
+            kernel = grid.Divergence(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
         x = np.arange(M+1)
         y = np.arange(N+1)
         t = np.arange(P+1)
 
         X,Y,T = np.meshgrid(x,y,t,indexing='ij')
-        self.eigvalues = ( 2. * (M**2) * ( 1. - np.cos( np.pi * ( X + 1. ) / ( M + 2. ) ) ) +
-                           2. * (N**2) * ( 1. - np.cos( np.pi * ( Y + 1. ) / ( N + 2. ) ) ) +
-                           2. * (P**2) * ( 1. - np.cos( np.pi * ( T + 1. ) / ( P + 2. ) ) ) )
+        (sx, sy, st) = self.scalings()
+        self.eigvalues = ( 2. * (sx**2) * ( 1. - np.cos( np.pi * ( X + 1. ) / ( M + 2. ) ) ) +
+                           2. * (sy**2) * ( 1. - np.cos( np.pi * ( Y + 1. ) / ( N + 2. ) ) ) +
+                           2. * (st**2) * ( 1. - np.cos( np.pi * ( T + 1. ) / ( P + 2. ) ) ) ).astype(self.dtype)
 
 
     def __repr__(self):
@@ -78,7 +79,7 @@ class ProxCdiv( Projector ):
         e = 0.
 
         for i in xrange(nTest):
-            div1 = grid.Divergence.random(self.M, self.N, self.P)
+            div1 = grid.Divergence.random(self.M, self.N, self.P, domain=self.domain)
 
             div2 = div1.copy()
             div2 = self.inverseATA(div2)
@@ -95,7 +96,7 @@ class ProxCdiv( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -103,7 +104,7 @@ class ProxCdiv( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
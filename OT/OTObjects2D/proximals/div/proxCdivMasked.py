@@ -0,0 +1,256 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+######################
+# Class ProxCdivMasked
+######################
+#
+# Projector on the divergence constrain of a masked domain
+#
+# The momentum is set to 0 on the inactive faces (operator S) and the
+# divergence constrain of the underlying projector (ProxCdiv, ProxCdivb or
+# ProxCdivtb) is enforced with the active faces only, i.e. A is replaced by A.S
+#
+# A.S.TA is not diagonalized by the DST/DCT anymore, hence it is inverted by
+# preconditioned conjugate gradients, the preconditioner being the inverseATA
+# of the underlying projector. The previous solution is used as first guess.
+#
+# A.S.TA is singular : mass is conserved in each connected component of the
+# active nodes that has no free boundary face, each inactive node being its own
+# component, and the spatial boundaries of the inactive faces are not used.
+# As with correctMassDefault, the mass default of each such component is removed
+# from the right-hand side and from the preconditioned residuals, so that the
+# conjugate gradients stay in the range of A.S.TA.
+#
+
+import time as tm
+import numpy as np
+
+from scipy.ndimage           import label
+
+from ..projector             import Projector
+from ...grid                 import grid
+from ...boundaries.mask      import faceMasks
+
+#__________________________________________________
+
+def rangeArrays(vector):
+    # arrays of an element of the range of A
+    if isinstance(vector, grid.DivergenceBoundaries):
+        return ( [ vector.divergence.div ,
+                   vector.boundaries.temporalBoundaries.bt0 ,
+                   vector.boundaries.temporalBoundaries.bt1 ,
+                   vector.boundaries.spatialBoundaries.bx0 ,
+                   vector.boundaries.spatialBoundaries.bx1 ,
+                   vector.boundaries.spatialBoundaries.by0 ,
+                   vector.boundaries.spatialBoundaries.by1 ] )
+    elif isinstance(vector, grid.DivergenceTemporalBoundaries):
+        return ( [ vector.divergence.div ,
+                   vector.temporalBoundaries.bt0 ,
+                   vector.temporalBoundaries.bt1 ] )
+    else:
+        return [ vector.div ]
+
+def dot(vector1, vector2):
+    return np.sum( [ ( a * b ).sum() for ( a , b ) in zip( rangeArrays(vector1) , rangeArrays(vector2) ) ] )
+
+#__________________________________________________
+
+def componentLabels(mask):
+    # labels 0 ... n-1 of the connected components of the active nodes, each inactive node being its own component
+    (labels, nComponents) = label(mask)
+    inactive              = np.nonzero(np.logical_not(mask))
+    labels[inactive]      = nComponents + 1 + np.arange(inactive[0].size)
+    return ( labels - 1 , nComponents + inactive[0].size )
+
+#__________________________________________________
+
+class ProxCdivMasked( Projector ):
+    '''
+    Projector on the divergence constrain of a masked domain
+    '''
+
+    def __init__( self ,
+                  M , N , P ,
+                  projector , mask ,
+                  tolerance=1.e-8 , maxIter=100 , domain=None ):
+        Projector.__init__( self ,
+                            M , N , P ,
+                            projector.kernel , domain=domain )
+
+        self.projector      = projector
+        self.mask           = mask
+        (maskX, maskY)      = faceMasks(mask)
+        self.maskX          = maskX[:,:,np.newaxis]
+        self.maskY          = maskY[:,:,np.newaxis]
+        self.tolerance      = tolerance
+        self.maxIter        = maxIter
+        self.firstGuess     = None
+        self.nIterations    = 0
+
+        (self.labels, self.nComponents) = componentLabels(mask)
+        self.conserved      = self.conservedComponents()
+
+    def __repr__(self):
+        return ( 'Projector on the divergence constrain space of a masked domain.' )
+
+    def restrict(self, field):
+        field.mx *= self.maskX
+        field.my *= self.maskY
+        return field
+
+    def A(self, field):
+        return self.projector.A(field)
+
+    def TA(self, vector):
+        return self.restrict( self.projector.TA(vector) )
+
+    def conservedComponents(self):
+        #
+        # the mass of a component is conserved unless it has a free boundary face :
+        # the temporal faces for ProxCdiv, the active spatial boundary faces for ProxCdivtb
+        #
+        if isinstance(self.kernel, grid.DivergenceBoundaries):
+            return np.ones(self.nComponents, dtype=bool)
+        elif isinstance(self.kernel, grid.DivergenceTemporalBoundaries):
+            free = np.zeros(self.nComponents, dtype=bool)
+            for (labels, mask) in [ ( self.labels[0,:]  , self.mask[0,:]  ) ,
+                                    ( self.labels[-1,:] , self.mask[-1,:] ) ,
+                                    ( self.labels[:,0]  , self.mask[:,0]  ) ,
+                                    ( self.labels[:,-1] , self.mask[:,-1] ) ]:
+                free[labels[mask]] = True
+            return np.logical_not(free)
+        else:
+            return np.zeros(self.nComponents, dtype=bool)
+
+    def projectRange(self, vector):
+        #
+        # removes the mass default of each conserved component, i.e. the orthogonal
+        # projection on the range of A.S.TA, in place
+        #
+        (sx, sy, st)  = vector.scalings()
+        arrays        = rangeArrays(vector)
+        weights       = np.zeros(shape=self.labels.shape)
+        masses        = arrays[0].sum(axis=2)
+        weights      += arrays[0].shape[2]
+
+        if len(arrays) > 1:
+            masses   += st * ( arrays[1] - arrays[2] )
+            weights  += 2. * st * st
+
+        if len(arrays) > 3:
+            # the spatial boundaries of the inactive faces are not used
+            edges     = [ ( (0,slice(None))  , self.maskX[0,:,0]  ,  sx ) ,
+                          ( (-1,slice(None)) , self.maskX[-1,:,0] , -sx ) ,
+                          ( (slice(None),0)  , self.maskY[:,0,0]  ,  sy ) ,
+                          ( (slice(None),-1) , self.maskY[:,-1,0] , -sy ) ]
+            for ( (index, active, s) , b ) in zip( edges , arrays[3:] ):
+                b                *= active[:,np.newaxis]
+                masses[index]    += s * b.sum(axis=1)
+                weights[index]   += s * s * b.shape[1] * active
+
+        flatLabels    = self.labels.ravel()
+        dm            = ( np.bincount(flatLabels, masses.ravel(), self.nComponents) /
+                          np.bincount(flatLabels, weights.ravel(), self.nComponents) )
+        dm           *= self.conserved
+        dm            = dm[self.labels]
+
+        arrays[0]    -= dm[:,:,np.newaxis]
+
+        if len(arrays) > 1:
+            arrays[1] -= st * dm
+            arrays[2] += st * dm
+
+        if len(arrays) > 3:
+            for ( (index, active, s) , b ) in zip( edges , arrays[3:] ):
+                b     -= s * ( dm[index] * active )[:,np.newaxis]
+
+        return vector
+
+    def preconditioner(self, vector):
+        return self.projectRange( self.projector.inverseATA( vector.copy() ) )
+
+    def inverseATA(self, vector):
+        #
+        # solves A.S.TA x = vector by preconditioned conjugate gradients,
+        # vector being first projected on the range of A.S.TA
+        #
+        vector = self.projectRange( vector.copy() )
+        norm0  = np.sqrt( dot( vector , vector ) )
+        if norm0 == 0.:
+            return 0. * vector
+
+        if self.firstGuess is None:
+            x = 0. * vector
+            r = vector.copy()
+        else:
+            x = self.firstGuess.copy()
+            r = vector - self.ATA(x)
+
+        z  = self.preconditioner(r)
+        p  = z.copy()
+        rz = dot( r , z )
+
+        self.nIterations = 0
+        while ( self.nIterations < self.maxIter and
+                np.sqrt( dot( r , r ) ) > self.tolerance * norm0 ):
+            q      = self.ATA(p)
+            alpha  = rz / dot( p , q )
+            x     += alpha * p
+            r     -= alpha * q
+
+            z      = self.preconditioner(r)
+            rzNew  = dot( r , z )
+            p      = z + ( rzNew / rz ) * p
+            rz     = rzNew
+
+            self.nIterations += 1
+
+        if self.nIterations == self.maxIter:
+            print( 'WARNING : masked projector, conjugate gradients stopped after ' + str(self.maxIter) +
+                   ' iterations with relative residual ' + str( np.sqrt( dot( r , r ) ) / norm0 ) )
+
+        self.firstGuess = x.copy()
+        return x
+
+    def __call__(self, field):
+        return Projector.__call__( self , self.restrict( field.copy() ) )
+
+    def testInverse(self,nTest):
+        e = 0.
+        for i in xrange(nTest):
+            vector1 = self.projectRange( self.kernel.random(self.M, self.N, self.P, domain=self.domain) )
+            vector2 = self.ATA( self.inverseATA( vector1.copy() ) )
+            e += ( vector1 - vector2 ).LInftyNorm()
+        return e/nTest
+
+    def test(self,nTest):
+        # the constrain that is enforced is the kernel projected on the range of A.S.TA
+        kernel = self.projectRange( self.kernel.copy() )
+        e = 0.
+        for i in xrange(nTest):
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            field = self(field)
+            e += ( self.A(field) - kernel ).LInftyNorm()
+            e += np.abs( field.mx * ( 1 - self.maskX ) ).max()
+            e += np.abs( field.my * ( 1 - self.maskY ) ).max()
+        return e/nTest
+
+    def timing(self,nTiming):
+        t = 0.
+        for i in xrange(nTiming):
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            time_start = tm.time()
+            field = self(field)
+            t += tm.time() - time_start
+        return t
@@ -0,0 +1,157 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+##############################################
+# Classes ProxCdivbSource and ProxCdivtbSource
+##############################################
+#
+# Projectors on the divergence constrain with a source term
+#   d_t f + div(m) - s / delta = kernel
+# where s is the scaled source (see grid/sourceGrid.py)
+#
+# The source only adds 1 / delta^2 to the eigenvalues of the laplacian,
+# hence the projections are computed with the same DCT/DST as ProxCdivb
+# and ProxCdivtb. The laplacian is not singular anymore : mass does not
+# have to be conserved.
+#
+
+import time as tm
+import numpy as np
+import scipy.fftpack as fft
+
+from proxCdivb  import ProxCdivb
+from proxCdivtb import ProxCdivtb
+from ...grid    import grid
+
+#__________________________________________________
+
+class ProxCdivbSource( ProxCdivb ):
+    '''
+    Projector on the divergence and boundary conditions constrain with a source term
+    '''
+
+    def __init__( self ,
+                  M, N , P ,
+                  kernel=None , delta=1. , domain=None ):
+        ProxCdivb.__init__( self ,
+                            M , N , P ,
+                            kernel , domain=domain )
+        self.delta          = delta
+        self.eigvalues     += 1. / delta**2
+        self.eigvalues[0,0,0] = 1. / delta**2
+
+    def __repr__(self):
+        return ( 'Projector on the divergence and boundary conditions constrain space with a source term.' )
+
+    def A(self, field, source):
+        divBound = field.divergenceBoundaries()
+        divBound.divergence.div -= source / self.delta
+        return divBound
+
+    def TA(self, divBound):
+        return ( divBound.TdivergenceBoundaries() , - divBound.divergence.div / self.delta )
+
+    def inverseLaplacian(self, div):
+        # solves ( -Laplacian + 1 / delta^2 ) u = div
+        div = 0.5*fft.dct(div, axis=0)
+        div = 0.5*fft.dct(div, axis=1)
+        div = 0.5*fft.dct(div, axis=2)
+
+        div = div / self.eigvalues
+
+        div = fft.idct(div, axis=0) / ( self.M + 1. )
+        div = fft.idct(div, axis=1) / ( self.N + 1. )
+        div = fft.idct(div, axis=2) / ( self.P + 1. )
+
+        return div
+
+    def __call__(self, field, source):
+        Avector  = self.A( field , source )
+        Avector -= self.kernel
+        Avector  = self.inverseATA( Avector )
+        (TAfield, TAsource) = self.TA( Avector )
+        return ( field - TAfield , source - TAsource )
+
+    def test(self,nTest):
+        e = 0.
+        for i in xrange(nTest):
+            field  = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            source = np.random.rand(self.M+1, self.N+1, self.P+1)
+            (field, source) = self(field, source)
+            e += ( self.A(field, source) - self.kernel ).LInftyNorm()
+        return e/nTest
+
+    def timing(self,nTiming):
+        t = 0.
+        for i in xrange(nTiming):
+            field  = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            source = np.random.rand(self.M+1, self.N+1, self.P+1)
+            time_start = tm.time()
+            (field, source) = self(field, source)
+            t += tm.time() - time_start
+        return t
+
+#__________________________________________________
+
+class ProxCdivtbSource( ProxCdivtb ):
+    '''
+    Projector on the divergence and temporal boundary conditions constrain with a source term
+    '''
+
+    def __init__( self ,
+                  M, N , P ,
+                  kernel=None , delta=1. , domain=None ):
+        ProxCdivtb.__init__( self ,
+                             M , N , P ,
+                             kernel , domain=domain )
+        self.delta      = delta
+        self.eigvalues += 1. / delta**2
+
+    def __repr__(self):
+        return ( 'Projector on the divergence and temporal boundary conditions constrain space with a source term.' )
+
+    def A(self, field, source):
+        divTempBound = field.divergenceTemporalBoundaries()
+        divTempBound.divergence.div -= source / self.delta
+        return divTempBound
+
+    def TA(self, divTempBound):
+        return ( divTempBound.TdivergenceTemporalBoundaries() , - divTempBound.divergence.div / self.delta )
+
+    def __call__(self, field, source):
+        Avector  = self.A( field , source )
+        Avector -= self.kernel
+        Avector  = self.inverseATA( Avector )
+        (TAfield, TAsource) = self.TA( Avector )
+        return ( field - TAfield , source - TAsource )
+
+    def test(self,nTest):
+        e = 0.
+        for i in xrange(nTest):
+            field  = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            source = np.random.rand(self.M+1, self.N+1, self.P+1)
+            (field, source) = self(field, source)
+            e += ( self.A(field, source) - self.kernel ).LInftyNorm()
+        return e/nTest
+
+    def timing(self,nTiming):
+        t = 0.
+        for i in xrange(nTiming):
+            field  = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
+            source = np.random.rand(self.M+1, self.N+1, self.P+1)
+            time_start = tm.time()
+            (field, source) = self(field, source)
+            t += tm.time() - time_start
+        return t
+
+#__________________________________________________
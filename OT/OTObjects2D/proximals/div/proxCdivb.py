@@ -31,22 +31,23 @@ class ProxCdivb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.DivergenceBoundaries(M,N,P)
+            kernel = grid.DivergenceBoundaries(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
         x = np.arange(M+1)
         y = np.arange(N+1)
         t = np.arange(P+1)
 
         X,Y,T = np.meshgrid(x,y,t,indexing='ij')
-        self.eigvalues = ( 2. * (M**2) * ( 1. - np.cos( np.pi * X / ( M + 1. ) ) ) +
-                           2. * (N**2) * ( 1. - np.cos( np.pi * Y / ( N + 1. ) ) ) +
-                           2. * (P**2) * ( 1. - np.cos( np.pi * T / ( P + 1. ) ) ) )
+        (sx, sy, st) = self.scalings()
+        self.eigvalues = ( 2. * (sx**2) * ( 1. - np.cos( np.pi * X / ( M + 1. ) ) ) +
+                           2. * (sy**2) * ( 1. - np.cos( np.pi * Y / ( N + 1. ) ) ) +
+                           2. * (st**2) * ( 1. - np.cos( np.pi * T / ( P + 1. ) ) ) ).astype(self.dtype)
 
         self.eigvalues[0,0,0] = 1.
 
@@ -59,10 +60,9 @@ class ProxCdivb( Projector ):
     def TA(self, div):
         return div.TdivergenceBoundaries()
 
-    def inverseATA(self, divBound):
-        divBound.applyGaussForward()
-
-        div = divBound.divergence.div
+    def inverseLaplacian(self, div):
+        # solves the Neumann problem -Laplacian(u) = div with zero-mean u
+        # on the (M+1)x(N+1)x(P+1) grid
         div = 0.5*fft.dct(div, axis=0)
         div = 0.5*fft.dct(div, axis=1)
         div = 0.5*fft.dct(div, axis=2)
@@ -74,7 +74,11 @@ class ProxCdivb( Projector ):
         div = fft.idct(div, axis=1) / ( self.N + 1. )
         div = fft.idct(div, axis=2) / ( self.P + 1. )
 
-        divBound.divergence.div = div
+        return div
+
+    def inverseATA(self, divBound):
+        divBound.applyGaussForward()
+        divBound.divergence.div = self.inverseLaplacian(divBound.divergence.div)
         divBound.applyGaussBackward()
 
         return divBound
@@ -84,7 +88,7 @@ class ProxCdivb( Projector ):
         e = 0.
 
         for i in xrange(nTest):
-            divB1 = grid.DivergenceBoundaries.random(self.M, self.N, self.P)
+            divB1 = grid.DivergenceBoundaries.random(self.M, self.N, self.P, domain=self.domain)
             divB1.correctMassDefault(EPS)
 
             divB2 = divB1.copy()
@@ -105,7 +109,7 @@ class ProxCdivb( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
 
             db = field.divergenceBoundaries()
             db2 = self.inverseATA(db)
@@ -118,7 +122,7 @@ class ProxCdivb( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
@@ -0,0 +1,100 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+#################
+# Class ProxCdivp
+#################
+#
+# Projector on the divergence and temporal boundary conditions constrain
+# for the dynamics periodic in space (see grid/periodic.py)
+#
+# The laplacian is circulant in x and y, hence it is diagonalized by real
+# FFTs in space (no padding) and by a DCT in time, as in ProxCdivtb
+#
+
+import numpy as np
+import scipy.fftpack as fft
+
+from proxCdivtb      import ProxCdivtb
+from ...grid         import grid
+from ...grid.periodic import wrapStaggeredField
+from ...grid.periodic import foldStaggeredField
+
+class ProxCdivp( ProxCdivtb ):
+    '''
+    Projector on the divergence and temporal boundary conditions constrain, periodic in space
+    '''
+
+    def __init__( self ,
+                  M, N , P ,
+                  kernel=None , domain=None ):
+        ProxCdivtb.__init__( self ,
+                             M , N , P ,
+                             kernel , domain=domain )
+
+        x = np.arange((M+1)/2+1)
+        y = np.arange(N+1)
+        t = np.arange(P+1)
+
+        X,Y,T = np.meshgrid(x,y,t,indexing='ij')
+        (sx, sy, st) = self.scalings()
+
+        self.eigvalues = ( 2. * (sx**2) * ( 1. - np.cos( 2. * np.pi * X / ( M + 1. ) ) ) +
+                           2. * (sy**2) * ( 1. - np.cos( 2. * np.pi * Y / ( N + 1. ) ) ) +
+                           2. * (st**2) * ( 1. - np.cos( np.pi * T / ( P + 1. ) ) ) ).astype(self.dtype)
+
+        self.eigvalues[0,0,0] = 1.
+
+    def __repr__(self):
+        return ( 'Projector on the divergence and temporal boundary conditions constrain space, periodic in space.' )
+
+    def TA(self, div):
+        return foldStaggeredField( div.TdivergenceTemporalBoundaries() )
+
+    def inverseATA(self, divTempBound):
+        divTempBound.applyGaussForward()
+
+        div = divTempBound.divergence.div
+        div = 0.5*fft.dct(div, axis=2)
+        div = np.fft.rfft2(div, axes=(1,0))
+
+        div[0,0,0] = 0.0
+        div = div / self.eigvalues
+
+        div = np.fft.irfft2(div, s=(self.N+1,self.M+1), axes=(1,0))
+        div = fft.idct(div, axis=2) / ( self.P + 1. )
+
+        # np.fft always works in double precision
+        divTempBound.divergence.div = div.astype(self.dtype)
+        divTempBound.applyGaussBackward()
+
+        return divTempBound
+
+    def __call__(self, field):
+        return ProxCdivtb.__call__( self , wrapStaggeredField( field.copy() ) )
+
+    def testInverse(self,nTest):
+        e = 0.
+
+        for i in xrange(nTest):
+            div1 = grid.DivergenceTemporalBoundaries.random(self.M, self.N, self.P, domain=self.domain)
+            # removes the mass default, which is not in the range of A
+            div1.divergence.div -= ( div1.divergence.sum() -
+                                     self.scalings()[2] * ( div1.temporalBoundaries.bt1.sum() -
+                                                            div1.temporalBoundaries.bt0.sum() ) ) / div1.divergence.div.size
+
+            div2 = div1.copy()
+            div2 = self.inverseATA(div2)
+            div2 = self.ATA(div2)
+            e += ( div1 - div2 ).LInftyNorm()
+
+        return e/nTest
@@ -31,23 +31,24 @@ class ProxCdivtb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.DivergenceTemporalBoundaries(M,N,P)
+            kernel = grid.DivergenceTemporalBoundaries(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
         x = np.arange(M+1)
         y = np.arange(N+1)
         t = np.arange(P+1)
 
         X,Y,T = np.meshgrid(x,y,t,indexing='ij')
+        (sx, sy, st) = self.scalings()
 
-        self.eigvalues = ( 2. * (M**2) * ( 1. - np.cos( np.pi * ( X + 1. ) / ( M + 2. ) ) ) +
-                           2. * (N**2) * ( 1. - np.cos( np.pi * ( Y + 1. ) / ( N + 2. ) ) ) +
-                           2. * (P**2) * ( 1. - np.cos( np.pi *   T        / ( P + 1. ) ) ) )
+        self.eigvalues = ( 2. * (sx**2) * ( 1. - np.cos( np.pi * ( X + 1. ) / ( M + 2. ) ) ) +
+                           2. * (sy**2) * ( 1. - np.cos( np.pi * ( Y + 1. ) / ( N + 2. ) ) ) +
+                           2. * (st**2) * ( 1. - np.cos( np.pi *   T        / ( P + 1. ) ) ) ).astype(self.dtype)
 
     def __repr__(self):
         return ( 'Projector on the divergence and temporal boundary conditions constrain space.' )
@@ -81,7 +82,7 @@ class ProxCdivtb( Projector ):
         e = 0.
 
         for i in xrange(nTest):
-            divTB1 = grid.DivergenceTemporalBoundaries.random(self.M, self.N, self.P)
+            divTB1 = grid.DivergenceTemporalBoundaries.random(self.M, self.N, self.P, domain=self.domain)
             
             divTB2 = divTB1.copy()
             divTB2 = self.inverseATA(divTB2)
@@ -98,7 +99,7 @@ class ProxCdivtb( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -106,7 +107,7 @@ class ProxCdivtb( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
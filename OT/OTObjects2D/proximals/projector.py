@@ -33,9 +33,9 @@ class Projector( OTObject ):
 
     def __init__( self ,
                   M , N , P ,
-                  kernel ):
+                  kernel , domain=None ):
         OTObject.__init__( self ,
-                           M , N , P )
+                           M , N , P , domain=domain )
         self.kernel = kernel
 
     def __repr__(self):
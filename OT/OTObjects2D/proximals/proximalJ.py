@@ -29,8 +29,8 @@ class ProxJ( OTObject ):
     Proximal operator for the cost function J
     '''
 
-    def __init__(self, M , N , P):
-        OTObject.__init__(self,M,N,P)
+    def __init__(self, M , N , P , domain=None):
+        OTObject.__init__(self,M,N,P,domain)
 
     def __repr__(self):
         return ( 'Proximal operator associated to the cost function J = sum(m**2/f)' )
@@ -41,8 +41,34 @@ class ProxJ( OTObject ):
     def timing(self,nTiming,gamma=1.):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.CenteredField.random(self.M,self.N,self.P)
+            field = grid.CenteredField.random(self.M,self.N,self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field,gamma)
             t += tm.time() - time_start
         return t
+
+class ProxJMasked( ProxJ ):
+    '''
+    Proximal operator for the cost function J, restricted to the active nodes of mask
+    '''
+
+    def __init__(self, M , N , P, mask, domain=None):
+        ProxJ.__init__(self,M,N,P,domain)
+        self.mask = mask
+
+    def __repr__(self):
+        return ( 'Proximal operator associated to the cost function J = sum(m**2/f) on a masked domain' )
+
+    def __call__(self, field, gamma):
+        # computes the proximal operator on the active nodes only
+        active = grid.CenteredField( self.M , self.N , self.P ,
+                                     field.mx[self.mask][:,np.newaxis,:] ,
+                                     field.my[self.mask][:,np.newaxis,:] ,
+                                     field.f[self.mask][:,np.newaxis,:] ,
+                                     domain=self.domain ).proximalJ(gamma)
+
+        result = grid.CenteredField( self.M , self.N , self.P , domain=self.domain )
+        result.mx[self.mask] = active.mx[:,0,:]
+        result.my[self.mask] = active.my[:,0,:]
+        result.f[self.mask]  = active.f[:,0,:]
+        return result
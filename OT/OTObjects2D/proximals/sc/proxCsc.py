@@ -30,17 +30,17 @@ class ProxCsc( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.CenteredField(M,N,P)
+            kernel = grid.CenteredField(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
-        self.inverseATAmx = np.linalg.inv( self.ATAmx() )
-        self.inverseATAmy = np.linalg.inv( self.ATAmy() )
-        self.inverseATAf  = np.linalg.inv( self.ATAf() )
+        self.inverseATAmx = np.linalg.inv( self.ATAmx() ).astype(self.dtype)
+        self.inverseATAmy = np.linalg.inv( self.ATAmy() ).astype(self.dtype)
+        self.inverseATAf  = np.linalg.inv( self.ATAf() ).astype(self.dtype)
 
     def ATAmx(self):
         alpha   = 0.5
@@ -78,7 +78,7 @@ class ProxCsc( Projector ):
     def testInverse(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field1 = grid.CenteredField.random(self.M, self.N , self.P)
+            field1 = grid.CenteredField.random(self.M, self.N , self.P , domain=self.domain)
 
             field2 = field1.copy()
             field2 = self.inverseATA(field2)
@@ -95,7 +95,7 @@ class ProxCsc( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -103,7 +103,7 @@ class ProxCsc( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
@@ -30,17 +30,17 @@ class ProxCscb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.CenteredFieldBoundaries(M,N,P)
+            kernel = grid.CenteredFieldBoundaries(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
-        self.inverseATAmx = np.linalg.inv( self.ATAmx() )
-        self.inverseATAmy = np.linalg.inv( self.ATAmy() )
-        self.inverseATAf  = np.linalg.inv( self.ATAf() )
+        self.inverseATAmx = np.linalg.inv( self.ATAmx() ).astype(self.dtype)
+        self.inverseATAmy = np.linalg.inv( self.ATAmy() ).astype(self.dtype)
+        self.inverseATAf  = np.linalg.inv( self.ATAf() ).astype(self.dtype)
 
     def ATAmx(self):
         alpha = 0.5
@@ -88,19 +88,19 @@ class ProxCscb( Projector ):
         return cFieldb.TinterpolationErrorBoundaries()
 
     def inverseATA(self, cFieldb):
-        mx = np.zeros(shape=(self.M+3,self.N+1,self.P+1))
+        mx = np.zeros(shape=(self.M+3,self.N+1,self.P+1), dtype=self.dtype)
         mx[0,:,:]          = cFieldb.boundaries.spatialBoundaries.bx0[:,:]
         mx[1:self.M+2,:,:] = cFieldb.centeredField.mx[0:self.M+1,:,:]
         mx[self.M+2,:,:]   = cFieldb.boundaries.spatialBoundaries.bx1[:,:]
         mx = np.tensordot( self.inverseATAmx , mx , ([1],[0]) )
 
-        my = np.zeros(shape=(self.M+1,self.N+3,self.P+1))
+        my = np.zeros(shape=(self.M+1,self.N+3,self.P+1), dtype=self.dtype)
         my[:,0,:]          = cFieldb.boundaries.spatialBoundaries.by0[:,:]
         my[:,1:self.N+2,:] = cFieldb.centeredField.my[:,0:self.N+1,:]
         my[:,self.N+2,:]   = cFieldb.boundaries.spatialBoundaries.by1[:,:]
         my = np.tensordot( self.inverseATAmy , my , ([1],[1]) ).transpose((1,0,2))
 
-        f = np.zeros(shape=(self.M+1,self.N+1,self.P+3))
+        f = np.zeros(shape=(self.M+1,self.N+1,self.P+3), dtype=self.dtype)
         f[:,:,0]          = cFieldb.boundaries.temporalBoundaries.bt0[:,:]
         f[:,:,1:self.P+2] = cFieldb.centeredField.f[:,:,0:self.P+1]
         f[:,:,self.P+2]   = cFieldb.boundaries.temporalBoundaries.bt1[:,:]
@@ -121,7 +121,7 @@ class ProxCscb( Projector ):
     def testInverse(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field1 = grid.CenteredFieldBoundaries.random(self.M, self.N , self.P)
+            field1 = grid.CenteredFieldBoundaries.random(self.M, self.N , self.P , domain=self.domain)
 
             field2 = field1.copy()
             field2 = self.inverseATA(field2)
@@ -137,7 +137,7 @@ class ProxCscb( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -145,7 +145,7 @@ class ProxCscb( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
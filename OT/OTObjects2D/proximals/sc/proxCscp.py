@@ -0,0 +1,58 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+################
+# Class ProxCscp
+################
+#
+# Projector on the staggered centered interpolation and temporal boundary condition constrain
+# for the dynamics periodic in space (see grid/periodic.py)
+#
+
+import numpy as np
+
+from proxCsctb        import ProxCsctb
+from ...grid          import grid
+from ...grid.periodic import wrapStaggeredField
+from ...grid.periodic import foldStaggeredField
+
+class ProxCscp( ProxCsctb ):
+    '''
+    Projector on the staggered centered interpolation and temporal boundary condition constrain, periodic in space
+    '''
+
+    def ATAmx(self):
+        alpha = 0.5
+        ATA   = ProxCsctb.ATAmx(self)
+        ATA[0,self.M] += alpha**2
+        ATA[self.M,0] += alpha**2
+        return ATA
+
+    def ATAmy(self):
+        alpha = 0.5
+        ATA   = ProxCsctb.ATAmy(self)
+        ATA[0,self.N] += alpha**2
+        ATA[self.N,0] += alpha**2
+        return ATA
+
+    def __repr__(self):
+        return ( 'Projector on the staggered centered interpolation and temporal boundary contion constrain space, periodic in space.' )
+
+    def TA(self, cFieldtb):
+        scField = cFieldtb.TinterpolationErrorTemporalBoundaries()
+        foldStaggeredField(scField.staggeredField)
+        return scField
+
+    def __call__(self, scField):
+        scField = scField.copy()
+        wrapStaggeredField(scField.staggeredField)
+        return ProxCsctb.__call__( self , scField )
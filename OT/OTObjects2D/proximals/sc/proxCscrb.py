@@ -30,18 +30,18 @@ class ProxCscrb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.CenteredFieldBoundaries(M,N,P)
+            kernel = grid.CenteredFieldBoundaries(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
-        self.inverseATAmx = np.linalg.inv( self.ATAmx() )
-        self.inverseATAmy = np.linalg.inv( self.ATAmy() )
-        self.inverseATAf  = np.linalg.inv( self.ATAf() )
-        self.inverseATAfr = np.linalg.inv( self.ATAfr() )
+        self.inverseATAmx = np.linalg.inv( self.ATAmx() ).astype(self.dtype)
+        self.inverseATAmy = np.linalg.inv( self.ATAmy() ).astype(self.dtype)
+        self.inverseATAf  = np.linalg.inv( self.ATAf() ).astype(self.dtype)
+        self.inverseATAfr = np.linalg.inv( self.ATAfr() ).astype(self.dtype)
 
 
     def ATAmx(self):
@@ -100,24 +100,24 @@ class ProxCscrb( Projector ):
         return cFieldb.TinterpolationErrorReservoirBoundaries()
 
     def inverseATA(self, cFieldrb):
-        mx = np.zeros(shape=(self.M+3,self.N+1,self.P+1))
+        mx = np.zeros(shape=(self.M+3,self.N+1,self.P+1), dtype=self.dtype)
         mx[0,:,:]          = cFieldrb.boundaries.spatialBoundaries.bx0[:,:]
         mx[1:self.M+2,:,:] = cFieldrb.centeredField.mx[0:self.M+1,:,:]
         mx[self.M+2,:,:]   = cFieldrb.boundaries.spatialBoundaries.bx1[:,:]
         mx = np.tensordot( self.inverseATAmx , mx , ([1],[0]) )
 
-        my = np.zeros(shape=(self.M+1,self.N+3,self.P+1))
+        my = np.zeros(shape=(self.M+1,self.N+3,self.P+1), dtype=self.dtype)
         my[:,0,:]          = cFieldrb.boundaries.spatialBoundaries.by0[:,:]
         my[:,1:self.N+2,:] = cFieldrb.centeredField.my[:,0:self.N+1,:]
         my[:,self.N+2,:]   = cFieldrb.boundaries.spatialBoundaries.by1[:,:]
         my = np.tensordot( self.inverseATAmy , my , ([1],[1]) ).transpose((1,0,2))
 
-        fv  = np.zeros(shape=(self.M+1,self.N+1,self.P+1))
-        bt0 = np.zeros(shape=(self.M+1,self.N+1))
-        bt1 = np.zeros(shape=(self.M+1,self.N+1))
+        fv  = np.zeros(shape=(self.M+1,self.N+1,self.P+1), dtype=self.dtype)
+        bt0 = np.zeros(shape=(self.M+1,self.N+1), dtype=self.dtype)
+        bt1 = np.zeros(shape=(self.M+1,self.N+1), dtype=self.dtype)
 
         # x = 0, y = :
-        f               = np.zeros(shape=(self.N+1,self.P+2))
+        f               = np.zeros(shape=(self.N+1,self.P+2), dtype=self.dtype)
         f[:,0]          = cFieldrb.boundaries.temporalBoundaries.bt0[0,:]
         f[:,1:self.P+2] = cFieldrb.centeredField.f[0,:,0:self.P+1]
         f = np.tensordot( self.inverseATAfr , f , ([1],[1]) ).transpose()
@@ -126,7 +126,7 @@ class ProxCscrb( Projector ):
         fv[0,:,0:self.P+1] = f[:,1:self.P+2]
 
         # x = :, y = 0
-        f             = np.zeros(shape=(self.M+1,self.P+2))
+        f             = np.zeros(shape=(self.M+1,self.P+2), dtype=self.dtype)
         f[:,0]          = cFieldrb.boundaries.temporalBoundaries.bt0[:,0]
         f[:,1:self.P+2] = cFieldrb.centeredField.f[:,0,0:self.P+1]
         f = np.tensordot( self.inverseATAfr , f , ([1],[1]) ).transpose()
@@ -135,7 +135,7 @@ class ProxCscrb( Projector ):
         fv[:,0,0:self.P+1] = f[:,1:self.P+2]
 
         # 0 < x < N
-        f                 = np.zeros(shape=(self.M-1,self.N-1,self.P+3))
+        f                 = np.zeros(shape=(self.M-1,self.N-1,self.P+3), dtype=self.dtype)
         f[:,:,0]          = cFieldrb.boundaries.temporalBoundaries.bt0[1:self.M,1:self.N]
         f[:,:,1:self.P+2] = cFieldrb.centeredField.f[1:self.M,1:self.N,0:self.P+1]
         f[:,:,self.P+2]   = cFieldrb.boundaries.temporalBoundaries.bt1[1:self.M,1:self.N]
@@ -146,7 +146,7 @@ class ProxCscrb( Projector ):
         bt1[1:self.M,1:self.N] = f[:,:,self.P+2]
 
         # x = M , y = :
-        f               = np.zeros(shape=(self.N+1,self.P+2))
+        f               = np.zeros(shape=(self.N+1,self.P+2), dtype=self.dtype)
         f[:,0]          = cFieldrb.boundaries.temporalBoundaries.bt0[self.M,:]
         f[:,1:self.P+2] = cFieldrb.centeredField.f[self.M,:,0:self.P+1]
         f = np.tensordot( self.inverseATAfr , f , ([1],[1]) ).transpose()
@@ -155,7 +155,7 @@ class ProxCscrb( Projector ):
         fv[self.M,:,0:self.P+1] = f[:,1:self.P+2]
 
         # x = : , y = N
-        f               = np.zeros(shape=(self.M+1,self.P+2))
+        f               = np.zeros(shape=(self.M+1,self.P+2), dtype=self.dtype)
         f[:,0]          = cFieldrb.boundaries.temporalBoundaries.bt0[:,self.N]
         f[:,1:self.P+2] = cFieldrb.centeredField.f[:,self.N,0:self.P+1]
         f = np.tensordot( self.inverseATAfr , f , ([1],[1]) ).transpose()
@@ -178,7 +178,7 @@ class ProxCscrb( Projector ):
     def testInverse(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field1 = grid.CenteredFieldBoundaries.random(self.M, self.N , self.P)
+            field1 = grid.CenteredFieldBoundaries.random(self.M, self.N , self.P , domain=self.domain)
             field1.boundaries.temporalBoundaries.bt1[0,:]      = 0.
             field1.boundaries.temporalBoundaries.bt1[self.M,:] = 0.
             field1.boundaries.temporalBoundaries.bt1[:,0]      = 0.
@@ -199,7 +199,7 @@ class ProxCscrb( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -207,7 +207,7 @@ class ProxCscrb( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
@@ -30,17 +30,17 @@ class ProxCsctb( Projector ):
     
     def __init__( self ,
                   M , N , P ,
-                  kernel=None ):
+                  kernel=None , domain=None ):
         if kernel is None:
-            kernel = grid.CenteredFieldTemporalBoundaries(M,N,P)
+            kernel = grid.CenteredFieldTemporalBoundaries(M,N,P, domain=domain)
 
         Projector.__init__( self ,
                             M , N , P ,
-                            kernel )
+                            kernel , domain=domain )
 
-        self.inverseATAmx = np.linalg.inv( self.ATAmx() )
-        self.inverseATAmy = np.linalg.inv( self.ATAmy() )
-        self.inverseATAf  = np.linalg.inv( self.ATAf() )
+        self.inverseATAmx = np.linalg.inv( self.ATAmx() ).astype(self.dtype)
+        self.inverseATAmy = np.linalg.inv( self.ATAmy() ).astype(self.dtype)
+        self.inverseATAf  = np.linalg.inv( self.ATAf() ).astype(self.dtype)
 
     def ATAmx(self):
         alpha = 0.5
@@ -79,7 +79,7 @@ class ProxCsctb( Projector ):
         cFieldtb.centeredField.mx = np.tensordot( self.inverseATAmx , cFieldtb.centeredField.mx , ([1],[0]) )
         cFieldtb.centeredField.my = np.tensordot( self.inverseATAmy , cFieldtb.centeredField.my , ([1],[1]) ).transpose((1,0,2))
 
-        f = np.zeros(shape=(self.M+1,self.N+1,self.P+3))
+        f = np.zeros(shape=(self.M+1,self.N+1,self.P+3), dtype=self.dtype)
         f[:,:,0]          = cFieldtb.temporalBoundaries.bt0[:,:]
         f[:,:,1:self.P+2] = cFieldtb.centeredField.f[:,:,0:self.P+1]
         f[:,:,self.P+2]   = cFieldtb.temporalBoundaries.bt1[:,:]
@@ -94,7 +94,7 @@ class ProxCsctb( Projector ):
     def testInverse(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field1 = grid.CenteredFieldTemporalBoundaries.random(self.M, self.N , self.P)
+            field1 = grid.CenteredFieldTemporalBoundaries.random(self.M, self.N , self.P , domain=self.domain)
             
             field2 = field1.copy()
             field2 = self.inverseATA(field2)
@@ -109,7 +109,7 @@ class ProxCsctb( Projector ):
     def test(self,nTest):
         e = 0.
         for i in xrange(nTest):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             field = self(field)
             e += ( self.A(field) - self.kernel ).LInftyNorm()
         return e/nTest
@@ -117,7 +117,7 @@ class ProxCsctb( Projector ):
     def timing(self,nTiming):
         t = 0.
         for i in xrange(nTiming):
-            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P)
+            field = grid.StaggeredCenteredField.random(self.M, self.N, self.P, domain=self.domain)
             time_start = tm.time()
             field = self(field)
             t += tm.time() - time_start
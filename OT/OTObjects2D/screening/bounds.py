@@ -0,0 +1,149 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#__________
+# bounds.py
+#__________
+#
+# Cheap bounds on W2^2 between f0 / sum(f0) and f1 / sum(f1)
+# on the (M+1)x(N+1) grid of [0,1]^2
+#
+# Lower bounds :
+#   * centroid  -> |m0 - m1|^2
+#   * sliced    -> W2^2 between the projections of f0 and f1 on a direction,
+#                  averaged (sliced) or maximized (max-sliced) over the directions
+#
+# Upper bounds, i.e. costs of feasible plans :
+#   * product           -> independent coupling
+#   * Knothe-Rosenblatt -> monotone coupling of the x-marginals, then of the
+#                          conditional y-distributions (and the other way round)
+#
+# The 1D W2 distances are computed with the quantile functions of the
+# anamorphose algorithm. Since everything is computed on the grid, these are
+# bounds up to the discretization error.
+#
+
+import numpy as np
+
+from ..grid.displacement                             import nodes
+from ..algorithms.gaussian.closedForm                import moments
+from ...OTObjects1D.algorithms.anamorph.quantile     import normalizedCDF
+from ...OTObjects1D.algorithms.anamorph.quantile     import quantileFunction
+from ...OTObjects1D.algorithms.anamorph.quantile     import quantileLevels
+from ...OTObjects1D.algorithms.anamorph.quantile     import squaredDistance
+
+#__________________________________________________
+
+def centroidLowerBound(f0, f1):
+    (m0, S0) = moments(f0)
+    (m1, S1) = moments(f1)
+    return np.power(m1 - m0, 2).sum()
+
+#__________________________________________________
+
+def productUpperBound(f0, f1):
+    (m0, S0) = moments(f0)
+    (m1, S1) = moments(f1)
+    return np.power(m1 - m0, 2).sum() + np.trace(S0) + np.trace(S1)
+
+#__________________________________________________
+
+def projections(f, nProjections, nBins):
+    #
+    # returns the stack of the projections of f on the directions theta in [0,pi)
+    # each projection being sampled on nBins points of its range, as well as
+    # the lengths of these ranges
+    #
+    M      = f.shape[0] - 1
+    N      = f.shape[1] - 1
+    X,Y    = nodes(M, N)
+
+    theta  = np.pi * np.arange(nProjections) / nProjections
+    c      = np.cos(theta)[:,np.newaxis]
+    s      = np.sin(theta)[:,np.newaxis]
+
+    pMin   = np.minimum(c, 0.) + np.minimum(s, 0.)
+    pMax   = np.maximum(c, 0.) + np.maximum(s, 0.)
+
+    # position of the nodes in [0,nBins-1]
+    u      = ( c * X.ravel() + s * Y.ravel() - pMin ) / ( pMax - pMin ) * ( nBins - 1. )
+    i      = np.minimum(np.floor(u).astype(int), nBins-2)
+    w      = u - i
+    rows   = np.arange(nProjections)[:,np.newaxis] * nBins
+
+    proj   = np.zeros(nProjections * nBins)
+    np.add.at(proj, ( rows + i ).ravel(),     ( ( 1. - w ) * f.ravel() ).ravel())
+    np.add.at(proj, ( rows + i + 1 ).ravel(), ( w * f.ravel() ).ravel())
+
+    return (proj.reshape((nProjections, nBins)), ( pMax - pMin ).ravel())
+
+#__________________________________________________
+
+def slicedLowerBounds(f0, f1, nProjections, nLevels, floor=1.e-8):
+    # returns (sliced, max-sliced) W2^2
+    (proj0, length) = projections(f0, nProjections, nLevels)
+    (proj1, length) = projections(f1, nProjections, nLevels)
+
+    U  = np.linspace(0., 1., nLevels)
+    W2 = squaredDistance(U, proj0, proj1, nLevels, floor) * length * length
+
+    return (W2.mean(), W2.max())
+
+#__________________________________________________
+
+def knotheRosenblattUpperBound(f0, f1, nLevels, floor=1.e-8):
+    # cost of the Knothe-Rosenblatt coupling, x-marginals first
+    M      = f0.shape[0] - 1
+    N      = f0.shape[1] - 1
+    X      = np.linspace(0., 1., M+1)
+    Y      = np.linspace(0., 1., N+1)
+    levels = quantileLevels(nLevels)
+
+    def conditionalQuantiles(f):
+        # quantiles of the x-marginal
+        Qx = quantileFunction(X, normalizedCDF(X, f.sum(axis=1), floor), levels)
+
+        # conditional densities of y at x = Qx, linearly interpolated between columns
+        x  = Qx * M
+        i  = np.minimum(np.floor(x).astype(int), M-1)
+        w  = ( x - i )[:,np.newaxis]
+        fy = ( 1. - w ) * f[i,:] + w * f[i+1,:]
+        fy = np.maximum(fy, floor * f.mean())
+
+        Qy = quantileFunction(Y, normalizedCDF(Y, fy, floor), levels)
+        return (Qx, Qy)
+
+    (Qx0, Qy0) = conditionalQuantiles(f0)
+    (Qx1, Qy1) = conditionalQuantiles(f1)
+
+    return np.power(Qx0 - Qx1, 2).mean() + np.power(Qy0 - Qy1, 2).mean()
+
+#__________________________________________________
+
+def lowerBound(f0, f1, nProjections, nLevels):
+    (sliced, maxSliced) = slicedLowerBounds(f0, f1, nProjections, nLevels)
+    return max(centroidLowerBound(f0, f1), maxSliced)
+
+#__________________________________________________
+
+def upperBound(f0, f1, nLevels):
+    return min( productUpperBound(f0, f1) ,
+                knotheRosenblattUpperBound(f0, f1, nLevels) ,
+                knotheRosenblattUpperBound(f0.T, f1.T, nLevels) )
+
+#__________________________________________________
+
+def bounds(f0, f1, nProjections, nLevels):
+    return (lowerBound(f0, f1, nProjections, nLevels), upperBound(f0, f1, nLevels))
+
+#__________________________________________________
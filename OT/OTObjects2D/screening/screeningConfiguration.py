@@ -0,0 +1,120 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________________
+# Class ScreeningConfiguration
+#_____________________________
+#
+# Defines everything necessary for screening pairs of fields
+# before running an OT algorithm from a config file
+#
+
+from screeningPipeline                           import ScreeningPipeline
+from ...utils.configuration.defaultConfiguration import DefaultConfiguration
+
+#__________________________________________________
+
+class ScreeningConfiguration(DefaultConfiguration):
+
+    def __init__(self, screeningConfigFile=None):
+        DefaultConfiguration.__init__(self, screeningConfigFile)
+
+    #_________________________
+
+    def __repr__(self):
+        return 'ScreeningConfiguration for a 2D OT algoritm'
+
+    #_________________________
+
+    def pipeline(self):
+        return ScreeningPipeline(self)
+
+    #_________________________
+
+    def checkAttributes(self):
+        DefaultConfiguration.checkAttributes(self)
+
+        if not self.screeningMode in ['threshold', 'ranking']:
+            print ( 'Value ' + self.screeningMode +
+                    ' is not valid for parameter screeningMode ' )
+            self.screeningMode = self.defaultValues['screeningMode']
+            print ( 'Replacing by default value : ' + self.screeningMode )
+            DefaultConfiguration.checkAttributes(self)
+
+        if self.screeningMode == 'ranking' and not self.nBest > 0:
+            print ( 'Value ' + str(self.nBest) +
+                    ' is not valid for parameter nBest ' )
+            self.nBest = self.defaultValues['nBest']
+            print ( 'Replacing by default value : ' + str ( self.nBest ) )
+
+        if not self.nProjections > 0:
+            print ( 'Value ' + str(self.nProjections) +
+                    ' is not valid for parameter nProjections ' )
+            self.nProjections = self.defaultValues['nProjections']
+            print ( 'Replacing by default value : ' + str ( self.nProjections ) )
+
+        if not self.nLevels > 1:
+            print ( 'Value ' + str(self.nLevels) +
+                    ' is not valid for parameter nLevels ' )
+            self.nLevels = self.defaultValues['nLevels']
+            print ( 'Replacing by default value : ' + str ( self.nLevels ) )
+
+    #_________________________
+
+    def defaultAttributes(self):
+        DefaultConfiguration.defaultAttributes(self)
+
+        self.addAttribute('EPSILON',
+                          defaultVal=1.e-8,
+                          attrType='float')
+
+        self.addAttribute('configFile',
+                          defaultVal='./OT2D.cfg')
+
+        self.addAttribute('outputDir',
+                          defaultVal='./output/')
+
+        self.addAttribute('fileListf0',
+                          defaultVal=['f0.bin'],
+                          attrType='list')
+
+        self.addAttribute('fileListf1',
+                          defaultVal=['f1.bin'],
+                          attrType='list')
+
+        self.addAttribute('screeningMode',
+                          defaultVal='threshold')
+
+        self.addAttribute('threshold',
+                          defaultVal=0.01,
+                          isSubAttr=[('screeningMode','threshold')],
+                          attrType='float')
+
+        self.addAttribute('nBest',
+                          defaultVal=1,
+                          isSubAttr=[('screeningMode','ranking')],
+                          attrType='int')
+
+        self.addAttribute('nProjections',
+                          defaultVal=32,
+                          attrType='int')
+
+        self.addAttribute('nLevels',
+                          defaultVal=256,
+                          attrType='int')
+
+        self.addAttribute('solveAmbiguous',
+                          defaultVal=True,
+                          attrType='bool')
+
+#__________________________________________________
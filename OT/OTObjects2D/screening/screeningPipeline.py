@@ -0,0 +1,230 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________
+# screeningPipeline.py
+#_____________________
+#
+# Compares every field of fileListf0 to every field of fileListf1
+#
+# The bounds of bounds.py are computed for each pair, and only the pairs
+# for which the bounds are not sufficient get the full OT algorithm.
+#
+# Each field is loaded, masked and normalized only once, and the bounds are
+# computed on the original grid. A configuration is only built for the
+# ambiguous pairs.
+#
+# Decisions :
+#    1 -> close enough (threshold mode) or among the nBest closest (ranking mode)
+#    0 -> too far (threshold mode) or pruned (ranking mode)
+#   -1 -> ambiguous
+#
+
+import os
+import time    as tm
+import cPickle as pck
+import numpy   as np
+
+from bounds                             import bounds
+from ..configuration                    import Configuration
+from ..boundaries.cropSupport           import embedOutput
+from ..boundaries.defineBoundaries      import temporalBoundaryFromFile
+from ..boundaries.mask                  import maskFromFile
+from ...utils.io.io                     import fileNameSuffix
+from ...utils.io.files                  import fileScreening
+from ...utils.io.saveResult             import saveResult
+from ...utils.io.extractScreening       import extractScreening
+
+#__________________________________________________
+
+def thresholdDecision(lower, upper, threshold):
+    if lower > threshold:
+        return 0
+    elif upper <= threshold:
+        return 1
+    else:
+        return -1
+
+#__________________________________________________
+
+def rankingDecisions(lowers, uppers, nBest):
+    #
+    # a candidate is pruned if its lower bound is larger than the upper bound
+    # of nBest other candidates
+    #
+    if len(lowers) <= nBest:
+        return [1] * len(lowers)
+
+    kthUpper  = np.sort(uppers)[nBest-1]
+    decisions = []
+    for lower in lowers:
+        if lower > kthUpper:
+            decisions.append(0)
+        else:
+            decisions.append(-1)
+
+    # if no more than nBest candidates remain, they are the nBest closest
+    if decisions.count(-1) <= nBest:
+        decisions = [ 0 if d == 0 else 1 for d in decisions ]
+
+    return decisions
+
+#__________________________________________________
+
+def rerankDecisions(lowers, uppers, W2s, decisions, nBest):
+    #
+    # ranks the candidates again once some pairs are solved, the solved pairs
+    # being ranked with their W2 and the others with their bounds
+    # pruned candidates stay pruned
+    #
+    solved       = np.isfinite(W2s)
+    newDecisions = rankingDecisions(np.where(solved, W2s, lowers),
+                                    np.where(solved, W2s, uppers), nBest)
+    return [ 0 if d == 0 else n for (d, n) in zip(decisions, newDecisions) ]
+
+#__________________________________________________
+
+def pairOutputDir(outputDir, pairSuffix):
+    return outputDir + 'pair' + pairSuffix + '/'
+
+#__________________________________________________
+
+class ScreeningPipeline:
+
+    def __init__(self, config):
+        self.config = config
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Pipeline for screening pairs of 2D fields'
+
+    #_________________________
+
+    def pairConfiguration(self, i, j):
+        suffix = ( fileNameSuffix(i, len(self.config.fileListf0)) + '_' +
+                   fileNameSuffix(j, len(self.config.fileListf1)) )
+        return Configuration(self.config.configFile, { 'boundaryType' : 0 ,
+                                                       'filef0'       : self.config.fileListf0[i] ,
+                                                       'filef1'       : self.config.fileListf1[j] ,
+                                                       'outputDir'    : pairOutputDir(self.config.outputDir, suffix) } )
+
+    #_________________________
+
+    def loadFields(self, config, fileList):
+        # fields of fileList in OT resolution, masked and with unit mass
+        mask   = None
+        if config.masked:
+            mask = maskFromFile(config.fileMask, config.M, config.N)
+
+        fields = []
+        for fileName in fileList:
+            f = temporalBoundaryFromFile(fileName, config.M, config.N)
+            if mask is not None:
+                f = f * mask
+            fields.append(f / f.sum())
+        return fields
+
+    #_________________________
+
+    def solve(self, i, j):
+        config  = self.pairConfiguration(i, j)
+        if not os.path.isdir(config.outputDir):
+            os.makedirs(config.outputDir)
+
+        print('__________________________________________________')
+        print('Ambiguous pair : '+config.filef0+' -> '+config.filef1)
+        print('__________________________________________________')
+
+        result  = config.algorithm().run()
+        if config.cropSupport:
+            result = embedOutput(config, result)
+        saveResult(config.outputDir, result)
+
+        # same scaling as the functional J
+        return result / ( config.P * config.boundaries.temporalBoundaries.bt0.sum() )
+
+    #_________________________
+
+    def run(self):
+        base      = Configuration(self.config.configFile, withBoundaries=False)
+
+        # the spatial boundaries of dynamics = 0 are read from the same files for every pair
+        if base.dynamics == 0:
+            raise ValueError('dynamics = 0 is not handled for screening, ' +
+                             'use dynamics = 1 or 2 in ' + self.config.configFile)
+
+        n0        = len(self.config.fileListf0)
+        n1        = len(self.config.fileListf1)
+
+        print('__________________________________________________')
+        print('Screening '+str(n0*n1)+' pairs...')
+        print('__________________________________________________')
+        timeStart = tm.time()
+
+        lowers    = np.zeros(shape=(n0, n1))
+        uppers    = np.zeros(shape=(n0, n1))
+        decisions = np.zeros(shape=(n0, n1), dtype=int)
+        W2s       = np.nan * np.ones(shape=(n0, n1))
+
+        f0s       = self.loadFields(base, self.config.fileListf0)
+        f1s       = self.loadFields(base, self.config.fileListf1)
+
+        for i in xrange(n0):
+            for j in xrange(n1):
+                (lowers[i,j], uppers[i,j]) = bounds(f0s[i], f1s[j],
+                                                    self.config.nProjections,
+                                                    self.config.nLevels)
+                if self.config.screeningMode == 'threshold':
+                    decisions[i,j] = thresholdDecision(lowers[i,j], uppers[i,j], self.config.threshold)
+
+            if self.config.screeningMode == 'ranking':
+                decisions[i,:] = rankingDecisions(lowers[i,:], uppers[i,:], self.config.nBest)
+
+        timeBounds = tm.time() - timeStart
+        nDecided   = int( ( decisions >= 0 ).sum() )
+
+        if self.config.solveAmbiguous:
+            for (i, j) in zip(*np.nonzero(decisions == -1)):
+                W2s[i,j] = self.solve(i, j)
+                if self.config.screeningMode == 'threshold':
+                    decisions[i,j] = int( W2s[i,j] <= self.config.threshold )
+
+            if self.config.screeningMode == 'ranking':
+                for i in np.unique(np.nonzero(np.isfinite(W2s))[0]):
+                    decisions[i,:] = rerankDecisions(lowers[i,:], uppers[i,:], W2s[i,:],
+                                                     decisions[i,:], self.config.nBest)
+
+        fileName  = fileScreening(self.config.outputDir)
+        f         = open(fileName, 'wb')
+        p         = pck.Pickler(f, protocol=-1)
+        p.dump(self.config.fileListf0)
+        p.dump(self.config.fileListf1)
+        p.dump(lowers)
+        p.dump(uppers)
+        p.dump(decisions)
+        p.dump(W2s)
+        f.close()
+
+        print('__________________________________________________')
+        print('Screening finished')
+        print('Pairs decided by the bounds : '+str(nDecided))
+        print('Pairs solved                : '+str(int(np.isfinite(W2s).sum())))
+        print('Time for the bounds         : '+str(timeBounds))
+        print('Time taken                  : '+str(tm.time()-timeStart))
+        print('Results written in '+fileName)
+        print('__________________________________________________')
+
+        return extractScreening(self.config.outputDir)
+
+#__________________________________________________
@@ -0,0 +1,95 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#____________________________
+# Class SequenceConfiguration
+#____________________________
+#
+# Defines everything necessary for running an OT algorithm
+# on a time series of pairs of fields from a config file
+#
+
+from sequencePipeline                            import SequencePipeline
+from ...utils.configuration.defaultConfiguration import DefaultConfiguration
+
+#__________________________________________________
+
+class SequenceConfiguration(DefaultConfiguration):
+
+    def __init__(self, sequenceConfigFile=None):
+        DefaultConfiguration.__init__(self, sequenceConfigFile)
+
+    #_________________________
+
+    def __repr__(self):
+        return 'SequenceConfiguration for a 2D OT algoritm'
+
+    #_________________________
+
+    def pipeline(self):
+        return SequencePipeline(self)
+
+    #_________________________
+
+    def checkAttributes(self):
+        DefaultConfiguration.checkAttributes(self)
+
+        if not len(self.fileListf0) == len(self.fileListf1):
+            print ( 'Lists fileListf0 and fileListf1 do not have the same length' )
+            nSteps          = min(len(self.fileListf0), len(self.fileListf1))
+            self.fileListf0 = self.fileListf0[0:nSteps]
+            self.fileListf1 = self.fileListf1[0:nSteps]
+            print ( 'Keeping only the first ' + str(nSteps) + ' time steps' )
+
+        if not self.nChains > 0:
+            print ( 'Value ' + str(self.nChains) +
+                    ' is not valid for parameter nChains ' )
+            self.nChains = self.defaultValues['nChains']
+            print ( 'Replacing by default value : ' + str ( self.nChains ) )
+
+    #_________________________
+
+    def defaultAttributes(self):
+        DefaultConfiguration.defaultAttributes(self)
+
+        self.addAttribute('EPSILON',
+                          defaultVal=1.e-8,
+                          attrType='float')
+
+        self.addAttribute('configFile',
+                          defaultVal='./OT2D.cfg')
+
+        self.addAttribute('outputDir',
+                          defaultVal='./output/')
+
+        self.addAttribute('fileListf0',
+                          defaultVal=['f0.bin'],
+                          attrType='list')
+
+        self.addAttribute('fileListf1',
+                          defaultVal=['f1.bin'],
+                          attrType='list')
+
+        self.addAttribute('warmStart',
+                          defaultVal=True,
+                          attrType='bool')
+
+        self.addAttribute('nChains',
+                          defaultVal=1,
+                          attrType='int')
+
+        self.addAttribute('analyse',
+                          defaultVal=False,
+                          attrType='bool')
+
+#__________________________________________________
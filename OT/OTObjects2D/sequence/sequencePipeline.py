@@ -0,0 +1,187 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________________
+# sequencePipeline.py
+#_____________________
+#
+# Solves a time series of OT problems (f0[k], f1[k]) in order
+#
+# Each time step is solved in its own output directory.
+# When possible, the algorithm for step k is initialized from
+# the converged state of step k-1 through the usual initial = 2 mechanism,
+# i.e. the state stored in finalState.bin is passed to Algorithm.setState.
+#
+# The sequence can be split into several contiguous chains
+# which are solved in parallel. Only one step per chain lives in memory,
+# the results being appended to one file per chain as soon as they are known.
+#
+
+import os
+import glob
+import time    as tm
+import cPickle as pck
+import numpy   as np
+
+from multiprocessing             import Pool
+
+from ..configuration             import Configuration
+from ..boundaries.cropSupport    import embedOutput
+from ..analyse.computeOperators  import applyAllOperators
+from ...utils.io.io              import fileNameSuffix
+from ...utils.io.files           import fileSequence
+from ...utils.io.saveResult      import saveResult
+from ...utils.io.extractSequence import extractSequence
+
+#__________________________________________________
+
+def splitSequence(nSteps, nChains):
+    bounds = np.linspace(0, nSteps, nChains+1).round().astype(int)
+    chains = []
+    for c in xrange(nChains):
+        if bounds[c+1] > bounds[c]:
+            chains.append(range(bounds[c], bounds[c+1]))
+    return chains
+
+#__________________________________________________
+
+def stepOutputDir(outputDir, stepSuffix):
+    return outputDir + 'step' + stepSuffix + '/'
+
+#__________________________________________________
+
+def runChain(chainArgs):
+    (configFile, steps, outputDir, chainSuffix, warmStart, analyse) = chainArgs
+
+    fileChain = fileSequence(outputDir, chainSuffix)
+    previous  = None
+
+    for (i, stepSuffix, filef0, filef1) in steps:
+        timeStart = tm.time()
+        stepDir   = stepOutputDir(outputDir, stepSuffix)
+        if not os.path.isdir(stepDir):
+            os.makedirs(stepDir)
+
+        config    = Configuration(configFile, { 'boundaryType' : 0 ,
+                                                'filef0'       : filef0 ,
+                                                'filef1'       : filef1 ,
+                                                'outputDir'    : stepDir } )
+
+        # the previous state can only be used if it lives on the same grid
+        # and with the same time orientation
+        if config.cropSupport:
+            cropBox = config.cropBox
+        else:
+            cropBox = None
+        current   = ( config.M , config.N , config.P , config.swappedInitFinal , cropBox )
+        warm      = ( warmStart and previous is not None and previous[1:] == current )
+        if warm:
+            config.initial         = 2
+            config.initialInputDir = previous[0]
+
+        print('__________________________________________________')
+        print('Time step '+str(i)+' : '+filef0+' -> '+filef1)
+        if warm:
+            print('Warm start from '+previous[0])
+        print('__________________________________________________')
+
+        algorithm = config.algorithm()
+        result    = algorithm.run()
+        if config.cropSupport:
+            result = embedOutput(config, result)
+        saveResult(stepDir, result)
+
+        if analyse:
+            applyAllOperators(stepDir)
+
+        f = open(fileChain, 'ab')
+        p = pck.Pickler(f, protocol=-1)
+        p.dump( ( i , filef0 , filef1 , stepDir , result , warm , tm.time() - timeStart ) )
+        f.close()
+
+        previous  = ( stepDir , ) + current
+
+        del algorithm
+        del config
+
+#__________________________________________________
+
+class SequencePipeline:
+
+    def __init__(self, config):
+        self.config = config
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Pipeline for a time series of 2D OT problems'
+
+    #_________________________
+
+    def chainArgs(self):
+        nSteps    = len(self.config.fileListf0)
+        chains    = splitSequence(nSteps, min(self.config.nChains, max(nSteps, 1)))
+        chainArgs = []
+
+        for (c, chain) in enumerate(chains):
+            steps = []
+            for i in chain:
+                steps.append( ( i ,
+                                fileNameSuffix(i, nSteps) ,
+                                self.config.fileListf0[i] ,
+                                self.config.fileListf1[i] ) )
+
+            chainArgs.append( ( self.config.configFile ,
+                                steps ,
+                                self.config.outputDir ,
+                                '_' + fileNameSuffix(c, len(chains)) ,
+                                self.config.warmStart ,
+                                self.config.analyse ) )
+
+        return chainArgs
+
+    #_________________________
+
+    def run(self):
+        # the spatial boundaries of dynamics = 0 are read from the same files for every time step
+        if Configuration(self.config.configFile, withBoundaries=False).dynamics == 0:
+            raise ValueError('dynamics = 0 is not handled for a time series, ' +
+                             'use dynamics = 1 or 2 in ' + self.config.configFile)
+
+        # the chains append their results, hence the files of a previous run are removed
+        for fileName in glob.glob(fileSequence(self.config.outputDir, '*')):
+            os.remove(fileName)
+
+        chainArgs = self.chainArgs()
+
+        print('__________________________________________________')
+        print('Solving '+str(len(self.config.fileListf0))+' time steps in '+str(len(chainArgs))+' chain(s)...')
+        print('__________________________________________________')
+        timeStart = tm.time()
+
+        if len(chainArgs) == 1:
+            runChain(chainArgs[0])
+        elif len(chainArgs) > 1:
+            pool = Pool(processes=len(chainArgs))
+            pool.map(runChain, chainArgs)
+            pool.close()
+            pool.join()
+
+        print('__________________________________________________')
+        print('Sequence finished')
+        print('Time taken : '+str(tm.time()-timeStart))
+        print('__________________________________________________')
+
+        return extractSequence(self.config.outputDir)
+
+#__________________________________________________
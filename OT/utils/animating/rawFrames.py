@@ -0,0 +1,174 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________
+# rawFrames.py
+#_____________
+#
+# Renders frames directly as RGB uint8 arrays (no matplotlib figure) and
+# streams them to a single encoder process
+#
+#   * fields are colormapped with a look-up table (see plotting/cmap.py)
+#   * contours are drawn as the pixels where the field crosses a level
+#   * one ffmpeg process writes all the requested files from the same frames
+#   * without ffmpeg, the frames are written as a sequence of .ppm images
+#
+
+import os
+import subprocess
+import numpy as np
+
+from distutils.spawn import find_executable
+
+from ..io.io         import fileNameSuffix
+
+#__________________________________________________
+
+def contourLevels(mini, maxi, levels):
+    # levels is either a number of levels or a list of levels
+    if isinstance(levels, int):
+        return np.linspace(mini, maxi, levels+2)[1:-1]
+    return np.array(levels, dtype=float)
+
+#__________________________________________________
+
+def contourMask(matrix, levels):
+    #
+    # pixels of the image of matrix crossed by one of the iso-lines
+    #
+    image = matrix.transpose()[::-1]
+    mask  = np.zeros(image.shape, dtype=bool)
+    for level in levels:
+        above        = ( image > level )
+        mask[:,1:]  |= ( above[:,1:] != above[:,:-1] )
+        mask[1:,:]  |= ( above[1:,:] != above[:-1,:] )
+    return mask
+
+#__________________________________________________
+
+def overlay(frame, mask, alpha, color):
+    # blends color with transparency alpha on the pixels of mask
+    if alpha <= 0.:
+        return frame
+    frame       = frame.copy()
+    pixels      = frame[mask].astype(float)
+    frame[mask] = np.round( ( 1. - alpha ) * pixels + alpha * 255. * np.array(color) ).astype(np.uint8)
+    return frame
+
+#__________________________________________________
+
+def upscale(frame, scale):
+    if scale <= 1:
+        return frame
+    return np.repeat(np.repeat(frame, scale, axis=0), scale, axis=1)
+
+#__________________________________________________
+
+def tileFrames(frames, gap=2):
+    # places the frames side by side, separated by white columns
+    height = max([ frame.shape[0] for frame in frames ])
+    tiles  = []
+    for frame in frames:
+        tile = 255 * np.ones(shape=(height, frame.shape[1]+gap, 3), dtype=np.uint8)
+        tile[height-frame.shape[0]:,:frame.shape[1]] = frame
+        tiles.append(tile)
+    return np.concatenate(tiles, axis=1)[:,:-gap]
+
+#__________________________________________________
+
+class RawFrameEncoder:
+    '''
+    encodes RGB frames into several files with a single ffmpeg process
+    '''
+
+    def __init__(self, executable, fileNames, width, height, fps, codec=None, bitrate=None, extraArgs=None):
+        command = [ executable , '-y' ,
+                    '-f' , 'rawvideo' , '-vcodec' , 'rawvideo' ,
+                    '-s' , str(width)+'x'+str(height) , '-pix_fmt' , 'rgb24' ,
+                    '-r' , str(fps) , '-i' , '-' ]
+
+        for fileName in fileNames:
+            # most codecs need even dimensions
+            command.extend(['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2'])
+            if codec is not None:
+                command.extend(['-vcodec', codec])
+            if bitrate is not None and bitrate > 0:
+                command.extend(['-b:v', str(bitrate)+'k'])
+            if not os.path.splitext(fileName)[1] == '.gif':
+                command.extend(['-pix_fmt', 'yuv420p'])
+            if extraArgs is not None:
+                command.extend(extraArgs)
+            command.append(fileName)
+
+        self.devnull = open(os.devnull, 'w')
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=self.devnull, stderr=self.devnull)
+
+    #_________________________
+
+    def write(self, frame):
+        self.process.stdin.write(np.ascontiguousarray(frame).tostring())
+
+    #_________________________
+
+    def close(self):
+        self.process.stdin.close()
+        returnCode = self.process.wait()
+        self.devnull.close()
+        return returnCode
+
+#__________________________________________________
+
+class PPMSequenceWriter:
+    '''
+    fallback writer : one binary .ppm image per frame
+    '''
+
+    def __init__(self, prefixFileName, nFrames):
+        self.prefixFileName = prefixFileName
+        self.nFrames        = nFrames
+        self.t              = 0
+
+    #_________________________
+
+    def write(self, frame):
+        fileName = self.prefixFileName + fileNameSuffix(self.t, self.nFrames) + '.ppm'
+        f        = open(fileName, 'wb')
+        f.write('P6\n'+str(frame.shape[1])+' '+str(frame.shape[0])+'\n255\n')
+        f.write(np.ascontiguousarray(frame).tostring())
+        f.close()
+        self.t  += 1
+
+    #_________________________
+
+    def close(self):
+        return 0
+
+#__________________________________________________
+
+def makeRawFrameWriter(writerName, figDir, prefixFigName, extensionsList, width, height, nFrames, fps, codec, bitrate, extraArgs):
+    # only ffmpeg-like encoders accept the raw frames command line
+    executable = None
+    for name in [writerName, 'ffmpeg', 'avconv']:
+        if name in ['ffmpeg', 'avconv'] and find_executable(name) is not None:
+            executable = name
+            break
+
+    if executable is None:
+        print('No encoder found, writing '+figDir+prefixFigName+'*.ppm ...')
+        return PPMSequenceWriter(figDir + prefixFigName, nFrames)
+
+    fileNames = [ figDir + prefixFigName + extension for extension in extensionsList ]
+    print('Saving '+', '.join(fileNames)+' ...')
+    return RawFrameEncoder(executable, fileNames, width, height, fps, codec, bitrate, extraArgs)
+
+#__________________________________________________
@@ -18,9 +18,15 @@
 # Uses Cardan formula to find roots for degree 3 polynoms 
 #
 
+import cmath
+import math
 import numpy as np
 import time
 
+# python scalars, which keep the precision of the arrays
+SQRT3      = math.sqrt(3.)
+ROOT3UNITY = cmath.exp(2.*math.pi*1j/3.)
+
 def reducePolynom(a,b,c,d):
     p = -1.*b*b/(3.*a*a) + 1.*c/a
     q = (1.*b/(27.*a))*(2.*b*b/(a*a)-9.*c/a) + 1.*d/a
@@ -32,23 +38,23 @@ def delta(p,q):
 def solutionPQ(p,q):
     d       = delta(p,q)
     rac_d   = np.sqrt(abs(d))
-    u       = 0.5*(-27.*q+3.*np.sqrt(3.)*rac_d)
-    v       = 0.5*(-27.*q-3.*np.sqrt(3.)*rac_d)
+    u       = 0.5*(-27.*q+3.*SQRT3*rac_d)
+    v       = 0.5*(-27.*q-3.*SQRT3*rac_d)
     rac_3_u = -np.power(abs(u),1./3.)*(u<0) + np.power(np.abs(u),1./3.)*(u>=0)
     rac_3_v = -np.power(abs(v),1./3.)*(v<0) + np.power(np.abs(v),1./3.)*(v>=0)
 
     root0   = (rac_3_u+rac_3_v)/3.
 
-    uc      = 0.5*(-27.*q+3.*np.sqrt(3.)*rac_d*1j)
+    uc      = 0.5*(-27.*q+3.*SQRT3*rac_d*1j)
     uc      = np.power(uc,1./3.)
     root1   = (uc+np.conj(uc))/3.
     root1   = root1.real
     
-    uc      = uc *(np.exp(2.*np.pi*1j/3.))
+    uc      = uc *ROOT3UNITY
     root2   = (uc+np.conj(uc))/3.
     root2   = root2.real
 
-    uc      = uc *(np.exp(2.*np.pi*1j/3.))
+    uc      = uc *ROOT3UNITY
     root3   = (uc + np.conj(uc))/3.
     root3   = root3.real
 
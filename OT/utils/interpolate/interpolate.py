@@ -17,6 +17,7 @@
 
 import numpy as np
 from scipy.interpolate import interp1d
+from scipy.ndimage     import map_coordinates
 
 #__________________________________________________
 
@@ -38,6 +39,135 @@ def interpolateTimeFinalStateMultiSim(fs, newP, copy=True):
 
 #__________________________________________________
 
+def centerMomentum(m, axis):
+    # staggered momentum (n+2 points along axis) -> centered momentum (n+1 points)
+    n  = m.shape[axis]
+    return 0.5 * ( m.take(np.arange(0, n-1), axis=axis) + m.take(np.arange(1, n), axis=axis) )
+
+#__________________________________________________
+
+class TimeResampledFinalState:
+    '''
+    lazy view of a final state f, given on oldP+2 time levels,
+    resampled on newP+2 time levels
+
+    f (and the momenta) have time as first axis, e.g. the read-only
+    memory-mapped arrays of extractFinalStateSlices, while the view has
+    time as last axis
+
+    time slices are only computed when asked for, e.g. f[:,:,t], from the
+    two closest time levels, and only the last slice is kept in memory
+    other keys are not handled, so that the whole state is never materialized
+
+    resampling modes :
+      * linear    -> linear interpolation between the two closest time levels
+      * transport -> semi-Lagrangian advection of the two closest time levels
+                     with the velocity m/f, ms being the list of the staggered
+                     momenta (one per spatial direction)
+    '''
+
+    def __init__(self, f, newP, ms=None, mode='linear'):
+        self.f     = f
+        self.ms    = ms
+        self.mode  = mode
+        self.oldP  = f.shape[0] - 2
+        self.newP  = newP
+        self.shape = f.shape[1:] + (newP+2,)
+        self.ndim  = len(self.shape)
+        self.cache = (None, None)
+
+    #_________________________
+
+    def __repr__(self):
+        return 'Lazy time resampling of a final state'
+
+    #_________________________
+
+    def transportSlice(self, k, w):
+        f0     = np.array(self.f[k])
+        f1     = np.array(self.f[k+1])
+        fMid   = 0.5 * ( f0 + f1 )
+        mask   = ( fMid > 0 )
+        fMid   = fMid * mask + 1.0 * ( 1. - mask )
+
+        coords = np.indices(f0.shape, dtype=float)
+        back   = coords.copy()
+        forth  = coords.copy()
+
+        for (axis, m) in enumerate(self.ms):
+            # velocity in grid units per time level, since df/dt + div(m) = 0
+            # is discretized as P * df + n * dm = 0
+            n            = f0.shape[axis] - 1
+            v            = centerMomentum(np.array(m[k]), axis) * mask / fMid
+            v           *= float(n) / self.oldP
+            back[axis]  -= w * v
+            forth[axis] += ( 1. - w ) * v
+
+        g      = ( ( 1. - w ) * map_coordinates(f0, back,  order=1, mode='nearest') +
+                   w          * map_coordinates(f1, forth, order=1, mode='nearest') )
+
+        # advection is not conservative : mass is set to the linear one
+        mass   = ( 1. - w ) * f0.sum() + w * f1.sum()
+        if g.sum() > 0:
+            g *= mass / g.sum()
+        return g
+
+    #_________________________
+
+    def timeSlice(self, t):
+        t = t % ( self.newP + 2 )
+        if self.oldP == self.newP:
+            return np.array(self.f[t])
+
+        s = float(t) * ( self.oldP + 1. ) / ( self.newP + 1. )
+        k = min(int(np.floor(s)), self.oldP)
+        w = s - k
+
+        if w <= 0.:
+            return np.array(self.f[k])
+        elif w >= 1.:
+            return np.array(self.f[k+1])
+        elif self.mode == 'transport' and self.ms is not None:
+            return self.transportSlice(k, w)
+        else:
+            return ( 1. - w ) * self.f[k] + w * self.f[k+1]
+
+    #_________________________
+
+    def cachedTimeSlice(self, t):
+        if not self.cache[0] == t:
+            self.cache = (t, self.timeSlice(t))
+        return self.cache[1]
+
+    #_________________________
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if ( isinstance(key[-1], (int, long, np.integer)) and
+             ( len(key) == self.ndim or key[0] is Ellipsis ) ):
+            return self.cachedTimeSlice(int(key[-1]))[key[:-1]]
+        raise IndexError('Only time slices, e.g. f[...,t], can be read from a lazy final state')
+
+    #_________________________
+
+    def min(self):
+        return min([ self.cachedTimeSlice(t).min() for t in xrange(self.newP+2) ])
+
+    #_________________________
+
+    def max(self):
+        return max([ self.cachedTimeSlice(t).max() for t in xrange(self.newP+2) ])
+
+#__________________________________________________
+
+def resampleTimeFinalStateMultiSim(fs, newP, msList=None, mode='linear'):
+    if msList is None:
+        msList = [ None for f in fs ]
+    return [ TimeResampledFinalState(f, newP, ms, mode) for (f, ms) in zip(fs, msList) ]
+
+#__________________________________________________
+
 def makeInterpolatorPP(X, Y, copy=True):
     if copy:
         return makeInterpolatorPP(X.copy(), Y.copy(), copy=False)
@@ -15,19 +15,49 @@
 # extractAnalyse.py
 ###################
 
+#
+# analyse.bin stores the iteration numbers, the iteration times and the names
+# of the operators, and analyseValues.npy the values, column-major so that
+# columns can be read alone
+#
+# analyse.bin written with the values (before analyseValues.npy) is converted
+# when read
+#
+
+import os
 import cPickle as pck
+import numpy   as np
 
 from files import fileAnalyse
+from files import fileAnalyseValues
+
+def writeAnalyse(outputDir, iterationNumbers, iterationTimes, names, values):
+    np.save(fileAnalyseValues(outputDir), np.asfortranarray(values))
 
-def extractAnalyse(outputDir):
+    f = open(fileAnalyse(outputDir), 'wb')
+    p = pck.Pickler(f, protocol=-1)
+    p.dump(iterationNumbers)
+    p.dump(iterationTimes)
+    p.dump(names)
+    f.close()
 
+def extractAnalyse(outputDir, mmap_mode=None):
     f                = open(fileAnalyse(outputDir), 'rb')
     p                = pck.Unpickler(f)
     iterationNumbers = p.load()
     iterationTimes   = p.load()
     names            = p.load()
-    values           = p.load()
-    f.close()
+
+    if os.path.exists(fileAnalyseValues(outputDir)):
+        f.close()
+        values = np.load(fileAnalyseValues(outputDir), mmap_mode=mmap_mode)
+    else:
+        values = p.load()
+        f.close()
+        try:
+            writeAnalyse(outputDir, iterationNumbers, iterationTimes, names, values)
+        except IOError:
+            print('Could not convert '+fileAnalyse(outputDir)+', keeping the values in memory')
 
     return (iterationNumbers, iterationTimes, names, values)
 
@@ -47,3 +77,35 @@ def extractAnalyseMultiSim(outputDirList):
         values.append(v)
 
     return (iterNumbers, iterTimes, names, values) 
+
+def extractAnalyseColumns(outputDir, columns):
+    #
+    # same as extractAnalyse, only the given columns being read
+    # values is a dict column -> array
+    #
+    (iterationNumbers, iterationTimes,
+     names, allValues) = extractAnalyse(outputDir, mmap_mode='r')
+    columns            = sorted(set([ min(len(names)-1, column) for column in columns ]))
+
+    values = {}
+    for column in columns:
+        values[column] = np.array(allValues[:, column])
+
+    return (iterationNumbers, iterationTimes, names, values)
+
+def extractAnalyseColumnsMultiSim(outputDirList, columns):
+
+    iterNumbers = []
+    iterTimes   = []
+    names       = []
+    values      = []
+
+    for outputDir in outputDirList:
+        (iN, iT, n, v) = extractAnalyseColumns(outputDir, columns)
+
+        iterNumbers.append(iN)
+        iterTimes.append(iT)
+        names.append(n)
+        values.append(v)
+
+    return (iterNumbers, iterTimes, names, values)
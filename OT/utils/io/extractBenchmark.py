@@ -0,0 +1,45 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#####################
+# extractBenchmark.py
+#####################
+
+import cPickle as pck
+
+from files import fileBenchmark
+
+def extractBenchmark(outputDir):
+
+    algoNames = []
+    sizes     = []
+    W2refs    = []
+    times     = []
+    errors    = []
+    timesAlgo = []
+
+    f = open(fileBenchmark(outputDir), 'rb')
+    p = pck.Unpickler(f)
+    try:
+        while True:
+            (algoName, size, W2ref, time, error, timeAlgo) = p.load()
+            algoNames.append(algoName)
+            sizes.append(size)
+            W2refs.append(W2ref)
+            times.append(time)
+            errors.append(error)
+            timesAlgo.append(timeAlgo)
+    except EOFError:
+        f.close()
+
+    return (algoNames, sizes, W2refs, times, errors, timesAlgo)
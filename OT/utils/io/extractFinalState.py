@@ -15,14 +15,18 @@
 # extractFinalState.py
 ######################
 
+import os
 import numpy   as np
 import cPickle as pck
 
 from extractConfig import extractConfig
 from files         import fileFinalState
+from files         import fileFinalStateSlices
+from files         import fileSolution
+from files         import fileDisplacementField
 #from files import fileConfig
 
-from ..interpolate.interpolate import interpolateTimeFinalStateMultiSim
+from ..interpolate.interpolate import resampleTimeFinalStateMultiSim
 
 def reverseTime(f):
     shape = f.shape
@@ -50,32 +54,120 @@ def reverseTime(f):
 
     return f
 
-def extractFinalState(outputDir):
+def finalMomenta(finalState):
+    # staggered momenta, one per spatial direction
+    if hasattr(finalState, 'mx'):
+        return [ finalState.mx , finalState.my ]
+    return [ finalState.m ]
+
+def fileFinalField(outputDir):
+    # static solvers (see StaticAlgorithm) may write a displacement interpolation instead of a final state
+    if not os.path.isfile(fileFinalState(outputDir)) and os.path.isfile(fileDisplacementField(outputDir)):
+        return fileDisplacementField(outputDir)
+    return fileFinalState(outputDir)
+
+def checkFinalState(outputDir):
+    if not os.path.isfile(fileFinalField(outputDir)) and os.path.isfile(fileSolution(outputDir)):
+        # static solvers (see StaticAlgorithm) do not compute any space-time field
+        raise IOError('No final state in '+outputDir+' : the simulation was run with a static solver'+
+                      ' without exportDisplacement')
+
+def extractFinalStateAndMomenta(outputDir):
+
+    checkFinalState(outputDir)
 
-    f              = open(fileFinalState(outputDir), 'rb')
+    f              = open(fileFinalField(outputDir), 'rb')
     p              = pck.Unpickler(f)
-    finalState     = p.load().convergingStaggeredField()
+    finalState     = p.load()
     f.close()
 
+    if hasattr(finalState, 'convergingStaggeredField'):
+        finalState = finalState.convergingStaggeredField()
+
     config         = extractConfig(outputDir)
  
     if config.swappedInitFinal:
         finit  = config.boundaries.temporalBoundaries.bt1
         ffinal = config.boundaries.temporalBoundaries.bt0
         f      = reverseTime(finalState.f)
+        ms     = [ - reverseTime(m) for m in finalMomenta(finalState) ]
     else:
         finit  = config.boundaries.temporalBoundaries.bt0
         ffinal = config.boundaries.temporalBoundaries.bt1
         f      = finalState.f
+        ms     = finalMomenta(finalState)
 
     mini   = np.min( [ finit.min() , ffinal.min() , f.min() ] )
     maxi   = np.max( [ finit.max() , ffinal.max() , f.max() ] )
 
-    return (f, finit, ffinal, mini, maxi, config.P)
+    return (f, finit, ffinal, mini, maxi, config.P, ms)
+
+def extractFinalState(outputDir):
+    (f, finit, ffinal, mini, maxi, P, ms) = extractFinalStateAndMomenta(outputDir)
+    return (f, finit, ffinal, mini, maxi, P)
+
+def writeTimeSlices(fileName, a):
+    # writes a with time as first axis, so that each time slice is contiguous
+    n  = a.shape[-1]
+    mm = np.lib.format.open_memmap(fileName, mode='w+', dtype=a.dtype, shape=(n,)+a.shape[:-1])
+    for k in xrange(n):
+        mm[k] = a[...,k]
+    mm.flush()
+    del mm
+
+def upToDate(fileName, outputDir):
+    return ( os.path.isfile(fileName) and
+             os.path.getmtime(fileName) >= os.path.getmtime(fileFinalField(outputDir)) )
+
+def extractFinalStateSlices(outputDir, withMomenta=False):
+    #
+    # returns the final state and, if asked for, the momenta as read-only
+    # memory-mapped arrays with time as first axis, so that a time slice is
+    # read without loading the others
+    #
+    # these arrays are written in finalStateSlices_*.npy the first time
+    # (or when finalState.bin is newer), finalState.bin being then fully
+    # loaded once (displacementField.bin for a static solver)
+    #
+    checkFinalState(outputDir)
+
+    fileF = fileFinalStateSlices(outputDir, 'f')
+    if not upToDate(fileF, outputDir) or ( withMomenta and
+                                           not upToDate(fileFinalStateSlices(outputDir, 'm0'), outputDir) ):
+        (f, finit, ffinal, mini, maxi, P, ms) = extractFinalStateAndMomenta(outputDir)
+        writeTimeSlices(fileF, f)
+        for (i, m) in enumerate(ms):
+            writeTimeSlices(fileFinalStateSlices(outputDir, 'm'+str(i)), m)
+        del f
+        del ms
+
+    config = extractConfig(outputDir)
+
+    if config.swappedInitFinal:
+        finit  = config.boundaries.temporalBoundaries.bt1
+        ffinal = config.boundaries.temporalBoundaries.bt0
+    else:
+        finit  = config.boundaries.temporalBoundaries.bt0
+        ffinal = config.boundaries.temporalBoundaries.bt1
+
+    f      = np.load(fileF, mmap_mode='r')
+    ms     = None
+    if withMomenta:
+        ms = [ np.load(fileFinalStateSlices(outputDir, 'm'+str(i)), mmap_mode='r') for i in xrange(f.ndim-1) ]
 
-def extractFinalStateMultiSim(outputDirList):
+    mini   = min( [ finit.min() , ffinal.min() ] + [ f[k].min() for k in xrange(f.shape[0]) ] )
+    maxi   = max( [ finit.max() , ffinal.max() ] + [ f[k].max() for k in xrange(f.shape[0]) ] )
 
+    return (f, finit, ffinal, mini, maxi, config.P, ms)
+
+def extractFinalStateMultiSim(outputDirList, timeResampling='linear'):
+    #
+    # the final states are returned as lazy views, resampled on Pmax+2 time levels
+    # timeResampling is either 'linear' or 'transport' (see TimeResampledFinalState)
+    # only one final state is loaded at a time (see extractFinalStateSlices)
+    #
     fs           = []
+    msList       = []
     finits       = []
     ffinals      = []
     Plist        = []
@@ -84,19 +176,15 @@ def extractFinalStateMultiSim(outputDirList):
     maxis        = []
 
     for outputDir in outputDirList:
-        (f, finit, ffinal, mini, maxi, P) = extractFinalState(outputDir)
+        (f, finit, ffinal, mini, maxi, P, ms) = extractFinalStateSlices(outputDir, timeResampling == 'transport')
         
         fs.append(f)
+        msList.append(ms)
         finits.append(finit)
         ffinals.append(ffinal)
 
-        minis.append(f.min())
-        minis.append(finit.min())
-        minis.append(ffinal.min())
-
-        maxis.append(f.max())
-        maxis.append(finit.max())
-        maxis.append(ffinal.max())
+        minis.append(mini)
+        maxis.append(maxi)
 
         Plist.append(P)
 
@@ -104,7 +192,7 @@ def extractFinalStateMultiSim(outputDirList):
     mini = np.min(minis)
     maxi = np.max(maxis)
 
-    fs   = interpolateTimeFinalStateMultiSim(fs, Pmax, copy=False)
+    fs   = resampleTimeFinalStateMultiSim(fs, Pmax, msList, timeResampling)
 
     return (fs, finits, ffinals, mini, maxi, Pmax)
 
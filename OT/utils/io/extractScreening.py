@@ -0,0 +1,34 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#####################
+# extractScreening.py
+#####################
+
+import cPickle as pck
+
+from files import fileScreening
+
+def extractScreening(outputDir):
+
+    f          = open(fileScreening(outputDir), 'rb')
+    p          = pck.Unpickler(f)
+    fileListf0 = p.load()
+    fileListf1 = p.load()
+    lowers     = p.load()
+    uppers     = p.load()
+    decisions  = p.load()
+    W2s        = p.load()
+    f.close()
+
+    return (fileListf0, fileListf1, lowers, uppers, decisions, W2s)
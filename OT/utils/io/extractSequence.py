@@ -0,0 +1,51 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+####################
+# extractSequence.py
+####################
+
+import glob
+import cPickle as pck
+
+from files import fileSequence
+
+def extractSequence(outputDir):
+
+    records = []
+
+    for fileName in sorted(glob.glob(fileSequence(outputDir, '*'))):
+        f = open(fileName, 'rb')
+        p = pck.Unpickler(f)
+        try:
+            while True:
+                records.append(p.load())
+        except EOFError:
+            f.close()
+
+    records.sort(key=lambda record: record[0])
+
+    indices  = []
+    stepDirs = []
+    results  = []
+    warm     = []
+    times    = []
+
+    for (i, filef0, filef1, stepDir, result, warmStart, time) in records:
+        indices.append(i)
+        stepDirs.append(stepDir)
+        results.append(result)
+        warm.append(warmStart)
+        times.append(time)
+
+    return (indices, stepDirs, results, warm, times)
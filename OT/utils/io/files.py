@@ -18,9 +18,24 @@
 def fileAnalyse(outputDir):
     return outputDir + 'analyse.bin'
 
+def fileAnalyseValues(outputDir):
+    return outputDir + 'analyseValues.npy'
+
 def fileFinalState(outputDir):
     return outputDir + 'finalState.bin'
 
+def fileSolution(outputDir):
+    return outputDir + 'solution.bin'
+
+def fileDisplacementField(outputDir):
+    return outputDir + 'displacementField.bin'
+
+def fileFinalStateSlices(outputDir, name):
+    return outputDir + 'finalStateSlices_' + name + '.npy'
+
+def fileEmbeddedFinalState(outputDir):
+    return outputDir + 'finalStateEmbedded.bin'
+
 def fileConfig(outputDir):
     return outputDir + 'config.bin'
 
@@ -35,3 +50,12 @@ def fileRunCount(outputDir):
 
 def fileStates(outputDir):
     return outputDir + 'states.bin'
+
+def fileSequence(outputDir, chainSuffix=''):
+    return outputDir + 'sequence' + chainSuffix + '.bin'
+
+def fileBenchmark(outputDir):
+    return outputDir + 'benchmark.bin'
+
+def fileScreening(outputDir):
+    return outputDir + 'screening.bin'
@@ -15,6 +15,8 @@
 # cmap.py
 #________
 
+import numpy as np
+
 from matplotlib import cm
 
 #__________________________________________________
@@ -27,3 +29,29 @@ def colormap(cmapName):
 
 #__________________________________________________
 
+def colormapLUT(cmapName, nColors=256, nChannels=3):
+    # look-up table of the colormap, array of shape (nColors, nChannels) of uint8
+    rgba = colormap(cmapName)(np.linspace(0., 1., nColors))
+    return np.round(255. * rgba[:,:nChannels]).astype(np.uint8)
+
+#__________________________________________________
+
+def colormapMatrix(matrix, lut, vmin, vmax):
+    #
+    # colormaps matrix, of shape (M+1,N+1), into an image of shape (N+1,M+1,nChannels)
+    # the origin of the image is the lower left corner, as with plotMatrix
+    # NaN values are transparent with an RGBA look-up table
+    #
+    nColors = lut.shape[0]
+    nan     = np.isnan(matrix)
+    if vmax > vmin:
+        index = ( np.where(nan, vmin, matrix) - vmin ) * ( ( nColors - 1. ) / ( vmax - vmin ) )
+    else:
+        index = np.zeros(matrix.shape)
+    index = np.clip(np.round(index), 0, nColors-1).astype(int)
+    image = lut[index.transpose()[::-1]]
+    if lut.shape[1] == 4 and nan.any():
+        image[nan.transpose()[::-1],3] = 0
+    return image
+
+#__________________________________________________
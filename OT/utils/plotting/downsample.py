@@ -0,0 +1,123 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#______________
+# downsample.py
+#______________
+#
+# Shape-preserving downsampling of curves before plotting
+#
+#   * lttb   -> largest-triangle-three-buckets : keeps in each bucket the
+#               point forming the largest triangle with its neighbours
+#   * minmax -> keeps the minimum and the maximum of each bucket (envelope)
+#
+# The buckets and the triangle areas are computed in the plotted
+# coordinates, i.e. in log scale for log-scaled axes
+#
+
+import numpy as np
+
+#__________________________________________________
+
+def plottedCoordinates(v, scale):
+    # log scale is only used if all the values are positive
+    if scale == 'log' and ( v > 0 ).all():
+        return np.log(v)
+    return np.array(v, dtype=float)
+
+#__________________________________________________
+
+def bucketEdges(x, nBuckets):
+    #
+    # indices delimiting nBuckets buckets of equal extent in x (x increasing)
+    #
+    edges = np.searchsorted(x, np.linspace(x[0], x[-1], nBuckets+1))
+    edges[0]  = 0
+    edges[-1] = len(x)
+    return edges
+
+#__________________________________________________
+
+def lttbIndices(x, y, nPoints):
+    n = len(x)
+    if nPoints >= n or nPoints < 3:
+        return np.arange(n)
+
+    # first and last points are kept, the other ones are bucketed
+    edges   = 1 + bucketEdges(x[1:-1], nPoints-2)
+    indices = np.zeros(nPoints, dtype=int)
+    k       = 1
+    a       = 0
+
+    for b in xrange(nPoints-2):
+        (start, end) = (edges[b], edges[b+1])
+        if end <= start:
+            continue
+
+        # average point of the next bucket
+        (nextStart, nextEnd) = (edges[b+1], edges[b+2]) if b+2 < len(edges) else (n-1, n)
+        if nextEnd <= nextStart:
+            (nextStart, nextEnd) = (n-1, n)
+        xAvg = x[nextStart:nextEnd].mean()
+        yAvg = y[nextStart:nextEnd].mean()
+
+        areas = np.abs( ( x[a] - xAvg ) * ( y[start:end] - y[a] ) -
+                        ( x[a] - x[start:end] ) * ( yAvg - y[a] ) )
+        a          = start + np.argmax(areas)
+        indices[k] = a
+        k         += 1
+
+    indices[k] = n-1
+    return indices[:k+1]
+
+#__________________________________________________
+
+def minMaxIndices(x, y, nPoints):
+    n = len(x)
+    if nPoints >= n or nPoints < 4:
+        return np.arange(n)
+
+    edges   = bucketEdges(x, nPoints/2)
+    indices = [0]
+    for (start, end) in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        iMin = start + np.argmin(y[start:end])
+        iMax = start + np.argmax(y[start:end])
+        indices.extend([min(iMin, iMax), max(iMin, iMax)])
+    indices.append(n-1)
+    return np.unique(indices)
+
+#__________________________________________________
+
+def downsample(X, Y, nPoints, method='lttb', xScale=None, yScale=None):
+    #
+    # returns (X, Y) downsampled to at most (about) nPoints points
+    # nPoints = 0 means no downsampling
+    #
+    if nPoints is None or nPoints < 1 or len(X) <= nPoints:
+        return (X, Y)
+
+    X = np.asarray(X)
+    Y = np.asarray(Y)
+    x = plottedCoordinates(X, xScale)
+    y = plottedCoordinates(Y, yScale)
+
+    if method == 'minmax':
+        indices = minMaxIndices(x, y, nPoints)
+    else:
+        indices = lttbIndices(x, y, nPoints)
+
+    return (X[indices], Y[indices])
+
+#__________________________________________________
@@ -0,0 +1,144 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#_____________
+# exportPNG.py
+#_____________
+#
+# Exports the time slices of fields as colormapped PNG images
+#
+#   * no matplotlib figure : the fields are colormapped with a look-up
+#     table (see cmap.py) and encoded with zlib
+#   * the frames are distributed over a pool of processes, the fields
+#     being shared through memory-mapped files (see parallelFrames.py)
+#
+
+import shutil
+import struct
+import tempfile
+import zlib
+import multiprocessing as mp
+import numpy           as np
+
+from ..io.io                import fileNameSuffix
+from ..animating.rawFrames  import upscale
+from cmap                   import colormapLUT
+from cmap                   import colormapMatrix
+from parallelFrames         import memmapArrays
+
+#__________________________________________________
+
+def pngChunk(chunkType, data):
+    return ( struct.pack('>I', len(data)) + chunkType + data +
+             struct.pack('>I', zlib.crc32(chunkType + data) & 0xffffffff) )
+
+#__________________________________________________
+
+def pngBytes(image, compressionLevel=6):
+    #
+    # image is an array of uint8 of shape (height, width, 3) (RGB) or (height, width, 4) (RGBA)
+    #
+    (height, width, nChannels) = image.shape
+    colorType                  = { 3 : 2 , 4 : 6 }[nChannels]
+
+    # every scanline starts with the filter type 0 (None)
+    raw       = np.zeros(shape=(height, 1+width*nChannels), dtype=np.uint8)
+    raw[:,1:] = image.reshape((height, width*nChannels))
+
+    header    = struct.pack('>IIBBBBB', width, height, 8, colorType, 0, 0, 0)
+    return ( '\x89PNG\r\n\x1a\n' +
+             pngChunk('IHDR', header) +
+             pngChunk('IDAT', zlib.compress(raw.tostring(), compressionLevel)) +
+             pngChunk('IEND', '') )
+
+#__________________________________________________
+
+def writePNG(fileName, image, compressionLevel=6):
+    f = open(fileName, 'wb')
+    f.write(pngBytes(image, compressionLevel))
+    f.close()
+
+#__________________________________________________
+
+class PNGFrameExporter:
+    '''
+    writes the time slice t of every array
+    '''
+
+    def __init__(self, fileNames, prefixFileNames, nFrames, lut, vmin, vmax, scale):
+        self.fileNames       = fileNames
+        self.prefixFileNames = prefixFileNames
+        self.nFrames         = nFrames
+        self.lut             = lut
+        self.vmin            = vmin
+        self.vmax            = vmax
+        self.scale           = scale
+        self.arrays          = None
+
+    #_________________________
+
+    def __getstate__(self):
+        # arrays are opened again by each worker
+        state           = self.__dict__.copy()
+        state['arrays'] = None
+        return state
+
+    #_________________________
+
+    def __call__(self, t):
+        if self.arrays is None:
+            self.arrays = [ np.load(fileName, mmap_mode='r') for fileName in self.fileNames ]
+
+        for (array, prefixFileName) in zip(self.arrays, self.prefixFileNames):
+            image = colormapMatrix(array[:,:,t], self.lut, self.vmin, self.vmax)
+            writePNG(prefixFileName + fileNameSuffix(t, self.nFrames) + '.png', upscale(image, self.scale))
+
+#__________________________________________________
+
+def exportFramesPNG(arrays, prefixFileNames, cmapName, vmin, vmax, scale=1, nProcesses=1):
+    #
+    # arrays are 3-dimensional, time being the last axis
+    # nProcesses = 0 uses all the cpus, nProcesses = 1 exports in the current process
+    #
+    nFrames = arrays[0].shape[2]
+
+    if nProcesses < 1:
+        nProcesses = mp.cpu_count()
+    nProcesses = min(nProcesses, nFrames)
+
+    for prefixFileName in prefixFileNames:
+        print('Writing '+prefixFileName+'*.png ...')
+
+    tmpDir = tempfile.mkdtemp(prefix='frames')
+    try:
+        exporter = PNGFrameExporter(memmapArrays(arrays, tmpDir),
+                                    prefixFileNames,
+                                    nFrames,
+                                    colormapLUT(cmapName, nChannels=4),
+                                    vmin,
+                                    vmax,
+                                    scale)
+
+        if nProcesses <= 1:
+            for t in xrange(nFrames):
+                exporter(t)
+        else:
+            pool = mp.Pool(nProcesses)
+            pool.map(exporter, xrange(nFrames), chunksize=max(1, nFrames/(4*nProcesses)))
+            pool.close()
+            pool.join()
+
+    finally:
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+#__________________________________________________
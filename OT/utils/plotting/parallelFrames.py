@@ -0,0 +1,136 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#__________________
+# parallelFrames.py
+#__________________
+#
+# Renders the frames of a figure sequence over a pool of processes
+#
+#   * the arrays are written once in memory-mapped files, which the workers
+#     open read-only, so that they are not pickled to every worker
+#   * each worker uses the Agg backend and a single figure, cleared and
+#     reused for all the frames it renders
+#
+
+import os
+import shutil
+import tempfile
+import multiprocessing as mp
+import numpy           as np
+
+#__________________________________________________
+
+# figure reused by the current process
+workerFigure = None
+
+#__________________________________________________
+
+def initWorker():
+    import matplotlib.pyplot as plt
+    plt.switch_backend('agg')
+
+#__________________________________________________
+
+def memmapArrays(arrays, tmpDir):
+    #
+    # writes the arrays in tmpDir and returns the file names
+    # lazy views (e.g. TimeResampledFinalState) are written slice by slice
+    # along their last axis, hence each slice is computed only once
+    #
+    fileNames = []
+    for (i, array) in enumerate(arrays):
+        fileName = os.path.join(tmpDir, 'array'+str(i)+'.npy')
+        mm       = np.lib.format.open_memmap(fileName, mode='w+', dtype=np.float64, shape=array.shape)
+        if len(array.shape) == 3:
+            for t in xrange(array.shape[2]):
+                mm[:,:,t] = array[:,:,t]
+        else:
+            mm[...] = array
+        mm.flush()
+        del mm
+        fileNames.append(fileName)
+    return fileNames
+
+#__________________________________________________
+
+class FrameRenderer:
+    '''
+    renders one frame of a figure sequence
+
+    sub-classes must define render(plt, arrays, t), arrays being the
+    read-only memory-mapped arrays
+    '''
+
+    def __init__(self, fileNames):
+        self.fileNames = fileNames
+        self.arrays    = None
+
+    #_________________________
+
+    def __getstate__(self):
+        # arrays are opened again by each worker
+        state           = self.__dict__.copy()
+        state['arrays'] = None
+        return state
+
+    #_________________________
+
+    def __call__(self, t):
+        global workerFigure
+        import matplotlib.pyplot as plt
+
+        if self.arrays is None:
+            self.arrays = [ np.load(fileName, mmap_mode='r') for fileName in self.fileNames ]
+
+        if workerFigure is None or not plt.fignum_exists(workerFigure.number):
+            workerFigure = plt.figure()
+
+        plt.figure(workerFigure.number)
+        workerFigure.clf()
+        self.render(plt, self.arrays, t)
+
+#__________________________________________________
+
+def renderFrames(makeRenderer, arrays, nFrames, nProcesses=1):
+    #
+    # makeRenderer(fileNames) returns the FrameRenderer
+    # nProcesses = 0 uses all the cpus, nProcesses = 1 renders in the current process
+    #
+    global workerFigure
+
+    if nProcesses < 1:
+        nProcesses = mp.cpu_count()
+    nProcesses = min(nProcesses, nFrames)
+
+    tmpDir = tempfile.mkdtemp(prefix='frames')
+    try:
+        renderer = makeRenderer(memmapArrays(arrays, tmpDir))
+
+        if nProcesses <= 1:
+            for t in xrange(nFrames):
+                renderer(t)
+        else:
+            pool = mp.Pool(nProcesses, initializer=initWorker)
+            pool.map(renderer, xrange(nFrames), chunksize=max(1, nFrames/(4*nProcesses)))
+            pool.close()
+            pool.join()
+
+    finally:
+        if workerFigure is not None:
+            import matplotlib.pyplot as plt
+            plt.close(workerFigure)
+            workerFigure = None
+        shutil.rmtree(tmpDir, ignore_errors=True)
+
+#__________________________________________________
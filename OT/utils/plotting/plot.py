@@ -93,6 +93,41 @@ def plotTimeTextPBar(ax, t, tMax):
 
 #__________________________________________________
 
+def addAnimatedTimeTextPBar(plt, tMax):
+    #
+    # same as addTimeTextPBar, the text and both lines being always
+    # created so that they can be updated with updateTimeTextPBar
+    #
+    rect     = timeTextPBarRect()
+    gsTTPB   = gridspec.GridSpec(1, 1, left=rect[0], bottom=rect[1], right=rect[2], top=rect[3])
+    ax       = plt.subplot(gsTTPB[0, 0], frameon=False)
+
+    (xTxt, yTxt, xPbarStart, xPbarEnd, yPbar) = positionsTimeTxtPbar()
+    text            = ax.text(xTxt, yTxt, '')
+    lineBkgPbar,    = plot(ax, [yPbar,yPbar], [xPbarStart,xPbarEnd], 'k-', linewidth=5)
+    linePbar,       = plot(ax, [yPbar,yPbar], [xPbarStart,xPbarStart], 'g-', linewidth=5)
+
+    adaptAxesExtent(ax, 0.0, 1.0, -0.5, 0.5, 0.0, 0.0, 0, 0, 1, 1, 0.0)
+    ret = [text, lineBkgPbar, linePbar]
+    updateTimeTextPBar(ret, 0, tMax)
+    return (ax, ret)
+
+#__________________________________________________
+
+def updateTimeTextPBar(ret, t, tMax):
+    (xTxt, yTxt, xPbarStart, xPbarEnd, yPbar) = positionsTimeTxtPbar()
+    (text, lineBkgPbar, linePbar)             = ret
+    xPbar                                     = xPbarStart+float(t)/(tMax)*(xPbarEnd-xPbarStart)
+
+    text.set_text(fileNameSuffix(t, tMax+1)+' / '+str(tMax))
+    lineBkgPbar.set_data([xPbar,xPbarEnd], [yPbar,yPbar])
+    linePbar.set_data([xPbarStart,xPbar], [yPbar,yPbar])
+    lineBkgPbar.set_visible(t < tMax)
+    linePbar.set_visible(t > 0)
+    return ret
+
+#__________________________________________________
+
 def plot(ax, Y, X=None, opt=None, **kwargs):
     args = []
     if X is not None:
@@ -39,6 +39,35 @@ def plotMatrix(ax, matrix, plotter, xmin=0.0, xmax=1.0, ymin=0.0, ymax=1.0, cmap
 
 #__________________________________________________
 
+def matrixArtists(im):
+    # list of the artists drawn by plotMatrix
+    if hasattr(im, 'collections'):
+        return list(im.collections)
+    return [im]
+
+#__________________________________________________
+
+def updateMatrix(ax, im, matrix, plotter, xmin=0.0, xmax=1.0, ymin=0.0, ymax=1.0, cmapName='jet', **kwargs):
+    #
+    # updates the output of plotMatrix with a new matrix
+    # images only swap their data, contour sets have to be computed again
+    #
+    if plotter == 'imshow':
+        im.set_data(matrix.transpose())
+        return im
+
+    for artist in matrixArtists(im):
+        artist.remove()
+    return plotMatrix(ax, matrix, plotter, xmin, xmax, ymin, ymax, cmapName, **kwargs)
+
+#__________________________________________________
+
+def setMatrixAlpha(im, alpha):
+    for artist in matrixArtists(im):
+        artist.set_alpha(alpha)
+
+#__________________________________________________
+
 def fillKwargs(plotter, xmin, xmax, ymin, ymax, cmapName, **kwargs):
 
     if plotter == 'imshow' or plotter == 'contourf':
@@ -0,0 +1,127 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#___________
+# metrics.py
+#___________
+#
+# Structured metrics of a running solve
+#
+#   * MetricsLog    -> appends one JSON object per line to a file
+#   * MetricsServer -> serves the latest metrics as JSON, either over HTTP
+#                      (address 'host:port' or 'port') or over a Unix socket
+#                      (address 'unix:/path/to/socket'), from a daemon thread
+#
+
+import os
+import json
+import resource
+import threading
+import SocketServer
+import BaseHTTPServer
+
+#__________________________________________________
+
+def currentRSS():
+    # resident set size in bytes (peak value if /proc is not available)
+    try:
+        f     = open('/proc/self/statm', 'r')
+        pages = int(f.read().split()[1])
+        f.close()
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except:
+        return 1024 * resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+#__________________________________________________
+
+class MetricsLog:
+    '''
+    JSON-lines log of metrics
+    '''
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+
+    #_________________________
+
+    def write(self, metrics):
+        try:
+            f = open(self.fileName, 'a')
+            f.write(json.dumps(metrics, sort_keys=True)+'\n')
+            f.close()
+        except:
+            print('WARNING : could not write '+self.fileName)
+
+#__________________________________________________
+
+class MetricsServer:
+    '''
+    serves the latest metrics as JSON
+    '''
+
+    def __init__(self, address):
+        self.metrics    = {}
+        self.socketFile = None
+        metricsServer   = self
+
+        if address.startswith('unix:'):
+            self.socketFile = address[len('unix:'):]
+            if os.path.exists(self.socketFile):
+                os.remove(self.socketFile)
+
+            class Handler(SocketServer.StreamRequestHandler):
+                def handle(self):
+                    self.wfile.write(json.dumps(metricsServer.metrics, sort_keys=True)+'\n')
+
+            self.server = SocketServer.UnixStreamServer(self.socketFile, Handler)
+
+        else:
+            if ':' in address:
+                (host, port) = address.rsplit(':', 1)
+            else:
+                (host, port) = ('127.0.0.1', address)
+
+            class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+                def do_GET(self):
+                    body = json.dumps(metricsServer.metrics, sort_keys=True)+'\n'
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self.server = BaseHTTPServer.HTTPServer((host or '127.0.0.1', int(port)), Handler)
+
+        self.thread        = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        print('Metrics served on '+address)
+
+    #_________________________
+
+    def update(self, metrics):
+        # the dict is replaced, never modified, so that it can be read by the server thread
+        self.metrics = dict(metrics)
+
+    #_________________________
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.socketFile is not None and os.path.exists(self.socketFile):
+            os.remove(self.socketFile)
+
+#__________________________________________________
@@ -0,0 +1,169 @@
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+#____________
+# profiler.py
+#____________
+#
+# Opt-in instrumentation of methods : for every label, accumulates
+#   * the number of calls
+#   * the wall and cpu times
+#   * the self wall time, i.e. without the time spent in other profiled calls
+#   * the bytes of the arrays returned (a proxy of the memory allocated)
+#
+# Methods are instrumented by replacing them on their class (patchClass) or
+# on a single object (patchObject), and restored by Profiler.restore().
+# A call made while the same method of the same object is already being
+# profiled (e.g. a sub-class calling its parent __call__) is not counted twice.
+#
+
+import json
+import time as tm
+import numpy as np
+
+#__________________________________________________
+
+def arrayBytes(obj, depth=3):
+    # bytes of the arrays held by obj (recursively, up to depth)
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if depth == 0:
+        return 0
+    if isinstance(obj, (tuple, list)):
+        return sum([ arrayBytes(o, depth-1) for o in obj ])
+    if hasattr(obj, '__dict__'):
+        return sum([ arrayBytes(o, depth-1) for o in obj.__dict__.values() ])
+    return 0
+
+#__________________________________________________
+
+class Profiler:
+    '''
+    accumulates the cost of the profiled calls
+    '''
+
+    fields = ['calls', 'wallTime', 'cpuTime', 'selfWallTime', 'bytes']
+
+    def __init__(self):
+        self.records = {}
+        self.stack   = []
+        self.patches = []
+
+    #_________________________
+
+    def record(self, label):
+        if not label in self.records:
+            self.records[label] = dict( [ ( field , 0 ) for field in Profiler.fields ] )
+        return self.records[label]
+
+    #_________________________
+
+    def call(self, label, key, function, *args, **kwargs):
+        if key in [ frame[0] for frame in self.stack ]:
+            return function(*args, **kwargs)
+
+        frame = [key, 0.]
+        self.stack.append(frame)
+        wallStart = tm.time()
+        cpuStart  = tm.clock()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            wall = tm.time() - wallStart
+            cpu  = tm.clock() - cpuStart
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][1] += wall
+
+        record                  = self.record(label)
+        record['calls']        += 1
+        record['wallTime']     += wall
+        record['cpuTime']      += cpu
+        record['selfWallTime'] += wall - frame[1]
+        record['bytes']        += arrayBytes(result)
+        return result
+
+    #_________________________
+
+    def patchClass(self, cls, methodName, label=None):
+        #
+        # profiles cls.methodName, which must be defined by cls itself
+        # the label defaults to the name of the class of the object
+        #
+        if not methodName in cls.__dict__:
+            return
+        profiler = self
+        function = cls.__dict__[methodName]
+
+        def profiled(obj, *args, **kwargs):
+            if label is None:
+                name = obj.__class__.__name__
+            else:
+                name = label
+            return profiler.call(name, (id(obj), methodName), function, obj, *args, **kwargs)
+
+        setattr(cls, methodName, profiled)
+        self.patches.append((cls, methodName, function))
+
+    #_________________________
+
+    def patchObject(self, obj, attrName, label):
+        profiler = self
+        function = getattr(obj, attrName)
+
+        def profiled(*args, **kwargs):
+            return profiler.call(label, (id(obj), attrName), function, *args, **kwargs)
+
+        setattr(obj, attrName, profiled)
+        self.patches.append((obj, attrName, function))
+
+    #_________________________
+
+    def restore(self):
+        for (owner, name, function) in reversed(self.patches):
+            setattr(owner, name, function)
+        self.patches = []
+
+    #_________________________
+
+    def report(self, nIterations):
+        #
+        # returns the records, with the costs per iteration
+        #
+        report = {}
+        for (label, record) in self.records.items():
+            report[label] = dict(record)
+            for field in Profiler.fields:
+                report[label][field+'PerIteration'] = float(record[field]) / max(1, nIterations)
+        return report
+
+    #_________________________
+
+    def writeJSON(self, fileName, nIterations):
+        f = open(fileName, 'w')
+        json.dump({ 'iterations' : nIterations , 'records' : self.report(nIterations) }, f, indent=1, sort_keys=True)
+        f.close()
+
+    #_________________________
+
+    def appendCSV(self, fileName, nIterations, writeHeader):
+        # one row per label and call to appendCSV
+        f = open(fileName, 'a')
+        if writeHeader:
+            f.write(','.join(['iterations', 'label'] + Profiler.fields)+'\n')
+        for label in sorted(self.records.keys()):
+            record = self.records[label]
+            f.write(','.join([str(nIterations), label] + [ str(record[field]) for field in Profiler.fields ])+'\n')
+        f.close()
+
+#__________________________________________________
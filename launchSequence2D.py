@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+from OT.utils.sys.run                              import runCommand
+from OT.utils.sys.argv                             import extractArgv
+from OT.OTObjects2D.sequence.sequenceConfiguration import SequenceConfiguration
+
+# Extract Arguments
+arguments   = extractArgv()
+configFile  = arguments['CONFIG_FILE']
+
+try:
+    printIO = ( arguments['PRINT_IO'] == 'True' )
+except:
+    printIO = False
+
+# Builds configuration
+config      = SequenceConfiguration(configFile)
+
+# Creates ouputdir
+runCommand('mkdir -p '+config.outputDir, printIO)
+
+# Runs all time steps
+pipeline    = config.pipeline()
+pipeline.run()
@@ -18,6 +18,7 @@ from OT.utils.sys.argv                       import extractArgv
 from OT.utils.io.saveResult                  import saveResult
 from OT.OTObjects2D.configuration            import Configuration
 from OT.OTObjects2D.analyse.computeOperators import applyAllOperators
+from OT.OTObjects2D.boundaries.cropSupport   import embedOutput
 
 # Extract Arguments
 arguments   = extractArgv()
@@ -38,6 +39,10 @@ runCommand('mkdir -p '+config.outputDir, printIO)
 algorithm   = config.algorithm()
 result      = algorithm.run()
 
+# Embeds results into the original grid
+if config.cropSupport:
+    result  = embedOutput(config, result)
+
 # Saves results
 saveResult(config.outputDir, result)
 
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+#==================================================
+#__________________________________________________
+
+# Copyrigth 2016 A. Farchi and M. Bocquet
+# CEREA, joint laboratory Ecole des Ponts ParisTech and EDF R&D
+
+# Code for the paper: Using the Wasserstein distance to compare fields of pollutants:
+# Application to the radionuclide atmospheric dispersion of the Fukushima-Daiichi accident
+# by A. Farchi, M. Bocquet, Y. Roustan, A. Mathieu and A. Querel
+
+#__________________________________________________
+#==================================================
+
+from OT.utils.sys.argv                  import extractArgv
+from OT.OTObjects2D.configuration       import Configuration
+from OT.OTObjects2D.algorithms.memory   import memoryReportForConfig
+from OT.OTObjects2D.algorithms.memory   import printMemoryReport
+
+# Extract Arguments
+arguments   = extractArgv()
+configFile  = arguments['CONFIG_FILE']
+
+# Builds configuration
+config      = Configuration(configFile)
+
+# Prints the predicted memory footprint, nothing is allocated
+print('M = '+str(config.M)+', N = '+str(config.N)+', P = '+str(config.P)+
+      ', algoName = '+config.algoName+', dynamics = '+str(config.dynamics)+
+      ', lowMemory = '+str(config.lowMemory))
+printMemoryReport(memoryReportForConfig(config))